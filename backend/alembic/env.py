@@ -19,6 +19,7 @@ from backend.database.base import Base
 from backend.models import *  # Import all models
 from backend.models.tmp_catalog import (  # Import tmp catalog models
     CatalogUpload,
+    ProductImportJob,
     TmpChair,
     TmpProductFamily,
     TmpProductImage,
@@ -0,0 +1,276 @@
+"""
+HTTP Conditional Requests for Public GET Endpoints
+
+Public catalog and CMS responses get a strong ETag computed from a version
+vector: row count and max(updated_at) of every table the response is built
+from, plus the request path, query params and (for priced endpoints) the
+company's pricing identity. A matching If-None-Match is answered with 304
+before the handler runs its queries.
+
+The vector is read in one statement and reused by every request on the same
+tables for HTTP_CACHE_VERSION_TTL seconds, so a conditional GET usually runs
+no query at all. Sessions in this process drop the vectors of the tables they
+wrote on commit; writes in other processes show up within the TTL.
+
+Anonymous responses are marked cacheable by shared caches and carry a
+Surrogate-Key header listing those table names, so a CDN can purge every
+cached response built from a table when an admin writes to it. Responses
+priced for a signed-in company are private.
+
+Usage:
+    router = APIRouter(route_class=ConditionalRoute)
+
+    @router.get("/finishes", dependencies=[conditional_get(Finish)])
+    async def get_finishes(...): ...
+"""
+
+import hashlib
+import logging
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import Table, event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.api.dependencies import get_optional_company
+from backend.core.config import settings
+from backend.database.base import get_read_db
+from backend.models.company import Company, CompanyPricing
+
+logger = logging.getLogger(__name__)
+
+WRITTEN_TABLES = "http_cache_written_tables"
+
+# Table names -> (monotonic expiry, version vector)
+_table_versions: Dict[Tuple[str, ...], Tuple[float, List[Any]]] = {}
+
+
+class NotModified(Exception):
+    """Raised by a conditional_get dependency when the client's copy is current"""
+
+    def __init__(self, headers: Dict[str, str]):
+        super().__init__("Not Modified")
+        self.headers = headers
+
+
+class ConditionalRoute(APIRoute):
+    """
+    APIRoute that answers NotModified with a 304 and adds the cache headers
+    chosen by conditional_get to successful responses, including responses
+    the handler builds itself (which FastAPI does not merge headers into)
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def conditional_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except NotModified as exc:
+                return Response(status_code=304, headers=exc.headers)
+            headers = getattr(request.state, "cache_headers", None)
+            if headers and response.status_code == 200:
+                response.headers.update(headers)
+            return response
+
+        return conditional_handler
+
+
+def _as_table(source: Any) -> Table:
+    return getattr(source, "__table__", source)
+
+
+async def get_table_versions(db: AsyncSession, tables: Iterable[Table]) -> List[Any]:
+    """
+    Row count and max(updated_at) of each table, in one statement
+
+    The count catches hard deletes, which leave max(updated_at) unchanged;
+    inactive rows are included so deactivating a row changes the version.
+
+    Args:
+        db: Database session
+        tables: Tables (or models) to version
+
+    Returns:
+        Flat list of counts and timestamps, in table order
+    """
+    columns = []
+    for table in map(_as_table, tables):
+        columns.append(select(func.count()).select_from(table).scalar_subquery())
+        if "updated_at" in table.c:
+            columns.append(select(func.max(table.c.updated_at)).scalar_subquery())
+    return list((await db.execute(select(*columns))).one())
+
+
+async def cached_table_versions(db: AsyncSession, tables: Tuple[Table, ...]) -> List[Any]:
+    """get_table_versions, reused for HTTP_CACHE_VERSION_TTL seconds per table set"""
+    key = tuple(table.name for table in tables)
+    now = time.monotonic()
+    cached = _table_versions.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    versions = await get_table_versions(db, tables)
+    _table_versions[key] = (now + settings.HTTP_CACHE_VERSION_TTL, versions)
+    return versions
+
+
+def forget_table_versions(table_names: Iterable[str]) -> None:
+    """Drop the cached version vectors that include any of ``table_names``"""
+    names = set(table_names)
+    for key in [key for key in _table_versions if names.intersection(key)]:
+        _table_versions.pop(key, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session: Session, flush_context) -> None:
+    written = session.info.setdefault(WRITTEN_TABLES, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        written.update(table.name for table in inspect(obj).mapper.tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_executed_tables(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            orm_execute_state.session.info.setdefault(WRITTEN_TABLES, set()).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_tables(session: Session) -> None:
+    written = session.info.pop(WRITTEN_TABLES, None)
+    if written:
+        forget_table_versions(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_tables(session: Session) -> None:
+    session.info.pop(WRITTEN_TABLES, None)
+
+
+def compute_etag(request: Request, versions: List[Any], identity: Tuple = ()) -> str:
+    """
+    Strong ETag for a response to ``request`` built from data at ``versions``
+
+    Args:
+        request: Incoming request (path and query params are part of the tag)
+        versions: Result of cached_table_versions
+        identity: Pricing identity of the caller, empty for anonymous requests
+
+    Returns:
+        Quoted ETag value
+    """
+    # GZipMiddleware compresses large bodies for clients that accept it, and a
+    # strong ETag must differ per encoding
+    gzip = "gzip" in request.headers.get("accept-encoding", "")
+    parts = [
+        settings.APP_VERSION,
+        request.url.path,
+        repr(sorted(request.query_params.multi_items())),
+        repr(identity),
+        repr([str(v) for v in versions]),
+        "gzip" if gzip else "identity",
+    ]
+    digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag``, as RFC 9110 requires"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def cache_headers(etag: str, surrogate_keys: str, private: bool, vary: str) -> Dict[str, str]:
+    """
+    Validator and caching headers for a conditional response
+
+    Browsers always revalidate (a 304 is cheap); shared caches keep anonymous
+    responses for HTTP_CACHE_SHARED_MAX_AGE or until purged by surrogate key.
+    """
+    if private:
+        return {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": vary}
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+            f"s-maxage={settings.HTTP_CACHE_SHARED_MAX_AGE}, "
+            f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+        ),
+        "Surrogate-Key": surrogate_keys,
+        "Vary": vary,
+    }
+
+
+async def _check(
+    request: Request,
+    db: AsyncSession,
+    tables: Tuple[Table, ...],
+    company: Optional[Company],
+    priced: bool,
+) -> None:
+    if not settings.HTTP_CACHE_ENABLED:
+        return
+
+    identity: Tuple = ()
+    if company is not None:
+        tables = tables + (CompanyPricing.__table__,)
+        identity = (company.id, company.pricing_tier_id, str(company.updated_at))
+        if company.pricing_tier_id:
+            # A tier takes effect/expires by date (PricingService.tier_in_effect)
+            identity += (date.today().isoformat(),)
+
+    versions = await cached_table_versions(db, tables)
+    etag = compute_etag(request, versions, identity)
+    headers = cache_headers(
+        etag,
+        surrogate_keys=" ".join(table.name for table in tables),
+        private=company is not None,
+        vary="Accept-Encoding, Authorization" if priced else "Accept-Encoding",
+    )
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise NotModified(headers)
+    request.state.cache_headers = headers
+
+
+def conditional_get(*tables: Any, priced: bool = False) -> Any:
+    """
+    Route dependency that makes a public GET endpoint conditional
+
+    Must be used on a router with ``route_class=ConditionalRoute``. The
+    version query shares the handler's read session.
+
+    Args:
+        *tables: Every model or table the response is built from
+        priced: The response depends on the signed-in company's pricing tier
+
+    Returns:
+        ``Depends(...)`` for the route's ``dependencies`` list
+    """
+    tables = tuple(_as_table(t) for t in tables)
+
+    if priced:
+        async def dependency(
+            request: Request,
+            db: AsyncSession = Depends(get_read_db),
+            company: Optional[Company] = Depends(get_optional_company),
+        ) -> None:
+            await _check(request, db, tables, company, priced=True)
+    else:
+        async def dependency(
+            request: Request,
+            db: AsyncSession = Depends(get_read_db),
+        ) -> None:
+            await _check(request, db, tables, None, priced=False)
+
+    return Depends(dependency)
@@ -23,6 +23,7 @@ Endpoints:
 import asyncio
 import json
 import logging
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -46,6 +47,7 @@ from backend.core.config import settings
 from backend.models.company import AdminRole
 from backend.core.security import SecurityManager
 from backend.database.base import get_db, AsyncSessionLocal
+from backend.database.query_counter import count_queries
 from backend.models.ai_chat import (
     AIChatSession,
     AIChatMessage,
@@ -56,17 +58,22 @@ from backend.models.ai_chat import (
     MessageRole,
     TrainingStatus,
 )
+from backend.services.ai_prompt_service import (
+    FRAGMENT_MEMORY,
+    FRAGMENT_TRAINING,
+    HISTORY_KEEP_MESSAGES,
+    AIPromptService,
+    invalidate_prompt_fragment,
+    load_active_memory,
+)
 from backend.services.ai_service import (
     AIStreamEvent,
-    build_system_prompt,
     extract_memory_from_conversation,
-    fetch_valid_reference_ids,
     generate_chat_title,
-    get_eaglechair_context,
-    process_training_document,
     process_uploaded_file,
     stream_ai_response,
 )
+from backend.services.job_queue_service import TRAINING_DOCUMENT, JobQueueService
 
 logger = logging.getLogger(__name__)
 
@@ -135,42 +142,6 @@ async def get_session_basic(session_id: str, db: AsyncSession, admin) -> AIChatS
     return session
 
 
-async def load_active_memory(db: AsyncSession, admin_id: int | None) -> list[dict]:
-    q = select(AIMemory).where(AIMemory.is_active == True)
-    if admin_id is not None:
-        q = q.where(AIMemory.admin_user_id == admin_id)
-    else:
-        q = q.where(AIMemory.admin_user_id.is_(None))
-    result = await db.execute(
-        q.order_by(desc(AIMemory.importance), desc(AIMemory.updated_at)).limit(50)
-    )
-    return [
-        {"key": m.key, "value": m.value, "category": m.category, "importance": m.importance}
-        for m in result.scalars().all()
-    ]
-
-
-async def load_training_summaries(db: AsyncSession) -> list[dict]:
-    result = await db.execute(
-        select(AITrainingDocument)
-        .where(
-            AITrainingDocument.is_active == True,
-            AITrainingDocument.status == TrainingStatus.COMPLETED,
-        )
-        .order_by(desc(AITrainingDocument.created_at))
-        .limit(20)
-    )
-    return [
-        {
-            "name": d.name,
-            "summary": d.summary or "",
-            "key_facts": d.key_facts or [],
-            "structured_data": d.structured_data or "",
-        }
-        for d in result.scalars().all()
-    ]
-
-
 def serialize_session(session: AIChatSession, include_messages: bool = True, messages_list: list | None = None) -> dict:
     data = {
         "id": session.id,
@@ -475,6 +446,7 @@ async def upsert_memory(
             importance=body.get("importance", 0.5),
         ))
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_MEMORY, admin_id)
     return {"success": True}
 
 
@@ -541,6 +513,7 @@ async def delete_memory(
             ).values(is_active=False)
         )
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_MEMORY, admin_id)
     return {"success": True}
 
 
@@ -575,6 +548,8 @@ async def list_training_docs(
             "created_at": d.created_at.isoformat() if d.created_at else None,
             "processed_at": d.processed_at.isoformat() if d.processed_at else None,
             "error_message": d.error_message,
+            "progress": {"chunks_done": d.chunks_done or 0, "chunks_total": d.chunks_total or 0},
+            "stats": d.processing_stats,
         }
         for d in docs
     ]
@@ -611,61 +586,12 @@ async def upload_training_document(
         tags=tags_list,
     )
     db.add(doc)
+    # Processed by the background worker
+    await JobQueueService.enqueue(
+        db, TRAINING_DOCUMENT, payload={"document_id": doc_id}, reference_id=doc_id, commit=False
+    )
     await db.commit()
 
-    # Start processing in background
-    async def process_training_bg():
-        try:
-            async with AsyncSessionLocal() as bg_db:
-                await bg_db.execute(
-                    update(AITrainingDocument)
-                    .where(AITrainingDocument.id == doc_id)
-                    .values(status=TrainingStatus.PROCESSING)
-                )
-                await bg_db.commit()
-
-                result = await process_training_document(
-                    str(save_path), file_type.value, file.filename or "upload", name
-                )
-
-                if result["success"]:
-                    await bg_db.execute(
-                        update(AITrainingDocument)
-                        .where(AITrainingDocument.id == doc_id)
-                        .values(
-                            status=TrainingStatus.COMPLETED,
-                            processed_content=result["processed_content"],
-                            summary=result["summary"],
-                            key_facts=result["key_facts"],
-                            structured_data=result.get("structured_data") or "",
-                            processed_at=datetime.utcnow(),
-                        )
-                    )
-                else:
-                    await bg_db.execute(
-                        update(AITrainingDocument)
-                        .where(AITrainingDocument.id == doc_id)
-                        .values(
-                            status=TrainingStatus.FAILED,
-                            error_message=result.get("error", "Unknown error"),
-                        )
-                    )
-                await bg_db.commit()
-        except Exception as e:
-            logger.error(f"Training document processing failed: {e}")
-            try:
-                async with AsyncSessionLocal() as bg_db:
-                    await bg_db.execute(
-                        update(AITrainingDocument)
-                        .where(AITrainingDocument.id == doc_id)
-                        .values(status=TrainingStatus.FAILED, error_message=str(e))
-                    )
-                    await bg_db.commit()
-            except Exception:
-                pass
-
-    asyncio.create_task(process_training_bg())
-
     return {"document_id": doc_id, "status": "pending", "name": name}
 
 
@@ -701,54 +627,12 @@ async def upload_training_batch(
             tags=[],
         )
         db.add(doc)
-        created.append({"id": doc_id, "name": name, "path": str(save_path), "file_type": file_type, "filename": filename})
+        await JobQueueService.enqueue(
+            db, TRAINING_DOCUMENT, payload={"document_id": doc_id}, reference_id=doc_id, commit=False
+        )
+        created.append({"id": doc_id, "name": name})
     await db.commit()
 
-    async def process_batch_sequential():
-        for item in created:
-            doc_id, name, path, file_type, filename = item["id"], item["name"], item["path"], item["file_type"], item["filename"]
-            try:
-                async with AsyncSessionLocal() as bg_db:
-                    await bg_db.execute(
-                        update(AITrainingDocument).where(AITrainingDocument.id == doc_id).values(status=TrainingStatus.PROCESSING)
-                    )
-                    await bg_db.commit()
-                result = await process_training_document(path, file_type.value, filename, name)
-                async with AsyncSessionLocal() as bg_db:
-                    if result["success"]:
-                        await bg_db.execute(
-                            update(AITrainingDocument)
-                            .where(AITrainingDocument.id == doc_id)
-                            .values(
-                                status=TrainingStatus.COMPLETED,
-                                processed_content=result["processed_content"],
-                                summary=result["summary"],
-                                key_facts=result["key_facts"],
-                                structured_data=result.get("structured_data") or "",
-                                processed_at=datetime.utcnow(),
-                            )
-                        )
-                    else:
-                        await bg_db.execute(
-                            update(AITrainingDocument)
-                            .where(AITrainingDocument.id == doc_id)
-                            .values(status=TrainingStatus.FAILED, error_message=result.get("error", "Unknown error"))
-                        )
-                    await bg_db.commit()
-            except Exception as e:
-                logger.error(f"Batch training doc {doc_id} failed: {e}")
-                try:
-                    async with AsyncSessionLocal() as bg_db:
-                        await bg_db.execute(
-                            update(AITrainingDocument)
-                            .where(AITrainingDocument.id == doc_id)
-                            .values(status=TrainingStatus.FAILED, error_message=str(e))
-                        )
-                        await bg_db.commit()
-                except Exception:
-                    pass
-
-    asyncio.create_task(process_batch_sequential())
     return {"uploaded": len(created), "documents": [{"id": c["id"], "name": c["name"]} for c in created], "status": "pending"}
 
 
@@ -764,6 +648,7 @@ async def delete_training_doc(
         .values(is_active=False)
     )
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_TRAINING)
     return {"success": True}
 
 
@@ -788,7 +673,8 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
       {"type": "fetching_url", "data": {"url": "..."}}
       {"type": "calculating", "data": {"expression": "..."}}
       {"type": "text_chunk", "data": {"content": "..."}}
-      {"type": "message_done", "data": {"message_id": "...", "tokens": N, "web_sources": [...]}}
+      {"type": "message_done", "data": {"message_id": "...", "tokens": N, "web_sources": [...],
+                                        "timing": {"prompt_build_ms": ..., "prompt_queries": N, ...}}}
       {"type": "error", "data": {"message": "..."}}
       {"type": "title_update", "data": {"title": "..."}}
     """
@@ -823,13 +709,10 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
     try:
         async with AsyncSessionLocal() as db:
             result = await db.execute(
-                select(AIChatSession)
+                select(AIChatSession.id)
                 .where(AIChatSession.id == session_id, AIChatSession.admin_user_id == admin_id)
-                .options(selectinload(AIChatSession.messages))
-                .options(selectinload(AIChatSession.files))
             )
-            session = result.scalar_one_or_none()
-            if not session:
+            if result.scalar_one_or_none() is None:
                 await websocket.send_json(AIStreamEvent.error("Chat session not found"))
                 await websocket.close(code=4004)
                 return
@@ -873,68 +756,72 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
                 await websocket.send_json(AIStreamEvent.error("Message cannot be empty"))
                 continue
 
-            async with AsyncSessionLocal() as db:
-                result = await db.execute(
-                    select(AIChatSession)
-                    .where(AIChatSession.id == session_id)
-                    .options(selectinload(AIChatSession.messages))
-                    .options(selectinload(AIChatSession.files))
-                )
-                session = result.scalar_one_or_none()
-                if not session:
-                    await websocket.send_json(AIStreamEvent.error("Session lost"))
-                    break
+            build_started = time.perf_counter()
+            with count_queries() as query_counter:
+                async with AsyncSessionLocal() as db:
+                    session = await db.get(AIChatSession, session_id)
+                    if not session:
+                        await websocket.send_json(AIStreamEvent.error("Session lost"))
+                        break
+
+                    # Only the messages after the rolling summary; load before the
+                    # new user message is added so autoflush doesn't include it
+                    history = await AIPromptService.load_history(db, session)
+
+                    full_user_content = user_content
+                    attached_file_content = []
+
+                    if file_ids:
+                        for fid in file_ids:
+                            fr = await db.execute(
+                                select(AIUploadedFile).where(AIUploadedFile.id == fid)
+                            )
+                            f = fr.scalar_one_or_none()
+                            if f and f.processed_content:
+                                attached_file_content.append(f.processed_content)
+                            elif f and not f.processed_content:
+                                processed = await process_uploaded_file(
+                                    f.file_path, f.file_type.value, f.original_filename
+                                )
+                                attached_file_content.append(processed)
+
+                    if attached_file_content:
+                        full_user_content = (
+                            user_content
+                            + "\n\n--- ATTACHED FILES ---\n\n"
+                            + "\n\n---\n\n".join(attached_file_content)
+                        )
 
-                full_user_content = user_content
-                attached_file_content = []
+                    user_msg = AIChatMessage(
+                        id=str(uuid.uuid4()),
+                        session_id=session_id,
+                        role=MessageRole.USER,
+                        content=user_content,
+                        file_ids=file_ids,
+                    )
+                    db.add(user_msg)
+                    session.message_count = (session.message_count or 0) + 1
 
-                if file_ids:
-                    for fid in file_ids:
-                        fr = await db.execute(
-                            select(AIUploadedFile).where(AIUploadedFile.id == fid)
-                        )
-                        f = fr.scalar_one_or_none()
-                        if f and f.processed_content:
-                            attached_file_content.append(f.processed_content)
-                        elif f and not f.processed_content:
-                            processed = await process_uploaded_file(
-                                f.file_path, f.file_type.value, f.original_filename
-                            )
-                            attached_file_content.append(processed)
+                    history.append({"role": "user", "content": full_user_content})
+                    # Summarise older messages once this exchange passes the verbatim window
+                    needs_summary = len(history) + 1 > HISTORY_KEEP_MESSAGES
 
-                if attached_file_content:
-                    full_user_content = (
-                        user_content
-                        + "\n\n--- ATTACHED FILES ---\n\n"
-                        + "\n\n---\n\n".join(attached_file_content)
+                    system_prompt, _ = await AIPromptService.build_system_prompt(
+                        db, admin_id, mode=mode, model=model,
+                        history_summary=session.history_summary,
                     )
 
-                user_msg = AIChatMessage(
-                    id=str(uuid.uuid4()),
-                    session_id=session_id,
-                    role=MessageRole.USER,
-                    content=user_content,
-                    file_ids=file_ids,
-                )
-                db.add(user_msg)
-                session.message_count = (session.message_count or 0) + 1
-
-                history = []
-                for m in session.messages:
-                    history.append({"role": m.role.value, "content": m.content})
-                history.append({"role": "user", "content": full_user_content})
-
-                memory = await load_active_memory(db, admin_id)
-                training = await load_training_summaries(db)
-                db_context = await get_eaglechair_context(db)
-                valid_ids = await fetch_valid_reference_ids() if mode in ("edit", "agent") else None
-                system_prompt = build_system_prompt(
-                    memory, training, mode=mode, model=model, valid_reference_ids=valid_ids
-                )
-                if db_context:
-                    system_prompt += f"\n\n## Live Data\n{db_context}"
+                    await db.commit()
 
-                await db.commit()
+            timing = {
+                "prompt_build_ms": round((time.perf_counter() - build_started) * 1000, 1),
+                "prompt_queries": query_counter.count,
+                "history_messages": len(history),
+            }
+            logger.info(
+                f"Chat turn prompt for session {session_id}: {timing['prompt_build_ms']}ms, "
+                f"{timing['prompt_queries']} queries, {timing['history_messages']} history messages"
+            )
 
             stream_state = {
                 "full_response": "",
@@ -1082,7 +969,7 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
                         await db.commit()
 
                     await websocket.send_json(
-                        AIStreamEvent.message_done(asst_msg_id, tokens_used, web_sources)
+                        AIStreamEvent.message_done(asst_msg_id, tokens_used, web_sources, timing)
                     )
 
                     if is_first_message and user_content and not interrupted:
@@ -1100,6 +987,8 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
                         asyncio.create_task(
                             _extract_and_save_memory(session_id, admin_id, history, full_response)
                         )
+                    if needs_summary:
+                        asyncio.create_task(AIPromptService.refresh_history_summary(session_id))
                 except Exception as e:
                     logger.error(f"Failed to save assistant message: {e}")
 
@@ -1154,5 +1043,7 @@ async def _extract_and_save_memory(
                         source_session_id=session_id,
                     ))
             await db.commit()
+            if new_memories:
+                await invalidate_prompt_fragment(FRAGMENT_MEMORY, admin_id)
     except Exception as e:
         logger.debug(f"Memory extraction background task failed: {e}")
@@ -55,6 +55,10 @@ from backend.models.chair import (
 )
 from backend.models.company import AdminRole, AdminUser
 from backend.models.content import Catalog, CatalogType, Hardware, Laminate
+from backend.services.ai_prompt_service import FRAGMENT_REFERENCE_IDS, invalidate_prompt_fragment
+from backend.services.catalog_thumbnail_service import CatalogThumbnailService
+from backend.services.category_tree_service import refresh_category_tree
+from backend.services.family_index_service import refresh_family_index
 from backend.utils.serializers import orm_list_to_dict_list, orm_to_dict
 from backend.utils.static_content_exporter import export_content_after_update
 
@@ -143,6 +147,7 @@ async def create_color(
     db.add(color)
     await db.commit()
     await db.refresh(color)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     return orm_to_dict(color)
 
@@ -191,6 +196,7 @@ async def update_color(
     
     await db.commit()
     await db.refresh(color)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     return orm_to_dict(color)
 
@@ -223,6 +229,7 @@ async def delete_color(
         color.is_active = False
     
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     return MessageResponse(
         message=f"Color '{color.name}' {'deleted' if hard_delete else 'deactivated'} successfully"
@@ -308,6 +315,7 @@ async def create_finish(
     db.add(finish)
     await db.commit()
     await db.refresh(finish)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     # Export to CMS
     await export_content_after_update('finishes', db)
@@ -331,6 +339,7 @@ async def reorder_finishes(
         if finish:
             finish.display_order = item.display_order
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('finishes', db)
     return {"message": "Order updated", "count": len(body.order)}
 
@@ -391,6 +400,7 @@ async def update_finish(
     
     await db.commit()
     await db.refresh(finish)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     # Export to CMS
     await export_content_after_update('finishes', db)
@@ -426,6 +436,7 @@ async def delete_finish(
         finish.is_active = False
     
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     # Export to CMS
     await export_content_after_update('finishes', db)
@@ -542,6 +553,7 @@ async def create_upholstery(
     db.add(upholstery)
     await db.commit()
     await db.refresh(upholstery)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     # Export to CMS
     await export_content_after_update('upholsteries', db)
@@ -565,6 +577,7 @@ async def reorder_upholsteries(
         if upholstery:
             upholstery.display_order = item.display_order
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('upholsteries', db)
     return {"message": "Order updated", "count": len(body.order)}
 
@@ -634,6 +647,7 @@ async def update_upholstery(
     
     await db.commit()
     await db.refresh(upholstery)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     # Export to CMS
     await export_content_after_update('upholsteries', db)
@@ -669,6 +683,7 @@ async def delete_upholstery(
         upholstery.is_active = False
     
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     # Export to CMS
     await export_content_after_update('upholsteries', db)
@@ -899,6 +914,8 @@ async def create_family(
     db.add(family)
     await db.commit()
     await db.refresh(family)
+    await refresh_family_index(db, family.id)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     return orm_to_dict(family)
 
@@ -919,6 +936,7 @@ async def reorder_families(
         if family:
             family.display_order = item.display_order
     await db.commit()
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     return {"message": "Order updated", "count": len(body.order)}
 
 
@@ -950,6 +968,8 @@ async def update_family(
     
     await db.commit()
     await db.refresh(family)
+    await refresh_family_index(db, family.id)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     return orm_to_dict(family)
 
@@ -982,6 +1002,8 @@ async def delete_family(
         family.is_active = False
     
     await db.commit()
+    await refresh_family_index(db, family_id)
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     
     return MessageResponse(
         message=f"Family '{family.name}' {'deleted' if hard_delete else 'deactivated'} successfully"
@@ -1042,6 +1064,8 @@ async def create_subcategory(
     await db.commit()
     await db.refresh(subcategory)
 
+    await refresh_category_tree(db, "subcategories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('categories', db)
     
     return orm_to_dict(subcategory)
@@ -1076,6 +1100,8 @@ async def update_subcategory(
     await db.commit()
     await db.refresh(subcategory)
 
+    await refresh_category_tree(db, "subcategories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('categories', db)
     
     return orm_to_dict(subcategory)
@@ -1110,6 +1136,8 @@ async def delete_subcategory(
     
     await db.commit()
 
+    await refresh_category_tree(db, "subcategories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('categories', db)
     
     return MessageResponse(
@@ -1487,6 +1515,9 @@ async def create_catalog(
     # Export to CMS
     await export_content_after_update('catalogs', db)
     
+    # Render the first-page preview now so the public endpoint only serves files
+    await CatalogThumbnailService.render_for_catalog(catalog.file_url)
+    
     return orm_to_dict(catalog)
 
 
@@ -1651,6 +1682,9 @@ async def update_catalog(
     # Export to CMS
     await export_content_after_update('catalogs', db)
     
+    if file or file_url is not None:
+        await CatalogThumbnailService.render_for_catalog(catalog.file_url)
+    
     return orm_to_dict(catalog)
 
 
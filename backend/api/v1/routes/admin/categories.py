@@ -22,6 +22,8 @@ from backend.api.v1.schemas.product import (
 from backend.database.base import get_db
 from backend.models.chair import Category, Chair, ProductSubcategory, chair_categories
 from backend.models.company import AdminRole, AdminUser
+from backend.services.ai_prompt_service import FRAGMENT_REFERENCE_IDS, invalidate_prompt_fragment
+from backend.services.category_tree_service import refresh_category_tree
 from backend.utils.slug import slugify
 from backend.utils.static_content_exporter import export_content_after_update
 
@@ -224,6 +226,8 @@ async def create_category(
     await db.commit()
     await db.refresh(category)
 
+    await refresh_category_tree(db, "categories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('categories', db)
 
     logger.info(f"Created category: {category.name} (ID: {category.id})")
@@ -284,6 +288,8 @@ async def update_category(
     await db.commit()
     await db.refresh(category)
 
+    await refresh_category_tree(db, "categories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('categories', db)
     
     children = await _load_category_children(db, category.id)
@@ -358,6 +364,8 @@ async def delete_category(
     
     await db.commit()
 
+    await refresh_category_tree(db, "categories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('categories', db)
     
     return MessageResponse(
@@ -382,6 +390,8 @@ async def batch_reorder_categories(
         if category:
             category.display_order = item.display_order
     await db.commit()
+    await refresh_category_tree(db, "categories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
     await export_content_after_update('categories', db)
     return {"message": "Order updated", "count": len(body.order)}
 
@@ -411,6 +421,9 @@ async def reorder_categories(
     await db.commit()
     await db.refresh(category)
 
+    await refresh_category_tree(db, "categories")
+    await invalidate_prompt_fragment(FRAGMENT_REFERENCE_IDS)
+
     category_dict = {
         "id": category.id,
         "name": category.name,
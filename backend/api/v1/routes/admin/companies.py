@@ -9,12 +9,13 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from backend.api.dependencies import get_current_admin, require_role
 from backend.api.v1.schemas.admin import (
+    CompanyBulkInviteRequest,
     CompanyInviteRequest,
     CompanyListResponse,
     CompanyStatusUpdate,
@@ -42,8 +43,11 @@ from backend.models.company import (
     CompanyShippingAddress,
     CompanyStatus,
 )
+from backend.models.job import BackgroundJob, JobStatus
 from backend.services.admin_service import AdminService
 from backend.services.email_service import EmailService
+from backend.services.export_service import ExportService, companies_export
+from backend.services.job_queue_service import COMPANY_INVITES, JobQueueService
 from backend.utils.serializers import orm_list_to_dict_list, orm_to_dict
 
 logger = logging.getLogger(__name__)
@@ -97,6 +101,31 @@ async def get_all_companies(
     return response_data
 
 
+@router.get(
+    "/export",
+    summary="Export companies (Admin)",
+    description="Stream all companies matching the list filters as CSV or Parquet"
+)
+async def export_companies(
+    format: str = Query("csv", pattern="^(csv|parquet)$", description="File format: csv, parquet (requires pyarrow)"),
+    search: Optional[str] = Query(None, description="Search term"),
+    status: Optional[CompanyStatus] = Query(None, description="Filter by status"),
+    sort_by: Optional[str] = Query(None, description="Sort by any exported column, or contact"),
+    sort_dir: Optional[str] = Query("asc", description="Sort direction: asc, desc"),
+    admin: AdminUser = Depends(get_current_admin)
+):
+    """
+    Export companies without pagination.
+
+    **Admin only** - Requires admin authentication.
+    """
+    ExportService.check_format(format)
+    logger.info(f"Admin {admin.username} exporting companies as {format}")
+
+    columns, stmt = companies_export(search=search, status=status, sort_by=sort_by, sort_dir=sort_dir)
+    return ExportService.streaming_response("companies", format, columns, stmt)
+
+
 @router.get(
     "/{company_id}",
     summary="Get company by ID (Admin)",
@@ -659,6 +688,22 @@ async def list_all_pricing_tiers(
     return tiers
 
 
+def _registration_url() -> str:
+    """Absolute registration page URL for invitation emails"""
+    frontend_url = settings.FRONTEND_URL
+    if not frontend_url or frontend_url == "http://localhost:5173":
+        frontend_url = "https://joshua.eaglechair.com"
+    if not frontend_url.startswith('http://') and not frontend_url.startswith('https://'):
+        frontend_url = f"https://{frontend_url}"
+    return f"{frontend_url.rstrip('/')}/register"
+
+
+def _inviter_name(admin: AdminUser) -> Optional[str]:
+    """Admin's full name, or None when only the username is known"""
+    inviter_name = f"{admin.first_name} {admin.last_name}".strip() if (admin.first_name or admin.last_name) else admin.username
+    return inviter_name if inviter_name != admin.username else None
+
+
 @router.post(
     "/invite",
     response_model=MessageResponse,
@@ -692,23 +737,13 @@ async def invite_company(
                 field="email"
             )
         
-        # Generate registration URL - ensure it's absolute with protocol
-        frontend_url = settings.FRONTEND_URL
-        if not frontend_url or frontend_url == "http://localhost:5173":
-            frontend_url = "https://joshua.eaglechair.com"
-        if not frontend_url.startswith('http://') and not frontend_url.startswith('https://'):
-            frontend_url = f"https://{frontend_url}"
-        registration_url = f"{frontend_url.rstrip('/')}/register"
-        
         # Send invitation email
-        inviter_name = f"{admin.first_name} {admin.last_name}".strip() if (admin.first_name or admin.last_name) else admin.username
-        
         email_sent = await EmailService.send_company_invite(
             db=db,
             to_email=invite_data.email,
             company_name=invite_data.company_name,
-            registration_url=registration_url,
-            inviter_name=inviter_name if inviter_name != admin.username else None
+            registration_url=_registration_url(),
+            inviter_name=_inviter_name(admin)
         )
         
         if not email_sent:
@@ -731,3 +766,98 @@ async def invite_company(
             status_code=500,
             detail=f"Failed to send invitation: {str(e)}"
         )
+
+
+@router.post(
+    "/invite/bulk",
+    summary="Invite companies in bulk (Admin)",
+    description="Queue invitation emails to many companies at once"
+)
+async def invite_companies_bulk(
+    invite_data: CompanyBulkInviteRequest,
+    admin: AdminUser = Depends(require_role(AdminRole.ADMIN)),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Queue invitation emails to many companies at once.
+    
+    **Admin only** - Requires admin role.
+    
+    Emails that already belong to a company, and duplicates within the
+    request, are skipped. The rest are sent by the background worker;
+    poll ``GET /invite/bulk/{job_id}`` for progress.
+    """
+    logger.info(f"Admin {admin.username} inviting {len(invite_data.invites)} companies")
+    
+    invites = {}
+    for invite in invite_data.invites:
+        invites.setdefault(invite.email.lower(), invite)
+    
+    result = await db.execute(
+        select(Company.rep_email).where(func.lower(Company.rep_email).in_(list(invites)))
+    )
+    existing = {email.lower() for email in result.scalars().all()}
+    
+    to_send = [
+        [invite.email, invite.company_name]
+        for email, invite in invites.items()
+        if email not in existing
+    ]
+    
+    job = None
+    if to_send:
+        job = await JobQueueService.enqueue(
+            db,
+            COMPANY_INVITES,
+            payload={
+                "invites": to_send,
+                "registration_url": _registration_url(),
+                "inviter_name": _inviter_name(admin),
+            },
+            reference_id=f"admin:{admin.id}",
+        )
+    
+    return {
+        "success": True,
+        "message": f"Queued {len(to_send)} invitations",
+        "job_id": job.id if job else None,
+        "status": job.status if job else JobStatus.SUCCEEDED.value,
+        "queued": len(to_send),
+        "skipped_existing": len(existing),
+        "skipped_duplicates": len(invite_data.invites) - len(invites),
+    }
+
+
+@router.get(
+    "/invite/bulk/{job_id}",
+    summary="Get bulk invite status (Admin)",
+    description="Progress of a queued bulk invitation job"
+)
+async def get_bulk_invite_status(
+    job_id: int,
+    admin: AdminUser = Depends(require_role(AdminRole.ADMIN)),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Status of a bulk invitation job.
+    
+    **Admin only** - Requires admin role.
+    
+    ``sent`` and ``refused`` list the recipients handled so far (also for a
+    job that is being retried or has failed).
+    """
+    job = await db.get(BackgroundJob, job_id)
+    if not job or job.job_type != COMPANY_INVITES:
+        raise HTTPException(status_code=404, detail="Invite job not found")
+    
+    result = job.result or {}
+    progress = result.get("checkpoint", result)
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "total": len((job.payload or {}).get("invites", [])),
+        "sent": progress.get("sent", []),
+        "refused": progress.get("refused", []),
+        "attempts": job.attempts,
+        "error": job.last_error,
+    }
@@ -5,6 +5,8 @@ Admin-only endpoints for dashboard and analytics
 """
 
 import logging
+import os
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
@@ -13,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.dependencies import get_current_admin
 from backend.core.exceptions import EagleChairException
 from backend.database.base import get_db
+from backend.database.pool import pool_plan, pool_status
 from backend.models.company import AdminUser
 from backend.services.analytics_service import AnalyticsService
 
@@ -112,12 +115,13 @@ async def get_quote_trends(
     description="Calculate various conversion rates"
 )
 async def get_conversion_rates(
+    days: Optional[int] = Query(None, ge=1, le=3650, description="Only quotes from the last N days (default: all time)"),
     admin: AdminUser = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """Get quote conversion rates"""
     try:
-        rates = await AnalyticsService.get_conversion_rates(db=db)
+        rates = await AnalyticsService.get_conversion_rates(db=db, days=days)
         return rates
     except Exception as e:
         logger.error(f"Error fetching conversion rates: {e}")
@@ -132,12 +136,13 @@ async def get_conversion_rates(
 async def get_top_customers(
     limit: int = Query(10, ge=1, le=50),
     by: str = Query("quote_count", regex="^(quote_count|total_value|accepted_quotes)$"),
+    days: Optional[int] = Query(None, ge=1, le=3650, description="Only quotes from the last N days (default: all time)"),
     admin: AdminUser = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """Get top customers by specified metric"""
     try:
-        customers = await AnalyticsService.get_top_customers(db=db, limit=limit, by=by)
+        customers = await AnalyticsService.get_top_customers(db=db, limit=limit, by=by, days=days)
         return {"items": customers}
     except Exception as e:
         logger.error(f"Error fetching top customers: {e}")
@@ -150,13 +155,53 @@ async def get_top_customers(
     description="Calculate average quote values"
 )
 async def get_average_values(
+    days: Optional[int] = Query(None, ge=1, le=3650, description="Only quotes from the last N days (default: all time)"),
     admin: AdminUser = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """Get average quote values"""
     try:
-        averages = await AnalyticsService.get_average_quote_value(db=db)
+        averages = await AnalyticsService.get_average_quote_value(db=db, days=days)
         return averages
     except Exception as e:
         logger.error(f"Error fetching average values: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch average values") from e
+
+
+@router.get(
+    "/analytics/response-time",
+    summary="Get quote response times (Admin)",
+    description="Hours from quote submission to first pricing"
+)
+async def get_response_time(
+    days: Optional[int] = Query(None, ge=1, le=3650, description="Only quotes from the last N days (default: all time)"),
+    admin: AdminUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get quote response time metrics"""
+    try:
+        return await AnalyticsService.get_quote_response_time(db=db, days=days)
+    except Exception as e:
+        logger.error(f"Error fetching response times: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch response times") from e
+
+
+@router.get(
+    "/system/db-pool",
+    summary="Get database pool metrics (Admin)",
+    description="Connection pool sizing plan and live pool metrics of the worker serving the request"
+)
+async def get_db_pool_metrics(
+    admin: AdminUser = Depends(get_current_admin)
+):
+    """
+    Get the pool plan and per-engine pool metrics.
+
+    Metrics are per process: each gunicorn worker has its own pools, so
+    repeated calls may be answered by different workers (see ``pid``).
+    """
+    return {
+        "pid": os.getpid(),
+        "plan": pool_plan().as_dict(),
+        "pools": pool_status(),
+    }
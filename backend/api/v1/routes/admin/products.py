@@ -6,9 +6,17 @@ Admin-only endpoints for product management
 
 import json
 import logging
+from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+)
 from fastapi.responses import JSONResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +29,7 @@ from backend.api.v1.schemas.admin import (
 )
 from backend.api.v1.schemas.common import MessageResponse
 from backend.api.v1.schemas.product import ChairResponse
+from backend.core.config import settings
 from backend.core.exceptions import ResourceNotFoundError, ValidationError
 from backend.database.base import get_db
 from backend.models.chair import Chair as Product
@@ -31,7 +40,17 @@ from backend.models.chair import (
     chair_subcategories,
 )
 from backend.models.company import AdminRole, AdminUser
+from backend.models.tmp_catalog import ProductImportJob
 from backend.services.admin_service import AdminService
+from backend.services.category_tree_service import refresh_category_tree
+from backend.services.export_service import ExportService, products_export
+from backend.services.family_index_service import refresh_family_index_for_product
+from backend.services.job_queue_service import PRODUCT_IMPORT, JobQueueService
+from backend.services.product_import_service import (
+    SUPPORTED_FORMATS,
+    check_upsert_support,
+    detect_format,
+)
 from backend.utils.serializers import orm_list_to_dict_list, orm_to_dict
 
 logger = logging.getLogger(__name__)
@@ -186,6 +205,34 @@ async def get_all_products(
     return response_data
 
 
+@router.get(
+    "/export",
+    summary="Export products (Admin)",
+    description="Stream all products matching the list filters as CSV or Parquet",
+)
+async def export_products(
+    format: str = Query("csv", pattern="^(csv|parquet)$", description="File format: csv, parquet (requires pyarrow)"),
+    search: Optional[str] = Query(None, description="Search term"),
+    category_id: Optional[int] = Query(None, description="Filter by category"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    sort_by: Optional[str] = Query(None, description="Sort by any exported column"),
+    sort_dir: Optional[str] = Query("asc", description="Sort direction: asc, desc"),
+    admin: AdminUser = Depends(get_current_admin),
+):
+    """
+    Export products without pagination.
+
+    **Admin only** - Requires admin authentication.
+    """
+    ExportService.check_format(format)
+    logger.info(f"Admin {admin.username} exporting products as {format}")
+
+    columns, stmt = products_export(
+        search=search, category_id=category_id, is_active=is_active, sort_by=sort_by, sort_dir=sort_dir
+    )
+    return ExportService.streaming_response("products", format, columns, stmt)
+
+
 @router.post("", summary="Create product (Admin)", description="Create a new product")
 async def create_product(
     product_data: ProductCreate,
@@ -207,6 +254,8 @@ async def create_product(
         from backend.services.cache_service import cache_service
 
         await cache_service.invalidate_all_products()
+        await refresh_category_tree(db, "counts")
+        await refresh_family_index_for_product(db, product.id)
 
         product_dict = orm_to_dict(product)
         await _add_category_assignments(db, [product_dict], [product.id])
@@ -217,6 +266,136 @@ async def create_product(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+# ============================================================================
+# Bulk Import / Update
+# ============================================================================
+
+BULK_IMPORT_DIR = Path(settings.FRONTEND_PATH) / "tmp" / "imports"
+MAX_BULK_IMPORT_SIZE = 200 * 1024 * 1024  # 200MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _import_job_to_dict(job: ProductImportJob) -> dict:
+    return {
+        "job_id": job.job_id,
+        "filename": job.filename,
+        "format": job.file_format,
+        "status": job.status,
+        "progress": job.progress_percentage,
+        "current_step": job.current_step,
+        "total_rows": job.total_rows,
+        "rows_processed": job.rows_processed,
+        "rows_failed": job.rows_failed,
+        "products_created": job.products_created,
+        "products_updated": job.products_updated,
+        "variations_upserted": job.variations_upserted,
+        "errors": job.row_errors or [],
+        "error_message": job.error_message,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+
+
+@router.post(
+    "/bulk",
+    status_code=202,
+    summary="Bulk import/update products (Admin)",
+    description="Upload an NDJSON or CSV file of products to create or update in the background",
+)
+async def bulk_import_products(
+    file: UploadFile = File(..., description="NDJSON (.ndjson/.jsonl) or CSV file"),
+    file_format: Optional[str] = Query(
+        None, alias="format", description="ndjson or csv (inferred from the file name when omitted)"
+    ),
+    admin: AdminUser = Depends(require_role(AdminRole.ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Bulk create/update products, variations and category assignments.
+
+    **Admin only** - Requires admin role.
+
+    Each row is one product matched on `slug` and may carry any product
+    field, `category_ids` / `subcategory_ids` / `secondary_family_ids` and a
+    `variations` list (upserted by SKU). CSV list columns accept JSON or
+    `1|2|3`. Rows are validated while the file is streamed and written in
+    batches by the background worker; poll `/bulk/{job_id}` for progress and
+    per-row errors.
+    """
+    filename = Path(file.filename or "").name
+    file_format = (file_format or detect_format(filename) or "").lower()
+    if file_format not in SUPPORTED_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported import format. Use one of: {', '.join(SUPPORTED_FORMATS)}",
+        )
+    # Fail before anything is staged rather than in the worker
+    check_upsert_support(db.get_bind().dialect.name)
+
+    logger.info(f"Admin {admin.username} starting bulk product import: {filename}")
+
+    job = ProductImportJob(
+        filename=filename or f"import.{file_format}",
+        file_format=file_format,
+        uploaded_by=admin.email,
+    )
+    db.add(job)
+    await db.flush()
+
+    BULK_IMPORT_DIR.mkdir(parents=True, exist_ok=True)
+    file_path = BULK_IMPORT_DIR / f"{job.job_id}.{file_format}"
+
+    # Stream the upload to disk instead of holding it in memory
+    size = 0
+    with open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_BULK_IMPORT_SIZE:
+                buffer.close()
+                file_path.unlink(missing_ok=True)
+                await db.rollback()
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"File too large. Maximum size: {MAX_BULK_IMPORT_SIZE // (1024 * 1024)}MB",
+                )
+            buffer.write(chunk)
+
+    job.file_size = size
+    job.file_path = str(file_path)
+    await JobQueueService.enqueue(
+        db, PRODUCT_IMPORT, payload={"job_id": job.job_id}, reference_id=job.job_id, commit=False
+    )
+    await db.commit()
+
+    return _import_job_to_dict(job)
+
+
+@router.get(
+    "/bulk/{job_id}",
+    summary="Get bulk import status (Admin)",
+    description="Progress, counts and row errors of a bulk product import",
+)
+async def get_bulk_import_status(
+    job_id: str,
+    admin: AdminUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the status of a bulk product import job.
+
+    **Admin only** - Requires admin authentication.
+    """
+    result = await db.execute(
+        select(ProductImportJob).where(ProductImportJob.job_id == job_id)
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Import job {job_id} not found")
+
+    return _import_job_to_dict(job)
+
+
 @router.get(
     "/{product_id}",
     summary="Get product by ID (Admin)",
@@ -311,6 +490,8 @@ async def update_product(
         from backend.services.cache_service import cache_service
 
         await cache_service.invalidate_product(product_id)
+        await refresh_category_tree(db, "counts")
+        await refresh_family_index_for_product(db, product_id)
 
         product_dict = orm_to_dict(product)
         await _add_category_assignments(db, [product_dict], [product.id])
@@ -347,6 +528,8 @@ async def delete_product(
         from backend.services.cache_service import cache_service
 
         await cache_service.invalidate_product(product_id)
+        await refresh_category_tree(db, "counts")
+        await refresh_family_index_for_product(db, product_id)
 
         return MessageResponse(
             message=f"Product {product_id} has been {'permanently deleted' if hard else 'deleted'} successfully"
@@ -449,6 +632,7 @@ async def create_product_variation(
     await db.refresh(variation)
 
     await cache_service.invalidate_product(product_id)
+    await refresh_family_index_for_product(db, product_id)
 
     logger.info(
         f"Created variation {variation.id} ({sku}) for product {product.name}"
@@ -520,6 +704,7 @@ async def update_product_variation(
     await db.refresh(variation)
 
     await cache_service.invalidate_product(product_id)
+    await refresh_family_index_for_product(db, product_id)
 
     return orm_to_dict(variation)
 
@@ -580,6 +765,7 @@ async def delete_product_variation(
     await db.commit()
 
     await cache_service.invalidate_product(product_id)
+    await refresh_family_index_for_product(db, product_id)
 
     return MessageResponse(
         message=f"Variation {variation_id} has been {'permanently deleted' if hard_delete else 'deactivated'}"
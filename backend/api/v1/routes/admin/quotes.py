@@ -27,6 +27,7 @@ from backend.database.base import get_db
 from backend.models.company import AdminRole, AdminUser
 from backend.models.quote import Quote, QuoteItem, QuoteShippingDestination, QuoteItemAllocation, QuoteStatus
 from backend.services.admin_service import AdminService
+from backend.services.export_service import ExportService, quotes_export
 from backend.utils.serializers import orm_to_dict
 
 logger = logging.getLogger(__name__)
@@ -125,6 +126,31 @@ async def get_all_quotes(
     return response_data
 
 
+@router.get(
+    "/export",
+    summary="Export quotes (Admin)",
+    description="Stream all quotes matching the list filters as CSV or Parquet",
+)
+async def export_quotes(
+    format: str = Query("csv", pattern="^(csv|parquet)$", description="File format: csv, parquet (requires pyarrow)"),
+    status: Optional[QuoteStatus] = Query(None, description="Filter by status"),
+    company_id: Optional[int] = Query(None, description="Filter by company"),
+    sort_by: Optional[str] = Query(None, description="Sort by any exported column"),
+    sort_dir: Optional[str] = Query("desc", description="Sort direction: asc, desc"),
+    admin: AdminUser = Depends(get_current_admin),
+):
+    """
+    Export quotes without pagination.
+
+    **Admin only** - Requires admin authentication.
+    """
+    ExportService.check_format(format)
+    logger.info(f"Admin {admin.username} exporting quotes as {format}")
+
+    columns, stmt = quotes_export(status=status, company_id=company_id, sort_by=sort_by, sort_dir=sort_dir)
+    return ExportService.streaming_response("quotes", format, columns, stmt)
+
+
 @router.get(
     "/{quote_id}",
     summary="Get quote by ID (Admin)",
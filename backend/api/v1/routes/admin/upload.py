@@ -4,6 +4,7 @@ Upload Routes - API v1
 Handles file uploads (images, documents, etc.)
 """
 
+import asyncio
 import io
 import logging
 import mimetypes
@@ -12,11 +13,15 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from PIL import Image
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.dependencies import get_current_admin
 from backend.core.config import settings
+from backend.database.base import get_db
+from backend.models.job import JobStatus
+from backend.services.image_index_service import ImageIndexService
+from backend.services.job_queue_service import IMAGE_INDEX, JobQueueService
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +178,8 @@ def process_image_to_webp(content: bytes, mime_type: str) -> tuple[bytes, str]:
         ext = ".svg" if mime_type == "image/svg+xml" else ".gif"
         return content, ext
 
+    from PIL import Image
+
     try:
         img = Image.open(io.BytesIO(content))
 
@@ -215,6 +222,17 @@ class DeleteImageRequest(BaseModel):
     url: str
 
 
+async def _enqueue_image_index(db: AsyncSession, upload_dir: Path, subfolder: str) -> None:
+    """Fingerprint the rest of the subfolder in the worker, unless a job is already pending"""
+    reference = f"images/{subfolder}"
+    latest = await JobQueueService.get_latest_for_reference(db, reference, IMAGE_INDEX)
+    if latest and latest.status in (JobStatus.QUEUED.value, JobStatus.RUNNING.value):
+        return
+    await JobQueueService.enqueue(
+        db, IMAGE_INDEX, payload={"folder": str(upload_dir)}, reference_id=reference
+    )
+
+
 @router.post(
     "/image",
     summary="Upload an image",
@@ -223,6 +241,8 @@ class DeleteImageRequest(BaseModel):
 async def upload_image(
     file: UploadFile = File(...),
     subfolder: str = Form("products"),
+    allow_duplicate: bool = Form(False),
+    db: AsyncSession = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """
@@ -233,6 +253,12 @@ async def upload_image(
     - **file**: The image file to upload
     - **subfolder**: Subfolder to organize images (e.g., 'products', 'team', 'hero')
     - **filename**: Optional custom filename (will be sanitized)
+    - **allow_duplicate**: Store the file even if an identical image is already in the subfolder
+    
+    If a file with identical (processed) bytes is already in the subfolder it
+    is returned instead of storing another copy (``duplicate: true``). A
+    visually similar image is only reported as ``possible_duplicate``; the
+    upload is stored either way.
     """
     try:
         content = await file.read()
@@ -280,6 +306,34 @@ async def upload_image(
         if not str(upload_dir_resolved).startswith(str(base_resolved)):
             raise HTTPException(status_code=400, detail="Invalid upload path")
 
+        fingerprint = None
+        possible_duplicate = None
+        if file_ext != ".svg":
+            check = await asyncio.to_thread(
+                ImageIndexService.check_duplicate, processed_content, upload_dir
+            )
+            fingerprint = check.fingerprint
+            if check.identical and not allow_duplicate:
+                existing = check.identical
+                logger.info(
+                    f"Image upload matched existing /uploads/images/{subfolder}/{existing.name} "
+                    f"by admin {current_admin.id}"
+                )
+                return {
+                    "success": True,
+                    "url": f"/uploads/images/{subfolder}/{existing.name}",
+                    "filename": existing.name,
+                    "size": existing.stat().st_size,
+                    "original_size": len(content),
+                    "duplicate": True,
+                    "possible_duplicate": None,
+                    "message": "An identical image was already uploaded"
+                }
+            if check.similar:
+                possible_duplicate = f"/uploads/images/{subfolder}/{check.similar.name}"
+            if check.unindexed:
+                await _enqueue_image_index(db, upload_dir, subfolder)
+
         timestamp = int(time.time())
         filename = f"{base_name}_{timestamp}{file_ext}"
 
@@ -289,6 +343,7 @@ async def upload_image(
         # Write processed file
         with open(file_path, "wb") as f:
             f.write(processed_content)
+        await asyncio.to_thread(ImageIndexService.record, file_path, fingerprint)
 
         original_kb = len(content) // 1024
         processed_kb = len(processed_content) // 1024
@@ -306,6 +361,8 @@ async def upload_image(
             "filename": filename,
             "size": len(processed_content),
             "original_size": len(content),
+            "duplicate": False,
+            "possible_duplicate": possible_duplicate,
             "message": "Image uploaded successfully"
         }
         
@@ -12,7 +12,6 @@ from typing import Optional
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     File,
     HTTPException,
@@ -25,8 +24,8 @@ from sqlalchemy.orm import Session, joinedload
 
 from backend.api.dependencies import get_current_admin
 from backend.core.config import settings
+from backend.core.exceptions import BusinessLogicError
 from backend.database.base import get_db
-from backend.models.chair import Chair, ProductFamily, ProductImage, ProductVariation
 from backend.models.tmp_catalog import (
     CatalogUpload,
     TmpChair,
@@ -34,8 +33,14 @@ from backend.models.tmp_catalog import (
     TmpProductImage,
     TmpProductVariation,
 )
+from backend.services.catalog_import_service import CatalogImportService
 from backend.services.cleanup_service import cleanup_service
-from backend.services.pdf_parser_service import CatalogParserService
+from backend.services.job_queue_service import (
+    CATALOG_IMPORT,
+    CATALOG_PARSE,
+    CLEANUP,
+    JobQueueService,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Admin - Virtual Catalog"])
@@ -57,7 +62,6 @@ TMP_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
     summary="Upload PDF Catalog"
 )
 async def upload_catalog(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="PDF catalog file"),
     max_pages: Optional[int] = Query(None, description="Limit parsing to N pages (for testing)"),
     db: Session = Depends(get_db),
@@ -69,7 +73,7 @@ async def upload_catalog(
     - **Admin only**
     - Accepts PDF files up to 1GB
     - Returns upload_id for tracking parse progress
-    - Parsing happens asynchronously in background
+    - Parsing runs in the background worker (`python -m backend.worker`)
     """
     # Validate filename exists
     if not file.filename:
@@ -147,21 +151,25 @@ async def upload_catalog(
         with open(file_path, "wb") as buffer:
             buffer.write(content)
         
-        # Update file size
+        # Update file size and queue parsing in the same transaction
         file_size = len(content)
         upload_record.file_size = file_size
         upload_record.file_path = str(file_path)
+        upload_record.current_step = 'Queued for parsing'
+        await JobQueueService.enqueue(
+            db,
+            CATALOG_PARSE,
+            payload={
+                "upload_id": upload_id,
+                "file_path": str(file_path),
+                "max_pages": max_pages,
+            },
+            reference_id=upload_id,
+            commit=False,
+        )
         await db.commit()
         
-        logger.info(f"File saved ({file_size} bytes), starting background parsing for {upload_id}")
-        
-        # Start parsing in background
-        background_tasks.add_task(
-            parse_catalog_background,
-            upload_id=upload_id,
-            file_path=str(file_path),
-            max_pages=max_pages
-        )
+        logger.info(f"File saved ({file_size} bytes), queued parsing for {upload_id}")
         
         return {
             "success": True,
@@ -169,7 +177,7 @@ async def upload_catalog(
             "filename": file.filename,
             "file_size": file_size,
             "status": "parsing",
-            "message": "File uploaded successfully, parsing started in background. Use /upload/{upload_id}/status to check progress."
+            "message": "File uploaded successfully, parsing queued. Use /upload/{upload_id}/status to check progress."
         }
     
     except Exception as e:
@@ -184,51 +192,6 @@ async def upload_catalog(
         )
 
 
-def parse_catalog_background(upload_id: str, file_path: str, max_pages: Optional[int] = None):
-    """
-    Background task for parsing catalog
-    Runs independently with its own DB session
-    """
-    from backend.database.base import SessionLocal
-    
-    db = SessionLocal()
-    try:
-        logger.info(f"Background parsing started for upload {upload_id}")
-        
-        # Get upload record
-        upload_record = db.query(CatalogUpload).filter(
-            CatalogUpload.upload_id == upload_id
-        ).first()
-        
-        if not upload_record:
-            logger.error(f"Upload record {upload_id} not found")
-            return
-        
-        # Parse catalog
-        parser = CatalogParserService(db, tmp_images_dir=str(TMP_IMAGES_DIR))
-        results = parser.parse_catalog(file_path, upload_record, max_pages=max_pages)
-        
-        logger.info(f"Background parsing completed for {upload_id}: {results}")
-        
-    except Exception as e:
-        logger.error(f"Background parsing failed for {upload_id}: {e}", exc_info=True)
-        
-        # Update status to failed
-        try:
-            upload_record = db.query(CatalogUpload).filter(
-                CatalogUpload.upload_id == upload_id
-            ).first()
-            if upload_record:
-                upload_record.status = 'failed'
-                upload_record.error_message = str(e)
-                db.commit()
-        except Exception as db_error:
-            logger.error(f"Failed to update error status: {db_error}")
-    
-    finally:
-        db.close()
-
-
 @router.get(
     "/uploads/recent",
     summary="List Recent Uploads"
@@ -294,6 +257,8 @@ async def get_upload_status(
             detail="Upload not found"
         )
     
+    job = await JobQueueService.get_latest_for_reference(db, upload_id)
+    
     return {
         "upload_id": upload.upload_id,
         "filename": upload.filename,
@@ -310,6 +275,13 @@ async def get_upload_status(
         "started_at": upload.started_at,
         "completed_at": upload.completed_at,
         "error_message": upload.error_message,
+        "job": {
+            "id": job.id,
+            "type": job.job_type,
+            "status": job.status,
+            "attempts": job.attempts,
+            "last_error": job.last_error,
+        } if job else None,
     }
 
 
@@ -766,172 +738,59 @@ async def update_tmp_product(
 )
 async def import_to_production(
     upload_id: str,
+    background: bool = Query(False, description="Queue the import for the background worker"),
     db: Session = Depends(get_db),
     admin = Depends(get_current_admin)
 ):
     """
     Import reviewed temporary data into production tables
     Moves tmp_* records to actual Chair, ProductFamily, etc.
-    """
-    # Get all tmp families for this upload
-    stmt = select(TmpProductFamily).where(
-        TmpProductFamily.upload_id == upload_id,
-        TmpProductFamily.import_status == 'approved'
-    )
-    result = await db.execute(stmt)
-    tmp_families = result.scalars().all()
     
-    if not tmp_families:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No approved families found for this upload"
+    With `background=true` the import is queued and progress is reported via
+    the upload status endpoint (`current_step`).
+    """
+    if background:
+        result = await db.execute(
+            select(CatalogUpload).where(CatalogUpload.upload_id == upload_id)
         )
-    
-    imported_counts = {
-        'families': 0,
-        'products': 0,
-        'variations': 0,
-        'images': 0,
-    }
-
-    # Pre-flight duplicate-SKU check: collect every variation SKU that would be
-    # inserted by this import and make sure none of them already exist in
-    # production. Doing this before any writes avoids an IntegrityError midway
-    # through the import rolling back the whole batch.
-    incoming_skus = []
-    for tmp_family in tmp_families:
-        for tmp_product in tmp_family.products:
-            if tmp_product.import_status != 'approved':
-                continue
-            for tmp_var in tmp_product.variations:
-                if tmp_var.sku:
-                    incoming_skus.append(tmp_var.sku)
-
-    if incoming_skus:
-        dup_stmt = select(ProductVariation.sku).where(ProductVariation.sku.in_(incoming_skus))
-        dup_result = await db.execute(dup_stmt)
-        conflicting_skus = sorted({row[0] for row in dup_result.all()})
-        if conflicting_skus:
+        upload = result.scalar_one_or_none()
+        if not upload:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=(
-                    "Cannot import: the following SKUs already exist in production: "
-                    f"{', '.join(conflicting_skus)}"
-                ),
-            )
-
-    try:
-        for tmp_family in tmp_families:
-            # Create production family
-            family = ProductFamily(
-                name=tmp_family.name,
-                slug=tmp_family.slug,
-                description=tmp_family.description,
-                features=tmp_family.features,
-                wood_species=tmp_family.wood_species,
-                options=tmp_family.options,
-                environmental_info=tmp_family.environmental_info,
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Upload not found"
             )
-            db.add(family)
-            await db.flush()
-            imported_counts['families'] += 1
-
-            # Import products
-            for tmp_product in tmp_family.products:
-                if tmp_product.import_status != 'approved':
-                    continue
-
-                # Chair.category_id and Chair.base_price are NOT NULL - resolve
-                # from the product's tmp category, falling back to the family's.
-                category_id = tmp_product.category_id or tmp_family.category_id
-                if category_id is None:
-                    raise ValueError(
-                        f"Product '{tmp_product.name}' (model {tmp_product.model_number}) "
-                        "has no category assigned - assign a category before importing."
-                    )
-
-                product = Chair(
-                    family_id=family.id,
-                    category_id=category_id,
-                    subcategory_id=tmp_product.subcategory_id,
-                    model_number=tmp_product.model_number,
-                    name=tmp_product.name,
-                    slug=tmp_product.slug,
-                    short_description=tmp_product.short_description,
-                    full_description=tmp_product.full_description,
-                    base_price=tmp_product.base_price or 0,
-                    height=tmp_product.height,
-                    width=tmp_product.width,
-                    depth=tmp_product.depth,
-                    weight=tmp_product.weight,
-                    frame_material=tmp_product.frame_material,
-                    stock_status=tmp_product.stock_status,
-                    primary_image_url=tmp_product.primary_image_url,
-                )
-                db.add(product)
-                await db.flush()
-                imported_counts['products'] += 1
-
-                # Import variations
-                for tmp_var in tmp_product.variations:
-                    variation = ProductVariation(
-                        product_id=product.id,
-                        sku=tmp_var.sku,
-                        price_adjustment=tmp_var.price_adjustment,
-                        stock_status=tmp_var.stock_status,
-                        is_available=tmp_var.is_available,
-                    )
-                    db.add(variation)
-                    imported_counts['variations'] += 1
-
-                # Import images. `tmp_product.images` is a JSON array of URL
-                # strings (not TmpProductImage rows), and ProductImage has no
-                # `is_primary` column - the primary image lives on
-                # Chair.primary_image_url instead (set above).
-                image_urls = tmp_product.images if isinstance(tmp_product.images, list) else []
-                for image_url in image_urls:
-                    if not image_url:
-                        continue
-                    image = ProductImage(
-                        product_id=product.id,
-                        image_url=image_url,
-                        image_type="gallery",
-                    )
-                    db.add(image)
-                    imported_counts['images'] += 1
-
-                # Mark tmp product as imported
-                tmp_product.import_status = 'imported'
-
-            # Mark tmp family as imported
-            tmp_family.import_status = 'imported'
-
-        await db.commit()
-
-        # Update upload record
-        stmt = select(CatalogUpload).where(
-            CatalogUpload.upload_id == upload_id
+        
+        upload.current_step = 'Queued for import'
+        job = await JobQueueService.enqueue(
+            db, CATALOG_IMPORT, payload={"upload_id": upload_id}, reference_id=upload_id, commit=False
         )
-        result = await db.execute(stmt)
-        upload = result.scalar_one_or_none()
-
-        if upload:
-            upload.status = 'imported'
-
         await db.commit()
-
+        
         return {
             "success": True,
-            "message": "Import completed successfully",
-            "imported": imported_counts
+            "message": "Import queued",
+            "job_id": job.id,
+            "status": "queued"
         }
-
+    
+    try:
+        imported_counts = await CatalogImportService.import_upload(db, upload_id)
+    except BusinessLogicError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message
+        )
     except Exception as e:
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Import failed: {str(e)}"
         )
+    
+    return {
+        "success": True,
+        "message": "Import completed successfully",
+        "imported": imported_counts
+    }
 
 
 @router.delete(
@@ -1080,6 +939,7 @@ async def delete_upload_session(
 )
 async def cleanup_expired_data(
     include_orphaned: bool = Query(True, description="Also cleanup orphaned files"),
+    background: bool = Query(False, description="Queue the cleanup for the background worker"),
     db: Session = Depends(get_db),
     admin = Depends(get_current_admin)
 ):
@@ -1087,6 +947,12 @@ async def cleanup_expired_data(
     Remove expired temporary data (files and database records)
     Optionally also removes orphaned files without DB records
     """
+    if background:
+        job = await JobQueueService.enqueue(
+            db, CLEANUP, payload={"include_orphaned": include_orphaned}
+        )
+        return {"success": True, "job_id": job.id, "status": "queued"}
+    
     try:
         # Run cleanup using the service
         expired_stats = await cleanup_service.cleanup_expired_data(db)
@@ -25,11 +25,12 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import PlainTextResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.api.http_cache import ConditionalRoute, conditional_get
 from backend.api.v1.schemas.content import (
     ClientLogoResponse,
     CompanyMilestoneResponse,
@@ -42,7 +43,7 @@ from backend.api.v1.schemas.content import (
     SalesRepresentativeResponse,
 )
 from backend.api.v1.schemas.product import ChairResponse
-from backend.database.base import get_db
+from backend.database.base import get_read_db
 from backend.models.chair import Chair
 from backend.models.content import (
     ClientLogo,
@@ -57,10 +58,14 @@ from backend.models.content import (
 )
 from backend.models.legal import LegalDocument, ShippingPolicy, WarrantyInformation
 from backend.services.default_content_service import default_content
+from backend.utils.precompressed import precompressed_response
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["CMS Content"])
+router = APIRouter(tags=["CMS Content"], route_class=ConditionalRoute)
+
+CONTENT_DATA_MEDIA_TYPE = "application/javascript"
+CONTENT_DATA_HEADERS = {"Cache-Control": "no-cache, must-revalidate, max-age=0"}
 
 
 # ============================================================================
@@ -69,10 +74,11 @@ router = APIRouter(tags=["CMS Content"])
 
 @router.get(
     "/site-settings",
+    dependencies=[conditional_get(SiteSettings)],
     summary="Get site settings",
     description="Retrieve global site settings (company info, contact, social links)"
 )
-async def get_site_settings(db: AsyncSession = Depends(get_db)):
+async def get_site_settings(db: AsyncSession = Depends(get_read_db)):
     """
     Get site settings.
     
@@ -129,11 +135,12 @@ async def get_site_settings(db: AsyncSession = Depends(get_db)):
 
 @router.get(
     "/hero-slides",
+    dependencies=[conditional_get(HeroSlide)],
     response_model=list[HeroSlideResponse],
     summary="Get hero slides",
     description="Retrieve all active hero slides for homepage carousel"
 )
-async def get_hero_slides(db: AsyncSession = Depends(get_db)):
+async def get_hero_slides(db: AsyncSession = Depends(get_read_db)):
     """
     Get all active hero slides ordered by display order.
     
@@ -187,13 +194,14 @@ async def get_hero_slides(db: AsyncSession = Depends(get_db)):
 
 @router.get(
     "/features",
+    dependencies=[conditional_get(Feature)],
     response_model=list[FeatureResponse],
     summary="Get features",
     description="Retrieve features/benefits (Why Choose Us section)"
 )
 async def get_features(
     type: Optional[str] = Query(None, description="Filter by feature type"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all active features.
@@ -251,11 +259,12 @@ async def get_features(
 
 @router.get(
     "/client-logos",
+    dependencies=[conditional_get(ClientLogo)],
     response_model=list[ClientLogoResponse],
     summary="Get client logos",
     description="Retrieve client/partner logos for display"
 )
-async def get_client_logos(db: AsyncSession = Depends(get_db)):
+async def get_client_logos(db: AsyncSession = Depends(get_read_db)):
     """
     Get all active client logos.
     
@@ -288,11 +297,12 @@ async def get_client_logos(db: AsyncSession = Depends(get_db)):
 
 @router.get(
     "/company-values",
+    dependencies=[conditional_get(CompanyValue)],
     response_model=list[CompanyValueResponse],
     summary="Get company values",
     description="Retrieve company core values for About page"
 )
-async def get_company_values(db: AsyncSession = Depends(get_db)):
+async def get_company_values(db: AsyncSession = Depends(get_read_db)):
     """
     Get all active company values.
     
@@ -341,11 +351,12 @@ async def get_company_values(db: AsyncSession = Depends(get_db)):
 
 @router.get(
     "/company-milestones",
+    dependencies=[conditional_get(CompanyMilestone)],
     response_model=list[CompanyMilestoneResponse],
     summary="Get company milestones",
     description="Retrieve company history milestones for About page timeline"
 )
-async def get_company_milestones(db: AsyncSession = Depends(get_db)):
+async def get_company_milestones(db: AsyncSession = Depends(get_read_db)):
     """
     Get all active company milestones.
     
@@ -385,13 +396,14 @@ async def get_company_milestones(db: AsyncSession = Depends(get_db)):
 
 @router.get(
     "/sales-reps",
+    dependencies=[conditional_get(SalesRepresentative)],
     response_model=list[SalesRepresentativeResponse],
     summary="Get sales representatives",
     description="Retrieve sales representatives for Find a Rep page"
 )
 async def get_sales_reps(
     state: Optional[str] = Query(None, description="Filter by state code"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all active sales representatives.
@@ -436,13 +448,14 @@ async def get_sales_reps(
 
 @router.get(
     "/installations",
+    dependencies=[conditional_get(Installation)],
     response_model=list[InstallationListItemResponse],
     summary="Get installations",
     description="Retrieve installation gallery images"
 )
 async def get_installations(
     project_type: Optional[str] = Query(None, description="Filter by project type"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all active installations.
@@ -489,6 +502,7 @@ async def get_installations(
 
 @router.get(
     "/page-content/{page_slug}",
+    dependencies=[conditional_get(PageContent)],
     response_model=list[PageContentItemResponse],
     summary="Get page content",
     description="Retrieve all content sections for a specific page"
@@ -496,7 +510,7 @@ async def get_installations(
 async def get_page_content(
     page_slug: str,
     section_key: Optional[str] = Query(None, description="Filter by section key"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get page content sections.
@@ -579,13 +593,14 @@ async def get_page_content(
 
 @router.get(
     "/featured-products",
+    dependencies=[conditional_get(Chair)],
     response_model=list[ChairResponse],
     summary="Get featured products",
     description="Retrieve products marked as featured for homepage display"
 )
 async def get_featured_products(
     limit: int = Query(4, ge=1, le=20, description="Number of products to return"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get featured products.
@@ -629,10 +644,11 @@ async def get_featured_products(
 
 @router.get(
     "/legal-documents",
+    dependencies=[conditional_get(LegalDocument)],
     summary="Get legal documents",
     description="Retrieve all active legal documents from static export"
 )
-async def get_legal_documents(db: AsyncSession = Depends(get_db)):
+async def get_legal_documents(db: AsyncSession = Depends(get_read_db)):
     """
     Get all active legal documents.
     
@@ -668,10 +684,11 @@ async def get_legal_documents(db: AsyncSession = Depends(get_db)):
 
 @router.get(
     "/warranties",
+    dependencies=[conditional_get(WarrantyInformation)],
     summary="Get warranties",
     description="Retrieve all active warranty information from static export"
 )
-async def get_warranties(db: AsyncSession = Depends(get_db)):
+async def get_warranties(db: AsyncSession = Depends(get_read_db)):
     """
     Get all active warranties.
     
@@ -705,10 +722,11 @@ async def get_warranties(db: AsyncSession = Depends(get_db)):
 
 @router.get(
     "/shipping-policies",
+    dependencies=[conditional_get(ShippingPolicy)],
     summary="Get shipping policies",
     description="Retrieve all active shipping policies from static export"
 )
-async def get_shipping_policies(db: AsyncSession = Depends(get_db)):
+async def get_shipping_policies(db: AsyncSession = Depends(get_read_db)):
     """
     Get all active shipping policies.
     
@@ -748,13 +766,16 @@ async def get_shipping_policies(db: AsyncSession = Depends(get_db)):
     description="Serves the generated contentData.js file for development mode",
     include_in_schema=True
 )
-async def get_content_data_file():
+async def get_content_data_file(request: Request):
     """
     Serve the contentData.js file.
     
     This endpoint allows the frontend to fetch the static content file
     in development mode via API call. In production, the file should be
     served from the dist folder directly.
+
+    Sent as a file (from a pre-compressed .br/.gz sibling when one exists
+    and the client accepts it) and revalidated by ETag.
     
     Returns:
         JavaScript file content with all CMS data
@@ -766,15 +787,13 @@ async def get_content_data_file():
     dist_file = base_dir / "frontend" / "dist" / "data" / "contentData.js"
     if dist_file.exists():
         logger.debug(f"Serving contentData from dist: {dist_file}")
-        with open(dist_file, 'r', encoding='utf-8') as f:
-            return f.read()
+        return precompressed_response(request, dist_file, CONTENT_DATA_MEDIA_TYPE, CONTENT_DATA_HEADERS)
     
     # Check src folder (development)
     src_file = base_dir / "frontend" / "src" / "data" / "contentData.js"
     if src_file.exists():
         logger.debug(f"Serving contentData from src: {src_file}")
-        with open(src_file, 'r', encoding='utf-8') as f:
-            return f.read()
+        return precompressed_response(request, src_file, CONTENT_DATA_MEDIA_TYPE, CONTENT_DATA_HEADERS)
     
     # File not found - return empty default
     logger.warning("contentData.js not found, returning empty defaults")
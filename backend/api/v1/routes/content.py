@@ -17,16 +17,12 @@ links to company account if authenticated.
 """
 
 import logging
-from pathlib import Path
 from typing import Optional
 
-import fitz
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.api.v1.routes.admin.upload import UPLOAD_BASE_DIR
-
 from backend.api.dependencies import get_optional_company
 from backend.api.v1.schemas.common import MessageResponse
 from backend.api.v1.schemas.content import (
@@ -39,8 +35,15 @@ from backend.api.v1.schemas.content import (
     InstallationResponse,
     TeamMemberResponse,
 )
-from backend.database.base import get_db
+from backend.core.config import settings
+from backend.database.base import get_db, get_read_db
 from backend.models.company import Company
+from backend.services.catalog_thumbnail_service import (
+    DEFAULT_VARIANT,
+    PREVIEW_SUBDIR,
+    VARIANTS,
+    CatalogThumbnailService,
+)
 from backend.services.content_service import ContentService
 
 logger = logging.getLogger(__name__)
@@ -59,7 +62,7 @@ router = APIRouter(tags=["Content"])
     description="Retrieve all FAQ categories"
 )
 async def get_faq_categories(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all FAQ categories.
@@ -85,7 +88,7 @@ async def get_faq_categories(
 async def get_faqs(
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     search: Optional[str] = Query(None, description="Search in questions and answers"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all FAQs.
@@ -144,7 +147,7 @@ async def get_faq(
     description="Retrieve all team members"
 )
 async def get_team_members(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all team members.
@@ -169,7 +172,7 @@ async def get_team_members(
 )
 async def get_team_member(
     member_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific team member by ID.
@@ -197,7 +200,7 @@ async def get_team_member(
     description="Retrieve company/about us information"
 )
 async def get_company_info(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get company information.
@@ -234,7 +237,7 @@ async def get_company_info(
     description="Retrieve all contact locations"
 )
 async def get_contact_locations(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all contact locations.
@@ -259,7 +262,7 @@ async def get_contact_locations(
 )
 async def get_contact_location(
     location_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific contact location by ID.
@@ -287,7 +290,7 @@ async def get_contact_location(
     description="Retrieve all available catalogs"
 )
 async def get_catalogs(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all catalogs.
@@ -312,7 +315,7 @@ async def get_catalogs(
 )
 async def get_catalog(
     catalog_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific catalog by ID.
@@ -332,55 +335,55 @@ async def get_catalog(
 @router.get(
     "/catalogs/{catalog_id}/pdf-thumbnail",
     summary="Get PDF first page as thumbnail",
-    description="Renders the first page of a catalog PDF as an image when no cover image exists"
+    description="Serves a pre-rendered WebP of the first page of a catalog PDF when no cover image exists"
 )
 async def get_catalog_pdf_thumbnail(
     catalog_id: int,
+    size: str = Query(DEFAULT_VARIANT, description=f"Preview variant: {', '.join(VARIANTS)}"),
     if_none_match: str | None = Header(None, alias="If-None-Match"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
+    if size not in VARIANTS:
+        raise HTTPException(status_code=400, detail=f"Unknown size. Use one of: {', '.join(VARIANTS)}")
     catalog = await ContentService.get_catalog_by_id(db=db, catalog_id=catalog_id)
     file_url = catalog.file_url or ""
     if not file_url.lower().endswith(".pdf"):
         raise HTTPException(status_code=404, detail="Catalog is not a PDF")
     if file_url.startswith("http"):
         raise HTTPException(status_code=404, detail="External PDF URLs not supported for thumbnail")
-    filename = Path(file_url).name
-    file_path = UPLOAD_BASE_DIR / "documents" / "catalogs" / filename
+    file_path = CatalogThumbnailService.pdf_path_for_url(file_url)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="PDF file not found")
-    mtime = file_path.stat().st_mtime
-    etag = f'"{filename}-{int(mtime)}"'
-    if if_none_match and etag in if_none_match:
-        return Response(status_code=304, headers={"Cache-Control": "public, max-age=31536000"})
+
     try:
-        doc = fitz.open(str(file_path))
-        if len(doc) == 0:
-            raise HTTPException(status_code=404, detail="PDF has no pages")
-        page = doc[0]
-        mat = fitz.Matrix(1.5, 1.5)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        png_bytes = pix.pil_tobytes("PNG")
-        doc.close()
-        return Response(
-            content=png_bytes,
-            media_type="image/png",
-            headers={
-                "Cache-Control": "public, max-age=31536000",
-                "ETag": etag,
-            }
-        )
+        # Normally rendered when the catalog was saved; renders once here otherwise
+        content_hash = await CatalogThumbnailService.ensure_previews(file_path)
     except Exception as e:
         logger.exception("Failed to render PDF thumbnail: %s", e)
         raise HTTPException(status_code=500, detail="Failed to render PDF thumbnail")
 
+    etag = f'"{content_hash}-{size}"'
+    headers = {"Cache-Control": "public, max-age=31536000", "ETag": etag}
+    if if_none_match and etag in if_none_match:
+        return Response(status_code=304, headers=headers)
+
+    preview_path = CatalogThumbnailService.preview_path(content_hash, size)
+    if settings.UPLOADS_ACCEL_REDIRECT_PREFIX:
+        # Let the reverse proxy send the file
+        accel_path = f"{settings.UPLOADS_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{PREVIEW_SUBDIR.as_posix()}/{preview_path.name}"
+        return Response(
+            media_type="image/webp",
+            headers={**headers, "X-Accel-Redirect": accel_path},
+        )
+    return FileResponse(preview_path, media_type="image/webp", headers=headers)
+
 
 @router.get(
     "/laminates",
     summary="Get laminates",
     description="Retrieve all available laminate options"
 )
-async def get_laminates(db: AsyncSession = Depends(get_db)):
+async def get_laminates(db: AsyncSession = Depends(get_read_db)):
     laminates = await ContentService.get_laminates(db=db, include_inactive=False)
     return laminates
 
@@ -390,7 +393,7 @@ async def get_laminates(db: AsyncSession = Depends(get_db)):
     summary="Get hardware",
     description="Retrieve all available hardware options"
 )
-async def get_hardware(db: AsyncSession = Depends(get_db)):
+async def get_hardware(db: AsyncSession = Depends(get_read_db)):
     hardware = await ContentService.get_hardware(db=db, include_inactive=False)
     return hardware
 
@@ -406,7 +409,7 @@ async def get_hardware(db: AsyncSession = Depends(get_db)):
     description="Retrieve all installation guides"
 )
 async def get_installation_guides(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all installation guides.
@@ -431,7 +434,7 @@ async def get_installation_guides(
 )
 async def get_installation_guide(
     guide_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific installation guide by ID.
@@ -17,7 +17,7 @@ from backend.api.v1.schemas.legal import (
     ShippingPolicyResponse,
     WarrantyResponse,
 )
-from backend.database.base import get_db
+from backend.database.base import get_read_db
 from backend.models.legal import (
     LegalDocument,
     LegalDocumentType,
@@ -42,7 +42,7 @@ router = APIRouter(tags=["Legal & Terms"])
 )
 async def get_legal_documents(
     document_type: Optional[str] = Query(None, description="Filter by document type"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all active legal documents.
@@ -91,7 +91,7 @@ async def get_legal_documents(
 )
 async def get_legal_document_by_slug(
     slug: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific legal document by slug.
@@ -142,7 +142,7 @@ async def get_legal_document_by_slug(
 )
 async def get_legal_document_by_type(
     document_type: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific legal document by type.
@@ -207,7 +207,7 @@ async def get_legal_document_by_type(
     description="Retrieve all active warranty information"
 )
 async def get_warranties(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all active warranties.
@@ -246,7 +246,7 @@ async def get_warranties(
 )
 async def get_warranty(
     warranty_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific warranty by ID.
@@ -290,7 +290,7 @@ async def get_warranty(
     description="Retrieve all active shipping policies"
 )
 async def get_shipping_policies(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all active shipping policies.
@@ -325,7 +325,7 @@ async def get_shipping_policies(
 )
 async def get_shipping_policy(
     policy_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific shipping policy by ID.
@@ -12,7 +12,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import attributes as sa_attributes
 
 from backend.api.dependencies import get_optional_company
+from backend.api.http_cache import ConditionalRoute, conditional_get
 from backend.api.v1.schemas.common import MessageResponse
+from backend.api.v1.serializers import (
+    CatalogJSONResponse,
+    chair_list_response,
+    chair_page_response,
+)
 from backend.api.v1.schemas.product import (
     CategoryChildResponse,
     CategoryResponse,
@@ -25,15 +31,59 @@ from backend.api.v1.schemas.product import (
     ProductSubcategoryResponse,
     UpholsteryResponse,
 )
-from backend.database.base import get_db
+from backend.database.base import get_db, get_read_db
+from backend.models.chair import (
+    Category,
+    Chair,
+    Color,
+    Finish,
+    ProductFamily,
+    ProductSubcategory,
+    ProductVariation,
+    Upholstery,
+    chair_categories,
+    chair_secondary_families,
+    chair_subcategories,
+    variation_families,
+)
 from backend.models.company import Company
+from backend.services.category_tree_service import CategoryTreeService
 from backend.services.pricing_service import PricingService
 from backend.services.product_service import ProductService
 from backend.utils.pagination import PaginatedResponse, PaginationParams
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["Products"])
+router = APIRouter(
+    tags=["Products"],
+    default_response_class=CatalogJSONResponse,
+    route_class=ConditionalRoute,
+)
+
+# Tables each conditional endpoint's response is built from (ETag version
+# vector and Surrogate-Key purge tags, see backend/api/http_cache.py)
+CATEGORY_TREE_TABLES = (Category, ProductSubcategory, Chair, chair_categories, chair_subcategories)
+PRODUCT_LIST_TABLES = (
+    Chair,
+    Category,
+    ProductSubcategory,
+    ProductFamily,
+    ProductVariation,
+    Finish,
+    Color,
+    Upholstery,
+    chair_categories,
+    chair_subcategories,
+)
+FAMILY_TABLES = (ProductFamily, Category, ProductSubcategory, Chair, chair_secondary_families)
+FAMILY_MEMBER_TABLES = (
+    ProductFamily,
+    Chair,
+    ProductVariation,
+    Category,
+    chair_secondary_families,
+    variation_families,
+)
 
 
 async def _populate_customizations(
@@ -187,6 +237,7 @@ async def _apply_pricing_tiers_to_products(
 
 @router.get(
     "/categories",
+    dependencies=[conditional_get(*CATEGORY_TREE_TABLES)],
     response_model=list[CategoryWithChildren],
     summary="Get all categories",
     description="Retrieve primary product categories (chairs, booths, tables, etc.) with their children"
@@ -197,7 +248,7 @@ async def get_categories(
         False,
         description="Include nested (child) categories in the returned list instead of only primary categories",
     ),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get product categories.
@@ -208,38 +259,22 @@ async def get_categories(
     categories — categories that have a `parent_id` — are children and are
     returned inside their parent's `subcategories` list alongside the
     category's product subcategories, each tagged with a `type`.
+
+    Served from the cached category tree snapshot (see CategoryTreeService).
     """
     logger.info(
         f"Fetching categories (parent_id={parent_id}, include_nested={include_nested})"
     )
 
-    categories = await ProductService.get_categories(
-        db=db,
-        include_inactive=False,
-        parent_id=parent_id,
-        top_level_only=not include_nested,
-    )
-
-    children = await ProductService.get_category_children(
-        db=db, include_inactive=False, with_counts=True
+    snapshot = await CategoryTreeService.get_snapshot(db)
+    categories = CategoryTreeService.list_categories(
+        snapshot, parent_id=parent_id, top_level_only=not include_nested
     )
 
     return [
         {
-            "id": category.id,
-            "name": category.name,
-            "slug": category.slug,
-            "description": category.description,
-            "parent_id": category.parent_id,
-            "display_order": category.display_order,
-            "is_active": category.is_active,
-            "icon_url": category.icon_url,
-            "banner_image_url": category.banner_image_url,
-            "meta_title": category.meta_title,
-            "meta_description": category.meta_description,
-            "created_at": category.created_at,
-            "updated_at": category.updated_at,
-            "subcategories": children.get(category.id, []),
+            **category,
+            "subcategories": CategoryTreeService.children_of(snapshot, category["id"]),
         }
         for category in categories
     ]
@@ -247,13 +282,14 @@ async def get_categories(
 
 @router.get(
     "/categories/{category_id}",
+    dependencies=[conditional_get(Category)],
     response_model=CategoryResponse,
     summary="Get category by ID",
     description="Retrieve a specific category by its ID"
 )
 async def get_category(
     category_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific category by ID.
@@ -272,13 +308,14 @@ async def get_category(
 
 @router.get(
     "/categories/slug/{slug}",
+    dependencies=[conditional_get(Category)],
     response_model=CategoryResponse,
     summary="Get category by slug",
     description="Retrieve a specific category by its slug"
 )
 async def get_category_by_slug(
     slug: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific category by slug.
@@ -301,6 +338,7 @@ async def get_category_by_slug(
 
 @router.get(
     "/products",
+    dependencies=[conditional_get(*PRODUCT_LIST_TABLES, priced=True)],
     response_model=PaginatedResponse[ChairResponse],
     summary="Get products",
     description="Retrieve paginated list of products with comprehensive filters"
@@ -330,7 +368,7 @@ async def get_products(
     smart_sort: bool = Query(False, description="Use smart sorting (featured→new→popular)"),
     sort: Optional[str] = Query(None, description="Sort order: name-asc, name-desc, featured (ignored when smart_sort=true)"),
     company: Optional[Company] = Depends(get_optional_company),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get paginated list of products with comprehensive filtering.
@@ -407,7 +445,8 @@ async def get_products(
         if items_list:
             await _apply_pricing_tiers_to_products(db, company, items_list)
     
-    return result
+    # Fast path: same JSON as PaginatedResponse[ChairResponse], without per-item validation
+    return chair_page_response(result)
 
 
 @router.get(
@@ -421,7 +460,7 @@ async def search_products(
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
     threshold: int = Query(75, ge=0, le=100, description="Fuzzy match threshold (0-100)"),
     company: Optional[Company] = Depends(get_optional_company),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Fuzzy search for products with cache-powered relevance scoring.
@@ -449,7 +488,7 @@ async def search_products(
     if products:
         await _populate_customizations(db, products)
     
-    return products
+    return chair_list_response(products)
 
 
 @router.get(
@@ -565,6 +604,7 @@ async def get_product_by_model(
 
 @router.get(
     "/finishes",
+    dependencies=[conditional_get(Finish)],
     response_model=list[FinishResponse],
     summary="Get finishes",
     description="Retrieve all available finishes (wood stains, paints, etc.)"
@@ -572,7 +612,7 @@ async def get_product_by_model(
 async def get_finishes(
     finish_type: Optional[str] = Query(None, description="Filter by finish type"),
     grade: Optional[str] = Query(None, description="Filter by grade (Standard, Premium, Premium Plus, Artisan)"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all available finishes.
@@ -593,13 +633,14 @@ async def get_finishes(
 
 @router.get(
     "/finishes/{finish_id}",
+    dependencies=[conditional_get(Finish)],
     response_model=FinishResponse,
     summary="Get finish by ID",
     description="Retrieve a specific finish by its ID"
 )
 async def get_finish(
     finish_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific finish by ID.
@@ -622,13 +663,14 @@ async def get_finish(
 
 @router.get(
     "/upholsteries",
+    dependencies=[conditional_get(Upholstery)],
     response_model=list[UpholsteryResponse],
     summary="Get upholsteries",
     description="Retrieve all available upholstery materials"
 )
 async def get_upholsteries(
     material_type: Optional[str] = Query(None, description="Filter by material type (Vinyl, Fabric, Leather)"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all available upholsteries.
@@ -648,13 +690,14 @@ async def get_upholsteries(
 
 @router.get(
     "/upholsteries/{upholstery_id}",
+    dependencies=[conditional_get(Upholstery)],
     response_model=UpholsteryResponse,
     summary="Get upholstery by ID",
     description="Retrieve a specific upholstery by its ID"
 )
 async def get_upholstery(
     upholstery_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific upholstery by ID.
@@ -677,6 +720,7 @@ async def get_upholstery(
 
 @router.get(
     "/families",
+    dependencies=[conditional_get(*FAMILY_TABLES)],
     response_model=list[ProductFamilyResponse],
     summary="Get product families",
     description="Retrieve product families with optional filters and product counts"
@@ -684,7 +728,7 @@ async def get_upholstery(
 async def get_families(
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     featured_only: bool = Query(False, description="Only show featured families"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get product families.
@@ -724,13 +768,14 @@ async def get_families(
 
 @router.get(
     "/families/{family_id}",
+    dependencies=[conditional_get(*FAMILY_TABLES)],
     response_model=ProductFamilyResponse,
     summary="Get family by ID",
     description="Retrieve a specific product family by ID with product count"
 )
 async def get_family_by_id(
     family_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific product family by ID.
@@ -776,13 +821,14 @@ async def get_family_by_id(
 
 @router.get(
     "/families/slug/{slug}",
+    dependencies=[conditional_get(*FAMILY_TABLES)],
     response_model=ProductFamilyResponse,
     summary="Get family by slug",
     description="Retrieve a specific product family by slug with product count"
 )
 async def get_family_by_slug(
     slug: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific product family by slug.
@@ -828,12 +874,13 @@ async def get_family_by_slug(
 
 @router.get(
     "/families/{family_id}/members",
+    dependencies=[conditional_get(*FAMILY_MEMBER_TABLES)],
     summary="Get family members",
     description="Get unified list of products and variations belonging to a family"
 )
 async def get_family_members(
     family_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all members of a product family — both product-level and variation-level.
@@ -855,136 +902,26 @@ async def get_family_members(
     """
     logger.info(f"Fetching family members for family {family_id}")
 
-    from sqlalchemy import or_, select
-    from sqlalchemy.orm import selectinload
+    from backend.services.family_index_service import FamilyIndexService
 
-    from backend.models.chair import (
-        Chair,
-        ProductFamily,
-        ProductVariation,
-        chair_secondary_families,
-        variation_families,
-    )
-
-    # Verify family exists
-    family_result = await db.execute(select(ProductFamily).where(ProductFamily.id == family_id))
-    family = family_result.scalar_one_or_none()
-    if not family:
+    index = await FamilyIndexService.get_index(db, family_id)
+    if index is None:
         from backend.core.exceptions import ResourceNotFoundError
         raise ResourceNotFoundError(resource_type="ProductFamily", resource_id=family_id)
 
-    # 1. Fetch product-level members (primary + secondary family)
-    subq = select(chair_secondary_families.c.chair_id).where(
-        chair_secondary_families.c.family_id == family_id
-    )
-    products_stmt = (
-        select(Chair)
-        .where(
-            Chair.is_active == True,
-            or_(Chair.family_id == family_id, Chair.id.in_(subq)),
-        )
-        .options(selectinload(Chair.category))
-    )
-    products_result = await db.execute(products_stmt)
-    product_members = products_result.scalars().all()
-
-    # 2. Fetch variation-level members
-    variations_stmt = (
-        select(ProductVariation)
-        .join(variation_families, variation_families.c.variation_id == ProductVariation.id)
-        .join(Chair, Chair.id == ProductVariation.product_id)
-        .where(
-            variation_families.c.family_id == family_id,
-            ProductVariation.is_available == True,
-            Chair.is_active == True,
-        )
-        .options(selectinload(ProductVariation.product).selectinload(Chair.category))
-    )
-    variations_result = await db.execute(variations_stmt)
-    variation_members = variations_result.scalars().all()
-
-    # Build unified list
-    # Products that appear as variation members: show only the variation(s), not the base product
-    product_ids_via_variations = {v.product_id for v in variation_members}
-
-    items = []
-
-    for p in product_members:
-        if p.id in product_ids_via_variations:
-            continue
-        items.append({
-            "type": "product",
-            "id": p.id,
-            "product_id": p.id,
-            "product_slug": p.slug,
-            "name": p.name,
-            "sku": p.model_number or "",
-            "primary_image_url": p.primary_image_url,
-            "variation_id": None,
-            "display_order": p.display_order,
-            "short_description": p.short_description,
-            "base_price": p.base_price,
-            "category": p.category.name if p.category else None,
-            "hover_images": p.hover_images,
-            "lead_time_days": p.lead_time_days,
-        })
-
-    def _variation_images(v):
-        if not v.images:
-            return None
-        if isinstance(v.images, list):
-            urls = []
-            for img in v.images:
-                if isinstance(img, str):
-                    urls.append(img)
-                elif isinstance(img, dict) and img.get("url"):
-                    urls.append(img["url"])
-            return urls if urls else None
-        return None
-
-    for v in variation_members:
-        p = v.product
-        base_price = (p.base_price or 0) + (v.price_adjustment or 0)
-        primary_image = v.primary_image_url or p.primary_image_url
-        var_images = _variation_images(v)
-        hover_images = var_images if var_images else ([primary_image] if primary_image else None)
-        items.append({
-            "type": "variation",
-            "id": v.id,
-            "product_id": p.id,
-            "product_slug": p.slug,
-            "name": v.name if v.name else p.name,
-            "sku": v.sku,
-            "primary_image_url": primary_image,
-            "variation_id": v.id,
-            "variation_has_own_image": bool(v.primary_image_url or var_images),
-            "display_order": v.display_order,
-            "short_description": p.short_description,
-            "base_price": base_price,
-            "category": p.category.name if p.category else None,
-            "hover_images": hover_images,
-            "lead_time_days": v.lead_time_days if v.lead_time_days is not None else p.lead_time_days,
-        })
-
-    # Sort by display_order then name
-    items.sort(key=lambda x: (x["display_order"] or 0, x["name"] or ""))
-
-    # Strip internal sort key
-    for item in items:
-        del item["display_order"]
-
-    return items
+    return index["members"]
 
 
 @router.get(
     "/subcategories",
+    dependencies=[conditional_get(*CATEGORY_TREE_TABLES)],
     response_model=list[CategoryChildResponse],
     summary="Get product subcategories",
     description="Retrieve the children of a category (subcategories and nested categories) with product counts"
 )
 async def get_subcategories(
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get the children of a category.
@@ -996,17 +933,12 @@ async def get_subcategories(
     """
     logger.info(f"Fetching subcategories (category_id={category_id})")
 
-    children = await ProductService.get_category_children(
-        db=db,
-        category_id=category_id,
-        include_inactive=False,
-        with_counts=True,
-    )
+    snapshot = await CategoryTreeService.get_snapshot(db)
 
     if category_id is not None:
-        return children.get(category_id, [])
+        return CategoryTreeService.children_of(snapshot, category_id)
 
-    return [child for items in children.values() for child in items]
+    return CategoryTreeService.all_children(snapshot)
 
 
 # ============================================================================
@@ -1015,13 +947,14 @@ async def get_subcategories(
 
 @router.get(
     "/colors",
+    dependencies=[conditional_get(Color)],
     response_model=list[ColorResponse],
     summary="Get colors",
     description="Retrieve all available colors for filtering"
 )
 async def get_colors(
     category: Optional[str] = Query(None, description="Filter by category (wood/metal/fabric/paint)"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all available colors.
@@ -1061,7 +994,7 @@ async def get_colors(
 )
 async def get_product_variations(
     product_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all variations for a product.
@@ -1122,7 +1055,7 @@ async def get_product_variations(
 )
 async def get_product_available_options(
     product_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all available options for a product.
@@ -1153,7 +1086,7 @@ async def get_product_available_options(
 async def get_product_images(
     product_id: int,
     variation_id: Optional[int] = Query(None, description="Get images for specific variation"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get product images organized by type.
@@ -1184,7 +1117,7 @@ async def get_related_products(
     product_id: int,
     limit: int = Query(100, ge=1, le=100, description="Max number of related products"),
     company: Optional[Company] = Depends(get_optional_company),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get related products.
@@ -1209,7 +1142,7 @@ async def get_related_products(
     if company and related:
         await _apply_pricing_tiers_to_products(db, company, related)
     
-    return related
+    return chair_list_response(related)
 
 
 # ============================================================================
@@ -1226,7 +1159,7 @@ async def calculate_product_price(
     company_id: Optional[int] = Query(None, description="Company ID for tier pricing"),
     variation_id: Optional[int] = Query(None, description="Variation ID"),
     custom_option_ids: Optional[str] = Query(None, description="Comma-separated custom option IDs"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Calculate product price with all adjustments.
@@ -1274,7 +1207,7 @@ async def calculate_product_price(
 async def get_product_price_range(
     product_id: int,
     company_id: Optional[int] = Query(None, description="Company ID for tier pricing"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get product price range.
@@ -1305,7 +1238,7 @@ async def get_product_price_range(
     description="Get last update timestamps for all product data types to enable mobile app cache invalidation"
 )
 async def get_cache_timestamps(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get last update timestamps for product-related data.
@@ -10,16 +10,17 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 
-from backend.database.base import get_db
-from backend.models.chair import Chair, Category, ProductFamily
+from backend.database.base import get_read_db
+from backend.models.chair import Chair, ProductFamily
+from backend.models.loaders import ChairLoad
+from backend.services.category_tree_service import CategoryTreeService
 
 router = APIRouter(prefix="/seo", tags=["SEO"])
 
 
 @router.get("/sitemap.xml", response_class=Response)
-async def get_sitemap(db: AsyncSession = Depends(get_db)):
+async def get_sitemap(db: AsyncSession = Depends(get_read_db)):
     """
     Generate dynamic sitemap.xml including all products, families, and categories
     """
@@ -27,21 +28,15 @@ async def get_sitemap(db: AsyncSession = Depends(get_db)):
         # Get all active products
         products_result = await db.execute(
             select(Chair)
-            .options(
-                selectinload(Chair.category),
-                selectinload(Chair.subcategory),
-            )
+            .options(*ChairLoad.EXPORT)
             .where(Chair.is_active == True)
             .order_by(Chair.updated_at.desc())
         )
         products = products_result.scalars().all()
         
-        # Get all active categories
-        categories_result = await db.execute(
-            select(Category)
-            .where(Category.is_active == True)
-        )
-        categories = categories_result.scalars().all()
+        # Active categories (primary and nested) come from the shared category tree snapshot
+        snapshot = await CategoryTreeService.get_snapshot(db)
+        categories = CategoryTreeService.list_categories(snapshot)
         
         # Get all active product families
         families_result = await db.execute(
@@ -75,10 +70,10 @@ async def get_sitemap(db: AsyncSession = Depends(get_db)):
         
         # Add categories
         for category in categories:
-            if category.slug:
-                lastmod = category.updated_at.strftime("%Y-%m-%d") if category.updated_at else current_date
+            if category["slug"]:
+                lastmod = category["updated_at"][:10] if category["updated_at"] else current_date
                 xml_lines.append(
-                    f'  <url><loc>{base_url}/products/category/{category.slug}</loc>'
+                    f'  <url><loc>{base_url}/products/category/{category["slug"]}</loc>'
                     f'<lastmod>{lastmod}</lastmod><changefreq>weekly</changefreq><priority>0.8</priority></url>'
                 )
         
@@ -141,17 +136,14 @@ async def get_sitemap(db: AsyncSession = Depends(get_db)):
 @router.get("/product/{product_id_or_slug}")
 async def get_product_seo(
     product_id_or_slug: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get SEO metadata for a specific product
     """
     try:
         # Try to find by ID first, then by slug
-        product_query = select(Chair).options(
-            selectinload(Chair.category),
-            selectinload(Chair.subcategory),
-        )
+        product_query = select(Chair).options(*ChairLoad.EXPORT)
         try:
             product_id = int(product_id_or_slug)
             result = await db.execute(
@@ -202,7 +194,7 @@ async def get_product_seo(
 @router.get("/family/{family_slug}")
 async def get_family_seo(
     family_slug: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get SEO metadata for a specific product family
@@ -47,6 +47,14 @@ class CompanyInviteRequest(BaseModel):
     email: EmailStr = Field(..., description="Email address to send invitation to")
 
 
+class CompanyBulkInviteRequest(BaseModel):
+    """Bulk company invitation request"""
+
+    invites: List[CompanyInviteRequest] = Field(
+        ..., min_length=1, max_length=5000, description="Companies to invite"
+    )
+
+
 class CompanyListResponse(BaseModel):
     """Company list response"""
 
@@ -453,6 +461,37 @@ class ProductListResponse(BaseModel):
     pages: int = Field(..., description="Total number of pages")
 
 
+class BulkVariationRow(BaseModel):
+    """One variation inside a bulk import row - upserted by SKU"""
+
+    sku: str = Field(..., min_length=1, max_length=100, description="Variation SKU")
+    name: Optional[str] = Field(None, max_length=255, description="Variation name")
+    finish_id: Optional[int] = Field(None, description="Finish ID")
+    upholstery_id: Optional[int] = Field(None, description="Upholstery ID")
+    color_id: Optional[int] = Field(None, description="Color ID")
+    price_adjustment: Optional[int] = Field(None, description="Price adjustment in cents")
+    stock_status: Optional[str] = Field(None, max_length=50, description="Stock status")
+    is_available: Optional[bool] = Field(None, description="Is available")
+    lead_time_days: Optional[int] = Field(None, ge=0, description="Lead time override in days")
+    display_order: Optional[int] = Field(None, ge=0, description="Display order")
+    primary_image_url: Optional[str] = Field(None, max_length=500, description="Variation image")
+
+
+class BulkProductRow(ProductUpdate):
+    """
+    One row of a bulk product import (NDJSON line or CSV record).
+
+    Rows are matched on ``slug``: existing products are updated with the
+    fields present in the row, unknown slugs are created and then also need
+    ``name``, ``model_number`` and a category.
+    """
+
+    slug: str = Field(..., min_length=1, max_length=255, description="URL slug (upsert key)")
+    variations: Optional[List[BulkVariationRow]] = Field(
+        None, description="Variations to upsert by SKU (existing ones not listed are kept)"
+    )
+
+
 # ============================================================================
 # Catalog Management Schemas (Families, Subcategories, etc.)
 # ============================================================================
@@ -0,0 +1,192 @@
+"""
+Fast-path Response Serializers - Version 1
+
+Hot catalog list endpoints serialize dozens of ``Chair`` rows per request.
+Validating each one through ``ChairResponse`` (``from_attributes``, the
+image validators, ``populate_category_ids``, computed fields) and then
+re-encoding with the stdlib JSON encoder dominates those requests.
+
+The serializers here read the ORM attributes straight into dicts using a
+field plan compiled once from the response schemas, reproduce the schema's
+validators by hand and encode with orjson. The output is byte-for-byte the
+JSON FastAPI would produce for the same ``response_model`` (enforced by
+tests/test_routes/test_product_serializers.py), so the schemas stay the
+single source of truth for field names, order and defaults.
+"""
+
+import json
+from typing import Any, Iterable, List, Optional, Tuple, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from backend.api.v1.schemas.product import (
+    CategoryResponse,
+    ChairResponse,
+    ProductImageItem,
+    ProductSubcategoryResponse,
+)
+from backend.core.config import settings
+
+# Attribute name, default and float flag for every schema field, in serialization order
+FieldPlan = Tuple[Tuple[str, Any, bool], ...]
+
+_MISSING = object()
+
+
+class CatalogJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson, writing UTC datetimes with a "Z" suffix as pydantic does"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+def compile_field_plan(schema: Type[BaseModel], exclude: Iterable[str] = ()) -> FieldPlan:
+    """
+    Precompute how to read each of a schema's fields from an ORM object
+
+    Args:
+        schema: Pydantic response schema
+        exclude: Fields the caller fills in itself
+
+    Returns:
+        Field plan in the schema's serialization order; required fields get
+        ``_MISSING`` so a missing attribute fails loudly like validation would
+    """
+    plan = []
+    for name, field in schema.model_fields.items():
+        if name in exclude:
+            continue
+        default = _MISSING if field.is_required() else field.get_default(call_default_factory=True)
+        # float fields turn ints (e.g. freshly assigned attributes) into 18.0
+        is_float = field.annotation in (float, Optional[float])
+        plan.append((name, default, is_float))
+    return tuple(plan)
+
+
+def _read(obj: Any, plan: FieldPlan) -> dict:
+    # Loaded columns (and attributes routes set at runtime) sit in the instance
+    # dict; only fall back to the descriptor for anything else
+    loaded = obj.__dict__
+    data = {}
+    for name, default, is_float in plan:
+        value = loaded.get(name, _MISSING)
+        if value is _MISSING:
+            value = getattr(obj, name, default)
+        if value is _MISSING:
+            raise AttributeError(f"{type(obj).__name__} has no attribute '{name}'")
+        if is_float and type(value) is int:
+            value = float(value)
+        data[name] = value
+    return data
+
+
+_CATEGORY_PLAN = compile_field_plan(CategoryResponse)
+_SUBCATEGORY_PLAN = compile_field_plan(ProductSubcategoryResponse)
+_IMAGE_ITEM_FIELDS = tuple(ProductImageItem.model_fields)
+
+# Fields ChairResponse derives in validators or from nested schemas
+_CHAIR_DERIVED = (
+    "images", "hover_images", "primary_image", "categories", "subcategories",
+    "category_ids", "subcategory_ids",
+)
+_CHAIR_PLAN = compile_field_plan(ChairResponse, exclude=_CHAIR_DERIVED)
+_CHAIR_FIELD_ORDER = tuple(ChairResponse.model_fields)
+
+
+def _images(value: Any) -> list:
+    """ChairBase.validate_images plus the List[str] | List[ProductImageItem] union"""
+    if not isinstance(value, list) or not value:
+        return []
+    if all(isinstance(item, str) for item in value):
+        return value
+    return [{key: item.get(key) for key in _IMAGE_ITEM_FIELDS} for item in value]
+
+
+def _hover_images(value: Any) -> list:
+    """ChairBase.validate_hover_images"""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str) and value not in ("", "[]"):
+        try:
+            parsed = json.loads(value)
+            return parsed if isinstance(parsed, list) else []
+        except (ValueError, TypeError):
+            return []
+    return []
+
+
+def _ids_primary_first(primary_id: Optional[int], related: Optional[list]) -> List[int]:
+    """ChairResponse.populate_category_ids for one relationship"""
+    ids = [row["id"] for row in related or []]
+    if primary_id is None:
+        return ids
+    return [primary_id] + [i for i in ids if i != primary_id]
+
+
+def serialize_chair(product: Any) -> dict:
+    """
+    Serialize a Chair ORM object exactly as ChairResponse would
+
+    Args:
+        product: Chair instance (relationships ``categories`` and
+            ``subcategories`` loaded), optionally carrying the attributes
+            routes add at runtime (customizations, pricing, variation_id)
+
+    Returns:
+        JSON-ready dict with ChairResponse's keys, order and defaults
+    """
+    data = _read(product, _CHAIR_PLAN)
+
+    categories = getattr(product, "categories", None)
+    subcategories = getattr(product, "subcategories", None)
+    primary_image = getattr(product, "primary_image", None)
+    if primary_image is None and getattr(product, "primary_image_url", None):
+        primary_image = product.primary_image_url
+
+    derived = {
+        "images": _images(getattr(product, "images")),
+        "hover_images": _hover_images(getattr(product, "hover_images", None)),
+        "primary_image": primary_image,
+        "categories": None if categories is None else [_read(c, _CATEGORY_PLAN) for c in categories],
+        "subcategories": (
+            None if subcategories is None else [_read(s, _SUBCATEGORY_PLAN) for s in subcategories]
+        ),
+    }
+    derived["category_ids"] = _ids_primary_first(data["category_id"], derived["categories"])
+    derived["subcategory_ids"] = _ids_primary_first(data["subcategory_id"], derived["subcategories"])
+
+    result = {name: data[name] if name in data else derived[name] for name in _CHAIR_FIELD_ORDER}
+    # Computed fields come last, in definition order
+    result["last_updated"] = result["updated_at"]
+    result["image_base_url"] = settings.IMAGE_BASE_URL
+    return result
+
+
+def serialize_chairs(products: Iterable[Any]) -> List[dict]:
+    """Serialize a list of Chair ORM objects (see serialize_chair)"""
+    return [serialize_chair(product) for product in products]
+
+
+def chair_list_response(products: Iterable[Any]) -> CatalogJSONResponse:
+    """Response equivalent to ``response_model=list[ChairResponse]``"""
+    return CatalogJSONResponse(serialize_chairs(products))
+
+
+def chair_page_response(page: dict) -> CatalogJSONResponse:
+    """
+    Response equivalent to ``response_model=PaginatedResponse[ChairResponse]``
+
+    Args:
+        page: Result of ``backend.utils.pagination.paginate``
+    """
+    return CatalogJSONResponse({
+        "items": serialize_chairs(page["items"]),
+        "total": page["total"],
+        "page": page["page"],
+        "per_page": page["per_page"],
+        "total_pages": page["total_pages"],
+        "has_next": page["has_next"],
+        "has_prev": page["has_prev"],
+    })
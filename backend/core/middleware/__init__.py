@@ -19,6 +19,7 @@ from backend.core.middleware.route_protection import (
     RouteProtectionMiddleware,
     RoleBasedAccessControl
 )
+from backend.core.middleware.read_your_writes import ReadYourWritesMiddleware
 
 # Import setup_middleware from the middleware_setup module
 from backend.core.middleware_setup import setup_middleware
@@ -35,5 +36,6 @@ __all__ = [
     "AdminIPWhitelistValidator",
     "RouteProtectionMiddleware",
     "RoleBasedAccessControl",
+    "ReadYourWritesMiddleware",
     "setup_middleware",
 ]
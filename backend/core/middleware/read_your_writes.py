@@ -0,0 +1,53 @@
+"""
+Read-Your-Writes Middleware
+
+Keeps a client on the primary database for a short window after it changes
+something, so replica lag never hides its own writes (e.g. an admin saving a
+product and reloading the public catalog).
+"""
+
+import logging
+import time
+from typing import Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.core.config import settings
+from backend.database.base import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Mark successful mutations so the client's next reads go to the primary
+
+    Sets a ``READ_PRIMARY_COOKIE`` cookie (browsers) and a
+    ``READ_PRIMARY_HEADER`` response header (API clients may echo it back as
+    a request header) holding the unix time until which ``get_read_db``
+    should use the primary.
+    """
+
+    def __init__(self, app, sticky_seconds: int = 10):
+        super().__init__(app)
+        self.sticky_seconds = sticky_seconds
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            until = f"{time.time() + self.sticky_seconds:.0f}"
+            response.headers[READ_PRIMARY_HEADER] = until
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                until,
+                max_age=self.sticky_seconds,
+                httponly=True,
+                secure=not settings.DEBUG,
+                samesite="lax",
+            )
+
+        return response
@@ -24,6 +24,7 @@ from backend.core.middleware.admin_security import AdminSecurityMiddleware
 from backend.core.middleware.ddos_protection import DDoSProtectionMiddleware
 from backend.core.middleware.input_sanitizer import InputSanitizerMiddleware
 from backend.core.middleware.rate_limiter import AdvancedRateLimiter
+from backend.core.middleware.read_your_writes import ReadYourWritesMiddleware
 from backend.core.middleware.request_validator import RequestValidationMiddleware
 from backend.core.middleware.route_protection import RouteProtectionMiddleware
 from backend.core.middleware.session_manager import SessionManager
@@ -283,6 +284,14 @@ def setup_middleware(app):
     if settings.ENABLE_COMPRESSION:
         app.add_middleware(GZipMiddleware, minimum_size=5000)
         logger.info("[OK] GZip compression enabled")
+
+    # Read-your-writes stickiness (only matters with a read replica)
+    if settings.DATABASE_READ_URL:
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            sticky_seconds=settings.DATABASE_READ_STICKY_SECONDS
+        )
+        logger.info("[OK] Read-your-writes routing enabled")
     
     # NOTE: CORS is intentionally NOT added here. In Starlette, each
     # add_middleware() call wraps OUTSIDE the previous one, so the request
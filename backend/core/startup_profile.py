@@ -0,0 +1,183 @@
+"""
+Startup Profiling
+
+Opt-in timing of application cold start, enabled with the
+``EAGLECHAIR_PROFILE_STARTUP`` environment variable:
+
+- ``EAGLECHAIR_PROFILE_STARTUP=1`` logs a report once the lifespan startup
+  completes: the slowest module imports (inclusive and self time) and the
+  duration of each lifespan step.
+- ``EAGLECHAIR_PROFILE_STARTUP=/path/report.json`` also writes the report
+  as JSON to that path.
+
+Import timing hooks ``sys.meta_path`` and must be installed before the
+modules it should see are imported (``backend.main`` does this first thing).
+Lifespan steps are always timed and logged at debug level; profiling only
+controls the import hook and the report.
+"""
+
+import importlib.abc
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "EAGLECHAIR_PROFILE_STARTUP"
+REPORT_TOP_IMPORTS = 25
+
+_started = time.perf_counter()
+_imports: Dict[str, Dict[str, float]] = {}
+_import_stack: List[List[float]] = []
+_steps: List[Dict[str, float]] = []
+
+
+def profile_target() -> Optional[str]:
+    """The ``EAGLECHAIR_PROFILE_STARTUP`` value, or None when profiling is off"""
+    value = os.environ.get(PROFILE_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    return value
+
+
+def enabled() -> bool:
+    return profile_target() is not None
+
+
+class _TimingLoader(importlib.abc.Loader):
+    """Wraps a module loader to time ``exec_module``"""
+
+    def __init__(self, loader, fullname: str):
+        self._loader = loader
+        self._fullname = fullname
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Hand the module back its real loader (importlib.resources etc. inspect it)
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        frame = [time.perf_counter(), 0.0]  # start, time spent in nested imports
+        _import_stack.append(frame)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            _import_stack.pop()
+            inclusive = time.perf_counter() - frame[0]
+            _imports[self._fullname] = {"inclusive": inclusive, "self": inclusive - frame[1]}
+            if _import_stack:
+                _import_stack[-1][1] += inclusive
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path hook that resolves specs through the other finders and times their loaders"""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimingLoader(spec.loader, fullname)
+            return spec
+        return None
+
+
+_finder: Optional[_TimingFinder] = None
+
+
+def install() -> None:
+    """Start timing module imports if profiling is enabled"""
+    global _finder, _started
+    if _finder is not None or not enabled():
+        return
+    _started = time.perf_counter()
+    _finder = _TimingFinder()
+    sys.meta_path.insert(0, _finder)
+
+
+def uninstall() -> None:
+    """Stop timing module imports"""
+    global _finder
+    if _finder is not None:
+        sys.meta_path.remove(_finder)
+        _finder = None
+
+
+@contextmanager
+def step(name: str) -> Iterator[None]:
+    """
+    Time one lifespan startup step
+
+    Args:
+        name: Step name shown in the report
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - started
+        _steps.append({"step": name, "seconds": duration})
+        logger.debug(f"[STARTUP] {name} took {duration * 1000:.0f}ms")
+
+
+def report(top: int = REPORT_TOP_IMPORTS) -> dict:
+    """
+    Build the startup report
+
+    Args:
+        top: Number of slowest imports to include
+
+    Returns:
+        Total time since profiling started, slowest imports and lifespan steps
+    """
+    slowest = sorted(_imports.items(), key=lambda item: item[1]["inclusive"], reverse=True)[:top]
+    return {
+        "total_seconds": time.perf_counter() - _started,
+        "modules_imported": len(_imports),
+        "imports": [
+            {"module": name, "inclusive_seconds": t["inclusive"], "self_seconds": t["self"]}
+            for name, t in slowest
+        ],
+        "steps": list(_steps),
+    }
+
+
+def log_report() -> None:
+    """Log the startup report (and write it as JSON if a path was given); no-op unless enabled"""
+    target = profile_target()
+    if target is None:
+        return
+    uninstall()
+    data = report()
+
+    lines = [f"[STARTUP] Ready in {data['total_seconds']:.2f}s ({data['modules_imported']} modules timed)"]
+    lines.append("[STARTUP] Slowest imports (inclusive / self):")
+    for entry in data["imports"]:
+        lines.append(
+            f"  {entry['inclusive_seconds'] * 1000:8.1f}ms {entry['self_seconds'] * 1000:8.1f}ms  {entry['module']}"
+        )
+    lines.append("[STARTUP] Lifespan steps:")
+    for entry in data["steps"]:
+        lines.append(f"  {entry['seconds'] * 1000:8.1f}ms  {entry['step']}")
+    logger.info("\n".join(lines))
+
+    if target.lower() not in ("1", "true", "yes", "on"):
+        try:
+            with open(target, "w") as f:
+                json.dump(data, f, indent=2)
+            logger.info(f"[STARTUP] Profile written to {target}")
+        except OSError as e:
+            logger.warning(f"[STARTUP] Could not write profile to {target}: {e}")
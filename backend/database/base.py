@@ -5,16 +5,19 @@ Configures async SQLAlchemy with PostgreSQL support and YokedCache integration
 """
 
 import logging
+import time
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 import orjson
+from fastapi import Request
 from sqlalchemy import Column, DateTime, create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, declared_attr, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from backend.core.config import settings
+from backend.database.pool import instrument_engine, instrumented_pool_class, pool_plan
 
 logger = logging.getLogger(__name__)
 
@@ -33,22 +36,46 @@ def orjson_deserializer(obj):
     return orjson.loads(obj)
 
 
-# NullPool does not accept pool_size/max_overflow kwargs, so only include
-# them when we're not forcing NullPool (i.e. not in TESTING mode).
-_async_engine_kwargs = dict(
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
-    json_serializer=orjson_serializer,
-    json_deserializer=orjson_deserializer,
-)
-if settings.TESTING:
-    _async_engine_kwargs["poolclass"] = NullPool
-else:
-    _async_engine_kwargs["pool_size"] = settings.DATABASE_POOL_SIZE
-    _async_engine_kwargs["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
+# Pool sizes come from the deployment-wide connection budget (see pool.py)
+_pool_plan = pool_plan()
+
+
+def _engine_kwargs(name: str, is_async: bool, pool_size: int, max_overflow: int) -> dict:
+    """
+    Engine options shared by the primary, replica and sync engines
+
+    NullPool does not accept pool_size/max_overflow kwargs, so only include
+    them when we're not forcing NullPool (i.e. not in TESTING mode).
+    """
+    kwargs = dict(
+        echo=settings.DATABASE_ECHO,
+        json_serializer=orjson_serializer,
+        json_deserializer=orjson_deserializer,
+    )
+    if settings.TESTING:
+        kwargs["poolclass"] = NullPool
+        kwargs["pool_pre_ping"] = True
+    else:
+        kwargs["poolclass"] = instrumented_pool_class(name, is_async=is_async)
+        kwargs["pool_size"] = pool_size
+        kwargs["max_overflow"] = max_overflow
+        kwargs["pool_recycle"] = settings.DATABASE_POOL_RECYCLE
+        # Otherwise idle connections are pinged by instrument_engine
+        kwargs["pool_pre_ping"] = settings.DATABASE_PRE_PING_INTERVAL <= 0
+    return kwargs
+
+
+def _create_async_engine(name: str, url: str):
+    async_engine = create_async_engine(
+        url, **_engine_kwargs(name, True, _pool_plan.pool_size, _pool_plan.max_overflow)
+    )
+    if not settings.TESTING:
+        instrument_engine(async_engine.sync_engine, name, settings.DATABASE_PRE_PING_INTERVAL)
+    return async_engine
+
 
 # Create async engine
-engine = create_async_engine(settings.database_url_async, **_async_engine_kwargs)
+engine = _create_async_engine("primary", settings.database_url_async)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -59,6 +86,34 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Optional read replica for public read-only routes (see get_read_db).
+# Without DATABASE_READ_URL both names point at the primary.
+read_engine = (
+    _create_async_engine("replica", settings.database_read_url_async)
+    if settings.DATABASE_READ_URL
+    else None
+)
+ReadSessionLocal = (
+    async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    if read_engine is not None
+    else AsyncSessionLocal
+)
+
+# Read-your-writes: after a mutation the client is told (cookie and response
+# header) to read from the primary until the given unix time, so it does not
+# see replica lag on its own changes. Set by ReadYourWritesMiddleware.
+READ_PRIMARY_COOKIE = "eaglechair_read_primary"
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+
+# Monotonic time until which reads skip an unhealthy replica
+_replica_down_until = 0.0
+
 # Build a sync-driver URL for the background-task engine. Convert the
 # async driver prefixes to their sync equivalents:
 #   postgresql+asyncpg:// -> postgresql+psycopg2://
@@ -69,20 +124,13 @@ _sync_database_url = (
     .replace("mysql+aiomysql://", "mysql+pymysql://")
 )
 
-_sync_engine_kwargs = dict(
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
-    json_serializer=orjson_serializer,
-    json_deserializer=orjson_deserializer,
-)
-if settings.TESTING:
-    _sync_engine_kwargs["poolclass"] = NullPool
-else:
-    _sync_engine_kwargs["pool_size"] = settings.DATABASE_POOL_SIZE
-    _sync_engine_kwargs["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
-
 # Create sync engine for background tasks (PDF parsing, etc.)
-sync_engine = create_engine(_sync_database_url, **_sync_engine_kwargs)
+sync_engine = create_engine(
+    _sync_database_url,
+    **_engine_kwargs("sync", False, _pool_plan.sync_pool_size, _pool_plan.sync_max_overflow),
+)
+if not settings.TESTING:
+    instrument_engine(sync_engine, "sync", settings.DATABASE_PRE_PING_INTERVAL)
 
 # Create sync session factory for background tasks
 SessionLocal = sessionmaker(
@@ -129,6 +177,63 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def read_primary_until(request: Request) -> float:
+    """Unix time until which the client asked to read from the primary (0 if not)"""
+    value = request.headers.get(READ_PRIMARY_HEADER) or request.cookies.get(READ_PRIMARY_COOKIE)
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+async def _replica_session() -> Optional[AsyncSession]:
+    """A replica session with a live connection, or None if the replica is unavailable"""
+    global _replica_down_until
+    if read_engine is None or time.monotonic() < _replica_down_until:
+        return None
+
+    session = ReadSessionLocal()
+    try:
+        await session.connection()
+        return session
+    except Exception as e:
+        await session.close()
+        _replica_down_until = time.monotonic() + settings.DATABASE_READ_RETRY_SECONDS
+        logger.warning(
+            f"Read replica unavailable, using primary for {settings.DATABASE_READ_RETRY_SECONDS}s: {e}"
+        )
+        return None
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only routes: a read replica session when one is configured
+
+    Falls back to the primary when there is no replica, while the client is
+    inside its read-your-writes window after a mutation, or when the replica
+    failed a connection check in the last DATABASE_READ_RETRY_SECONDS.
+
+    Args:
+        request: Current request (carries the read-your-writes cookie/header)
+
+    Yields:
+        AsyncSession: Database session (must only be used for reads)
+    """
+    session = None
+    if read_primary_until(request) <= time.time():
+        session = await _replica_session()
+    if session is None:
+        session = AsyncSessionLocal()
+
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 async def init_db() -> None:
     """
     Initialize database - create all tables
@@ -142,3 +247,5 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database engine and cleanup connections"""
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
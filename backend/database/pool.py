@@ -0,0 +1,257 @@
+"""
+Connection Pool Sizing and Instrumentation
+
+Every gunicorn worker and the background job worker (``python -m
+backend.worker``) open their own async and sync engines, so the number of
+connections the database sees is ``processes x per-process pools``. Rather
+than fixing the worker count and per-engine pool sizes independently,
+``pool_plan`` derives both from the CPU count and one total connection
+budget (DATABASE_CONNECTION_BUDGET) that must fit under the server's
+``max_connections``.
+
+The pools are instrumented: ``pool_status`` reports size, in-use and
+overflow connections together with checkout wait times and timeouts for
+each engine in this process.
+
+Liveness checks are interval based instead of a ``SELECT 1`` on every
+checkout: a connection is pinged only when it sat idle in the pool longer
+than DATABASE_PRE_PING_INTERVAL, and DATABASE_POOL_RECYCLE replaces
+connections past a maximum age without any round trip.
+"""
+
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# The background job worker process shares the budget with the web workers
+BACKGROUND_PROCESSES = 1
+
+# Fewer connections than this per process and requests queue on the pool
+MIN_CONNECTIONS_PER_PROCESS = 6
+
+# Share of a process's connections reserved for the sync engine, which only
+# serves occasional background helpers
+SYNC_ENGINE_SHARE = 0.2
+
+
+@dataclass(frozen=True)
+class PoolPlan:
+    """Worker count and per-process pool sizes"""
+
+    workers: int
+    pool_size: int
+    max_overflow: int
+    sync_pool_size: int
+    sync_max_overflow: int
+
+    @property
+    def connections_per_process(self) -> int:
+        return self.pool_size + self.max_overflow + self.sync_pool_size + self.sync_max_overflow
+
+    @property
+    def max_connections(self) -> int:
+        """Worst case for the whole deployment (all pools fully overflowed)"""
+        return self.connections_per_process * (self.workers + BACKGROUND_PROCESSES)
+
+    def as_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "connections_per_process": self.connections_per_process,
+            "max_connections": self.max_connections,
+        }
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects container/affinity limits)"""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def plan_pools(
+    budget: int,
+    cpus: int,
+    workers: Optional[int] = None,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+) -> PoolPlan:
+    """
+    Split a total connection budget across worker processes and engines
+
+    Args:
+        budget: Total connections the deployment may open
+        cpus: Available CPUs; one async worker per CPU saturates them
+        workers: Explicit web worker count (default: derived)
+        pool_size: Explicit async pool size per process (default: derived)
+        max_overflow: Explicit async overflow per process (default: derived)
+
+    Returns:
+        PoolPlan whose ``max_connections`` stays within the budget unless
+        explicit overrides push it over
+    """
+    if workers is None:
+        # Never run so many workers that each would be starved of connections
+        affordable = budget // MIN_CONNECTIONS_PER_PROCESS - BACKGROUND_PROCESSES
+        workers = max(1, min(cpus, affordable))
+
+    per_process = max(2, budget // (workers + BACKGROUND_PROCESSES))
+    sync_total = max(1, int(per_process * SYNC_ENGINE_SHARE))
+    async_total = max(1, per_process - sync_total)
+
+    # Two thirds stay open, the rest is overflow that closes again when idle
+    derived_pool_size = max(1, async_total * 2 // 3)
+    return PoolPlan(
+        workers=workers,
+        pool_size=pool_size if pool_size is not None else derived_pool_size,
+        max_overflow=max_overflow if max_overflow is not None else async_total - derived_pool_size,
+        sync_pool_size=1,
+        sync_max_overflow=sync_total - 1,
+    )
+
+
+def pool_plan() -> PoolPlan:
+    """The plan for this deployment, from settings and the available CPUs"""
+    return plan_pools(
+        budget=settings.DATABASE_CONNECTION_BUDGET,
+        cpus=available_cpus(),
+        workers=settings.WEB_WORKERS,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    )
+
+
+class PoolStats:
+    """Checkout counters for one engine's pool"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+        self.pre_pings = 0
+        self.stale_connections = 0
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+
+    def snapshot(self, pool) -> dict:
+        """Counters plus the pool's current gauges"""
+        return {
+            "name": self.name,
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+            "max_overflow": pool._max_overflow,
+            "checkouts": self.checkouts,
+            "wait_ms_avg": round(self.wait_seconds_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+            "timeouts": self.timeouts,
+            "pre_pings": self.pre_pings,
+            "stale_connections": self.stale_connections,
+        }
+
+
+class _TimedCheckoutMixin:
+    """Times how long each checkout waits for a free connection"""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.record_wait(time.perf_counter() - started)
+        return connection
+
+
+_stats: Dict[str, PoolStats] = {}
+_engines: Dict[str, Engine] = {}
+
+
+def instrumented_pool_class(name: str, is_async: bool = True) -> type:
+    """
+    Pool class that records checkout metrics under ``name``
+
+    The stats live on the class, so they survive ``engine.dispose()``
+    (which recreates the pool from its class).
+
+    Args:
+        name: Engine name shown in ``pool_status``
+        is_async: AsyncAdaptedQueuePool for async engines, QueuePool otherwise
+    """
+    stats = _stats.setdefault(name, PoolStats(name))
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    return type(f"Instrumented{base.__name__}", (_TimedCheckoutMixin, base), {"stats": stats})
+
+
+def instrument_engine(engine: Engine, name: str, pre_ping_interval: int) -> None:
+    """
+    Register an engine for ``pool_status`` and ping connections that sat idle
+
+    Args:
+        engine: Sync engine (``AsyncEngine.sync_engine`` for async engines)
+        name: Name used with ``instrumented_pool_class``
+        pre_ping_interval: Ping on checkout after this many idle seconds
+            (0 disables; the engine then uses ``pool_pre_ping`` instead)
+    """
+    _engines[name] = engine
+    stats = _stats.setdefault(name, PoolStats(name))
+    if pre_ping_interval <= 0:
+        return
+
+    @event.listens_for(engine, "checkin")
+    def _mark_idle(dbapi_connection, connection_record):
+        connection_record.info["idle_since"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        idle_since = connection_record.info.get("idle_since")
+        # Fresh connections were just opened; recently used ones are trusted
+        if idle_since is None or time.monotonic() - idle_since < pre_ping_interval:
+            return
+        stats.pre_pings += 1
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as e:
+            stats.stale_connections += 1
+            logger.warning(f"[POOL] {name}: dropping stale connection idle for "
+                           f"{time.monotonic() - idle_since:.0f}s ({e})")
+            # Makes the pool discard this connection and retry with a new one
+            raise sa_exc.DisconnectionError() from e
+
+
+def pool_status() -> List[dict]:
+    """Current gauges and counters of every instrumented pool in this process"""
+    status = []
+    for name, engine in _engines.items():
+        pool = engine.pool
+        stats = getattr(pool, "stats", None) or _stats[name]
+        if not isinstance(pool, QueuePool):
+            status.append({"name": name, "pool": type(pool).__name__})
+            continue
+        status.append(stats.snapshot(pool))
+    return status
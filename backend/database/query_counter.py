@@ -0,0 +1,53 @@
+"""
+Query Counter
+
+Counts the SQL statements executed by the current task, so code paths can
+report (or tests can assert) how many round trips they make:
+
+    with count_queries() as counter:
+        await db.execute(...)
+    logger.info(f"{counter.count} queries")
+
+The listener is attached to the ``Engine`` class once, so it covers the app's
+async and sync engines as well as engines created by tests. When no counter
+is active it costs a single ContextVar lookup per statement.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """Statements executed while the counter was active"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+_active_counter: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _active_counter.get()
+    if counter is not None:
+        counter.statements.append(statement)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Count statements executed inside the block (by this task and its children)"""
+    counter = QueryCounter()
+    token = _active_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _active_counter.reset(token)
@@ -1,10 +1,13 @@
 import os
 
 from backend.core.config import settings
+from backend.database.pool import pool_plan
 
 # Gunicorn setup
 bind = f"{settings.HOST}:{settings.PORT}"
-workers = 2
+# One async worker per CPU, capped so every worker's pools fit the
+# DATABASE_CONNECTION_BUDGET (override with WEB_WORKERS)
+workers = pool_plan().workers
 worker_class = "backend.core.worker.AsyncioUvicornWorker"
 
 # Timeout and Keepalive
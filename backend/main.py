@@ -11,6 +11,11 @@ A production-ready FastAPI backend with:
 - Full test coverage with pytest
 """
 
+# Installed first so EAGLECHAIR_PROFILE_STARTUP can time every import below
+from backend.core import startup_profile
+
+startup_profile.install()
+
 import asyncio
 import logging
 import os
@@ -20,7 +25,6 @@ from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
-import gunicorn.app.base
 
 from backend.api import versioning
 from backend.api.v1 import router as v1_router
@@ -68,14 +72,17 @@ async def lifespan(app: FastAPI):
 
             # Simple distributed lock
             # We use set(nx=True) to ensure only one worker gets the lock
-            if await redis_client.set(lock_key, worker_id, nx=True, ex=60):
+            with startup_profile.step("acquire_startup_lock"):
+                acquired = await redis_client.set(lock_key, worker_id, nx=True, ex=60)
+            if acquired:
                 lock_acquired = True
                 logger.info(f"[WORKER] Acquired startup lock (ID: {worker_id})")
 
                 # --- START CRITICAL SECTION ---
 
                 try:
-                    await init_db()
+                    with startup_profile.step("init_db"):
+                        await init_db()
                     logger.info("[OK] Database initialized")
                 except Exception as e:
                     logger.error(f"❌ Database initialization failed: {e}")
@@ -88,9 +95,10 @@ async def lifespan(app: FastAPI):
                     async with AsyncSessionLocal() as db:
                         try:
                             logger.info("📦 Exporting CMS content to static files...")
-                            success = await CMSAdminService.export_all_static_content(
-                                db
-                            )
+                            with startup_profile.step("cms_export"):
+                                success = await CMSAdminService.export_all_static_content(
+                                    db
+                                )
                             await db.commit()
                             if success:
                                 logger.info("[OK] CMS content exported to frontend")
@@ -102,17 +110,8 @@ async def lifespan(app: FastAPI):
                 except Exception as e:
                     logger.warning(f"[WARN] CMS export setup failed: {e}")
 
-                # Run cleanup of expired temporary catalog data
-                try:
-                    from backend.services.cleanup_service import run_cleanup
-
-                    logger.info(
-                        "🧹 Running cleanup of expired temporary catalog data..."
-                    )
-                    asyncio.create_task(run_cleanup())
-                    logger.info("[OK] Cleanup task started in background")
-                except Exception as e:
-                    logger.warning(f"[WARN] Cleanup task failed to start: {e}")
+                # Cleanup of expired temporary catalog data is a recurring
+                # job in the background worker (python -m backend.worker)
 
                 # --- END CRITICAL SECTION ---
 
@@ -120,9 +119,13 @@ async def lifespan(app: FastAPI):
                 logger.info(
                     "[WORKER] Startup lock held by another worker - skipping one-time initialization tasks"
                 )
-                # Wait a bit to let the other worker finish critical DB tasks before we proceed
+                # Wait (up to 2s) for the other worker to finish critical DB tasks before we proceed
                 # This helps avoid race conditions immediately after startup
-                await asyncio.sleep(2)
+                with startup_profile.step("wait_for_startup_lock"):
+                    for _ in range(20):
+                        if not await redis_client.exists(lock_key):
+                            break
+                        await asyncio.sleep(0.1)
 
         finally:
             # Release lock if we acquired it
@@ -142,63 +145,47 @@ async def lifespan(app: FastAPI):
         # Fallback: Run critical tasks anyway if coordination fails
         # This handles cases where Redis is down
         try:
-            await init_db()
+            with startup_profile.step("init_db"):
+                await init_db()
         except:
             pass
 
-    # Cache warm-up is safe to run on all workers (idempotent-ish) or can be skipped
-    # Actually, one worker warming it is enough.
-    # We'll just let it run in background on all workers for now as it doesn't hurt much (just reads DB)
-    # or keeps cache fresh.
+    # Keep the product search index warm. Every worker runs this loop, but
+    # the cluster-wide lock in refresh_search_cache lets only one of them
+    # rebuild per interval, and the interval is shorter than the index TTL.
+    async def refresh_search_cache_periodically():
+        """Background task that (re)builds the search index without blocking startup"""
+        import random
 
-    # Warm up product search cache for fast fuzzy search (non-blocking)
-    async def warm_cache_background():
-        """Background task to warm up cache without blocking server startup"""
-        try:
-            from backend.services.cache_service import cache_service
+        from backend.database.base import AsyncSessionLocal
+        from backend.services.cache_service import cache_service
+        from backend.services.product_service import SEARCH_REFRESH_SECONDS, ProductService
 
-            # Quick health check to see if Redis is available
-            if not cache_service.enabled or not cache_service.cache:
-                return
+        if not cache_service.enabled or not cache_service.cache:
+            return
 
+        # Random small delay to prevent all workers hitting the lock at the same time
+        await asyncio.sleep(random.uniform(1, 5))
+        while True:
             try:
-                await asyncio.wait_for(
-                    cache_service.cache.get("__health_check__"), timeout=2.0
-                )
-            except:
-                return
-
-            from backend.database.base import AsyncSessionLocal
-            from backend.services.product_service import ProductService
-
-            async with AsyncSessionLocal() as db:
-                try:
-                    # Random small delay to prevent all workers hitting DB exactly at same time
-                    import random
-
-                    await asyncio.sleep(random.uniform(1, 5))
-
-                    logger.info("🔍 Warming product search cache...")
-                    await asyncio.wait_for(
-                        ProductService.warm_search_cache(db),
-                        timeout=30.0,
-                    )
-                    await db.commit()
-                except:
-                    await db.rollback()
-        except:
-            pass
+                async with AsyncSessionLocal() as db:
+                    await ProductService.refresh_search_cache(db)
+            except Exception as e:
+                logger.warning(f"[WARN] Search cache refresh failed: {e}")
+            await asyncio.sleep(SEARCH_REFRESH_SECONDS)
 
     # Start warm-up as background task (non-blocking)
-    asyncio.create_task(warm_cache_background())
+    search_refresh_task = asyncio.create_task(refresh_search_cache_periodically())
 
     logger.info(f"🎯 API v1 available at: {settings.API_V1_PREFIX}")
     logger.info("✨ EagleChair API is ready!")
+    startup_profile.log_report()
 
     yield
 
     # Shutdown
     logger.info("🛑 Shutting down EagleChair API...")
+    search_refresh_task.cancel()
 
     try:
         # Close cache connections first
@@ -370,46 +357,49 @@ if frontend_dist_path.exists() and (frontend_dist_path / "index.html").exists():
 
     # Mount data directory if it exists (for contentData.js)
     if (frontend_dist_path / "data").exists():
-        # Special handling for contentData.json/js - disable caching
-        from fastapi.responses import FileResponse
+        # contentData.json/js change on every CMS save: clients revalidate
+        # (ETag). Hashed bundles never change: cached for a year. All are sent
+        # from pre-compressed .br/.gz siblings when the client accepts them.
+        from backend.utils.precompressed import IMMUTABLE_CACHE_CONTROL, precompressed_response
+        from backend.utils.static_content_exporter import HASHED_BUNDLE_RE, MANIFEST_NAME
+
+        data_dir = frontend_dist_path / "data"
+        _revalidate_headers = {
+            "Cache-Control": "no-cache, must-revalidate, max-age=0",
+            "Pragma": "no-cache",
+            "Expires": "0",
+        }
 
-        @app.get(
-            "/data/contentData.json",
-            response_class=FileResponse,
-            include_in_schema=False,
-        )
-        async def serve_content_data_json():
-            """Serve contentData.json with no-cache headers (dynamic CMS content)"""
-            content_data_file = frontend_dist_path / "data" / "contentData.json"
+        def _content_data_response(request: Request, name: str, media_type: str, headers: dict):
+            content_data_file = data_dir / name
             if content_data_file.exists():
-                return FileResponse(
-                    content_data_file,
-                    media_type="application/json",
-                    headers={
-                        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-                        "Pragma": "no-cache",
-                        "Expires": "0",
-                    },
-                )
+                return precompressed_response(request, content_data_file, media_type, headers)
             return JSONResponse(content={"detail": "Content data not found"}, status_code=404)
 
-        @app.get(
-            "/data/contentData.js", response_class=FileResponse, include_in_schema=False
-        )
-        async def serve_content_data_js():
-            """Serve contentData.js with no-cache headers (legacy format, backward compatibility)"""
-            content_data_file = frontend_dist_path / "data" / "contentData.js"
-            if content_data_file.exists():
-                return FileResponse(
-                    content_data_file,
-                    media_type="application/javascript",
-                    headers={
-                        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-                        "Pragma": "no-cache",
-                        "Expires": "0",
-                    },
-                )
-            return JSONResponse(content={"detail": "Content data not found"}, status_code=404)
+        @app.get("/data/contentData.json", include_in_schema=False)
+        async def serve_content_data_json(request: Request):
+            """Serve contentData.json, revalidated on every use (dynamic CMS content)"""
+            return _content_data_response(request, "contentData.json", "application/json", _revalidate_headers)
+
+        @app.get("/data/contentData.js", include_in_schema=False)
+        async def serve_content_data_js(request: Request):
+            """Serve contentData.js, revalidated on every use (legacy format, backward compatibility)"""
+            return _content_data_response(request, "contentData.js", "application/javascript", _revalidate_headers)
+
+        @app.get(f"/data/{MANIFEST_NAME}", include_in_schema=False)
+        async def serve_content_data_manifest(request: Request):
+            """Serve the manifest naming the current hashed contentData bundle"""
+            return _content_data_response(request, MANIFEST_NAME, "application/json", _revalidate_headers)
+
+        @app.get("/data/contentData.{version}.json", include_in_schema=False)
+        async def serve_content_data_bundle(request: Request, version: str):
+            """Serve a content-hashed contentData bundle with immutable caching"""
+            name = f"contentData.{version}.json"
+            if not HASHED_BUNDLE_RE.match(name):
+                return JSONResponse(content={"detail": "Content data not found"}, status_code=404)
+            return _content_data_response(
+                request, name, "application/json", {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+            )
 
         # Mount other data files with normal caching
         app.mount(
@@ -507,34 +497,38 @@ async def root_old():
     return get_api_docs_html()
 
 
-class StandaloneApplication(gunicorn.app.base.BaseApplication):
-    """
-    Custom Gunicorn application to run programmatically.
-    """
+if __name__ == "__main__":
+    # Gunicorn is only needed when running this module directly
+    import gunicorn.app.base
 
-    def __init__(self, app, options=None):
-        self.options = options or {}
-        self.application = app
-        super().__init__()
+    from backend.database.pool import pool_plan
 
-    def load_config(self):
-        config = {
-            key: value
-            for key, value in self.options.items()
-            if key in self.cfg.settings and value is not None
-        }
-        for key, value in config.items():
-            self.cfg.set(key.lower(), value)
+    class StandaloneApplication(gunicorn.app.base.BaseApplication):
+        """
+        Custom Gunicorn application to run programmatically.
+        """
 
-    def load(self):
-        return self.application
+        def __init__(self, app, options=None):
+            self.options = options or {}
+            self.application = app
+            super().__init__()
 
+        def load_config(self):
+            config = {
+                key: value
+                for key, value in self.options.items()
+                if key in self.cfg.settings and value is not None
+            }
+            for key, value in config.items():
+                self.cfg.set(key.lower(), value)
+
+        def load(self):
+            return self.application
 
-if __name__ == "__main__":
     # Gunicorn options matching gunicorn_conf.py
     options = {
         "bind": f"{settings.HOST}:{settings.PORT}",
-        "workers": 2,
+        "workers": pool_plan().workers,
         "worker_class": "backend.core.worker.AsyncioUvicornWorker",
         "timeout": 120,
         "keepalive": 5,
@@ -75,6 +75,12 @@ from backend.models.quote import (
     SavedConfiguration,
 )
 
+# Background jobs
+from backend.models.job import BackgroundJob, JobStatus
+
+# Analytics rollups
+from backend.models.analytics import QuoteCompanyDaily, QuoteResponseDaily, QuoteStatusDaily
+
 __all__ = [
     # Legal
     "LegalDocument",
@@ -123,4 +129,11 @@ __all__ = [
     "Cart",
     "CartItem",
     "SavedConfiguration",
+    # Background jobs
+    "BackgroundJob",
+    "JobStatus",
+    # Analytics rollups
+    "QuoteStatusDaily",
+    "QuoteCompanyDaily",
+    "QuoteResponseDaily",
 ]
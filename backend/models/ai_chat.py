@@ -72,6 +72,11 @@ class AIChatSession(Base):
     pinned = Column(Boolean, default=False, nullable=False)
     tags = Column(JSON, default=list)
 
+    # Rolling summary of the messages up to history_summary_until; only the
+    # messages after it are sent verbatim to the model
+    history_summary = Column(Text, nullable=True)
+    history_summary_until = Column(DateTime, nullable=True)
+
     # Relationships
     messages = relationship(
         "AIChatMessage",
@@ -155,6 +160,13 @@ class AITrainingDocument(Base):
     structured_data = Column(Text, nullable=True)  # Full tables/pricing in markdown
     embeddings_count = Column(Integer, default=0)  # Number of chunks stored
 
+    # Ingestion progress: per-chunk results are saved as they complete so a
+    # retried job resumes instead of re-analysing finished chunks
+    chunks_total = Column(Integer, default=0, nullable=False)
+    chunks_done = Column(Integer, default=0, nullable=False)
+    chunk_results = Column(JSON, nullable=True)  # {"content_hash": ..., "parts": {index: result}}
+    processing_stats = Column(JSON, nullable=True)  # Timings and throughput of the last run
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,49 @@
+"""
+Analytics Rollup Models
+
+Daily quote aggregates read by the admin dashboard instead of scanning the
+``quotes`` table. Rows are kept current by the quote flush hooks in
+``backend.services.quote_rollup_service`` and can be rebuilt with
+``python -m backend.scripts.backfill_quote_rollups``.
+"""
+
+from sqlalchemy import BigInteger, Column, Date, Integer, String
+
+from backend.database.base import Base
+
+
+class QuoteStatusDaily(Base):
+    """Quotes created on ``day`` that are currently in ``status``"""
+
+    __tablename__ = "analytics_quote_status_daily"
+
+    day = Column(Date, primary_key=True)
+    status = Column(String(20), primary_key=True)
+    quote_count = Column(Integer, default=0, nullable=False)
+    total_amount_sum = Column(BigInteger, default=0, nullable=False)  # In cents
+    quoted_price_sum = Column(BigInteger, default=0, nullable=False)  # In cents
+    quoted_price_count = Column(Integer, default=0, nullable=False)  # Quotes with a quoted price
+
+
+class QuoteCompanyDaily(Base):
+    """Per-company quote totals for quotes created on ``day`` (guest quotes excluded)"""
+
+    __tablename__ = "analytics_quote_company_daily"
+
+    day = Column(Date, primary_key=True)
+    company_id = Column(Integer, primary_key=True, index=True)
+    quote_count = Column(Integer, default=0, nullable=False)
+    accepted_count = Column(Integer, default=0, nullable=False)
+    quoted_value_sum = Column(BigInteger, default=0, nullable=False)  # Quoted or accepted, in cents
+
+
+class QuoteResponseDaily(Base):
+    """First responses (quote priced) made on ``day``, measured from submission"""
+
+    __tablename__ = "analytics_quote_response_daily"
+
+    day = Column(Date, primary_key=True)
+    response_count = Column(Integer, default=0, nullable=False)
+    response_seconds_sum = Column(BigInteger, default=0, nullable=False)
+    fastest_seconds = Column(Integer, nullable=True)
+    slowest_seconds = Column(Integer, nullable=True)
@@ -324,19 +324,16 @@ class Chair(Base):
     # Additional category / subcategory assignments (many-to-many).
     # Always contains the primary assignment as well, so `categories` is the
     # complete set of categories a product should be listed under.
-    # lazy="selectin" keeps these usable from async response serialization
-    # without every caller having to remember to eager load them.
+    # Loaded only where a query asks for them (see backend/models/loaders.py).
     categories = relationship(
         "Category",
         secondary=chair_categories,
         backref="all_products",
-        lazy="selectin",
     )
     subcategories = relationship(
         "ProductSubcategory",
         secondary=chair_subcategories,
         backref="all_products",
-        lazy="selectin",
     )
 
     family_id = Column(
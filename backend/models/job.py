@@ -0,0 +1,61 @@
+"""
+Background Job Models
+
+Durable job queue consumed by the ``python -m backend.worker`` process:
+catalog parsing, import to production, cleanup, training documents and bulk
+product imports.
+"""
+
+import enum
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+
+from backend.database.base import Base
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class BackgroundJob(Base):
+    """
+    One unit of background work.
+
+    A worker claims a job by setting ``locked_by``/``locked_until`` (a lease)
+    and keeps extending the lease with heartbeats while it runs. A job whose
+    lease expired - the worker crashed or was restarted - is claimable again.
+    """
+
+    __tablename__ = "background_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(50), nullable=False, index=True)
+    status = Column(String(20), default=JobStatus.QUEUED.value, nullable=False, index=True)
+    payload = Column(JSON, nullable=True)
+
+    # Domain record the job works on (upload_id, training doc id, import job id)
+    reference_id = Column(String(100), nullable=True, index=True)
+
+    # Retries
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=1, nullable=False)
+    run_after = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    # Lease
+    locked_by = Column(String(100), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    result = Column(JSON, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (Index("ix_background_jobs_claim", "status", "job_type", "run_after"),)
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob(id={self.id}, type={self.job_type}, status={self.status})>"
@@ -0,0 +1,66 @@
+"""
+Chair Loader Profiles
+
+Chair relationships load lazily by default; queries state what they need by
+applying one of these named eager-loading profiles:
+
+    select(Chair).options(*ChairLoad.LIST)
+
+With DATABASE_RAISE_ON_LAZY_LOAD (on in tests) every profile also adds
+``raiseload("*", sql_only=True)``, so touching a relationship the profile
+did not load fails loudly instead of quietly issuing a query per row (or a
+MissingGreenlet error under asyncio).
+"""
+
+from sqlalchemy.orm import raiseload, selectinload
+
+from backend.core.config import settings
+from backend.models.chair import Category, Chair, ProductVariation
+
+_STRICT = (raiseload("*", sql_only=True),) if settings.DATABASE_RAISE_ON_LAZY_LOAD else ()
+
+_CARD = (
+    selectinload(Chair.category).selectinload(Category.parent),
+    selectinload(Chair.subcategory),
+    selectinload(Chair.family),
+    selectinload(Chair.categories),
+    selectinload(Chair.subcategories),
+)
+
+_VARIATIONS = (
+    selectinload(Chair.variations).selectinload(ProductVariation.finish),
+    selectinload(Chair.variations).selectinload(ProductVariation.upholstery),
+    selectinload(Chair.variations).selectinload(ProductVariation.color),
+    selectinload(Chair.variations).selectinload(ProductVariation.families),
+)
+
+
+class ChairLoad:
+    """Named eager-loading profiles for Chair queries"""
+
+    # Storefront product cards (ChairResponse): primary category with its
+    # parent (for parent_slug), subcategory, family and the category lists
+    LIST = _CARD + _STRICT
+
+    # Product page (ChairDetailResponse): a card plus variations and families
+    DETAIL = _CARD + (selectinload(Chair.secondary_families),) + _VARIATIONS + _STRICT
+
+    # Search and related-product results (ChairResponse without parent_slug)
+    SEARCH = (
+        selectinload(Chair.category),
+        selectinload(Chair.categories),
+        selectinload(Chair.subcategories),
+    ) + _STRICT
+
+    # Admin product table: primary assignments and variations, no category lists
+    ADMIN = (
+        selectinload(Chair.category),
+        selectinload(Chair.subcategory),
+        selectinload(Chair.family),
+    ) + _VARIATIONS + _STRICT
+
+    # Sitemap, SEO and exports: just what product URLs are built from
+    EXPORT = (
+        selectinload(Chair.category),
+        selectinload(Chair.subcategory),
+    ) + _STRICT
@@ -4,7 +4,7 @@ EagleChair Quote and Cart Models
 Models for quote requests and shopping cart (quotes only, no actual purchasing)
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, Float, ForeignKey, JSON, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, DateTime, Integer, String, Text, Boolean, Float, ForeignKey, JSON, Enum as SQLEnum, UniqueConstraint
 from sqlalchemy.orm import relationship
 import enum
 
@@ -207,6 +207,12 @@ class Cart(Base):
     estimated_shipping = Column(Integer, default=0, nullable=False)
     estimated_total = Column(Integer, default=0, nullable=False)
     
+    # Price snapshot: stamp of the pricing inputs (tier + products + items)
+    # the cached unit prices/totals were computed from. Reads only reprice
+    # when the stamp no longer matches.
+    price_version = Column(String(64), nullable=True)
+    priced_at = Column(DateTime, nullable=True)
+    
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
     
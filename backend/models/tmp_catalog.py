@@ -330,3 +330,45 @@ class CatalogUpload(Base):
     
     def __repr__(self) -> str:
         return f"<CatalogUpload(id={self.id}, upload_id={self.upload_id}, status={self.status})>"
+
+
+class ProductImportJob(Base):
+    """
+    Track bulk product import jobs (NDJSON/CSV uploads to /admin/products/bulk)
+    """
+    __tablename__ = "product_import_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(100), unique=True, nullable=False, index=True, default=lambda: str(uuid.uuid4()))
+    
+    # File information
+    filename = Column(String(255), nullable=False)
+    file_format = Column(String(20), nullable=False)  # ndjson, csv
+    file_size = Column(Integer, default=0, nullable=False)  # In bytes
+    file_path = Column(String(500), nullable=True)
+    
+    # Processing status
+    status = Column(String(50), default='uploaded', nullable=False)  # uploaded, importing, completed, failed
+    progress_percentage = Column(Integer, default=0, nullable=False)
+    current_step = Column(String(100), nullable=True)
+    error_message = Column(Text, nullable=True)
+    
+    # Results
+    total_rows = Column(Integer, nullable=True)
+    rows_processed = Column(Integer, default=0, nullable=False)
+    rows_failed = Column(Integer, default=0, nullable=False)
+    products_created = Column(Integer, default=0, nullable=False)
+    products_updated = Column(Integer, default=0, nullable=False)
+    variations_upserted = Column(Integer, default=0, nullable=False)
+    row_errors = Column(JSON, nullable=True)  # [{"row": n, "error": "..."}], capped
+    
+    # Metadata
+    uploaded_by = Column(String(100), nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self) -> str:
+        return f"<ProductImportJob(id={self.id}, job_id={self.job_id}, status={self.status})>"
@@ -0,0 +1,43 @@
+"""
+Backfill Quote Rollups Script
+
+Rebuilds the daily analytics rollups used by the admin dashboard from the
+quotes table. Run once after deploying the rollup tables, and again after
+any bulk SQL change to quotes (those bypass the incremental hooks).
+
+Usage:
+    python -m backend.scripts.backfill_quote_rollups
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.database.base import AsyncSessionLocal, close_db, init_db
+from backend.services.quote_rollup_service import QuoteRollupService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def backfill() -> None:
+    await init_db()
+    try:
+        async with AsyncSessionLocal() as db:
+            stats = await QuoteRollupService.rebuild(db)
+        logger.info(
+            f"Backfilled rollups from {stats['quotes']} quotes: "
+            f"{stats['status_rows']} status rows, {stats['company_rows']} company rows, "
+            f"{stats['response_rows']} response rows"
+        )
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill())
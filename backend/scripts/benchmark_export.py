@@ -0,0 +1,117 @@
+"""
+Export Benchmark Script
+
+Seeds a throwaway SQLite database with synthetic companies and streams the
+admin company export from it, sampling resident memory as rows go out.
+RSS should stay flat while throughput is reported in rows/s and MB/s.
+
+Usage:
+    python -m backend.scripts.benchmark_export
+    python -m backend.scripts.benchmark_export --rows 200000 --format parquet
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import backend.services.export_service as export_module
+from backend.database.base import Base
+from backend.models.company import Company, CompanyStatus
+from backend.services.export_service import EXPORT_BATCH_SIZE, ExportService, companies_export
+
+SEED_BATCH = 20000
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB (Linux), else peak RSS"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def seed(db_path: str, rows: int) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine, tables=[Company.__table__])
+    statuses = list(CompanyStatus)
+    with engine.begin() as conn:
+        for start in range(0, rows, SEED_BATCH):
+            conn.execute(insert(Company), [
+                {
+                    "company_name": f"Company {i}",
+                    "rep_first_name": "Pat",
+                    "rep_last_name": f"Buyer{i}",
+                    "rep_email": f"buyer{i}@example.com",
+                    "rep_phone": "555-0100",
+                    "hashed_password": "x",
+                    "billing_address_line1": f"{i} Main St",
+                    "billing_city": "Springfield",
+                    "billing_state": "IL",
+                    "billing_zip": "62701",
+                    "status": statuses[i % len(statuses)],
+                }
+                for i in range(start, min(start + SEED_BATCH, rows))
+            ])
+    engine.dispose()
+
+
+async def run(db_path: str, rows: int, fmt: str, batch_size: int) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    export_module.AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+    ExportService.check_format(fmt)
+    columns, stmt = companies_export()
+    baseline = rss_mb()
+    samples = []
+    total_bytes = 0
+    chunks = 0
+    started = time.perf_counter()
+    async for chunk in ExportService.stream("companies", fmt, columns, stmt, batch_size=batch_size):
+        total_bytes += len(chunk)
+        chunks += 1
+        if chunks % 20 == 0:
+            samples.append(rss_mb())
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    print(f"format:      {fmt} (batch {batch_size})")
+    print(f"rows:        {rows:,}")
+    print(f"output:      {total_bytes / 1e6:,.1f} MB in {chunks:,} chunks")
+    print(f"elapsed:     {elapsed:.2f}s")
+    print(f"throughput:  {rows / elapsed:,.0f} rows/s, {total_bytes / elapsed / 1e6:.1f} MB/s")
+    if samples:
+        print(f"RSS (MB):    start {baseline:.1f}, min {min(samples):.1f}, max {max(samples):.1f}, "
+              f"end {samples[-1]:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark streamed admin exports")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "export-bench.db")
+        started = time.perf_counter()
+        seed(db_path, args.rows)
+        print(f"seeded {args.rows:,} companies in {time.perf_counter() - started:.1f}s")
+        asyncio.run(run(db_path, args.rows, args.format, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Product Serialization Benchmark Script
+
+Times turning a page of Chair ORM objects into response bytes two ways:
+
+- ``ChairResponse``: what FastAPI does for ``response_model=list[ChairResponse]``
+  (validate from attributes, dump to JSON-compatible Python, stdlib json)
+- fast path: ``backend.api.v1.serializers`` (field plan + orjson)
+
+The products are transient ORM objects, so no database is needed and only
+serialization is measured. Results are reported per 100 products.
+
+Usage:
+    python -m backend.scripts.benchmark_product_serialization
+    python -m backend.scripts.benchmark_product_serialization --products 20 --iterations 2000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from backend.api.v1.schemas.product import ChairResponse
+from backend.api.v1.serializers import chair_list_response
+from backend.models.chair import Category, Chair, ProductSubcategory
+
+
+def as_loaded(obj):
+    """Give every column a value, like a row loaded from the database"""
+    for column in type(obj).__table__.columns:
+        if column.key not in obj.__dict__:
+            setattr(obj, column.key, None)
+    return obj
+
+
+def build_products(count: int) -> list:
+    now = datetime(2025, 1, 1, 12, 30)
+    categories = [
+        as_loaded(Category(id=i, name=f"Category {i}", slug=f"category-{i}", display_order=i,
+                           is_active=True, created_at=now, updated_at=now))
+        for i in range(1, 4)
+    ]
+    subcategory = as_loaded(ProductSubcategory(id=1, name="Side Chairs", slug="side-chairs", category_id=1,
+                                               display_order=0, is_active=True, created_at=now, updated_at=now))
+    products = []
+    for i in range(count):
+        product = Chair(
+            id=i + 1, model_number=f"{6000 + i}", name=f"Side Chair {i}", slug=f"side-chair-{i}",
+            short_description="Stackable hospitality side chair",
+            full_description="Solid beech frame with upholstered seat and back. " * 4,
+            category_id=1, subcategory_id=1, base_price=25000, msrp=32000,
+            width=18.5, depth=21.0, height=33.5, seat_height=18.0,
+            features=["Stackable", "Commercial grade"], available_finishes=[1, 2, 3],
+            images=[{"url": f"/images/{6000 + i}-{view}.jpg", "type": view, "order": n}
+                    for n, view in enumerate(("front", "side", "back"))],
+            hover_images=[f"/images/{6000 + i}-hover.jpg"], primary_image_url=f"/images/{6000 + i}-front.jpg",
+            stock_status="In Stock", lead_time_days=42, minimum_order_quantity=1,
+            keywords=["dining", "restaurant"], is_active=True, is_featured=i % 5 == 0, is_new=False,
+            is_custom_only=False, display_order=i, ada_compliant=False, is_outdoor_suitable=False,
+            view_count=i * 3, quote_count=i, created_at=now, updated_at=now,
+            categories=categories[:2], subcategories=[subcategory],
+        )
+        as_loaded(product)
+        product.customizations = {"finishes": [{"id": 1, "name": "Walnut"}], "colors": [], "fabrics": []}
+        products.append(product)
+    return products
+
+
+def time_per_100(render, products: list, iterations: int) -> float:
+    render(products)  # warm up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render(products)
+    elapsed = time.perf_counter() - started
+    return elapsed / iterations / len(products) * 100 * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark product list serialization")
+    parser.add_argument("--products", type=int, default=100, help="Products per response")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    products = build_products(args.products)
+    adapter = TypeAdapter(list[ChairResponse])
+
+    def pydantic_path(items):
+        validated = adapter.validate_python(items, from_attributes=True)
+        return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+    def fast_path(items):
+        return chair_list_response(items).body
+
+    assert pydantic_path(products) == fast_path(products), "fast path output differs from ChairResponse"
+
+    slow = time_per_100(pydantic_path, products, args.iterations)
+    fast = time_per_100(fast_path, products, args.iterations)
+    print(f"{args.products} products x {args.iterations} iterations, {len(fast_path(products)):,} bytes/response")
+    print(f"ChairResponse + json:  {slow:8.2f} ms per 100 products")
+    print(f"fast path + orjson:    {fast:8.2f} ms per 100 products")
+    print(f"speedup:               {slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Search Cache Warm-up Benchmark Script
+
+Seeds a throwaway SQLite database with a synthetic catalog and times
+``ProductService.warm_search_cache`` against the configured cache
+(REDIS_URL). ``--sequential`` times the previous approach instead: load all
+chairs as ORM objects and index them one cache call at a time.
+
+Without a reachable Redis, ``--dry-run`` swaps the cache writes for a no-op
+so the database streaming and text building can still be measured.
+
+Usage:
+    python -m backend.scripts.benchmark_search_warmup
+    python -m backend.scripts.benchmark_search_warmup --products 50000 --batch-size 1000
+    python -m backend.scripts.benchmark_search_warmup --sequential
+    python -m backend.scripts.benchmark_search_warmup --dry-run
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from backend.database.base import Base
+from backend.models.chair import Category, Chair
+from backend.services.cache_service import cache_service
+from backend.services.product_service import (
+    SEARCH_INDEX_TTL,
+    SEARCH_WARM_BATCH_SIZE,
+    ProductService,
+    _searchable_text,
+)
+
+SEED_BATCH = 5000
+CATEGORIES = 40
+
+
+def seed(db_path: str, products: int) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [
+            {"name": f"Category {i}", "slug": f"category-{i}"} for i in range(CATEGORIES)
+        ])
+        for start in range(0, products, SEED_BATCH):
+            conn.execute(insert(Chair), [
+                {
+                    "model_number": f"{6000 + i}",
+                    "name": f"Side Chair {i}",
+                    "slug": f"side-chair-{i}",
+                    "short_description": "Stackable hospitality side chair",
+                    "full_description": "Solid beech frame with upholstered seat and back. " * 4,
+                    "keywords": ["dining", "restaurant", f"series-{i % 50}"],
+                    "category_id": i % CATEGORIES + 1,
+                    "base_price": 25000,
+                }
+                for i in range(start, min(start + SEED_BATCH, products))
+            ])
+    engine.dispose()
+
+
+async def warm_sequential(db) -> int:
+    """The previous warm-up: ORM load of the whole catalog, one cache call per product"""
+    result = await db.execute(
+        select(Chair).where(Chair.is_active == True).options(selectinload(Chair.category))
+    )
+    indexed = 0
+    for product in result.scalars().all():
+        text = _searchable_text(
+            product.name, product.model_number, product.short_description, product.full_description,
+            product.category.name if product.category else None, product.keywords,
+        )
+        indexed += await cache_service.index_product_for_search(product.id, text, ttl=SEARCH_INDEX_TTL)
+    return indexed
+
+
+async def run(db_path: str, sequential: bool, batch_size: int, dry_run: bool) -> None:
+    if dry_run:
+        async def _discard(products, ttl=SEARCH_INDEX_TTL):
+            return len(products)
+
+        async def _discard_one(product_id, searchable_text, ttl=SEARCH_INDEX_TTL):
+            return True
+
+        cache_service.index_products_for_search = _discard
+        cache_service.index_product_for_search = _discard_one
+    elif not cache_service.enabled or not await cache_service.cache.health():
+        print("cache unavailable (check REDIS_URL / ENABLE_CACHE) - use --dry-run")
+        return
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    started = time.perf_counter()
+    async with session_factory() as db:
+        if sequential:
+            indexed = await warm_sequential(db)
+        else:
+            indexed = await ProductService.warm_search_cache(db, batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    mode = "sequential" if sequential else f"pipelined (batch {batch_size})"
+    print(f"mode:        {mode}{' [dry run]' if dry_run else ''}")
+    print(f"indexed:     {indexed:,}")
+    print(f"elapsed:     {elapsed:.2f}s")
+    print(f"throughput:  {indexed / elapsed:,.0f} products/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the product search cache warm-up")
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=SEARCH_WARM_BATCH_SIZE)
+    parser.add_argument("--sequential", action="store_true", help="Time the previous one-by-one warm-up")
+    parser.add_argument("--dry-run", action="store_true", help="Skip cache writes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "search-warmup-bench.db")
+        started = time.perf_counter()
+        seed(db_path, args.products)
+        print(f"seeded {args.products:,} products in {time.perf_counter() - started:.1f}s")
+        asyncio.run(run(db_path, args.sequential, args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
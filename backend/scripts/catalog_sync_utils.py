@@ -7,10 +7,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from backend.api.v1.routes.admin.upload import detect_mime_from_content, process_image_to_webp
 from backend.models.chair import Chair
-from backend.scripts.migrations.catalog_fill_utils import (
-    family_name_from_pdf_path,
-    parse_pdf_for_fill,
-)
+from backend.scripts.migrations.catalog_fill_utils import family_name_from_pdf_path
+from backend.scripts.migrations.pdf_extract_cache import extract_pdfs
+from backend.services.image_index_service import ImageIndex, ImageIndexService
 
 BOOTH_IMAGE_BY_MODEL: Dict[str, str] = {
     "8320": "Boothilicious_2024_images/Boothilicious 2024 Copy_image_01.png",
@@ -83,11 +82,13 @@ def index_asset_images(assets_root: Path) -> Dict[str, List[Path]]:
     return dict(by_base)
 
 
-def pick_best_asset_image(paths: List[Path]) -> Optional[Path]:
+def pick_best_asset_image(paths: List[Path], index: Optional[ImageIndex] = None) -> Optional[Path]:
+    """Best source image by filename rules; with an index, ties go to the sharper, larger file."""
     if not paths:
         return None
+    quality = {Path(k): fp.quality for k, fp in index.fingerprints(paths).items()} if index else {}
 
-    def score(p: Path) -> Tuple[int, int, str]:
+    def score(p: Path) -> Tuple[int, Tuple[int, float], int, str]:
         name = p.name.lower()
         s = 0
         if "cmyk-scans" in str(p).lower():
@@ -98,7 +99,7 @@ def pick_best_asset_image(paths: List[Path]) -> Optional[Path]:
             s -= 10
         if "v12" in name or "v42" in name:
             s += 5
-        return (s, -len(name), name)
+        return (s, quality.get(p, (0, 0.0)), -len(name), name)
 
     return max(paths, key=score)
 
@@ -156,10 +157,14 @@ def copy_asset_to_uploads(
     processed, ext = process_image_to_webp(content, mime)
     dest_dir = uploads_dir / "images" / "products"
     dest_dir.mkdir(parents=True, exist_ok=True)
+    check = ImageIndexService.check_duplicate(processed, dest_dir)
+    if check.identical:
+        return f"/uploads/images/products/{check.identical.name}"
     safe = re.sub(r"[^a-zA-Z0-9._-]+", "_", src.stem)[:80]
     filename = f"{model_number}_{safe}_{int(time.time())}{ext}"
     dest = dest_dir / filename
     dest.write_bytes(processed)
+    ImageIndexService.record(dest, check.fingerprint)
     return f"/uploads/images/products/{filename}"
 
 
@@ -179,29 +184,25 @@ def index_catalog_pdf_filenames(pdf_dir: Path) -> Dict[str, Dict[str, Any]]:
     return by_model
 
 
-def parse_pdfs_for_models(pdf_dir: Path, model_numbers: set[str]) -> Dict[str, Dict[str, Any]]:
+def parse_pdfs_for_models(
+    pdf_dir: Path, model_numbers: set[str], workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
     filename_index = index_catalog_pdf_filenames(pdf_dir)
     by_model: Dict[str, Dict[str, Any]] = {}
-    pdfs_to_parse: set[Path] = set()
+    pdfs_to_parse: set[str] = set()
     for mn in model_numbers:
         entry = filename_index.get(mn)
         if entry:
             by_model[mn] = dict(entry)
-            for p in entry.get("pdf_paths") or []:
-                pdfs_to_parse.add(Path(p))
-        for base, entry in filename_index.items():
-            if mn == base:
-                by_model.setdefault(mn, dict(entry))
-                for p in entry.get("pdf_paths") or []:
-                    pdfs_to_parse.add(Path(p))
-
-    for pdf in sorted(pdfs_to_parse):
-        family = family_name_from_pdf_path(str(pdf))
-        for rec in parse_pdf_for_fill(str(pdf)):
+            pdfs_to_parse.update(entry.get("pdf_paths") or [])
+
+    for pdf, records in extract_pdfs(sorted(pdfs_to_parse), workers=workers).items():
+        family = family_name_from_pdf_path(pdf)
+        for rec in records:
             base = rec["base_model"]
             if base not in model_numbers and base not in by_model:
                 continue
-            existing = by_model.get(base, {"family_name": family, "pdf_paths": [str(pdf)]})
+            existing = by_model.get(base, {"family_name": family, "pdf_paths": [pdf]})
             existing.update(rec)
             if not existing.get("family_name"):
                 existing["family_name"] = family
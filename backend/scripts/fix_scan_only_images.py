@@ -43,6 +43,7 @@ from backend.scripts.catalog_sync_utils import (
     copy_asset_to_uploads,
 )
 from backend.services.admin_service import AdminService
+from backend.services.image_index_service import ImageIndex, is_near_duplicate
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -104,13 +105,19 @@ def index_by_model(folder: Path, require_install: bool = False) -> Dict[str, Lis
     return by_base
 
 
-def pick_best_scan(model_number: str, model_suffix: Optional[str], scans: List[Path]) -> Optional[Path]:
+def pick_best_scan(
+    model_number: str,
+    model_suffix: Optional[str],
+    scans: List[Path],
+    index: Optional[ImageIndex] = None,
+) -> Optional[Path]:
     if not scans:
         return None
     mn = (model_number or "").strip()
     suffix = (model_suffix or "").strip().upper()
+    quality = {Path(k): fp.quality for k, fp in index.fingerprints(scans).items()} if index else {}
 
-    def score(p: Path) -> Tuple[int, int, str]:
+    def score(p: Path) -> Tuple[int, Tuple[int, float], int, str]:
         name = p.name.lower()
         stem = p.stem.replace(" ", "")
         s = 0
@@ -128,13 +135,19 @@ def pick_best_scan(model_number: str, model_suffix: Optional[str], scans: List[P
             s -= 80
         if "banquette" in name and "booth" not in (model_number or ""):
             s -= 15
-        return (s, -len(name), name)
+        return (s, quality.get(p, (0, 0.0)), -len(name), name)
 
     best = max(scans, key=score)
     return best if score(best)[0] >= 20 else None
 
 
-def pick_install_shots(model_number: str, installs: List[Path], limit: int = MAX_GALLERY_INSTALLS) -> List[Path]:
+def pick_install_shots(
+    model_number: str,
+    installs: List[Path],
+    limit: int = MAX_GALLERY_INSTALLS,
+    index: Optional[ImageIndex] = None,
+) -> List[Path]:
+    """Install shots for the gallery; with an index, near-identical shots are skipped."""
     mn = (model_number or "").strip()
     candidates = []
     for p in installs:
@@ -155,12 +168,19 @@ def pick_install_shots(model_number: str, installs: List[Path], limit: int = MAX
         return (s, p.name)
 
     candidates.sort(key=score, reverse=True)
+    fingerprints = index.fingerprints(candidates) if index else {}
     seen = set()
+    kept = []
     out = []
     for p in candidates:
         if p in seen:
             continue
         seen.add(p)
+        fp = fingerprints.get(str(p))
+        if fp and any(is_near_duplicate(fp, other) for other in kept):
+            continue
+        if fp:
+            kept.append(fp)
         out.append(p)
         if len(out) >= limit:
             break
@@ -238,6 +258,10 @@ def gallery_urls_set(gallery: List[Dict[str, Any]]) -> set:
 def build_plan(chairs: List[Chair]) -> Dict[str, Any]:
     scan_index = index_by_model(SCANS_DIR)
     install_index = index_by_model(INSTALLS_DIR, require_install=False)
+    image_index = ImageIndex()
+    image_index.update(
+        p for by_model in (scan_index, install_index) for paths in by_model.values() for p in paths
+    )
 
     plan: Dict[str, Any] = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -267,7 +291,7 @@ def build_plan(chairs: List[Chair]) -> Dict[str, Any]:
         if pclass == "scan":
             plan["before"]["scan_primary"] += 1
             scans = scan_index.get(mn, [])
-            installs = pick_install_shots(mn, install_index.get(mn, []))
+            installs = pick_install_shots(mn, install_index.get(mn, []), index=image_index)
             if installs:
                 plan["actions"].append(
                     {
@@ -286,8 +310,8 @@ def build_plan(chairs: List[Chair]) -> Dict[str, Any]:
             plan["before"]["wrong_primary"] += 1
 
         scans = scan_index.get(mn, [])
-        best_scan = pick_best_scan(mn, chair.model_suffix, scans)
-        installs = pick_install_shots(mn, install_index.get(mn, []))
+        best_scan = pick_best_scan(mn, chair.model_suffix, scans, image_index)
+        installs = pick_install_shots(mn, install_index.get(mn, []), index=image_index)
 
         gallery = parse_gallery(chair.images)
         existing_urls = gallery_urls_set(gallery)
@@ -336,6 +360,7 @@ def build_plan(chairs: List[Chair]) -> Dict[str, Any]:
         "gallery_install_only": sum(1 for a in plan["actions"] if a["action"] == "add_gallery_installs_only"),
         "null_primary_after": len(plan["null_primary_skus"]),
     }
+    image_index.close()
     return plan
 
 
@@ -0,0 +1,148 @@
+"""
+Image index report: near-duplicate and orphaned files under /uploads, plus
+near-duplicates among the source assets, in one pass.
+
+Fingerprints (dimensions, perceptual hash, sharpness) are computed in parallel
+once per file and kept in the image index (see image_index_service); re-runs
+only fingerprint new or changed files. Orphans are files no text or JSON
+column in the database points to. Nothing is deleted; review the report.
+
+Usage:
+  python -m backend.scripts.image_index --env-file backend/.env.production
+  python -m backend.scripts.image_index --uploads-dir /path/to/uploads --assets-dir "/path/to/Eagel Chair Assets"
+  python -m backend.scripts.image_index --no-db   # duplicates only
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+if "--env-file" in sys.argv:
+    idx = sys.argv.index("--env-file")
+    env_arg = sys.argv[idx + 1] if idx + 1 < len(sys.argv) and not sys.argv[idx + 1].startswith("-") else "backend/.env.production"
+    env_path = project_root / env_arg if not os.path.isabs(env_arg) else Path(env_arg)
+    if env_path.is_file():
+        from dotenv import load_dotenv
+        load_dotenv(env_path, override=True)
+
+from sqlalchemy import JSON, String, Text, select
+
+from backend.database.base import AsyncSessionLocal, Base
+from backend.scripts.fix_scan_only_images import resolve_uploads_dir
+from backend.services.image_index_service import ImageFingerprint, ImageIndex, ImageIndexService
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+OUTPUT = project_root / "backend" / "scripts" / "output"
+UPLOAD_URL_RE = re.compile(r"/uploads/[^\s\"'<>()?#\\]+")
+
+
+def _urls_in(value: Any, found: Set[str]) -> None:
+    if isinstance(value, str):
+        found.update(UPLOAD_URL_RE.findall(value))
+    elif isinstance(value, dict):
+        for v in value.values():
+            _urls_in(v, found)
+    elif isinstance(value, list):
+        for v in value:
+            _urls_in(v, found)
+
+
+async def collect_referenced_urls() -> Set[str]:
+    """Every /uploads/... URL stored in any string, text or JSON column."""
+    import backend.models  # noqa: F401 - registers every table on Base.metadata
+
+    found: Set[str] = set()
+    async with AsyncSessionLocal() as db:
+        for table in Base.metadata.sorted_tables:
+            cols = [c for c in table.columns if isinstance(c.type, (String, Text, JSON))]
+            if not cols:
+                continue
+            for row in (await db.execute(select(*cols))).all():
+                for value in row:
+                    _urls_in(value, found)
+    return found
+
+
+def _describe(group: List[ImageFingerprint]) -> Dict[str, Any]:
+    best, *rest = group
+    return {
+        "keep": best.path,
+        "keep_size": [best.width, best.height],
+        "duplicates": [fp.path for fp in rest],
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    uploads_dir = resolve_uploads_dir(args.uploads_dir)
+    report: Dict[str, Any] = {"uploads_dir": str(uploads_dir)}
+
+    with ImageIndex(args.index) as index:
+        uploads = index.scan(uploads_dir, workers=args.workers)
+        report["uploads"] = {
+            "images": len(uploads),
+            "duplicate_groups": [_describe(g) for g in ImageIndexService.group_duplicates(uploads.values())],
+        }
+        if args.assets_dir:
+            assets = index.scan(Path(args.assets_dir), workers=args.workers)
+            report["assets"] = {
+                "images": len(assets),
+                "duplicate_groups": [_describe(g) for g in ImageIndexService.group_duplicates(assets.values())],
+            }
+
+    if not args.no_db:
+        referenced = await collect_referenced_urls()
+        orphans = ImageIndexService.find_orphans(uploads, uploads_dir, referenced)
+        report["uploads"]["referenced_urls"] = len(referenced)
+        report["uploads"]["orphans"] = [str(p) for p in orphans]
+        report["uploads"]["orphan_bytes"] = sum(p.stat().st_size for p in orphans)
+
+    OUTPUT.mkdir(parents=True, exist_ok=True)
+    out_path = OUTPUT / f"image_index_report_{int(time.time())}.json"
+    out_path.write_text(json.dumps(report, indent=2))
+
+    logger.info(
+        "uploads: %s images, %s duplicate groups, %s orphans (%.1f MB) in %.1fs -> %s",
+        report["uploads"]["images"],
+        len(report["uploads"]["duplicate_groups"]),
+        len(report["uploads"].get("orphans", [])),
+        report["uploads"].get("orphan_bytes", 0) / 1e6,
+        time.perf_counter() - started,
+        out_path,
+    )
+    if "assets" in report:
+        logger.info(
+            "assets: %s images, %s duplicate groups",
+            report["assets"]["images"],
+            len(report["assets"]["duplicate_groups"]),
+        )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Duplicate and orphan report for uploaded images")
+    ap.add_argument("--env-file", nargs="?", const="backend/.env.production")
+    ap.add_argument("--uploads-dir", default=None)
+    ap.add_argument("--assets-dir", default=None, help="Also report duplicates among source assets")
+    ap.add_argument("--index", default=None, help="Image index file (default: .cache/image_index.sqlite)")
+    ap.add_argument("--workers", type=int, default=None, help="Fingerprint processes (default: CPU count)")
+    ap.add_argument("--no-db", action="store_true", help="Skip the orphan check")
+    args = ap.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
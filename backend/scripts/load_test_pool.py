@@ -0,0 +1,217 @@
+"""
+Connection Pool Load Test Script
+
+Drives concurrent catalog reads and guest quote submissions and reports
+latency percentiles, errors and the database pool metrics, to check the
+worker/pool configuration derived from DATABASE_CONNECTION_BUDGET
+(see backend/database/pool.py) under load.
+
+Two targets:
+
+- ``--base-url``: a running deployment (e.g. gunicorn behind run_gunicorn.sh).
+  Pool metrics are read from ``/api/v1/admin/dashboard/system/db-pool`` when
+  ``--admin-token`` is given; they belong to whichever worker answers.
+- default: the app in-process against a seeded throwaway SQLite database
+  with the instrumented pools enabled, so pool metrics are exact for the
+  single process. SQLite serializes writes, so quote latency and errors
+  there say little about PostgreSQL; use ``--base-url`` for those.
+
+Usage:
+    python -m backend.scripts.load_test_pool
+    python -m backend.scripts.load_test_pool --concurrency 100 --duration 30 --quote-ratio 0.2
+    python -m backend.scripts.load_test_pool --base-url http://localhost:8000 --admin-token <JWT>
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+
+API = "/api/v1"
+CATEGORIES = 20
+POOL_METRICS_PATH = f"{API}/admin/dashboard/system/db-pool"
+
+
+def seed(db_path: str, products: int) -> None:
+    from sqlalchemy import create_engine, insert
+
+    from backend.database.base import Base
+    from backend.models.chair import Category, Chair
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [
+            {"name": f"Category {i}", "slug": f"category-{i}"} for i in range(CATEGORIES)
+        ])
+        conn.execute(insert(Chair), [
+            {
+                "model_number": f"{6000 + i}",
+                "name": f"Side Chair {i}",
+                "slug": f"side-chair-{i}",
+                "short_description": "Stackable hospitality side chair",
+                "category_id": i % CATEGORIES + 1,
+                "base_price": 25000,
+            }
+            for i in range(products)
+        ])
+    engine.dispose()
+
+
+def catalog_request(products: int) -> tuple:
+    """A random public catalog read"""
+    choice = random.random()
+    if choice < 0.5:
+        return "catalog:list", "GET", f"{API}/products?page={random.randint(1, 5)}&per_page=20", None
+    if choice < 0.8:
+        return "catalog:detail", "GET", f"{API}/products/slug/side-chair-{random.randrange(products)}", None
+    return "catalog:categories", "GET", f"{API}/categories", None
+
+
+def quote_request(products: int) -> tuple:
+    """A guest quote submission for a few random products"""
+    address = {"line1": "1 Load Test Way", "city": "Miami", "state": "FL", "zip": "33101"}
+    payload = {
+        "contact_email": "loadtest@example.com",
+        "contact_name": "Load Test",
+        "contact_phone": "5550100",
+        "billing_address": address,
+        "shipping_destinations": [address],
+        "project_name": "Pool load test",
+        "items": [
+            {"product_id": random.randint(1, products), "quantity": random.randint(1, 40)}
+            for _ in range(random.randint(1, 3))
+        ],
+    }
+    return "quote:guest", "POST", f"{API}/quotes/request-guest", payload
+
+
+async def client_loop(
+    client: httpx.AsyncClient,
+    deadline: float,
+    products: int,
+    quote_ratio: float,
+    latencies: Dict[str, List[float]],
+    statuses: Counter,
+) -> None:
+    while time.perf_counter() < deadline:
+        make = quote_request if random.random() < quote_ratio else catalog_request
+        name, method, url, payload = make(products)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, json=payload)
+            statuses[f"{name} {response.status_code}"] += 1
+        except httpx.HTTPError as e:
+            statuses[f"{name} {type(e).__name__}"] += 1
+            continue
+        latencies[name].append(time.perf_counter() - started)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def fetch_pool_metrics(client: httpx.AsyncClient, admin_token: Optional[str]) -> Optional[dict]:
+    if admin_token is None:
+        return None
+    response = await client.get(POOL_METRICS_PATH, headers={"Authorization": f"Bearer {admin_token}"})
+    if response.status_code != 200:
+        print(f"pool metrics unavailable: HTTP {response.status_code}")
+        return None
+    return response.json()
+
+
+async def run(args, client: httpx.AsyncClient) -> Optional[dict]:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Counter = Counter()
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client_loop(client, deadline, args.products, args.quote_ratio, latencies, statuses)
+        for _ in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+
+    total = sum(statuses.values())
+    print(f"\n{total:,} requests in {elapsed:.1f}s ({total / elapsed:,.0f} req/s), concurrency {args.concurrency}")
+    print(f"{'scenario':<22}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name, values in sorted(latencies.items()):
+        print(
+            f"{name:<22}{len(values):>8}{percentile(values, 0.5) * 1000:>10.1f}"
+            f"{percentile(values, 0.95) * 1000:>10.1f}{max(values) * 1000:>10.1f}"
+        )
+    print("responses: " + ", ".join(f"{key}: {count}" for key, count in sorted(statuses.items())))
+
+    if args.base_url:
+        return await fetch_pool_metrics(client, args.admin_token)
+
+    from backend.database.pool import pool_plan, pool_status
+
+    return {"pid": os.getpid(), "plan": pool_plan().as_dict(), "pools": pool_status()}
+
+
+def print_pool_metrics(metrics: Optional[dict]) -> None:
+    if metrics is None:
+        return
+    print(f"\npool plan (pid {metrics['pid']}): {json.dumps(metrics['plan'])}")
+    for pool in metrics["pools"]:
+        print(f"  {json.dumps(pool)}")
+
+
+async def run_remote(args) -> None:
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+        print_pool_metrics(await run(args, client))
+
+
+async def run_in_process(args) -> None:
+    from backend.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=30) as client:
+        print_pool_metrics(await run(args, client))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the database pool configuration")
+    parser.add_argument("--base-url", help="Target a running deployment instead of the in-process app")
+    parser.add_argument("--admin-token", help="Admin JWT for reading pool metrics from --base-url")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds to run")
+    parser.add_argument("--quote-ratio", type=float, default=0.1, help="Share of requests that submit quotes")
+    parser.add_argument("--products", type=int, default=500, help="Catalog size (seeded in-process)")
+    args = parser.parse_args()
+
+    if args.base_url:
+        asyncio.run(run_remote(args))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "pool-load-test.db")
+        # Must be set before backend modules read settings
+        os.environ.update({
+            "DATABASE_URL": f"sqlite+aiosqlite:///{db_path}",
+            "DEBUG": "true",
+            "LOG_LEVEL": "WARNING",
+            "RATE_LIMIT_ENABLED": "false",
+        })
+        os.environ.pop("TESTING", None)
+        seed(db_path, args.products)
+        asyncio.run(run_in_process(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Add rolling history summary columns to ai_chat_sessions table.
+
+history_summary condenses the messages up to history_summary_until; only
+later messages are sent verbatim to the model.
+
+Usage:
+    python -m backend.scripts.migrations.add_ai_chat_history_summary [--confirm]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+
+from backend.database.base import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COLUMNS = [
+    ("history_summary", "TEXT NULL"),
+    ("history_summary_until", "TIMESTAMP NULL"),
+]
+
+
+async def run_migration(confirm: bool = False):
+    if not confirm:
+        logger.warning("Run with --confirm to execute the migration.")
+        return
+
+    async with engine.begin() as conn:
+        for col_name, col_type in COLUMNS:
+            await conn.execute(
+                text(
+                    f"ALTER TABLE ai_chat_sessions ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+                )
+            )
+            logger.info("Added ai_chat_sessions.%s", col_name)
+    logger.info("Added chat session history summary columns.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add history_summary and history_summary_until to ai_chat_sessions")
+    parser.add_argument("--confirm", action="store_true", help="Execute the migration")
+    args = parser.parse_args()
+    asyncio.run(run_migration(confirm=args.confirm))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Add price snapshot columns to carts table.
+
+price_version stamps the pricing inputs (tier, products, items) the cached
+cart prices were computed from; priced_at is when they were computed.
+
+Usage:
+    python -m backend.scripts.migrations.add_cart_price_snapshot [--confirm]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+
+from backend.database.base import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COLUMNS = [
+    ("price_version", "VARCHAR(64) NULL"),
+    ("priced_at", "TIMESTAMP NULL"),
+]
+
+
+async def run_migration(confirm: bool = False):
+    if not confirm:
+        logger.warning("Run with --confirm to execute the migration.")
+        return
+
+    async with engine.begin() as conn:
+        for col_name, col_type in COLUMNS:
+            await conn.execute(
+                text(
+                    f"ALTER TABLE carts ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+                )
+            )
+            logger.info("Added carts.%s", col_name)
+    logger.info("Added cart price snapshot columns.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add price_version and priced_at to carts")
+    parser.add_argument("--confirm", action="store_true", help="Execute the migration")
+    args = parser.parse_args()
+    asyncio.run(run_migration(confirm=args.confirm))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Add ingestion progress columns to ai_training_documents table.
+
+Per-chunk results are saved as they complete so a retried ingestion job
+resumes instead of re-analysing finished chunks.
+
+Usage:
+    python -m backend.scripts.migrations.add_training_document_progress [--confirm]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+
+from backend.database.base import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COLUMNS = [
+    ("chunks_total", "INTEGER NOT NULL DEFAULT 0"),
+    ("chunks_done", "INTEGER NOT NULL DEFAULT 0"),
+    ("chunk_results", "JSON NULL"),
+    ("processing_stats", "JSON NULL"),
+]
+
+
+async def run_migration(confirm: bool = False):
+    if not confirm:
+        logger.warning("Run with --confirm to execute the migration.")
+        return
+
+    async with engine.begin() as conn:
+        for col_name, col_type in COLUMNS:
+            await conn.execute(
+                text(
+                    f"ALTER TABLE ai_training_documents ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+                )
+            )
+            logger.info("Added ai_training_documents.%s", col_name)
+    logger.info("Added training document progress columns.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add ingestion progress columns to ai_training_documents")
+    parser.add_argument("--confirm", action="store_true", help="Execute the migration")
+    args = parser.parse_args()
+    asyncio.run(run_migration(confirm=args.confirm))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,171 +1,501 @@
 """
 Base SQL Parser for WordPress Migrations
 
-Shared utilities for parsing the eaglechair_com.sql file.
+Shared utilities for reading the eaglechair_com.sql dump.
+
+The dump is streamed, never loaded whole: ``iter_dump`` tokenizes it one
+statement at a time and yields a typed row tuple for every row of every
+``INSERT`` (MySQL string escapes and ``''`` quotes, NULL, integers, decimals,
+hex and ``_binary`` literals). Column names come from the INSERT column list
+or the table's ``CREATE TABLE``. Memory is bounded by the largest single
+value rather than the dump size.
+
+Migration scripts don't scan the dump themselves. ``open_dump_index`` copies
+the WordPress tables they need into a SQLite file next to the dump in one
+pass, rebuilds it only when the dump's size or mtime changes, and returns a
+connection to query:
+
+    index = open_dump_index()
+    rows = index.execute("SELECT ID, post_title FROM wp_posts WHERE post_type = 'product'")
+
+Usage:
+    python -m backend.scripts.migrations.base_parser [--rebuild] [--tables wp_posts wp_postmeta]
 """
 
+import argparse
+import io
+import logging
+import os
 import re
+import sqlite3
+import sys
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
 
 # SQL File Location
 SQL_FILE_PATH = Path(__file__).parent.parent / "eaglechair_com.sql"
 
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Tables copied into the index by default
+INDEXED_TABLES = (
+    "wp_posts",
+    "wp_postmeta",
+    "wp_terms",
+    "wp_term_taxonomy",
+    "wp_term_relationships",
+    "wp_options",
+)
+
+# SQLite indexes created after loading, when the table has the columns
+INDEX_COLUMNS = {
+    "wp_posts": [("post_type", "post_status"), ("post_name",)],
+    "wp_postmeta": [("post_id",), ("meta_key",)],
+    "wp_term_taxonomy": [("taxonomy",)],
+    "wp_term_relationships": [("object_id",), ("term_taxonomy_id",)],
+    "wp_options": [("option_name",)],
+}
+
+INDEX_VERSION = 1
+INDEX_BATCH_SIZE = 5000
+
+Row = Tuple[Any, ...]
+
+
+class DumpParseError(ValueError):
+    """The dump is not valid MySQL (at ``offset`` characters, when known)"""
+
+    def __init__(self, message: str, offset: Optional[int] = None):
+        super().__init__(f"{message} (at character {offset:,})" if offset is not None else message)
+        self.offset = offset
+
+
+# Whitespace and comments between statements and tokens
+_SPACE_RE = re.compile(r"(?:\s+|--[^\n]*(?:\n|\Z)|#[^\n]*(?:\n|\Z)|/\*.*?\*/)*", re.S)
+_COMMENT_STARTS = ("--", "#", "/*")
+_KEYWORD_RE = re.compile(r"[A-Za-z]+")
+_INSERT_RE = re.compile(
+    r"(?:INSERT|REPLACE)(?:\s+(?:LOW_PRIORITY|DELAYED|HIGH_PRIORITY|IGNORE))*\s+INTO\s+"
+    r"`?([^`\s(]+)`?\s*(?:\(([^)]*)\)\s*)?VALUES\s*",
+    re.I,
+)
+# A whole statement that is not an INSERT (CREATE TABLE, SET, LOCK, ...)
+_STATEMENT_RE = re.compile(
+    r"(?:[^;'\"`/]|'(?:[^'\\]|\\.|'')*'(?!')|\"(?:[^\"\\]|\\.|\"\")*\"(?!\")|`[^`]*`|/\*.*?\*/|/(?!\*))*;",
+    re.S,
+)
+_CREATE_TABLE_RE = re.compile(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?([^`\s(]+)`?", re.I)
+_COLUMN_DEF_RE = re.compile(r"^\s*`([^`]+)`", re.M)
+
+# One value of a row and the delimiter after it. String bodies use the
+# unrolled-loop form so long strings match in runs, without backtracking
+_VALUE_RE = re.compile(
+    r"""\s*(?:
+        '([^'\\]*(?:(?:\\.|'')[^'\\]*)*)'             # 1 string
+      | (NULL)                                        # 2 null
+      | ([-+]?\d+)(?=\s*[,)])                         # 3 integer
+      | ([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)   # 4 decimal / float
+      | 0x([0-9A-Fa-f]*)                              # 5 hex
+      | _binary\s*'([^'\\]*(?:(?:\\.|'')[^'\\]*)*)'   # 6 binary string
+    )\s*([,)])                                        # 7 delimiter
+    """,
+    re.S | re.X | re.I,
+)
+
+_ESCAPE_RE = re.compile(r"\\(.)|''", re.S)
+_ESCAPES = {
+    "0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a",
+    # MySQL keeps the backslash for these two (they only matter in LIKE)
+    "%": "\\%", "_": "\\_",
+}
+
+
+def _unescape_match(match: "re.Match[str]") -> str:
+    char = match.group(1)
+    if char is None:
+        return "'"
+    return _ESCAPES.get(char, char)
 
-def get_sql_content() -> str:
-    """Load and return the SQL file content."""
-    if not SQL_FILE_PATH.exists():
-        raise FileNotFoundError(
-            f"SQL file not found: {SQL_FILE_PATH}\n"
-            f"Please ensure eaglechair_com.sql is in backend/scripts/"
-        )
-    
-    with open(SQL_FILE_PATH, 'r', encoding='utf-8', errors='ignore') as f:
-        return f.read()
 
+def unescape_mysql_string(value: str) -> str:
+    """Decode the body of a single-quoted MySQL string literal."""
+    if "\\" not in value and "''" not in value:
+        return value
+    return _ESCAPE_RE.sub(_unescape_match, value)
 
-def extract_table_inserts(sql_content: str, table_name: str) -> list[str]:
+
+class _DumpReader:
+    """Tokenizer over a text stream, holding at most one statement's worth of buffer"""
+
+    def __init__(self, stream: TextIO, chunk_size: int = READ_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._consumed = 0  # characters dropped from the front of the buffer
+        self._eof = False
+        self.columns: Dict[str, Tuple[str, ...]] = {}
+
+    @property
+    def offset(self) -> int:
+        return self._consumed + self._pos
+
+    def _fill(self) -> bool:
+        """Read another chunk; returns False at end of input"""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos:
+            self._consumed += self._pos
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += chunk
+        return True
+
+    def _match(self, pattern: "re.Pattern[str]") -> Optional["re.Match[str]"]:
+        """
+        Match at the cursor, reading more input while the match could have
+        been cut short by the end of the buffer
+        """
+        while True:
+            match = pattern.match(self._buf, self._pos)
+            if match is not None and match.end() < len(self._buf):
+                return match
+            if not self._fill():
+                return match
+
+    def _skip_space(self) -> None:
+        while True:
+            end = _SPACE_RE.match(self._buf, self._pos).end()
+            # A comment cut off by the end of the buffer is not skipped yet
+            if end < len(self._buf) and not self._buf.startswith(_COMMENT_STARTS, end):
+                break
+            if not self._fill():
+                break
+        self._pos = end
+
+    def _peek(self, size: int = 1) -> str:
+        while len(self._buf) - self._pos < size and self._fill():
+            pass
+        return self._buf[self._pos:self._pos + size]
+
+    def statements(self, tables: Optional[set]) -> Iterator[Tuple[str, Tuple[str, ...], Row]]:
+        """Yield (table, columns, row) for every INSERT row of the wanted tables"""
+        while True:
+            self._skip_space()
+            if not self._peek():
+                return
+
+            keyword = self._match(_KEYWORD_RE)
+            word = keyword.group(0).upper() if keyword else ""
+            if word in ("INSERT", "REPLACE"):
+                header = self._match(_INSERT_RE)
+                if header is None:
+                    raise DumpParseError("Malformed INSERT statement", self.offset)
+                self._pos = header.end()
+                table = header.group(1)
+                if header.group(2):
+                    columns = tuple(c.strip().strip("`") for c in header.group(2).split(","))
+                else:
+                    columns = self.columns.get(table, ())
+                wanted = tables is None or table in tables
+                for row in self._rows(decode=wanted):
+                    if wanted:
+                        yield table, columns or tuple(f"col{i}" for i in range(1, len(row) + 1)), row
+            else:
+                statement = self._match(_STATEMENT_RE)
+                if statement is None:
+                    raise DumpParseError("Unterminated statement", self.offset)
+                self._pos = statement.end()
+                if word == "CREATE":
+                    text = statement.group(0)
+                    create = _CREATE_TABLE_RE.match(text)
+                    if create:
+                        body = text[text.find("(", create.end()) + 1:]
+                        self.columns[create.group(1)] = tuple(_COLUMN_DEF_RE.findall(body))
+
+    def _rows(self, decode: bool = True) -> Iterator[Row]:
+        """Rows of one INSERT's VALUES list, up to and including its ``;``"""
+        value_re = _VALUE_RE
+        while True:
+            self._skip_space()
+            if self._peek() != "(":
+                raise DumpParseError("Expected '(' to start a row", self.offset)
+            self._pos += 1
+
+            values: List[Any] = []
+            while True:
+                match = value_re.match(self._buf, self._pos)
+                if match is None or match.end() >= len(self._buf):
+                    match = self._match(value_re)
+                    if match is None:
+                        raise DumpParseError("Unrecognised value", self.offset)
+                self._pos = match.end()
+                if decode:
+                    values.append(_convert(match))
+                if match.group(7) == ")":
+                    break
+
+            yield tuple(values)
+
+            self._skip_space()
+            delimiter = self._peek()
+            self._pos += 1
+            if delimiter == ";":
+                return
+            if delimiter != ",":
+                raise DumpParseError("Expected ',' or ';' after a row", self.offset - 1)
+
+
+def _convert(match: "re.Match[str]") -> Any:
+    string, null, integer, decimal, hexdigits, binary = match.group(1, 2, 3, 4, 5, 6)
+    if string is not None:
+        return unescape_mysql_string(string)
+    if integer is not None:
+        return int(integer)
+    if null is not None:
+        return None
+    if decimal is not None:
+        return float(decimal)
+    if hexdigits is not None:
+        return bytes.fromhex(hexdigits)
+    return unescape_mysql_string(binary).encode("latin-1", errors="replace")
+
+
+def iter_dump(
+    path: Path = SQL_FILE_PATH,
+    tables: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, Tuple[str, ...], Row]]:
     """
-    Extract all INSERT statements for a specific table.
-    
+    Stream INSERT rows out of a MySQL dump.
+
     Args:
-        sql_content: Full SQL file content
-        table_name: Table name (e.g., 'wp_posts', 'wp_postmeta')
-    
-    Returns:
-        List of INSERT statement value strings
+        path: Dump file
+        tables: Only yield rows of these tables (others are skipped
+            without decoding their values)
+
+    Yields:
+        (table, column names, row tuple) for every row, in dump order
     """
-    # Pattern to match INSERT INTO statements for the table
-    pattern = rf"INSERT INTO `{table_name}`.*?VALUES\s*(.+?);"
-    matches = re.findall(pattern, sql_content, re.DOTALL | re.IGNORECASE)
-    return matches
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        yield from _DumpReader(f).statements(set(tables) if tables is not None else None)
 
 
 def parse_insert_values(values_string: str) -> list[tuple]:
     """
-    Parse VALUES string into list of tuples.
-    
+    Parse a VALUES list into typed row tuples.
+
     Example:
-        "(1, 'value1', 'value2'), (2, 'value3', 'value4')"
-        Returns: [(1, 'value1', 'value2'), (2, 'value3', 'value4')]
+        "(1, 'value1', NULL), (2, 'it''s', 3.5)"
+        Returns: [(1, 'value1', None), (2, "it's", 3.5)]
     """
-    # This is a simplified parser - WordPress SQL can be complex
-    # For production, you might want a more robust parser
-    
-    results = []
-    
-    # Split by "),(" to get individual rows
-    rows = values_string.split('),(')
-    
-    for row in rows:
-        # Clean up the row
-        row = row.strip()
-        row = row.lstrip('(').rstrip(')')
-        
-        # TODO: Properly parse the row values (this is complex due to escaping)
-        # For now, we'll use regex to extract the basic structure
-        results.append(row)
-    
-    return results
-
-
-def extract_wp_posts(sql_content: str, post_type: str = None) -> list[dict[str, Any]]:
+    reader = _DumpReader(io.StringIO(values_string.rstrip().rstrip(";") + ";"))
+    return list(reader._rows())
+
+
+# ============================================================================
+# On-disk index
+# ============================================================================
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _default_index_path(dump_path: Path) -> Path:
+    return dump_path.with_name(dump_path.stem + ".index.sqlite")
+
+
+def _require_dump(dump_path: Path) -> None:
+    if not dump_path.exists():
+        raise FileNotFoundError(
+            f"SQL file not found: {dump_path}\n"
+            f"Please ensure eaglechair_com.sql is in backend/scripts/"
+        )
+
+
+def build_dump_index(
+    dump_path: Path = SQL_FILE_PATH,
+    index_path: Optional[Path] = None,
+    tables: Sequence[str] = INDEXED_TABLES
+) -> Path:
     """
-    Extract WordPress posts of a specific type.
-    
+    Copy the given tables out of the dump into a SQLite file in one pass.
+
+    The file is written next to the target and renamed into place, so a
+    failed build never leaves a half-written index behind.
+
     Args:
-        sql_content: Full SQL content
-        post_type: Filter by post_type (e.g., 'product', 'page', 'post')
-    
+        dump_path: Dump file
+        index_path: SQLite file to write (default: next to the dump)
+        tables: Tables to copy
+
     Returns:
-        List of post dictionaries with basic fields
+        Path of the index
     """
-    posts = []
-    
-    # Pattern for wp_posts INSERT statements
-    # This is a simplified version - adjust based on actual SQL structure
-    if post_type:
-        pattern = rf"\((\d+),\s*\d+,\s*'[^']*',\s*'[^']*',\s*'([^']*)',\s*'([^']+)',\s*'([^']*)',\s*'publish'[^)]*'{post_type}'"
-    else:
-        pattern = r"\((\d+),\s*\d+,\s*'[^']*',\s*'[^']*',\s*'([^']*)',\s*'([^']+)',\s*'([^']*)',\s*'publish'"
-    
-    matches = re.findall(pattern, sql_content, re.IGNORECASE)
-    
-    for match in matches:
-        post_id, excerpt, title, description = match
-        posts.append({
-            'id': post_id,
-            'title': title,
-            'excerpt': excerpt,
-            'description': description,
-        })
-    
-    return posts
-
-
-def extract_wp_postmeta(sql_content: str, post_id: str = None, meta_key: str = None) -> list[dict]:
+    dump_path = Path(dump_path)
+    _require_dump(dump_path)
+    index_path = Path(index_path) if index_path else _default_index_path(dump_path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    started = time.perf_counter()
+    stat = dump_path.stat()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+        table_columns: Dict[str, List[str]] = {}
+        insert_sql: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        pending: Dict[str, List[Row]] = {}
+        counts: Dict[str, int] = {}
+
+        def flush(sql: str) -> None:
+            rows = pending.pop(sql, None)
+            if rows:
+                conn.executemany(sql, rows)
+
+        for table, columns, row in iter_dump(dump_path, tables):
+            key = (table, columns)
+            sql = insert_sql.get(key)
+            if sql is None:
+                existing = table_columns.get(table)
+                if existing is None:
+                    conn.execute(f"CREATE TABLE {_quote(table)} ({', '.join(_quote(c) for c in columns)})")
+                    table_columns[table] = list(columns)
+                else:
+                    for column in columns:
+                        if column not in existing:
+                            conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)}")
+                            existing.append(column)
+                sql = insert_sql[key] = (
+                    f"INSERT INTO {_quote(table)} ({', '.join(_quote(c) for c in columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})"
+                )
+            if len(row) != len(columns):
+                raise DumpParseError(f"{table}: row has {len(row)} values for {len(columns)} columns")
+            batch = pending.setdefault(sql, [])
+            batch.append(row)
+            counts[table] = counts.get(table, 0) + 1
+            if len(batch) >= INDEX_BATCH_SIZE:
+                flush(sql)
+
+        for sql in list(pending):
+            flush(sql)
+
+        for table, column_sets in INDEX_COLUMNS.items():
+            for columns in column_sets:
+                if table in table_columns and all(c in table_columns[table] for c in columns):
+                    conn.execute(
+                        f"CREATE INDEX {_quote('ix_' + table + '_' + '_'.join(columns))} "
+                        f"ON {_quote(table)} ({', '.join(_quote(c) for c in columns)})"
+                    )
+
+        conn.execute("CREATE TABLE _dump_index (key TEXT PRIMARY KEY, value TEXT)")
+        conn.executemany(
+            "INSERT INTO _dump_index (key, value) VALUES (?, ?)",
+            [
+                ("version", str(INDEX_VERSION)),
+                ("source_size", str(stat.st_size)),
+                ("source_mtime_ns", str(stat.st_mtime_ns)),
+                ("tables", ",".join(sorted(tables))),
+            ],
+        )
+        conn.commit()
+    except BaseException:
+        conn.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    conn.close()
+    os.replace(tmp_path, index_path)
+
+    summary = ", ".join(f"{counts.get(t, 0):,} {t}" for t in tables)
+    logger.info(f"Indexed {dump_path.name} in {time.perf_counter() - started:.1f}s ({summary})")
+    return index_path
+
+
+def _index_is_current(index_path: Path, dump_path: Path, tables: Sequence[str]) -> bool:
+    if not index_path.exists():
+        return False
+    try:
+        conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM _dump_index"))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+    stat = dump_path.stat()
+    return (
+        meta.get("version") == str(INDEX_VERSION)
+        and meta.get("source_size") == str(stat.st_size)
+        and meta.get("source_mtime_ns") == str(stat.st_mtime_ns)
+        and set(tables) <= set(meta.get("tables", "").split(","))
+    )
+
+
+def open_dump_index(
+    dump_path: Path = SQL_FILE_PATH,
+    index_path: Optional[Path] = None,
+    tables: Sequence[str] = INDEXED_TABLES,
+    rebuild: bool = False
+) -> sqlite3.Connection:
     """
-    Extract WordPress post metadata.
-    
+    Connection to the dump's SQLite index, building it first if needed.
+
     Args:
-        sql_content: Full SQL content
-        post_id: Filter by specific post ID
-        meta_key: Filter by specific meta key (e.g., '_price', '_sku')
-    
-    Returns:
-        List of metadata dictionaries
-    """
-    metadata = []
-    
-    # Pattern for wp_postmeta - simplified
-    pattern = r"\((\d+),\s*(\d+),\s*'([^']+)',\s*'([^']*)'\)"
-    matches = re.findall(pattern, sql_content, re.IGNORECASE)
-    
-    for match in matches:
-        meta_id, post_id_val, key, value = match
-        
-        # Apply filters if provided
-        if post_id and post_id_val != post_id:
-            continue
-        if meta_key and key != meta_key:
-            continue
-        
-        metadata.append({
-            'meta_id': meta_id,
-            'post_id': post_id_val,
-            'meta_key': key,
-            'meta_value': value,
-        })
-    
-    return metadata
-
-
-def extract_wp_terms(sql_content: str) -> list[dict]:
-    """
-    Extract WordPress taxonomy terms (categories, tags, etc.).
-    
+        dump_path: Dump file
+        index_path: SQLite index (default: next to the dump)
+        tables: Tables the caller needs
+        rebuild: Rebuild even if the index is current
+
     Returns:
-        List of term dictionaries
+        sqlite3 connection whose rows support access by column name.
+        Tables missing from the dump are absent from the index.
     """
-    terms = []
-    
-    # Pattern for wp_terms table
-    pattern = r"INSERT INTO `wp_terms`.*?VALUES\s*(.+?);"
-    matches = re.findall(pattern, sql_content, re.DOTALL | re.IGNORECASE)
-    
-    if matches:
-        # Parse the values
-        values = matches[0]
-        # Simplified parsing - extract term data
-        term_pattern = r"\((\d+),\s*'([^']+)',\s*'([^']+)'"
-        term_matches = re.findall(term_pattern, values)
-        
-        for term_match in term_matches:
-            term_id, name, slug = term_match
-            terms.append({
-                'term_id': term_id,
-                'name': name,
-                'slug': slug,
-            })
-    
-    return terms
+    dump_path = Path(dump_path)
+    _require_dump(dump_path)
+    index_path = Path(index_path) if index_path else _default_index_path(dump_path)
+
+    if rebuild or not _index_is_current(index_path, dump_path, tables):
+        logger.info(f"Building SQL dump index {index_path.name}...")
+        build_dump_index(dump_path, index_path, sorted(set(tables) | set(INDEXED_TABLES)))
+
+    conn = sqlite3.connect(index_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def index_has_table(index: sqlite3.Connection, table: str) -> bool:
+    """Whether the dump contained rows for ``table``"""
+    return index.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Build the SQLite index of the WordPress SQL dump")
+    parser.add_argument("--dump", type=Path, default=SQL_FILE_PATH, help="MySQL dump file")
+    parser.add_argument("--index", type=Path, default=None, help="Index file (default: next to the dump)")
+    parser.add_argument("--tables", nargs="+", default=list(INDEXED_TABLES), help="Tables to index")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild even if the index is current")
+    args = parser.parse_args()
+
+    try:
+        index = open_dump_index(args.dump, args.index, args.tables, rebuild=args.rebuild)
+    except (FileNotFoundError, DumpParseError) as e:
+        logger.error(str(e))
+        sys.exit(1)
+    for (name,) in index.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name != '_dump_index' ORDER BY name"
+    ):
+        count = index.execute(f"SELECT COUNT(*) FROM {_quote(name)}").fetchone()[0]
+        logger.info(f"  {name}: {count:,} rows")
@@ -42,10 +42,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.database.base import AsyncSessionLocal
 from backend.models.chair import Category, Chair
-from backend.scripts.migrations.catalog_fill_utils import (
-    load_xls_prices,
-    parse_pdf_for_fill,
-)
+from backend.scripts.migrations.catalog_fill_utils import load_xls_prices
+from backend.scripts.migrations.pdf_extract_cache import extract_pdfs
 from backend.services.admin_service import AdminService
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -175,10 +173,9 @@ async def run(
     logger.info("Loaded %s model->price entries", len(prices))
 
     all_products: list = []
-    for pdf_path in pdfs:
-        recs = parse_pdf_for_fill(str(pdf_path))
+    for pdf_path, recs in extract_pdfs(pdfs).items():
         all_products.extend(recs)
-        logger.info("PDF %s: %s product records", pdf_path.name, len(recs))
+        logger.info("PDF %s: %s product records", Path(pdf_path).name, len(recs))
 
     seen_base = set()
     unique_products: list = []
@@ -24,7 +24,6 @@ import argparse
 import asyncio
 import logging
 import os
-import re
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -56,9 +55,9 @@ from backend.models.legal import (  # noqa: E402
 
 # Handle both direct execution and module execution
 try:
-    from .base_parser import get_sql_content  # noqa: E402
+    from .base_parser import index_has_table, open_dump_index  # noqa: E402
 except ImportError:
-    from base_parser import get_sql_content  # noqa: E402
+    from base_parser import index_has_table, open_dump_index  # noqa: E402
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -93,33 +92,39 @@ def _apply_base_url(url: Optional[str], base_url: Optional[str]) -> Optional[str
     return url
 
 
-def parse_pages_and_legal(sql_content: str) -> dict:
-    """Parse WordPress pages and identify legal documents."""
+def parse_pages_and_legal(index) -> dict:
+    """Parse published WordPress pages and identify legal documents by slug."""
     data = {
         'legal_documents': [],
         'regular_pages': [],
     }
     
-    # Pattern for pages in wp_posts (post_type='page')
-    # NOTE: For more robust parsing, expand the base_parser utilities
+    if not index_has_table(index, "wp_posts"):
+        logger.warning("No wp_posts found in SQL dump")
+        return data
     
-    # Extract pages (this is simplified - real SQL parsing is more complex)
-    # Looking for common legal page titles/slugs
-    legal_keywords = ['terms', 'privacy', 'warranty', 'return', 'shipping', 'refund', 
-                      'cookie', 'disclaimer', 'legal', 'policy']
-    
-    # Search for legal-related content in the SQL
-    for keyword in legal_keywords:
-        # Case-insensitive search for pages with these keywords
-        pattern = rf"post_type.*page.*{keyword}"
-        if re.search(pattern, sql_content, re.IGNORECASE):
-            logger.info(f"Found potential legal document: {keyword}")
-    
-    # For now, we'll extract some common ones manually
-    # In production, you'd want more sophisticated parsing
+    rows = index.execute(
+        """
+        SELECT post_name, post_title, post_content FROM wp_posts
+        WHERE post_type = 'page' AND post_status = 'publish'
+        ORDER BY ID
+        """
+    )
+    for row in rows:
+        page = {
+            'slug': row['post_name'],
+            'title': row['post_title'],
+            'content': row['post_content'],
+        }
+        document_type = LEGAL_SLUG_MAPPINGS.get(row['post_name'])
+        if document_type is not None:
+            data['legal_documents'].append({**page, 'document_type': document_type})
+            logger.info(f"Found legal document: {row['post_name']}")
+        else:
+            data['regular_pages'].append(page)
     
-    logger.info(f"✓ Found {len(data['legal_documents'])} legal documents (parsed) [placeholder]")
-    logger.info(f"✓ Found {len(data['regular_pages'])} regular pages (parsed) [placeholder]")
+    logger.info(f"✓ Found {len(data['legal_documents'])} legal documents (parsed)")
+    logger.info(f"✓ Found {len(data['regular_pages'])} regular pages (parsed)")
     
     return data
 
@@ -759,8 +764,9 @@ async def main(dry_run: bool = False, image_base_url: Optional[str] = None):
 
     # Parse SQL (placeholder for future enrichments)
     logger.info("Step 1: Parsing WordPress SQL file...")
-    sql_content = get_sql_content()
-    content_data = parse_pages_and_legal(sql_content)
+    index = open_dump_index()
+    content_data = parse_pages_and_legal(index)
+    index.close()
     
     # Load curated demo data for seeding
     demo = load_demo_seed_data(base_url)
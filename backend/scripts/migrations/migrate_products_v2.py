@@ -41,9 +41,9 @@ from backend.models.chair import (
 
 # Handle both direct execution and module execution
 try:
-    from .base_parser import get_sql_content
+    from .base_parser import index_has_table, open_dump_index
 except ImportError:
-    from base_parser import get_sql_content
+    from base_parser import index_has_table, open_dump_index
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -140,73 +140,47 @@ def clean_html_description(text: str) -> str:
     return clean.strip()
 
 
-def extract_wordpress_terms(sql_content: str) -> dict:
+def extract_wordpress_terms(index) -> dict:
     """Extract all terms from wp_terms table."""
-    # Find INSERT INTO wp_terms
-    term_start = sql_content.find("INSERT INTO `wp_terms`")
-    if term_start == -1:
+    if not index_has_table(index, "wp_terms"):
         logger.warning("No wp_terms found")
         return {}
     
-    values_start = sql_content.find("VALUES", term_start)
-    next_insert = sql_content.find("\nINSERT INTO `wp_term", values_start)
-    if next_insert == -1:
-        next_insert = values_start + 50000
-    
-    terms_section = sql_content[values_start:next_insert]
-    
-    # Parse: (term_id, 'name', 'slug', term_group, term_order)
-    term_pattern = re.compile(r"\((\d+),\s*'([^']+)',\s*'([^']+)',\s*\d+,\s*\d+\)")
     terms = {}
-    for term_id, name, slug in term_pattern.findall(terms_section):
-        name = name.replace('&amp;', '&')
-        terms[term_id] = {'name': name, 'slug': slug}
+    for row in index.execute("SELECT term_id, name, slug FROM wp_terms"):
+        name = (row['name'] or '').replace('&amp;', '&')
+        terms[str(row['term_id'])] = {'name': name, 'slug': row['slug']}
     
     logger.info(f"Extracted {len(terms)} WordPress terms")
     return terms
 
 
-def extract_taxonomy_relationships(sql_content: str) -> tuple[dict, dict]:
+def extract_taxonomy_relationships(index) -> tuple[dict, dict]:
     """Extract term taxonomy (which terms are product_cat) and post relationships."""
-    # Extract taxonomy data
-    taxonomy_start = sql_content.find("INSERT INTO `wp_term_taxonomy`")
-    if taxonomy_start == -1:
+    if not index_has_table(index, "wp_term_taxonomy"):
         return {}, {}
     
-    values_start = sql_content.find("VALUES", taxonomy_start)
-    next_insert = sql_content.find("\nINSERT INTO", values_start + 10)
-    if next_insert == -1:
-        next_insert = values_start + 100000
-    
-    taxonomy_section = sql_content[values_start:next_insert]
-    
-    # Parse: (term_taxonomy_id, term_id, 'taxonomy', 'description', parent, count)
-    tax_pattern = re.compile(r"\((\d+),\s*(\d+),\s*'([^']+)',\s*'[^']*',\s*(\d+),\s*\d+\)")
-    
     product_cat_terms = {}  # term_id -> parent_term_id
-    for tax_id, term_id, taxonomy, parent in tax_pattern.findall(taxonomy_section):
-        if taxonomy == 'product_cat':
-            product_cat_terms[term_id] = parent if parent != '0' else None
+    for row in index.execute(
+        "SELECT term_id, parent FROM wp_term_taxonomy WHERE taxonomy = 'product_cat'"
+    ):
+        parent = str(row['parent'])
+        product_cat_terms[str(row['term_id'])] = parent if parent != '0' else None
     
     # Extract post-to-term relationships
-    rel_start = sql_content.find("INSERT INTO `wp_term_relationships`")
-    if rel_start == -1:
+    if not index_has_table(index, "wp_term_relationships"):
         return product_cat_terms, {}
     
-    values_start = sql_content.find("VALUES", rel_start)
-    next_insert = sql_content.find("\nINSERT INTO", values_start + 10)
-    if next_insert == -1:
-        next_insert = values_start + 100000
-    
-    rel_section = sql_content[values_start:next_insert]
-    
-    # Parse: (post_id, term_id, order)
-    rel_pattern = re.compile(r"\((\d+),\s*(\d+),\s*\d+\)")
-    
     post_terms = defaultdict(list)  # post_id -> [term_ids]
-    for post_id, term_id in rel_pattern.findall(rel_section):
-        if term_id in product_cat_terms:  # Only product categories
-            post_terms[post_id].append(term_id)
+    for row in index.execute(
+        """
+        SELECT r.object_id, tt.term_id
+        FROM wp_term_relationships r
+        JOIN wp_term_taxonomy tt ON tt.term_taxonomy_id = r.term_taxonomy_id
+        WHERE tt.taxonomy = 'product_cat'
+        """
+    ):
+        post_terms[str(row['object_id'])].append(str(row['term_id']))
     
     logger.info(f"Found {len(product_cat_terms)} product categories")
     logger.info(f"Found relationships for {len(post_terms)} posts")
@@ -214,153 +188,132 @@ def extract_taxonomy_relationships(sql_content: str) -> tuple[dict, dict]:
     return product_cat_terms, dict(post_terms)
 
 
-def extract_product_metadata(sql_content: str) -> dict:
+def extract_product_metadata(index) -> dict:
     """Extract product metadata (images, prices, stock status) from wp_postmeta."""
-    meta_start = sql_content.find("INSERT INTO `wp_postmeta`")
-    if meta_start == -1:
+    if not index_has_table(index, "wp_postmeta"):
         logger.warning("No wp_postmeta found")
         return {}
     
-    values_start = sql_content.find("VALUES", meta_start)
-    next_insert = sql_content.find("\nINSERT INTO `wp_posts`", values_start)  # Next major table
-    if next_insert == -1:
-        next_insert = values_start + 5000000  # Large section
-    
-    meta_section = sql_content[values_start:next_insert]
-    
-    # Parse: (meta_id, post_id, 'meta_key', 'meta_value')
-    # Handle escaped quotes and special chars
-    meta_pattern = re.compile(r"\((\d+),\s*(\d+),\s*'([^']+)',\s*'([^']*)'\)")
-    
     product_meta = defaultdict(dict)  # post_id -> {meta_key: meta_value}
-    for meta_id, post_id, meta_key, meta_value in meta_pattern.findall(meta_section):
-        if meta_key in ['_thumbnail_id', '_regular_price', '_sale_price', '_stock_status']:
-            product_meta[post_id][meta_key] = meta_value
+    for row in index.execute(
+        """
+        SELECT post_id, meta_key, meta_value FROM wp_postmeta
+        WHERE meta_key IN ('_thumbnail_id', '_regular_price', '_sale_price', '_stock_status')
+        ORDER BY meta_id
+        """
+    ):
+        product_meta[str(row['post_id'])][row['meta_key']] = _meta_text(row['meta_value'])
     
     logger.info(f"Extracted metadata for {len(product_meta)} posts")
     return dict(product_meta)
 
 
-def extract_attachment_urls(sql_content: str) -> dict:
+def extract_attachment_urls(index) -> dict:
     """Extract attachment (image) URLs from wp_postmeta '_wp_attached_file'.
 
     Returns: dict mapping attachment post_id (str) -> uploads URL (str)
     """
-    meta_start = sql_content.find("INSERT INTO `wp_postmeta`")
-    if meta_start == -1:
+    if not index_has_table(index, "wp_postmeta"):
         logger.warning("No wp_postmeta found for attachments")
         return {}
 
-    values_start = sql_content.find("VALUES", meta_start)
-    next_insert = sql_content.find("\nINSERT INTO `wp_posts`", values_start)
-    if next_insert == -1:
-        next_insert = values_start + 5000000
-
-    meta_section = sql_content[values_start:next_insert]
-
-    # Parse only rows with meta_key = '_wp_attached_file'
-    attach_pattern = re.compile(r"\((\d+),\s*(\d+),\s*'_wp_attached_file',\s*'([^']*)'\)")
     attachments: dict[str, str] = {}
-    for _meta_id, post_id, rel_path in attach_pattern.findall(meta_section):
-        # Unescape and build URL under wp-content/uploads
-        clean_path = rel_path.replace("\\'", "'").replace('\\"', '"').replace('\\\\', '\\')
-        url = f"/wp-content/uploads/{clean_path}".replace('//', '/')
-        attachments[post_id] = url
+    for row in index.execute(
+        "SELECT post_id, meta_value FROM wp_postmeta WHERE meta_key = '_wp_attached_file' ORDER BY meta_id"
+    ):
+        # Build URL under wp-content/uploads
+        url = f"/wp-content/uploads/{_meta_text(row['meta_value'])}".replace('//', '/')
+        attachments[str(row['post_id'])] = url
 
     logger.info(f"Extracted {len(attachments)} attachment images")
     return attachments
 
 
-def parse_products_from_wp_posts(sql_content: str, terms: dict, post_terms: dict, metadata: dict) -> dict:
-    """Parse products and families from wp_posts - handles multiple INSERT statements."""
+def _meta_text(value) -> str:
+    """meta_value as text (the dump may store it as a binary literal)"""
+    if value is None:
+        return ''
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    return str(value)
+
+
+def parse_products_from_wp_posts(index, terms: dict, post_terms: dict, metadata: dict) -> dict:
+    """Parse products and families from published wp_posts products."""
     logger.info("Parsing products from wp_posts...")
     
     families = []
     products = []
     
-    # WordPress has MANY INSERT INTO wp_posts statements (185+)
-    # We need to process ALL of them, not just the first
-    start_pos = 0
-    section_num = 0
-    
-    while True:
-        # Find next wp_posts INSERT
-        posts_start = sql_content.find("INSERT INTO `wp_posts`", start_pos)
-        if posts_start == -1:
-            break
+    if not index_has_table(index, "wp_posts"):
+        logger.warning("No wp_posts found")
+        return {'families': families, 'products': products}
+    
+    rows = index.execute(
+        """
+        SELECT ID, post_content, post_title, post_excerpt FROM wp_posts
+        WHERE post_status = 'publish' AND post_type = 'product'
+        ORDER BY ID
+        """
+    )
+    for row in rows:
+        post_id = str(row['ID'])
+        content = row['post_content'] or ''
+        excerpt = row['post_excerpt'] or ''
         
-        section_num += 1
-        values_start = sql_content.find("VALUES", posts_start)
-        next_insert = sql_content.find("\nINSERT INTO", values_start + 10)
-        if next_insert == -1:
-            next_insert = len(sql_content)
+        # Clean the title (should be simple)
+        title = (row['post_title'] or '').strip()
+        clean_desc = clean_html_description(content or excerpt)
         
-        posts_section = sql_content[values_start:next_insert]
+        # Get categories for this post
+        wp_category_slugs = []
+        if post_id in post_terms:
+            for term_id in post_terms[post_id]:
+                if term_id in terms:
+                    wp_category_slugs.append(terms[term_id]['slug'])
         
-        # Pattern to match product posts
-        # (ID, author, 'date', 'date', 'content', 'title', 'excerpt', 'publish', ...)
-        post_pattern = re.compile(
-            r"\((\d+),\s*\d+,\s*'[^']+',\s*'[^']+',\s*'((?:[^'\\]|\\.|'')*?)',\s*'((?:[^'\\]|\\.|'')*?)',\s*'((?:[^'\\]|\\.|'')*?)',\s*'publish'.*?'product'.*?\)",
-            re.IGNORECASE | re.DOTALL
-        )
+        # Get metadata
+        meta = metadata.get(post_id, {})
+        thumbnail_id = meta.get('_thumbnail_id')
+        price = meta.get('_regular_price', '0')
+        sale_price = meta.get('_sale_price')
+        stock_status = meta.get('_stock_status', 'instock')
         
-        for post_id, content, title, excerpt in post_pattern.findall(posts_section):
-            # Clean the title (should be simple)
-            title = title.strip()
-            clean_desc = clean_html_description(content or excerpt)
-            
-            # Get categories for this post
-            wp_category_slugs = []
-            if post_id in post_terms:
-                for term_id in post_terms[post_id]:
-                    if term_id in terms:
-                        wp_category_slugs.append(terms[term_id]['slug'])
-            
-            # Get metadata
-            meta = metadata.get(post_id, {})
-            thumbnail_id = meta.get('_thumbnail_id')
-            price = meta.get('_regular_price', '0')
-            sale_price = meta.get('_sale_price')
-            stock_status = meta.get('_stock_status', 'instock')
+        # Determine if it's a family or individual product
+        if 'family' in title.lower():
+            families.append({
+                'wp_post_id': post_id,
+                'name': title,
+                'slug': title.lower().replace(' family', '').replace(' ', '-'),
+                'description': clean_desc,
+                'wp_categories': wp_category_slugs,
+                'thumbnail_id': thumbnail_id,
+            })
+        elif PRODUCT_TITLE_PATTERN.search(title):  # Use flexible pattern
+            # Try to extract model number (may not always work for "Series" products)
+            match = MODEL_NUMBER_PATTERN.match(title.strip())
+            if match:
+                base_model, suffix, variant = match.groups()
+            else:
+                # For products like "TR Series, Boston" or "Add-On: Nails"
+                # Extract first word/number as model
+                base_model = title.split()[0].replace(':', '').replace(',', '')
+                suffix = ''
+                variant = ''
             
-            # Determine if it's a family or individual product
-            if 'family' in title.lower():
-                families.append({
-                    'wp_post_id': post_id,
-                    'name': title,
-                    'slug': title.lower().replace(' family', '').replace(' ', '-'),
-                    'description': clean_desc,
-                    'wp_categories': wp_category_slugs,
-                    'thumbnail_id': thumbnail_id,
-                })
-            elif PRODUCT_TITLE_PATTERN.search(title):  # Use flexible pattern
-                # Try to extract model number (may not always work for "Series" products)
-                match = MODEL_NUMBER_PATTERN.match(title.strip())
-                if match:
-                    base_model, suffix, variant = match.groups()
-                else:
-                    # For products like "TR Series, Boston" or "Add-On: Nails"
-                    # Extract first word/number as model
-                    base_model = title.split()[0].replace(':', '').replace(',', '')
-                    suffix = ''
-                    variant = ''
-                
-                products.append({
-                    'wp_post_id': post_id,
-                    'model_number': base_model,
-                    'suffix': suffix or '',
-                    'variant': variant or '',
-                    'full_model': title.strip(),
-                    'description': clean_desc,
-                    'wp_categories': wp_category_slugs,
-                    'thumbnail_id': thumbnail_id,
-                    'price': price,
-                    'sale_price': sale_price,
-                    'stock_status': stock_status,
-                })
-        
-        # Move to next section
-        start_pos = next_insert
+            products.append({
+                'wp_post_id': post_id,
+                'model_number': base_model,
+                'suffix': suffix or '',
+                'variant': variant or '',
+                'full_model': title.strip(),
+                'description': clean_desc,
+                'wp_categories': wp_category_slugs,
+                'thumbnail_id': thumbnail_id,
+                'price': price,
+                'sale_price': sale_price,
+                'stock_status': stock_status,
+            })
     
     logger.info(f"Parsed {len(families)} families and {len(products)} products")
     return {'families': families, 'products': products}
@@ -648,25 +601,25 @@ async def main(dry_run: bool = False, image_base_url: str | None = None):
     if dry_run:
         logger.warning("⚠️  DRY RUN MODE - No database changes\n")
     
-    # Step 1: Parse SQL file
-    logger.info("Step 1: Loading WordPress SQL file...")
-    sql_content = get_sql_content()
-    logger.info("✓ SQL file loaded\n")
+    # Step 1: Open the SQL dump index (built in one pass on first use)
+    logger.info("Step 1: Opening WordPress SQL dump index...")
+    index = open_dump_index()
+    logger.info("✓ SQL dump index ready\n")
     
     # Step 2: Extract terms and taxonomy
     logger.info("Step 2: Extracting WordPress terms and categories...")
-    terms = extract_wordpress_terms(sql_content)
-    product_cat_terms, post_terms = extract_taxonomy_relationships(sql_content)
+    terms = extract_wordpress_terms(index)
+    product_cat_terms, post_terms = extract_taxonomy_relationships(index)
     logger.info("✓ Terms extracted\n")
     
     # Step 3: Extract metadata
     logger.info("Step 3: Extracting product metadata...")
-    metadata = extract_product_metadata(sql_content)
+    metadata = extract_product_metadata(index)
     logger.info("✓ Metadata extracted\n")
     
     # Step 3b: Extract attachment image URLs
     logger.info("Step 3b: Extracting attachment images...")
-    attachments = extract_attachment_urls(sql_content)
+    attachments = extract_attachment_urls(index)
     # Allow env var override if CLI flag not provided
     if image_base_url is None:
         image_base_url = os.getenv('IMAGE_BASE_URL')
@@ -676,7 +629,8 @@ async def main(dry_run: bool = False, image_base_url: str | None = None):
     
     # Step 4: Parse products
     logger.info("Step 4: Parsing products and families...")
-    data = parse_products_from_wp_posts(sql_content, terms, post_terms, metadata)
+    data = parse_products_from_wp_posts(index, terms, post_terms, metadata)
+    index.close()
     logger.info("✓ Products parsed\n")
     
     # Step 5: Migrate to database
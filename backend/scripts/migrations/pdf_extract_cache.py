@@ -0,0 +1,269 @@
+"""
+Catalog PDF Extraction Cache
+
+``parse_pdf_for_fill`` reads every page of a catalog PDF with pdfplumber,
+which takes seconds per file. Its records are kept in a SQLite file keyed by
+the PDF's sha256 and ``PARSER_VERSION``, so re-running a catalog audit only
+parses PDFs that are new or changed, and those are parsed in a process pool.
+
+Each entry is one zlib-compressed JSON document per PDF; ``full_page_text``
+is shared by every record of a PDF and stored once. A second table remembers
+(path, mtime_ns, size) -> sha256 so unchanged files are not re-hashed.
+
+Bump ``PARSER_VERSION`` whenever ``parse_pdf_for_fill`` or the
+pdf_parser_service extractors change what they return.
+
+    records_by_pdf = extract_pdfs(sorted(CATALOG_PDF.glob("*.pdf")))
+
+Usage:
+    python -m backend.scripts.migrations.pdf_extract_cache "assets/catalog pages 4 email"
+    python -m backend.scripts.migrations.pdf_extract_cache DIR [--workers 4] [--prune]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from backend.scripts.migrations.catalog_fill_utils import (
+    family_name_from_pdf_path,
+    parse_pdf_for_fill,
+)
+
+logger = logging.getLogger(__name__)
+
+PARSER_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+COMMIT_EVERY = 20
+SQLITE_MAX_PARAMS = 500
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get("PDF_EXTRACT_CACHE")
+    or Path(__file__).resolve().parents[3] / ".cache" / "pdf_extract.sqlite"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS extracts (
+    sha256 TEXT NOT NULL,
+    parser_version INTEGER NOT NULL,
+    records BLOB NOT NULL,
+    PRIMARY KEY (sha256, parser_version)
+);
+"""
+
+PathLike = Union[str, Path]
+
+
+def hash_pdf(pdf_path: PathLike) -> str:
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pack_records(records: List[Dict[str, Any]]) -> bytes:
+    text = records[0].get("full_page_text", "") if records else ""
+    slim = [{k: v for k, v in rec.items() if k != "full_page_text"} for rec in records]
+    doc = json.dumps({"text": text, "records": slim}, separators=(",", ":"), ensure_ascii=False)
+    return zlib.compress(doc.encode("utf-8"))
+
+
+def unpack_records(blob: bytes, pdf_path: str) -> List[Dict[str, Any]]:
+    """
+    Rebuild parse_pdf_for_fill records for ``pdf_path``.
+
+    family_name comes from the file name, not the content, so it is re-derived
+    here: two copies of one catalog under different names share an entry.
+    """
+    doc = json.loads(zlib.decompress(blob).decode("utf-8"))
+    family = family_name_from_pdf_path(pdf_path)
+    return [
+        {**rec, "family_name": family, "full_page_text": doc["text"]}
+        for rec in doc["records"]
+    ]
+
+
+def _parse_worker(pdf_path: str) -> Tuple[str, bytes]:
+    """Parse one PDF in a pool process; pack there to keep the pickle small."""
+    return pdf_path, pack_records(parse_pdf_for_fill(pdf_path))
+
+
+def _chunks(items: List[str], size: int = SQLITE_MAX_PARAMS) -> Iterator[List[str]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class PdfExtractCache:
+    """SQLite store of parse_pdf_for_fill results keyed by content hash."""
+
+    def __init__(self, path: Optional[PathLike] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "PdfExtractCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def content_hash(self, pdf_path: PathLike) -> str:
+        """sha256 of the file, re-hashed only when its size or mtime changes."""
+        key = str(pdf_path)
+        stat = os.stat(key)
+        row = self._conn.execute(
+            "SELECT sha256 FROM files WHERE path = ? AND mtime_ns = ? AND size = ?",
+            (key, stat.st_mtime_ns, stat.st_size),
+        ).fetchone()
+        if row:
+            return row[0]
+        sha = hash_pdf(key)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, sha256) VALUES (?, ?, ?, ?)",
+            (key, stat.st_mtime_ns, stat.st_size, sha),
+        )
+        return sha
+
+    def _cached(self, hashes: List[str]) -> Dict[str, bytes]:
+        found: Dict[str, bytes] = {}
+        for chunk in _chunks(hashes):
+            marks = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT sha256, records FROM extracts WHERE parser_version = ? AND sha256 IN ({marks})",
+                (PARSER_VERSION, *chunk),
+            )
+            found.update(rows)
+        return found
+
+    def _store(self, sha: str, blob: bytes) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO extracts (sha256, parser_version, records) VALUES (?, ?, ?)",
+            (sha, PARSER_VERSION, blob),
+        )
+
+    def _parse(self, pdf_paths: List[str], workers: int) -> Iterator[Tuple[str, bytes]]:
+        if workers <= 1 or len(pdf_paths) == 1:
+            for pdf_path in pdf_paths:
+                yield _parse_worker(pdf_path)
+            return
+        with ProcessPoolExecutor(max_workers=min(workers, len(pdf_paths))) as pool:
+            futures = [pool.submit(_parse_worker, p) for p in pdf_paths]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def extract(
+        self,
+        pdf_paths: Iterable[PathLike],
+        workers: Optional[int] = None,
+        rebuild: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        parse_pdf_for_fill records for each PDF, parsing only uncached content.
+
+        Args:
+            pdf_paths: PDFs to read; duplicates are ignored
+            workers: Parser processes (default: CPU count; 1 parses inline)
+            rebuild: Re-parse every PDF even if it is cached
+
+        Returns:
+            Dict of str(path) -> records, in the order the paths were given
+        """
+        hash_by_path: Dict[str, str] = {}
+        for pdf_path in pdf_paths:
+            key = str(pdf_path)
+            if key not in hash_by_path:
+                hash_by_path[key] = self.content_hash(key)
+        self._conn.commit()
+
+        hashes = list(dict.fromkeys(hash_by_path.values()))
+        blobs = {} if rebuild else self._cached(hashes)
+
+        todo: Dict[str, str] = {}
+        for key, sha in hash_by_path.items():
+            if sha not in blobs:
+                todo.setdefault(sha, key)
+        todo = {key: sha for sha, key in todo.items()}
+        if todo:
+            logger.info(
+                "Parsing %s of %s PDFs (%s cached)", len(todo), len(hashes), len(hashes) - len(todo)
+            )
+            for done, (key, blob) in enumerate(self._parse(list(todo), workers or os.cpu_count() or 1), 1):
+                blobs[todo[key]] = blob
+                self._store(todo[key], blob)
+                if done % COMMIT_EVERY == 0:
+                    self._conn.commit()
+                    logger.info("Parsed %s/%s PDFs", done, len(todo))
+            self._conn.commit()
+
+        return {key: unpack_records(blobs[sha], key) for key, sha in hash_by_path.items()}
+
+    def prune(self) -> int:
+        """Drop other parser versions, vanished files and unreferenced entries."""
+        gone = [p for (p,) in self._conn.execute("SELECT path FROM files") if not os.path.exists(p)]
+        for chunk in _chunks(gone):
+            self._conn.execute(f"DELETE FROM files WHERE path IN ({','.join('?' * len(chunk))})", chunk)
+        removed = self._conn.execute(
+            "DELETE FROM extracts WHERE parser_version != ? OR sha256 NOT IN (SELECT sha256 FROM files)",
+            (PARSER_VERSION,),
+        ).rowcount
+        self._conn.commit()
+        self._conn.execute("VACUUM")
+        return removed
+
+
+def extract_pdfs(
+    pdf_paths: Iterable[PathLike],
+    cache_path: Optional[PathLike] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Cached parse_pdf_for_fill for many PDFs; see PdfExtractCache.extract."""
+    with PdfExtractCache(cache_path) as cache:
+        return cache.extract(pdf_paths, workers=workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm the catalog PDF extraction cache")
+    parser.add_argument("pdf_dir", type=Path, help="Directory of catalog PDFs")
+    parser.add_argument("--cache", type=Path, default=None, help=f"Cache file (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--rebuild", action="store_true", help="Re-parse every PDF")
+    parser.add_argument("--prune", action="store_true", help="Remove entries for missing files and old parser versions")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    if not args.pdf_dir.is_dir():
+        logger.error("Not a directory: %s", args.pdf_dir)
+        sys.exit(1)
+
+    pdfs = sorted(args.pdf_dir.glob("*.pdf"))
+    with PdfExtractCache(args.cache) as cache:
+        extracted = cache.extract(pdfs, workers=args.workers, rebuild=args.rebuild)
+        if args.prune:
+            logger.info("Pruned %s stale entries", cache.prune())
+    logger.info(
+        "%s PDFs, %s product records in %s",
+        len(extracted), sum(len(r) for r in extracted.values()), cache.path,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,9 +16,13 @@ Main Categories:
 Subcategories vary by category (Wood, Metal, Lounge, Arm, Outdoor, etc)
 
 Usage:
-    python -m backend.scripts.migrations.seed_categories
+    python -m backend.scripts.migrations.seed_categories [--check-dump]
+
+--check-dump lists WordPress product categories in the SQL dump (via its
+index, see base_parser.py) that have no seeded category or subcategory.
 """
 
+import argparse
 import asyncio
 import logging
 import sys
@@ -33,6 +37,12 @@ from sqlalchemy import select
 from backend.database.base import AsyncSessionLocal
 from backend.models.chair import Category, ProductSubcategory
 
+# Handle both direct execution and module execution
+try:
+    from .base_parser import index_has_table, open_dump_index
+except ImportError:
+    from base_parser import index_has_table, open_dump_index
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -182,5 +192,41 @@ async def seed_categories():
             raise
 
 
+def report_unseeded_wp_categories() -> list[str]:
+    """Log WordPress product categories whose slug is not seeded here."""
+    seeded = {cat['slug'] for cat in CATEGORY_STRUCTURE}
+    seeded |= {sub['slug'] for cat in CATEGORY_STRUCTURE for sub in cat['subcategories']}
+    
+    index = open_dump_index()
+    try:
+        if not (index_has_table(index, "wp_terms") and index_has_table(index, "wp_term_taxonomy")):
+            logger.warning("No WordPress terms found in SQL dump")
+            return []
+        rows = index.execute(
+            """
+            SELECT t.slug, t.name, tt.count
+            FROM wp_term_taxonomy tt
+            JOIN wp_terms t ON t.term_id = tt.term_id
+            WHERE tt.taxonomy = 'product_cat'
+            ORDER BY tt.count DESC, t.slug
+            """
+        ).fetchall()
+    finally:
+        index.close()
+    
+    missing = [row for row in rows if row['slug'] not in seeded]
+    logger.info(f"{len(rows)} WordPress product categories, {len(missing)} not seeded:")
+    for row in missing:
+        logger.info(f"  {row['slug']:<30} {row['name']} ({row['count']} products)")
+    return [row['slug'] for row in missing]
+
+
 if __name__ == "__main__":
-    asyncio.run(seed_categories())
+    parser = argparse.ArgumentParser(description="Seed categories and subcategories")
+    parser.add_argument('--check-dump', action='store_true', help='Report WordPress categories missing from the seed structure')
+    args = parser.parse_args()
+    
+    if args.check_dump:
+        report_unseeded_wp_categories()
+    else:
+        asyncio.run(seed_categories())
@@ -50,6 +50,7 @@ from backend.scripts.catalog_sync_utils import (
     variations_from_pdf_record,
 )
 from backend.services.admin_service import AdminService
+from backend.services.image_index_service import ImageIndex
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -174,6 +175,8 @@ async def cmd_cleanup(apply: bool) -> None:
 
 async def cmd_enrich_images(assets_root: Path, uploads_dir: Path, apply: bool, limit: Optional[int]) -> None:
     asset_index = index_asset_images(assets_root)
+    image_index = ImageIndex()
+    image_index.update(p for paths in asset_index.values() for p in paths)
     updated = 0
     skipped = 0
     async with AsyncSessionLocal() as db:
@@ -190,7 +193,7 @@ async def cmd_enrich_images(assets_root: Path, uploads_dir: Path, apply: bool, l
             if not paths:
                 skipped += 1
                 continue
-            src = pick_best_asset_image(paths)
+            src = pick_best_asset_image(paths, image_index)
             if not src:
                 skipped += 1
                 continue
@@ -214,6 +217,7 @@ async def cmd_enrich_images(assets_root: Path, uploads_dir: Path, apply: bool, l
                 updated += 1
                 logger.info("[dry-run] would set image id=%s model=%s <- %s", chair.id, chair.model_number, src.name)
 
+    image_index.close()
     logger.info("enrich-images: updated=%s skipped=%s apply=%s uploads=%s", updated, skipped, apply, uploads_dir)
 
 
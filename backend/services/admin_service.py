@@ -40,7 +40,9 @@ from backend.models.content import (
     Installation,
     TeamMember,
 )
+from backend.models.loaders import ChairLoad
 from backend.models.quote import Quote, QuoteItem, QuoteStatus
+from backend.services import quote_rollup_service  # noqa: F401  (registers the quote rollup hooks)
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +121,29 @@ class AdminService:
     # Product Management
     # ========================================================================
 
+    @staticmethod
+    def product_filters(
+        search: Optional[str] = None,
+        category_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+    ) -> List[Any]:
+        """WHERE clauses for the admin product list (shared with exports)"""
+        filters = []
+        if search:
+            filters.append(
+                or_(
+                    Chair.name.ilike(f"%{search}%"),
+                    Chair.short_description.ilike(f"%{search}%"),
+                    Chair.full_description.ilike(f"%{search}%"),
+                    Chair.model_number.ilike(f"%{search}%"),
+                )
+            )
+        if category_id:
+            filters.append(_chair_in_category(category_id))
+        if is_active is not None:
+            filters.append(Chair.is_active == is_active)
+        return filters
+
     @staticmethod
     async def get_all_products(
         db: AsyncSession,
@@ -136,46 +161,11 @@ class AdminService:
         sort_by: name, model_number, base_price, view_count, quote_count, is_active, created_at, category
         sort_dir: asc, desc (default asc)
         """
-        query = select(Chair).options(
-            selectinload(Chair.category),
-            selectinload(Chair.subcategory),
-            selectinload(Chair.family),
-            selectinload(Chair.variations).selectinload(ProductVariation.finish),
-            selectinload(Chair.variations).selectinload(ProductVariation.upholstery),
-            selectinload(Chair.variations).selectinload(ProductVariation.color),
-            selectinload(Chair.variations).selectinload(ProductVariation.families),
-        )
+        query = select(Chair).options(*ChairLoad.ADMIN)
 
-        if search:
-            query = query.where(
-                or_(
-                    Chair.name.ilike(f"%{search}%"),
-                    Chair.short_description.ilike(f"%{search}%"),
-                    Chair.full_description.ilike(f"%{search}%"),
-                    Chair.model_number.ilike(f"%{search}%"),
-                )
-            )
-
-        if category_id:
-            query = query.where(_chair_in_category(category_id))
-
-        if is_active is not None:
-            query = query.where(Chair.is_active == is_active)
-
-        count_query = select(func.count(Chair.id))
-        if search:
-            count_query = count_query.where(
-                or_(
-                    Chair.name.ilike(f"%{search}%"),
-                    Chair.short_description.ilike(f"%{search}%"),
-                    Chair.full_description.ilike(f"%{search}%"),
-                    Chair.model_number.ilike(f"%{search}%"),
-                )
-            )
-        if category_id:
-            count_query = count_query.where(_chair_in_category(category_id))
-        if is_active is not None:
-            count_query = count_query.where(Chair.is_active == is_active)
+        filters = AdminService.product_filters(search, category_id, is_active)
+        query = query.where(*filters)
+        count_query = select(func.count(Chair.id)).where(*filters)
 
         total_result = await db.execute(count_query)
         total_count = total_result.scalar()
@@ -746,6 +736,26 @@ class AdminService:
     # Company Management
     # ========================================================================
 
+    @staticmethod
+    def company_filters(
+        search: Optional[str] = None,
+        status: Optional[CompanyStatus] = None,
+    ) -> List[Any]:
+        """WHERE clauses for the admin company list (shared with exports)"""
+        filters = []
+        if search:
+            filters.append(
+                or_(
+                    Company.company_name.ilike(f"%{search}%"),
+                    Company.rep_email.ilike(f"%{search}%"),
+                    Company.rep_first_name.ilike(f"%{search}%"),
+                    Company.rep_last_name.ilike(f"%{search}%"),
+                )
+            )
+        if status:
+            filters.append(Company.status == status)
+        return filters
+
     @staticmethod
     async def get_all_companies(
         db: AsyncSession,
@@ -762,33 +772,9 @@ class AdminService:
         sort_by: company_name, status, contact, created_at
         sort_dir: asc, desc
         """
-        query = select(Company)
-
-        if search:
-            query = query.where(
-                or_(
-                    Company.company_name.ilike(f"%{search}%"),
-                    Company.rep_email.ilike(f"%{search}%"),
-                    Company.rep_first_name.ilike(f"%{search}%"),
-                    Company.rep_last_name.ilike(f"%{search}%"),
-                )
-            )
-
-        if status:
-            query = query.where(Company.status == status)
-
-        count_query = select(func.count(Company.id))
-        if search:
-            count_query = count_query.where(
-                or_(
-                    Company.company_name.ilike(f"%{search}%"),
-                    Company.rep_email.ilike(f"%{search}%"),
-                    Company.rep_first_name.ilike(f"%{search}%"),
-                    Company.rep_last_name.ilike(f"%{search}%"),
-                )
-            )
-        if status:
-            count_query = count_query.where(Company.status == status)
+        filters = AdminService.company_filters(search, status)
+        query = select(Company).where(*filters)
+        count_query = select(func.count(Company.id)).where(*filters)
 
         total_result = await db.execute(count_query)
         total_count = total_result.scalar()
@@ -866,6 +852,19 @@ class AdminService:
     # Quote Management
     # ========================================================================
 
+    @staticmethod
+    def quote_filters(
+        status: Optional[QuoteStatus] = None,
+        company_id: Optional[int] = None,
+    ) -> List[Any]:
+        """WHERE clauses for the admin quote list (shared with exports)"""
+        filters = []
+        if status:
+            filters.append(Quote.status == status)
+        if company_id is not None:
+            filters.append(Quote.company_id == company_id)
+        return filters
+
     @staticmethod
     async def get_all_quotes(
         db: AsyncSession,
@@ -887,17 +886,9 @@ class AdminService:
             selectinload(Quote.items).selectinload(QuoteItem.product),
         )
 
-        if status:
-            query = query.where(Quote.status == status)
-
-        if company_id is not None:
-            query = query.where(Quote.company_id == company_id)
-
-        count_query = select(func.count(Quote.id))
-        if status:
-            count_query = count_query.where(Quote.status == status)
-        if company_id is not None:
-            count_query = count_query.where(Quote.company_id == company_id)
+        filters = AdminService.quote_filters(status, company_id)
+        query = query.where(*filters)
+        count_query = select(func.count(Quote.id)).where(*filters)
 
         total_result = await db.execute(count_query)
         total_count = total_result.scalar()
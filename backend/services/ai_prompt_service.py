@@ -0,0 +1,302 @@
+"""
+AI Prompt Service
+
+Builds the admin AI chat system prompt from cached, versioned fragments and
+loads chat history incrementally, so a chat turn no longer reloads the whole
+session and re-queries every prompt input.
+
+Fragments (per-admin memory, training summaries, valid reference IDs and the
+live data line) are held in the shared cache as ``{"version", "data"}``, the
+version being a hash of the data. Each fragment is dropped by its own write
+paths through ``invalidate_prompt_fragment``: memory by the memory routes and
+the extraction task, training by document processing and deletion, reference
+IDs by category/subcategory/family/finish/upholstery/color writes. The live
+data counts simply expire. On the per-process memory cache backend an
+invalidation (e.g. by training documents processed in the worker) only
+reaches its own process, so fragments are kept for
+``cache_service.shared_ttl`` there. The assembled prompt is memoised
+in-process by fragment versions, mode, model and date.
+
+Only the messages after a session's ``history_summary_until`` are loaded;
+once more than ``HISTORY_KEEP_MESSAGES`` accumulate, the older ones are folded
+into ``history_summary`` in the background.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import desc, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.base import AsyncSessionLocal
+from backend.models.ai_chat import (
+    AIChatMessage,
+    AIChatSession,
+    AIMemory,
+    AITrainingDocument,
+    TrainingStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fragment kinds
+FRAGMENT_MEMORY = "memory"
+FRAGMENT_TRAINING = "training"
+FRAGMENT_REFERENCE_IDS = "reference_ids"
+FRAGMENT_LIVE_DATA = "live_data"
+
+FRAGMENT_TTL = 3600  # Dropped by each fragment's writers via invalidate_prompt_fragment
+LIVE_DATA_TTL = 300
+
+# Messages sent verbatim after the summary; older ones get summarised
+HISTORY_KEEP_MESSAGES = 20
+# Upper bound on messages loaded per turn while a summary is pending
+HISTORY_MAX_MESSAGES = 60
+# Upper bound on messages folded into the summary in one call
+HISTORY_SUMMARY_BATCH = 100
+
+ASSEMBLED_PROMPT_CACHE_SIZE = 64
+
+_assembled_prompts: "OrderedDict[tuple, str]" = OrderedDict()
+_summarizing: Set[str] = set()
+
+
+def _fragment_key(kind: str, scope: Any = "all") -> str:
+    return f"eaglechair:ai_prompt:{kind}:{scope}"
+
+
+def _fragment_version(data: Any) -> str:
+    payload = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:16]
+
+
+async def load_active_memory(db: AsyncSession, admin_id: int | None) -> list[dict]:
+    q = select(AIMemory).where(AIMemory.is_active == True)
+    if admin_id is not None:
+        q = q.where(AIMemory.admin_user_id == admin_id)
+    else:
+        q = q.where(AIMemory.admin_user_id.is_(None))
+    result = await db.execute(
+        q.order_by(desc(AIMemory.importance), desc(AIMemory.updated_at)).limit(50)
+    )
+    return [
+        {"key": m.key, "value": m.value, "category": m.category, "importance": m.importance}
+        for m in result.scalars().all()
+    ]
+
+
+async def load_training_summaries(db: AsyncSession) -> list[dict]:
+    result = await db.execute(
+        select(AITrainingDocument)
+        .where(
+            AITrainingDocument.is_active == True,
+            AITrainingDocument.status == TrainingStatus.COMPLETED,
+        )
+        .order_by(desc(AITrainingDocument.created_at))
+        .limit(20)
+    )
+    return [
+        {
+            "name": d.name,
+            "summary": d.summary or "",
+            "key_facts": d.key_facts or [],
+            "structured_data": d.structured_data or "",
+        }
+        for d in result.scalars().all()
+    ]
+
+
+class AIPromptService:
+    """Assemble chat system prompts and incremental history"""
+
+    @staticmethod
+    async def get_fragment(
+        kind: str,
+        scope: Any,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = FRAGMENT_TTL,
+    ) -> Tuple[str, Any]:
+        """
+        Return a prompt fragment and its version, loading it on a miss
+
+        Empty-string results (the loaders' error fallback) are not cached.
+
+        Args:
+            kind: Fragment kind constant
+            scope: Admin ID for per-admin fragments, "all" otherwise
+            loader: Coroutine factory producing the fragment data
+            ttl: Cache lifetime in seconds
+
+        Returns:
+            (version, data)
+        """
+        from backend.services.cache_service import cache_service
+
+        key = _fragment_key(kind, scope)
+        cached = await cache_service.get(key)
+        if isinstance(cached, dict) and "version" in cached:
+            return cached["version"], cached["data"]
+
+        data = await loader()
+        version = _fragment_version(data)
+        if data != "":
+            await cache_service.set(
+                key, {"version": version, "data": data}, ttl=cache_service.shared_ttl(ttl)
+            )
+        return version, data
+
+    @staticmethod
+    async def build_system_prompt(
+        db: AsyncSession,
+        admin_id: int | None,
+        mode: str = "edit",
+        model: str = "auto",
+        history_summary: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Build the system prompt for one chat turn
+
+        Args:
+            db: Database session
+            admin_id: Admin whose memory is included
+            mode: Chat mode ("ask", "edit", "agent")
+            model: Model/personality selector
+            history_summary: Rolling summary of earlier messages, if any
+
+        Returns:
+            (system prompt, fragment versions)
+        """
+        from backend.services.ai_service import (
+            build_system_prompt,
+            fetch_valid_reference_ids,
+            get_eaglechair_context,
+        )
+
+        memory_version, memory = await AIPromptService.get_fragment(
+            FRAGMENT_MEMORY, admin_id, lambda: load_active_memory(db, admin_id)
+        )
+        training_version, training = await AIPromptService.get_fragment(
+            FRAGMENT_TRAINING, "all", lambda: load_training_summaries(db)
+        )
+        reference_version, valid_ids = None, None
+        if mode in ("edit", "agent"):
+            reference_version, valid_ids = await AIPromptService.get_fragment(
+                FRAGMENT_REFERENCE_IDS, "all", fetch_valid_reference_ids
+            )
+        live_version, live_data = await AIPromptService.get_fragment(
+            FRAGMENT_LIVE_DATA, "all", lambda: get_eaglechair_context(db), ttl=LIVE_DATA_TTL
+        )
+
+        versions = {
+            FRAGMENT_MEMORY: memory_version,
+            FRAGMENT_TRAINING: training_version,
+            FRAGMENT_REFERENCE_IDS: reference_version,
+            FRAGMENT_LIVE_DATA: live_version,
+        }
+        key = (memory_version, training_version, reference_version, live_version,
+               mode, model, date.today().isoformat())
+
+        prompt = _assembled_prompts.get(key)
+        if prompt is None:
+            prompt = build_system_prompt(
+                memory, training, mode=mode, model=model, valid_reference_ids=valid_ids
+            )
+            if live_data:
+                prompt += f"\n\n## Live Data\n{live_data}"
+            _assembled_prompts[key] = prompt
+            while len(_assembled_prompts) > ASSEMBLED_PROMPT_CACHE_SIZE:
+                _assembled_prompts.popitem(last=False)
+        else:
+            _assembled_prompts.move_to_end(key)
+
+        if history_summary:
+            prompt += f"\n\n## Earlier in This Conversation (summary)\n{history_summary}"
+        return prompt, versions
+
+    @staticmethod
+    async def load_history(db: AsyncSession, session: AIChatSession) -> List[dict]:
+        """
+        Messages not yet covered by the session's summary, oldest first
+
+        At most ``HISTORY_MAX_MESSAGES`` (the newest) are returned.
+        """
+        stmt = select(AIChatMessage.role, AIChatMessage.content).where(
+            AIChatMessage.session_id == session.id
+        )
+        if session.history_summary_until is not None:
+            stmt = stmt.where(AIChatMessage.created_at > session.history_summary_until)
+        result = await db.execute(
+            stmt.order_by(desc(AIChatMessage.created_at)).limit(HISTORY_MAX_MESSAGES)
+        )
+        rows = result.all()
+        return [
+            {"role": getattr(role, "value", role), "content": content}
+            for role, content in reversed(rows)
+        ]
+
+    @staticmethod
+    async def refresh_history_summary(session_id: str) -> bool:
+        """
+        Fold all but the newest ``HISTORY_KEEP_MESSAGES`` unsummarised messages
+        into the session's rolling summary (run as a background task)
+
+        Returns:
+            True if the summary was updated
+        """
+        from backend.services.ai_service import summarize_conversation
+
+        if session_id in _summarizing:
+            return False
+        _summarizing.add(session_id)
+        try:
+            async with AsyncSessionLocal() as db:
+                session = await db.get(AIChatSession, session_id)
+                if not session:
+                    return False
+
+                stmt = select(
+                    AIChatMessage.role, AIChatMessage.content, AIChatMessage.created_at
+                ).where(AIChatMessage.session_id == session_id)
+                if session.history_summary_until is not None:
+                    stmt = stmt.where(AIChatMessage.created_at > session.history_summary_until)
+                rows = (await db.execute(stmt.order_by(AIChatMessage.created_at))).all()
+                if len(rows) <= HISTORY_KEEP_MESSAGES:
+                    return False
+
+                older = rows[:-HISTORY_KEEP_MESSAGES][-HISTORY_SUMMARY_BATCH:]
+                summary = await summarize_conversation(
+                    session.history_summary,
+                    [{"role": getattr(r.role, "value", r.role), "content": r.content} for r in older],
+                )
+                if not summary:
+                    return False
+
+                await db.execute(
+                    update(AIChatSession)
+                    .where(AIChatSession.id == session_id)
+                    .values(
+                        history_summary=summary,
+                        history_summary_until=older[-1].created_at,
+                        # Summarising is not activity; keep the chat list order
+                        updated_at=AIChatSession.updated_at,
+                    )
+                )
+                await db.commit()
+                logger.info(f"Summarised {len(older)} messages of chat session {session_id}")
+                return True
+        except Exception as e:
+            logger.warning(f"History summary failed for session {session_id}: {e}")
+            return False
+        finally:
+            _summarizing.discard(session_id)
+
+
+async def invalidate_prompt_fragment(kind: str, scope: Any = "all") -> None:
+    """Drop a prompt fragment after a write; it is reloaded on the next chat turn."""
+    from backend.services.cache_service import cache_service
+
+    await cache_service.delete(_fragment_key(kind, scope))
@@ -22,19 +22,12 @@ import re
 import threading
 import time
 import traceback
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
 
 import httpx
-import html2text
-import pandas as pd
-import pdfplumber
-import sympy
-from ddgs import DDGS
-from google import genai
-from google.genai import types
-from fuzzywuzzy import fuzz
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text
 
@@ -43,6 +36,10 @@ from backend.database.base import AsyncSessionLocal
 from backend.models.ai_chat import AITrainingDocument, TrainingStatus
 from backend.services.ai_domain_knowledge import EAGLECHAIR_DOMAIN_KNOWLEDGE
 
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,9 +47,11 @@ logger = logging.getLogger(__name__)
 # Gemini Client Setup
 # ─────────────────────────────────────────────────────────────────────────────
 
-_client: Optional[genai.Client] = None
+_client: Optional["genai.Client"] = None
+
+def get_gemini_client() -> "genai.Client":
+    from google import genai
 
-def get_gemini_client() -> genai.Client:
     global _client
     if _client is None:
         api_key = getattr(settings, "GEMINI_API_KEY", None) or os.environ.get("GEMINI_API_KEY")
@@ -68,6 +67,8 @@ def get_gemini_client() -> genai.Client:
 
 def web_search(query: str, max_results: int = 12) -> dict:
     """Search the web using DuckDuckGo."""
+    from ddgs import DDGS
+
     try:
         results = []
         with DDGS() as ddgs:
@@ -85,6 +86,8 @@ def web_search(query: str, max_results: int = 12) -> dict:
 
 def fetch_webpage(url: str, max_chars: int = 8000) -> dict:
     """Fetch and convert a webpage to markdown for AI reading."""
+    import html2text
+
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (compatible; EagleChair-AI/1.0)",
@@ -115,6 +118,8 @@ def fetch_webpage(url: str, max_chars: int = 8000) -> dict:
 
 def calculate(expression: str) -> dict:
     """Evaluate a mathematical expression using sympy for exact results."""
+    import sympy
+
     try:
         # Safe evaluation with sympy
         expr = sympy.sympify(expression)
@@ -137,6 +142,8 @@ def calculate(expression: str) -> dict:
 
 def analyze_csv_content(content: str, max_rows: int = 50) -> dict:
     """Analyze CSV content and return summary statistics."""
+    import pandas as pd
+
     try:
         df = pd.read_csv(io.StringIO(content))
         analysis = {
@@ -164,6 +171,9 @@ def analyze_csv_content(content: str, max_rows: int = 50) -> dict:
 
 def analyze_pdf_content(file_path: str, max_pages: int = 100) -> dict:
     """Extract text from a PDF file."""
+    import pandas as pd
+    import pdfplumber
+
     try:
         pages = []
         with pdfplumber.open(file_path) as pdf:
@@ -196,6 +206,8 @@ def analyze_pdf_content(file_path: str, max_pages: int = 100) -> dict:
 
 def convert_excel_to_markdown(file_path: str, max_rows_per_sheet: int = 1000) -> dict:
     """Convert Excel file to markdown tables."""
+    import pandas as pd
+
     try:
         ext = Path(file_path).suffix.lower()
         engine = "xlrd" if ext == ".xls" else "openpyxl"
@@ -218,209 +230,214 @@ def convert_excel_to_markdown(file_path: str, max_rows_per_sheet: int = 1000) ->
 # Gemini Tool Definitions
 # ─────────────────────────────────────────────────────────────────────────────
 
-TOOL_DEFINITIONS = [
-    types.Tool(
-        function_declarations=[
-            types.FunctionDeclaration(
-                name="web_search",
-                description="Search the web for current information using DuckDuckGo. Use this to find pricing data, industry news, product specs, competitor info, or any information not in your training data.",
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "query": types.Schema(
-                            type=types.Type.STRING,
-                            description="Search query. Be specific and concise.",
-                        ),
-                        "max_results": types.Schema(
-                            type=types.Type.INTEGER,
-                            description="Number of results to return (1-15, default 12)",
-                        ),
-                    },
-                    required=["query"],
-                ),
-            ),
-            types.FunctionDeclaration(
-                name="fetch_webpage",
-                description="Fetch and read the full content of a specific webpage URL. Use after web_search to get detailed info from a result.",
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "url": types.Schema(
-                            type=types.Type.STRING,
-                            description="The URL to fetch",
-                        ),
-                    },
-                    required=["url"],
-                ),
-            ),
-            types.FunctionDeclaration(
-                name="calculate",
-                description="Perform mathematical calculations, pricing math, percentages, unit conversions. Supports algebra, statistics formulas, and more.",
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "expression": types.Schema(
-                            type=types.Type.STRING,
-                            description="Mathematical expression to evaluate. E.g. '250 * 1.15' or 'sqrt(144)' or '(500 - 350) / 500 * 100'",
-                        ),
-                    },
-                    required=["expression"],
-                ),
-            ),
-            types.FunctionDeclaration(
-                name="search_catalog",
-                description=(
-                    "Search the Eagle Chair catalog. Use query 'all' or 'everything' for full catalog overview "
-                    "(all families, all model numbers). For specific terms: product/family name, model number, "
-                    "finish, upholstery, color. Searches families, products, variations, finishes, upholsteries, "
-                    "colors, categories. Use FIRST when the user asks about products. Call before saying you don't know."
-                ),
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "query": types.Schema(
-                            type=types.Type.STRING,
-                            description="Search term: product/family name, model number, finish, upholstery, color, etc.",
-                        ),
-                    },
-                    required=["query"],
-                ),
-            ),
-            types.FunctionDeclaration(
-                name="search_training_data",
-                description=(
-                    "Search ALL training documents (uploaded PDFs, CSVs, pricing sheets, etc.) using fuzzy matching. "
-                    "Use when the user asks about models, products, pricing, or specs that might be in training data. "
-                    "Returns matched facts and chunks from each document. Call this for 'search your training data', "
-                    "'find all models in training', 'what does the pricing sheet say', etc."
+@lru_cache(maxsize=1)
+def _tool_definitions() -> list:
+    """Gemini tool declarations, built on first use so google.genai loads lazily"""
+    from google.genai import types
+
+    return [
+        types.Tool(
+            function_declarations=[
+                types.FunctionDeclaration(
+                    name="web_search",
+                    description="Search the web for current information using DuckDuckGo. Use this to find pricing data, industry news, product specs, competitor info, or any information not in your training data.",
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "query": types.Schema(
+                                type=types.Type.STRING,
+                                description="Search query. Be specific and concise.",
+                            ),
+                            "max_results": types.Schema(
+                                type=types.Type.INTEGER,
+                                description="Number of results to return (1-15, default 12)",
+                            ),
+                        },
+                        required=["query"],
+                    ),
                 ),
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "query": types.Schema(
-                            type=types.Type.STRING,
-                            description="Search term: model number, product name, price, spec, or keyword to find in training docs.",
-                        ),
-                        "max_results": types.Schema(
-                            type=types.Type.INTEGER,
-                            description="Max number of document matches to return (default 20)",
-                        ),
-                    },
-                    required=["query"],
+                types.FunctionDeclaration(
+                    name="fetch_webpage",
+                    description="Fetch and read the full content of a specific webpage URL. Use after web_search to get detailed info from a result.",
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "url": types.Schema(
+                                type=types.Type.STRING,
+                                description="The URL to fetch",
+                            ),
+                        },
+                        required=["url"],
+                    ),
                 ),
-            ),
-            types.FunctionDeclaration(
-                name="get_product_catalog",
-                description=(
-                    "Retrieve the complete Eagle Chair product catalog from the live database. "
-                    "Returns all active products, variations, categories, families, finishes, upholsteries, colors. "
-                    "Use when search_catalog returns nothing but you need full context, or when the user asks for "
-                    "broad catalog info, pricing overview, or full structure."
+                types.FunctionDeclaration(
+                    name="calculate",
+                    description="Perform mathematical calculations, pricing math, percentages, unit conversions. Supports algebra, statistics formulas, and more.",
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "expression": types.Schema(
+                                type=types.Type.STRING,
+                                description="Mathematical expression to evaluate. E.g. '250 * 1.15' or 'sqrt(144)' or '(500 - 350) / 500 * 100'",
+                            ),
+                        },
+                        required=["expression"],
+                    ),
                 ),
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={},
+                types.FunctionDeclaration(
+                    name="search_catalog",
+                    description=(
+                        "Search the Eagle Chair catalog. Use query 'all' or 'everything' for full catalog overview "
+                        "(all families, all model numbers). For specific terms: product/family name, model number, "
+                        "finish, upholstery, color. Searches families, products, variations, finishes, upholsteries, "
+                        "colors, categories. Use FIRST when the user asks about products. Call before saying you don't know."
+                    ),
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "query": types.Schema(
+                                type=types.Type.STRING,
+                                description="Search term: product/family name, model number, finish, upholstery, color, etc.",
+                            ),
+                        },
+                        required=["query"],
+                    ),
                 ),
-            ),
-            types.FunctionDeclaration(
-                name="get_training_vs_catalog_overview",
-                description=(
-                    "Compare model numbers in training data vs live catalog. Returns which models appear only in "
-                    "training, only in catalog, or in both. Use when the user asks to 'compare training to catalog', "
-                    "'find all models in training and compare with catalog', or 'what models are in training but not catalog'."
+                types.FunctionDeclaration(
+                    name="search_training_data",
+                    description=(
+                        "Search ALL training documents (uploaded PDFs, CSVs, pricing sheets, etc.) using fuzzy matching. "
+                        "Use when the user asks about models, products, pricing, or specs that might be in training data. "
+                        "Returns matched facts and chunks from each document. Call this for 'search your training data', "
+                        "'find all models in training', 'what does the pricing sheet say', etc."
+                    ),
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "query": types.Schema(
+                                type=types.Type.STRING,
+                                description="Search term: model number, product name, price, spec, or keyword to find in training docs.",
+                            ),
+                            "max_results": types.Schema(
+                                type=types.Type.INTEGER,
+                                description="Max number of document matches to return (default 20)",
+                            ),
+                        },
+                        required=["query"],
+                    ),
                 ),
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={},
+                types.FunctionDeclaration(
+                    name="get_product_catalog",
+                    description=(
+                        "Retrieve the complete Eagle Chair product catalog from the live database. "
+                        "Returns all active products, variations, categories, families, finishes, upholsteries, colors. "
+                        "Use when search_catalog returns nothing but you need full context, or when the user asks for "
+                        "broad catalog info, pricing overview, or full structure."
+                    ),
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={},
+                    ),
                 ),
-            ),
-            types.FunctionDeclaration(
-                name="get_product_details",
-                description=(
-                    "Get FULL detailed specs for products. Prefer model_numbers (e.g. ['5242', '6018']) — users "
-                    "know models like 5242, not internal IDs. Pass model_numbers when the user says a model; "
-                    "product_ids only when you have them from search_catalog. Returns dimensions, features, "
-                    "weight, variations, stock_status, and everything. Never give partial info when full data is available."
+                types.FunctionDeclaration(
+                    name="get_training_vs_catalog_overview",
+                    description=(
+                        "Compare model numbers in training data vs live catalog. Returns which models appear only in "
+                        "training, only in catalog, or in both. Use when the user asks to 'compare training to catalog', "
+                        "'find all models in training and compare with catalog', or 'what models are in training but not catalog'."
+                    ),
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={},
+                    ),
                 ),
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "product_ids": types.Schema(
-                            type=types.Type.ARRAY,
-                            items=types.Schema(type=types.Type.INTEGER),
-                            description="Product IDs from search_catalog (optional if model_numbers provided)",
-                        ),
-                        "model_numbers": types.Schema(
-                            type=types.Type.ARRAY,
-                            items=types.Schema(type=types.Type.STRING),
-                            description="Model numbers or SKUs the user mentioned (e.g. ['5242', '5242P', '6018WB'])",
-                        ),
-                    },
+                types.FunctionDeclaration(
+                    name="get_product_details",
+                    description=(
+                        "Get FULL detailed specs for products. Prefer model_numbers (e.g. ['5242', '6018']) — users "
+                        "know models like 5242, not internal IDs. Pass model_numbers when the user says a model; "
+                        "product_ids only when you have them from search_catalog. Returns dimensions, features, "
+                        "weight, variations, stock_status, and everything. Never give partial info when full data is available."
+                    ),
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "product_ids": types.Schema(
+                                type=types.Type.ARRAY,
+                                items=types.Schema(type=types.Type.INTEGER),
+                                description="Product IDs from search_catalog (optional if model_numbers provided)",
+                            ),
+                            "model_numbers": types.Schema(
+                                type=types.Type.ARRAY,
+                                items=types.Schema(type=types.Type.STRING),
+                                description="Model numbers or SKUs the user mentioned (e.g. ['5242', '5242P', '6018WB'])",
+                            ),
+                        },
+                    ),
                 ),
-            ),
-            types.FunctionDeclaration(
-                name="create_product",
-                description=(
-                    "Create a new product when the admin asks you to add one. REQUIRED: category_id MUST be from "
-                    "the Valid Reference IDs section in your context (or from get_product_catalog/search_catalog). "
-                    "family_id and subcategory_id, if provided, must also be from that list. base_price in cents "
-                    "(e.g. 25000 for $250). Slug is auto-generated."
+                types.FunctionDeclaration(
+                    name="create_product",
+                    description=(
+                        "Create a new product when the admin asks you to add one. REQUIRED: category_id MUST be from "
+                        "the Valid Reference IDs section in your context (or from get_product_catalog/search_catalog). "
+                        "family_id and subcategory_id, if provided, must also be from that list. base_price in cents "
+                        "(e.g. 25000 for $250). Slug is auto-generated."
+                    ),
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "name": types.Schema(type=types.Type.STRING, description="Product name"),
+                            "model_number": types.Schema(type=types.Type.STRING, description="Model number (e.g. 201, 5242)"),
+                            "category_id": types.Schema(type=types.Type.INTEGER, description="Category ID from Valid Reference IDs only"),
+                            "base_price": types.Schema(type=types.Type.INTEGER, description="Base price in cents"),
+                            "short_description": types.Schema(type=types.Type.STRING, description="Short description"),
+                            "full_description": types.Schema(type=types.Type.STRING, description="Full description"),
+                            "family_id": types.Schema(type=types.Type.INTEGER, description="Family ID from Valid Reference IDs (optional)"),
+                            "subcategory_id": types.Schema(type=types.Type.INTEGER, description="Subcategory ID from Valid Reference IDs (optional)"),
+                            "stock_status": types.Schema(type=types.Type.STRING, description="e.g. In Stock, Made to Order"),
+                            "msrp": types.Schema(type=types.Type.INTEGER, description="MSRP in cents (optional)"),
+                        },
+                        required=["name", "model_number", "category_id", "base_price"],
+                    ),
                 ),
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "name": types.Schema(type=types.Type.STRING, description="Product name"),
-                        "model_number": types.Schema(type=types.Type.STRING, description="Model number (e.g. 201, 5242)"),
-                        "category_id": types.Schema(type=types.Type.INTEGER, description="Category ID from Valid Reference IDs only"),
-                        "base_price": types.Schema(type=types.Type.INTEGER, description="Base price in cents"),
-                        "short_description": types.Schema(type=types.Type.STRING, description="Short description"),
-                        "full_description": types.Schema(type=types.Type.STRING, description="Full description"),
-                        "family_id": types.Schema(type=types.Type.INTEGER, description="Family ID from Valid Reference IDs (optional)"),
-                        "subcategory_id": types.Schema(type=types.Type.INTEGER, description="Subcategory ID from Valid Reference IDs (optional)"),
-                        "stock_status": types.Schema(type=types.Type.STRING, description="e.g. In Stock, Made to Order"),
-                        "msrp": types.Schema(type=types.Type.INTEGER, description="MSRP in cents (optional)"),
-                    },
-                    required=["name", "model_number", "category_id", "base_price"],
+                types.FunctionDeclaration(
+                    name="propose_edit",
+                    description=(
+                        "Suggest an edit to a product, family, finish, upholstery, or color when the admin asks you to "
+                        "change something. Admin must approve before the edit is applied. CRITICAL: For product edits, "
+                        "category_id, subcategory_id, family_id in changes MUST come from the Valid Reference IDs section "
+                        "or from get_product_details/search_catalog results. Never guess or infer IDs."
+                    ),
+                    parameters=types.Schema(
+                        type=types.Type.OBJECT,
+                        properties={
+                            "entity_type": types.Schema(
+                                type=types.Type.STRING,
+                                description="One of: product, family, finish, upholstery, color",
+                            ),
+                            "entity_id": types.Schema(
+                                type=types.Type.INTEGER,
+                                description="ID of the entity to edit (from search_catalog or get_product_details)",
+                            ),
+                            "entity_name": types.Schema(
+                                type=types.Type.STRING,
+                                description="Human-readable name for display (e.g. 'Abruzzo 5242')",
+                            ),
+                            "changes": types.Schema(
+                                type=types.Type.OBJECT,
+                                description="Fields to update. For products: base_price (cents), name, short_description, stock_status, lead_time_days, category_id, subcategory_id, family_id. ID fields must be from Valid Reference IDs.",
+                            ),
+                            "reason": types.Schema(
+                                type=types.Type.STRING,
+                                description="Brief explanation of why this edit was suggested",
+                            ),
+                        },
+                        required=["entity_type", "entity_id", "entity_name", "changes", "reason"],
+                    ),
                 ),
-            ),
-            types.FunctionDeclaration(
-                name="propose_edit",
-                description=(
-                    "Suggest an edit to a product, family, finish, upholstery, or color when the admin asks you to "
-                    "change something. Admin must approve before the edit is applied. CRITICAL: For product edits, "
-                    "category_id, subcategory_id, family_id in changes MUST come from the Valid Reference IDs section "
-                    "or from get_product_details/search_catalog results. Never guess or infer IDs."
-                ),
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "entity_type": types.Schema(
-                            type=types.Type.STRING,
-                            description="One of: product, family, finish, upholstery, color",
-                        ),
-                        "entity_id": types.Schema(
-                            type=types.Type.INTEGER,
-                            description="ID of the entity to edit (from search_catalog or get_product_details)",
-                        ),
-                        "entity_name": types.Schema(
-                            type=types.Type.STRING,
-                            description="Human-readable name for display (e.g. 'Abruzzo 5242')",
-                        ),
-                        "changes": types.Schema(
-                            type=types.Type.OBJECT,
-                            description="Fields to update. For products: base_price (cents), name, short_description, stock_status, lead_time_days, category_id, subcategory_id, family_id. ID fields must be from Valid Reference IDs.",
-                        ),
-                        "reason": types.Schema(
-                            type=types.Type.STRING,
-                            description="Brief explanation of why this edit was suggested",
-                        ),
-                    },
-                    required=["entity_type", "entity_id", "entity_name", "changes", "reason"],
-                ),
-            ),
-        ]
-    )
-]
+            ]
+        )
+    ]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -428,12 +445,15 @@ TOOL_DEFINITIONS = [
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _get_tools_for_mode(mode: str):
+    from google.genai import types
+
+    tool_definitions = _tool_definitions()
     if mode == "ask":
         exclude = {"propose_edit", "create_product"}
-        tool = TOOL_DEFINITIONS[0]
+        tool = tool_definitions[0]
         decls = [f for f in tool.function_declarations if f.name not in exclude]
-        return [types.Tool(function_declarations=decls)] if decls else TOOL_DEFINITIONS
-    return TOOL_DEFINITIONS
+        return [types.Tool(function_declarations=decls)] if decls else tool_definitions
+    return tool_definitions
 
 
 def build_system_prompt(
@@ -584,7 +604,7 @@ Eagle Chair is a premium B2B chair manufacturer selling to commercial clients (h
 # File Processing
 # ─────────────────────────────────────────────────────────────────────────────
 
-async def process_uploaded_file(
+def extract_file_content(
     file_path: str,
     file_type: str,
     original_filename: str,
@@ -592,7 +612,10 @@ async def process_uploaded_file(
     max_excel_rows: int = 1000,
     max_pdf_pages: int = 100,
 ) -> str:
-    """Convert uploaded file to text/markdown for AI consumption."""
+    """
+    Convert uploaded file to text/markdown for AI consumption.
+    Blocking (pdfplumber/pandas): run it in a thread or process pool.
+    """
     try:
         path = Path(file_path)
         if not path.exists():
@@ -650,6 +673,26 @@ async def process_uploaded_file(
         return f"[Error processing {original_filename}: {str(e)}]"
 
 
+async def process_uploaded_file(
+    file_path: str,
+    file_type: str,
+    original_filename: str,
+    max_csv_rows: int = 500,
+    max_excel_rows: int = 1000,
+    max_pdf_pages: int = 100,
+) -> str:
+    """Convert uploaded file to text/markdown without blocking the event loop."""
+    return await asyncio.to_thread(
+        extract_file_content,
+        file_path,
+        file_type,
+        original_filename,
+        max_csv_rows,
+        max_excel_rows,
+        max_pdf_pages,
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main AI Streaming Engine
 # ─────────────────────────────────────────────────────────────────────────────
@@ -682,15 +725,15 @@ class AIStreamEvent:
         return {"type": "text_chunk", "data": {"content": content}}
 
     @staticmethod
-    def message_done(message_id: str, tokens: int, web_sources: list) -> dict:
-        return {
-            "type": "message_done",
-            "data": {
-                "message_id": message_id,
-                "tokens": tokens,
-                "web_sources": web_sources,
-            },
+    def message_done(message_id: str, tokens: int, web_sources: list, timing: dict | None = None) -> dict:
+        data = {
+            "message_id": message_id,
+            "tokens": tokens,
+            "web_sources": web_sources,
         }
+        if timing:
+            data["timing"] = timing
+        return {"type": "message_done", "data": data}
 
     @staticmethod
     def error(message: str) -> dict:
@@ -762,8 +805,10 @@ async def _execute_tool_and_yield(
     search_count_ref: list,
     yield_fn,
     cancelled_fn,
-) -> tuple[types.Part, bool]:
+) -> "tuple[types.Part, bool]":
     """Execute one tool, yield events, return (FunctionResponse part, True if cancelled)."""
+    from google.genai import types
+
     func_name = fc.name
     func_args = dict(fc.args) if fc.args else {}
     if func_name == "web_search":
@@ -893,6 +938,8 @@ async def stream_ai_response(
     Agent-style streaming: yields text and tool_call events interleaved as the model produces them.
     Uses generate_content_stream so we get text chunks before/after tool calls.
     """
+    from google.genai import types
+
     client = get_gemini_client()
     gemini_model = getattr(settings, "GEMINI_MODEL", "gemini-2.5-flash-lite")
     tools = _get_tools_for_mode(mode)
@@ -1034,6 +1081,8 @@ async def stream_ai_response(
 
 async def generate_chat_title(first_message: str) -> str:
     """Generate a short title for a chat based on the first message."""
+    from google.genai import types
+
     try:
         client = get_gemini_client()
         response = await asyncio.to_thread(
@@ -1057,6 +1106,8 @@ async def extract_memory_from_conversation(
     existing_memory: list[dict],
 ) -> list[dict]:
     """Extract important facts from conversation to save to memory."""
+    from google.genai import types
+
     try:
         client = get_gemini_client()
         convo_text = "\n".join(
@@ -1102,44 +1153,70 @@ Return [] if nothing meets the criteria. Return ONLY valid JSON."""
         return []
 
 
-async def process_training_document(
-    file_path: str,
-    file_type: str,
-    original_filename: str,
-    document_name: str,
-) -> dict:
+async def summarize_conversation(
+    previous_summary: str | None,
+    messages: list[dict],
+) -> str | None:
     """
-    Fully analyze a training document and extract all knowledge.
-    Returns processed_content, summary, key_facts, structured_data.
-    Uses higher extraction limits so CSV/Excel/PDF retain as much data as possible.
+    Fold older messages into a session's rolling summary.
+
+    Returns None if the model call fails, so the caller keeps the old summary
+    and retries on a later turn.
     """
+    from google.genai import types
+
     try:
-        raw_content = await process_uploaded_file(
-            file_path,
-            file_type,
-            original_filename,
-            max_csv_rows=2000,
-            max_excel_rows=2000,
-            max_pdf_pages=200,
+        client = get_gemini_client()
+        convo_text = "\n".join(
+            f"{m['role'].upper()}: {m['content'][:1500]}" for m in messages
         )
+        prompt = f"""Update the running summary of an admin's conversation with the EagleChair assistant.
 
-        if not raw_content or raw_content.startswith("[Error") or raw_content.startswith("[File not"):
-            return {
-                "success": False,
-                "error": raw_content,
-                "processed_content": "",
-                "summary": "",
-                "key_facts": [],
-                "structured_data": "",
-            }
+Keep: what the admin asked for, decisions made, product names/model numbers/IDs mentioned, edits proposed or applied, and open questions.
+Drop: greetings, filler and tool-call chatter. Write at most 250 words of plain text.
 
-        client = get_gemini_client()
-        content_cap = 120000
+Current summary:
+{previous_summary or "None"}
 
-        analysis_prompt = f"""You are analyzing a business document for Eagle Chair, a premium B2B chair manufacturer.
+New messages:
+{convo_text}
 
-Document: {document_name} ({file_type})
+Return ONLY the updated summary."""
+
+        response = await asyncio.to_thread(
+            lambda: client.models.generate_content(
+                model="gemini-2.0-flash",
+                contents=prompt,
+                config=types.GenerateContentConfig(max_output_tokens=600, temperature=0.2),
+            )
+        )
+        summary = (response.text or "").strip()
+        return summary or None
+    except Exception as e:
+        logger.warning(f"Conversation summary failed: {e}")
+        return None
+
+
+async def analyze_training_chunk(
+    document_name: str,
+    file_type: str,
+    content: str,
+    part: int = 1,
+    parts: int = 1,
+) -> dict:
+    """
+    Extract summary, key facts and tables from one chunk of a training document.
+    Raises if the model call fails so the ingestion job can retry the chunk.
+    """
+    from google.genai import types
 
+    client = get_gemini_client()
+    part_line = f"Part {part} of {parts} of the document. Extract only what is in this part.\n" if parts > 1 else ""
+
+    analysis_prompt = f"""You are analyzing a business document for Eagle Chair, a premium B2B chair manufacturer.
+
+Document: {document_name} ({file_type})
+{part_line}
 Instructions:
 - RETAIN EVERYTHING. Do not summarize away data. For pricing sheets, CSV, or Excel: every product, model number, price, and row is a key fact.
 - For catalog PDFs: extract every product name, model number, dimension, price, and spec from text and tables. Some content may be in images; extract all text and tables you have.
@@ -1147,52 +1224,63 @@ Instructions:
 - Structured Data: reproduce ALL tables in full markdown (every row). For CSV/Excel this is the full dataset in markdown. Do not truncate.
 
 Content:
-{raw_content[:content_cap]}
+{content}
 
 Output valid JSON only:
 {{
-  "summary": "2-3 paragraph overview of what this document contains",
+  "summary": "2-3 paragraph overview of what this content contains",
   "key_facts": ["every", "single", "fact", "price", "product", "..."],
   "structured_data": "full markdown tables, every row, no truncation",
   "insights": ["optional short insights"]
 }}"""
 
+    response = await asyncio.to_thread(
+        lambda: client.models.generate_content(
+            model="gemini-2.0-flash",
+            contents=analysis_prompt,
+            config=types.GenerateContentConfig(max_output_tokens=65536, temperature=0.1),
+        )
+    )
+
+    analysis_text = response.text.strip()
+    match = re.search(r"\{.*\}", analysis_text, re.DOTALL)
+    analysis = {"summary": analysis_text, "key_facts": []}
+    if match:
+        try:
+            analysis = json.loads(match.group())
+        except json.JSONDecodeError:
+            pass
+
+    return {
+        "summary": analysis.get("summary", ""),
+        "key_facts": analysis.get("key_facts", []),
+        "structured_data": analysis.get("structured_data", ""),
+        "insights": analysis.get("insights", []),
+    }
+
+
+async def merge_training_summaries(document_name: str, summaries: list[str]) -> str:
+    """Combine the per-chunk summaries of a training document into one overview."""
+    from google.genai import types
+
+    joined = "\n\n".join(s for s in summaries if s)
+    try:
+        client = get_gemini_client()
         response = await asyncio.to_thread(
             lambda: client.models.generate_content(
                 model="gemini-2.0-flash",
-                contents=analysis_prompt,
-                config=types.GenerateContentConfig(max_output_tokens=65536, temperature=0.1),
+                contents=(
+                    f"These are summaries of consecutive parts of the document '{document_name}'. "
+                    "Write one 2-3 paragraph overview of the whole document. Return ONLY the overview.\n\n"
+                    f"{joined[:60000]}"
+                ),
+                config=types.GenerateContentConfig(max_output_tokens=1024, temperature=0.2),
             )
         )
-
-        analysis_text = response.text.strip()
-        match = re.search(r"\{.*\}", analysis_text, re.DOTALL)
-        analysis = {}
-        if match:
-            try:
-                analysis = json.loads(match.group())
-            except json.JSONDecodeError:
-                analysis = {"summary": analysis_text, "key_facts": []}
-
-        return {
-            "success": True,
-            "processed_content": raw_content,
-            "summary": analysis.get("summary", ""),
-            "key_facts": analysis.get("key_facts", []),
-            "structured_data": analysis.get("structured_data", ""),
-            "insights": analysis.get("insights", []),
-        }
-
+        return (response.text or "").strip() or joined
     except Exception as e:
-        logger.error(f"Training document processing failed: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "processed_content": "",
-            "summary": "",
-            "key_facts": [],
-            "structured_data": "",
-        }
+        logger.warning(f"Summary merge failed for {document_name}: {e}")
+        return joined
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1308,190 +1396,14 @@ async def fetch_valid_reference_ids() -> str:
 
 async def fetch_product_catalog() -> str:
     """
-    Fetch the full EagleChair product catalog from the database and format as markdown.
-    Called on-demand when the AI needs catalog information.
+    Return the full EagleChair product catalog formatted as markdown.
+    Served from the versioned catalog digest (see catalog_digest_service).
     """
-    try:
-        async with AsyncSessionLocal() as db:
-            lines = [
-                "# Eagle Chair — Live Product Catalog\n",
-                "## Product Naming & Units",
-                "- Base model: 4 digits (e.g., 5242, 6018). Suffixes: P, PB, WB, BX. Dashes optional (5242-P = 5242P).",
-                "- Variations: sku = full model (e.g., 5242PBX). Usually share base model with their product.",
-                "- Dimensions: inches. Weight: lbs. Upholstery amount: yards. Prices: dollars (displayed from cents).\n",
-            ]
-
-            # ── Categories ──────────────────────────────────────────────────
-            r = await db.execute(text(
-                "SELECT id, name, slug, parent_id FROM categories WHERE is_active = true ORDER BY display_order"
-            ))
-            cats = r.fetchall()
-            cat_map = {c.id: c.name for c in cats}
-
-            lines.append("## Categories")
-            for c in [c for c in cats if not c.parent_id]:
-                lines.append(f"- **{c.name}** (id:{c.id}, slug:{c.slug})")
-                for ch in [ch for ch in cats if ch.parent_id == c.id]:
-                    lines.append(f"  - {ch.name} (id:{ch.id})")
-            lines.append("")
-
-            # ── Subcategories ────────────────────────────────────────────────
-            r = await db.execute(text(
-                "SELECT id, name, slug, category_id FROM product_subcategories WHERE is_active = true ORDER BY display_order"
-            ))
-            subcats = r.fetchall()
-            subcat_map = {s.id: s.name for s in subcats}
-
-            if subcats:
-                lines.append("## Subcategories")
-                for s in subcats:
-                    lines.append(f"- {s.name} (id:{s.id}, category:{cat_map.get(s.category_id, '?')})")
-                lines.append("")
-
-            # ── Families ─────────────────────────────────────────────────────
-            r = await db.execute(text(
-                "SELECT id, name, slug, category_id, subcategory_id, overview_text, is_featured "
-                "FROM product_families WHERE is_active = true ORDER BY display_order"
-            ))
-            families = r.fetchall()
-            family_map = {f.id: f.name for f in families}
-
-            lines.append("## Product Families")
-            lines.append("| ID | Name | Category | Subcategory | Featured | Overview |")
-            lines.append("|---|---|---|---|---|---|")
-            for f in families:
-                cat_name = cat_map.get(f.category_id, "-")
-                subcat_name = subcat_map.get(f.subcategory_id, "-") if f.subcategory_id else "-"
-                featured = "Yes" if f.is_featured else "No"
-                overview = (f.overview_text or "")[:80].replace("|", "/").replace("\n", " ")
-                lines.append(f"| {f.id} | {f.name} | {cat_name} | {subcat_name} | {featured} | {overview} |")
-            lines.append("")
-
-            # ── Finishes ─────────────────────────────────────────────────────
-            r = await db.execute(text(
-                "SELECT id, name, finish_code, finish_type, grade, additional_cost "
-                "FROM finishes WHERE is_active = true ORDER BY display_order"
-            ))
-            finishes = r.fetchall()
-            finish_map = {f.id: f.name for f in finishes}
-
-            lines.append("## Finishes (wood stains, paints, metal coatings)")
-            lines.append("| ID | Name | Code | Type | Grade | Additional Cost |")
-            lines.append("|---|---|---|---|---|---|")
-            for f in finishes:
-                cost = f"${f.additional_cost / 100:.2f}" if f.additional_cost else "$0.00"
-                lines.append(f"| {f.id} | {f.name} | {f.finish_code or '-'} | {f.finish_type or '-'} | {f.grade} | {cost} |")
-            lines.append("")
-
-            # ── Upholsteries ─────────────────────────────────────────────────
-            r = await db.execute(text(
-                "SELECT id, name, material_code, material_type, grade, "
-                "additional_cost, grade_a_cost, grade_b_cost, grade_c_cost, premium_cost "
-                "FROM upholsteries WHERE is_active = true ORDER BY display_order"
-            ))
-            upholsteries = r.fetchall()
-            upholstery_map = {u.id: u.name for u in upholsteries}
-
-            lines.append("## Upholsteries (fabrics, vinyls, leathers)")
-            lines.append("| ID | Name | Code | Type | Grade | Base | Gr.A | Gr.B | Gr.C | Premium |")
-            lines.append("|---|---|---|---|---|---|---|---|---|---|")
-            def fmt_cents(v: int) -> str:
-                return f"${v / 100:.2f}" if v else "$0.00"
-
-            for u in upholsteries:
-                lines.append(
-                    f"| {u.id} | {u.name} | {u.material_code or '-'} | {u.material_type} "
-                    f"| {u.grade or '-'} | {fmt_cents(u.additional_cost)} "
-                    f"| {fmt_cents(u.grade_a_cost)} | {fmt_cents(u.grade_b_cost)} "
-                    f"| {fmt_cents(u.grade_c_cost)} | {fmt_cents(u.premium_cost)} |"
-                )
-            lines.append("")
-
-            # ── Colors ───────────────────────────────────────────────────────
-            r = await db.execute(text(
-                "SELECT id, name, color_code, hex_value, category FROM colors WHERE is_active = true ORDER BY display_order"
-            ))
-            colors = r.fetchall()
-            color_map = {c.id: c.name for c in colors}
-
-            lines.append("## Colors")
-            lines.append("| ID | Name | Code | Hex | Category |")
-            lines.append("|---|---|---|---|---|")
-            for c in colors:
-                lines.append(f"| {c.id} | {c.name} | {c.color_code or '-'} | {c.hex_value or '-'} | {c.category or '-'} |")
-            lines.append("")
-
-            # ── Products ─────────────────────────────────────────────────────
-            r = await db.execute(text("""
-                SELECT id, model_number, model_suffix, suffix_description, name,
-                       category_id, subcategory_id, family_id, base_price, msrp,
-                       width, depth, height, seat_height, weight, upholstery_amount,
-                       frame_material, features, stock_status, is_featured, is_new, is_outdoor_suitable,
-                       recommended_use, minimum_order_quantity, lead_time_days,
-                       ada_compliant, flame_certifications, warranty_info
-                FROM chairs WHERE is_active = true ORDER BY display_order, model_number
-            """))
-            products = r.fetchall()
-
-            lines.append(f"## Products ({len(products)} active)")
-            lines.append("| ID | Model | Suffix | Name | Category | Family | Price | MSRP | W×D×H (in) | Seat H | Weight (lb) | Uph Yds | Frame | Stock | Features |")
-            lines.append("|---|---|---|---|---|---|---|---|---|---|---|---|---|---|---|")
-            for p in products:
-                cat_name = cat_map.get(p.category_id, f"?{p.category_id}")
-                fam_name = family_map.get(p.family_id, "-") if p.family_id else "-"
-                price = f"${p.base_price / 100:.2f}" if p.base_price else "-"
-                msrp = f"${p.msrp / 100:.2f}" if p.msrp else "-"
-                dims = f"{p.width or '?'}×{p.depth or '?'}×{p.height or '?'}"
-                seat_h = str(p.seat_height) if p.seat_height else "-"
-                weight_str = f"{p.weight}" if p.weight is not None else "-"
-                uph_str = f"{p.upholstery_amount}" if p.upholstery_amount is not None else "-"
-                features_str = ""
-                if p.features:
-                    try:
-                        feats = json.loads(p.features) if isinstance(p.features, str) else p.features
-                        features_str = ", ".join(feats) if isinstance(feats, list) else str(feats)
-                    except Exception:
-                        features_str = str(p.features)
-                lines.append(
-                    f"| {p.id} | {p.model_number} | {p.model_suffix or ''} | {p.name} "
-                    f"| {cat_name} | {fam_name} "
-                    f"| {price} | {msrp} | {dims} | {seat_h} | {weight_str} | {uph_str} "
-                    f"| {p.frame_material or '-'} | {p.stock_status} | {features_str[:50]} |"
-                )
-            lines.append("")
-
-            # ── Variations ───────────────────────────────────────────────────
-            r = await db.execute(text("""
-                SELECT id, product_id, sku, name, finish_id, upholstery_id, color_id,
-                       price_adjustment, stock_status, is_available,
-                       width, depth, height, seat_height, weight, upholstery_amount
-                FROM product_variations WHERE is_available = true ORDER BY product_id, display_order
-            """))
-            variations = r.fetchall()
-
-            lines.append(f"## Product Variations ({len(variations)} available)")
-            lines.append("| ID | SKU | Product ID | Name | Finish | Upholstery | Color | Price Adj | W×D×H | Weight | Uph Yds |")
-            lines.append("|---|---|---|---|---|---|---|---|---|---|---|")
-            for v in variations:
-                finish_name = finish_map.get(v.finish_id, "-") if v.finish_id else "-"
-                uph_name = upholstery_map.get(v.upholstery_id, "-") if v.upholstery_id else "-"
-                color_name = color_map.get(v.color_id, "-") if v.color_id else "-"
-                adj = f"${v.price_adjustment / 100:+.2f}" if v.price_adjustment else "$0.00"
-                dims = ""
-                if v.width or v.depth or v.height:
-                    dims = f"{v.width or '?'}×{v.depth or '?'}×{v.height or '?'}"
-                else:
-                    dims = "-"
-                weight_str = f"{v.weight}" if v.weight is not None else "-"
-                uph_str = f"{v.upholstery_amount}" if v.upholstery_amount is not None else "-"
-                lines.append(
-                    f"| {v.id} | {v.sku} | {v.product_id} | {v.name or ''} "
-                    f"| {finish_name} | {uph_name} | {color_name} | {adj} | {dims} | {weight_str} | {uph_str} |"
-                )
-            lines.append("")
-
-            return "\n".join(lines)
+    from backend.services.catalog_digest_service import CatalogDigestService
 
+    try:
+        digest = await CatalogDigestService.get_digest()
+        return digest["markdown"]
     except Exception as e:
         logger.error(f"Failed to fetch product catalog: {e}")
         return f"Error fetching product catalog: {str(e)}"
@@ -1502,6 +1414,8 @@ async def search_training_data(query: str, max_results: int = 20, fuzzy_threshol
     Search ALL training documents using fuzzy matching over key_facts, structured_data, and summary.
     Use when the user asks about models, products, pricing, or any info that might be in training docs.
     """
+    from fuzzywuzzy import fuzz
+
     if not query or not query.strip():
         return {"error": "Empty search query", "results": [], "count": 0}
     q = query.strip().lower()
@@ -1629,195 +1543,31 @@ async def search_catalog(query: str, max_results: int = 50) -> dict:
     Search the Eagle Chair catalog for a term. Searches families, products, variations,
     finishes, upholsteries, colors, categories. Case-insensitive partial match.
     For broad queries (all, *, everything), returns full catalog overview.
+    Served from the in-memory index of the catalog digest.
     """
+    from backend.services.catalog_digest_service import CatalogDigestService
+
     q = (query or "").strip()
-    if _is_broad_catalog_query(q):
-        try:
-            async with AsyncSessionLocal() as db:
-                families_r = await db.execute(text("""
-                    SELECT pf.id, pf.name, pf.slug, c.name as category_name,
-                           (SELECT COUNT(*) FROM chairs ch WHERE ch.family_id = pf.id AND ch.is_active) as product_count
-                    FROM product_families pf
-                    LEFT JOIN categories c ON pf.category_id = c.id
-                    WHERE pf.is_active = true ORDER BY pf.display_order
-                """))
-                families_overview = []
-                for row in families_r.fetchall():
-                    families_overview.append({
-                        "id": row.id, "name": row.name, "slug": row.slug,
-                        "category": row.category_name, "product_count": row.product_count or 0,
-                    })
-                models_r = await db.execute(text("""
-                    SELECT model_number, model_suffix, name, base_price FROM chairs
-                    WHERE is_active = true ORDER BY display_order, model_number
-                """))
-                all_models = []
-                for row in models_r.fetchall():
-                    full_model = f"{row.model_number}{row.model_suffix or ''}"
-                    all_models.append({
-                        "model": full_model, "name": row.name,
-                        "price": f"${row.base_price / 100:.2f}" if row.base_price else None,
-                    })
-                return {
-                    "query": query,
-                    "broad_overview": True,
-                    "families": families_overview,
-                    "all_models": all_models[:max_results * 2],
-                    "total_products": len(all_models),
-                    "products": [], "variations": [], "finishes": [], "upholsteries": [], "colors": [], "categories": [],
-                }
-        except Exception as e:
-            logger.error(f"Broad catalog fetch failed: {e}")
-            return {"error": str(e), "query": query, "families": [], "products": [], "variations": [], "finishes": [], "upholsteries": [], "colors": [], "categories": []}
-    term = f"%{q}%"
-    result = {"query": query, "families": [], "products": [], "variations": [], "finishes": [], "upholsteries": [], "colors": [], "categories": []}
+    empty = {"families": [], "products": [], "variations": [], "finishes": [], "upholsteries": [], "colors": [], "categories": []}
     try:
-        async with AsyncSessionLocal() as db:
-            r = await db.execute(
-                text("""
-                    SELECT pf.id, pf.name, pf.slug, pf.category_id, pf.subcategory_id,
-                           pf.overview_text, pf.is_featured,
-                           pf.family_image, pf.banner_image_url,
-                           c.name as category_name, sc.name as subcategory_name
-                    FROM product_families pf
-                    LEFT JOIN categories c ON pf.category_id = c.id
-                    LEFT JOIN product_subcategories sc ON pf.subcategory_id = sc.id
-                    WHERE pf.is_active = true
-                    AND (LOWER(pf.name) LIKE LOWER(:t) OR LOWER(pf.slug) LIKE LOWER(:t)
-                         OR (pf.overview_text IS NOT NULL AND LOWER(pf.overview_text) LIKE LOWER(:t)))
-                    ORDER BY pf.display_order
-                    LIMIT :lim
-                """),
-                {"t": term, "lim": max_results},
-            )
-            for row in r.fetchall():
-                result["families"].append({
-                    "id": row.id, "name": row.name, "slug": row.slug,
-                    "category_id": row.category_id, "subcategory_id": row.subcategory_id,
-                    "category": row.category_name, "subcategory": row.subcategory_name,
-                    "featured": row.is_featured, "overview": (row.overview_text or "")[:200],
-                    "family_image": row.family_image,
-                    "banner_image_url": row.banner_image_url,
-                })
-
-            r = await db.execute(
-                text("""
-                    SELECT ch.id, ch.model_number, ch.model_suffix, ch.name, ch.base_price, ch.msrp,
-                           ch.category_id, ch.subcategory_id, ch.family_id,
-                           pf.name as family_name, c.name as category_name
-                    FROM chairs ch
-                    LEFT JOIN product_families pf ON ch.family_id = pf.id
-                    LEFT JOIN categories c ON ch.category_id = c.id
-                    WHERE ch.is_active = true
-                    AND (LOWER(ch.model_number) LIKE LOWER(:t) OR LOWER(COALESCE(ch.model_suffix,'')) LIKE LOWER(:t)
-                         OR LOWER(ch.name) LIKE LOWER(:t) OR (pf.name IS NOT NULL AND LOWER(pf.name) LIKE LOWER(:t)))
-                    ORDER BY ch.display_order
-                    LIMIT :lim
-                """),
-                {"t": term, "lim": max_results},
-            )
-            for row in r.fetchall():
-                result["products"].append({
-                    "id": row.id, "model": row.model_number, "suffix": row.model_suffix or "",
-                    "name": row.name, "family": row.family_name, "category": row.category_name,
-                    "category_id": row.category_id, "subcategory_id": row.subcategory_id, "family_id": row.family_id,
-                    "price": f"${row.base_price / 100:.2f}" if row.base_price else None,
-                    "msrp": f"${row.msrp / 100:.2f}" if row.msrp else None,
-                })
-
-            r = await db.execute(
-                text("""
-                    SELECT pv.id, pv.sku, pv.product_id, pv.name, pv.price_adjustment,
-                           f.name as finish_name, u.name as upholstery_name, col.name as color_name
-                    FROM product_variations pv
-                    LEFT JOIN finishes f ON pv.finish_id = f.id
-                    LEFT JOIN upholsteries u ON pv.upholstery_id = u.id
-                    LEFT JOIN colors col ON pv.color_id = col.id
-                    WHERE pv.is_available = true
-                    AND (LOWER(pv.sku) LIKE LOWER(:t) OR LOWER(COALESCE(pv.name,'')) LIKE LOWER(:t)
-                         OR (f.name IS NOT NULL AND LOWER(f.name) LIKE LOWER(:t))
-                         OR (u.name IS NOT NULL AND LOWER(u.name) LIKE LOWER(:t))
-                         OR (col.name IS NOT NULL AND LOWER(col.name) LIKE LOWER(:t)))
-                    ORDER BY pv.product_id
-                    LIMIT :lim
-                """),
-                {"t": term, "lim": max_results},
-            )
-            for row in r.fetchall():
-                result["variations"].append({
-                    "id": row.id, "sku": row.sku, "product_id": row.product_id,
-                    "name": row.name or "", "finish": row.finish_name, "upholstery": row.upholstery_name,
-                    "color": row.color_name,
-                    "price_adj": f"${row.price_adjustment / 100:+.2f}" if row.price_adjustment else "$0",
-                })
-
-            r = await db.execute(
-                text("""
-                    SELECT id, name, finish_code, finish_type, grade, additional_cost, image_url
-                    FROM finishes WHERE is_active = true
-                    AND (LOWER(name) LIKE LOWER(:t) OR LOWER(COALESCE(finish_code,'')) LIKE LOWER(:t) OR LOWER(COALESCE(finish_type,'')) LIKE LOWER(:t))
-                    ORDER BY display_order LIMIT :lim
-                """),
-                {"t": term, "lim": max_results},
-            )
-            for row in r.fetchall():
-                result["finishes"].append({
-                    "id": row.id, "name": row.name, "code": row.finish_code or "-",
-                    "type": row.finish_type or "-", "grade": row.grade,
-                    "cost": f"${row.additional_cost / 100:.2f}" if row.additional_cost else "$0",
-                    "image_url": row.image_url,
-                })
-
-            r = await db.execute(
-                text("""
-                    SELECT id, name, material_code, material_type, grade, additional_cost, image_url, swatch_image_url
-                    FROM upholsteries WHERE is_active = true
-                    AND (LOWER(name) LIKE LOWER(:t) OR LOWER(COALESCE(material_code,'')) LIKE LOWER(:t) OR LOWER(material_type) LIKE LOWER(:t))
-                    ORDER BY display_order LIMIT :lim
-                """),
-                {"t": term, "lim": max_results},
-            )
-            for row in r.fetchall():
-                result["upholsteries"].append({
-                    "id": row.id, "name": row.name, "code": row.material_code or "-",
-                    "type": row.material_type, "grade": row.grade or "-",
-                    "cost": f"${row.additional_cost / 100:.2f}" if row.additional_cost else "$0",
-                    "image_url": row.image_url,
-                    "swatch_image_url": row.swatch_image_url,
-                })
-
-            r = await db.execute(
-                text("""
-                    SELECT id, name, color_code, hex_value, category, image_url
-                    FROM colors WHERE is_active = true
-                    AND (LOWER(name) LIKE LOWER(:t) OR LOWER(COALESCE(color_code,'')) LIKE LOWER(:t) OR (category IS NOT NULL AND LOWER(category) LIKE LOWER(:t)))
-                    ORDER BY display_order LIMIT :lim
-                """),
-                {"t": term, "lim": max_results},
-            )
-            for row in r.fetchall():
-                result["colors"].append({
-                    "id": row.id, "name": row.name, "code": row.color_code or "-",
-                    "hex": row.hex_value or "-", "category": row.category or "-",
-                    "image_url": row.image_url,
-                })
-
-            r = await db.execute(
-                text("""
-                    SELECT id, name, slug, parent_id FROM categories
-                    WHERE is_active = true AND (LOWER(name) LIKE LOWER(:t) OR LOWER(slug) LIKE LOWER(:t))
-                    ORDER BY display_order LIMIT :lim
-                """),
-                {"t": term, "lim": max_results},
-            )
-            for row in r.fetchall():
-                result["categories"].append({"id": row.id, "name": row.name, "slug": row.slug,
-                                            "parent_id": row.parent_id})
-
-        return result
+        digest = await CatalogDigestService.get_digest()
     except Exception as e:
         logger.error(f"Catalog search failed: {e}")
-        return {"error": str(e), "query": query, "families": [], "products": [], "variations": [], "finishes": [], "upholsteries": [], "colors": [], "categories": []}
+        return {"error": str(e), "query": query, **empty}
+
+    if _is_broad_catalog_query(q):
+        overview = digest["index"]["overview"]
+        return {
+            "query": query,
+            "broad_overview": True,
+            "families": overview["families"],
+            "all_models": overview["all_models"][:max_results * 2],
+            "total_products": len(overview["all_models"]),
+            "products": [], "variations": [], "finishes": [], "upholsteries": [], "colors": [], "categories": [],
+        }
+    result = CatalogDigestService.search(digest, q, max_results=max_results)
+    result["query"] = query
+    return result
 
 
 def _slugify(text: str) -> str:
@@ -1863,6 +1613,9 @@ async def create_product_in_db(
                 product_data["msrp"] = msrp
 
             product = await AdminService.create_product(db=db, product_data=product_data)
+            from backend.services.catalog_digest_service import CatalogDigestService
+
+            CatalogDigestService.invalidate()
             return {
                 "success": True,
                 "id": product.id,
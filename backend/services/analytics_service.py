@@ -12,10 +12,12 @@ from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from backend.models.analytics import QuoteCompanyDaily, QuoteResponseDaily, QuoteStatusDaily
 from backend.models.chair import Category, Chair
 from backend.models.company import Company, CompanyStatus
 from backend.models.content import FAQ, Catalog, Installation
 from backend.models.quote import Quote, QuoteItem, QuoteStatus
+from backend.services.quote_rollup_service import since
 
 logger = logging.getLogger(__name__)
 
@@ -231,35 +233,25 @@ class AnalyticsService:
         days: int = 30
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Get quote trends over time
+        Get quote trends over time (from the daily rollups)
         
         Args:
             db: Database session
             days: Number of days to analyze
             
         Returns:
-            Dictionary with daily quote counts
+            Dictionary with daily quote counts per status
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Get quotes by status over time
         result = await db.execute(
-            select(
-                Quote.status,
-                func.date(Quote.created_at).label('date'),
-                func.count(Quote.id).label('count')
-            )
-            .where(Quote.created_at >= cutoff_date)
-            .group_by(Quote.status, func.date(Quote.created_at))
-            .order_by(func.date(Quote.created_at))
+            select(QuoteStatusDaily.status, QuoteStatusDaily.day, QuoteStatusDaily.quote_count)
+            .where(QuoteStatusDaily.day >= since(days), QuoteStatusDaily.quote_count > 0)
+            .order_by(QuoteStatusDaily.day)
         )
         
         trends = {}
-        for status, date, count in result:
-            if status.value not in trends:
-                trends[status.value] = []
-            trends[status.value].append({
-                'date': date,
+        for status, day, count in result:
+            trends.setdefault(status, []).append({
+                'date': day,
                 'count': count
             })
         
@@ -269,106 +261,106 @@ class AnalyticsService:
     async def get_top_customers(
         db: AsyncSession,
         limit: int = 10,
-        by: str = 'quote_count'
+        by: str = 'quote_count',
+        days: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get top customers by various metrics
+        Get top customers by various metrics (from the daily rollups)
         
         Args:
             db: Database session
             limit: Number of customers to return
             by: Metric to sort by ('quote_count', 'total_value', 'accepted_quotes')
+            days: Only count quotes created in the last N days (None = all time)
             
         Returns:
             List of top customers
         """
-        if by == 'quote_count':
-            query = (
-                select(
-                    Company,
-                    func.count(Quote.id).label('quote_count')
-                )
-                .outerjoin(Quote, Quote.company_id == Company.id)
-                .group_by(Company.id)
-                .order_by(desc('quote_count'))
-                .limit(limit)
-            )
-        elif by == 'total_value':
-            query = (
-                select(
-                    Company,
-                    func.sum(Quote.quoted_price).label('total_value')
-                )
-                .outerjoin(Quote, Quote.company_id == Company.id)
-                .where(Quote.status.in_([QuoteStatus.ACCEPTED, QuoteStatus.QUOTED]))
-                .group_by(Company.id)
-                .order_by(desc('total_value'))
-                .limit(limit)
-            )
-        else:  # accepted_quotes
-            query = (
-                select(
-                    Company,
-                    func.count(Quote.id).label('accepted_count')
-                )
-                .outerjoin(Quote, Quote.company_id == Company.id)
-                .where(Quote.status == QuoteStatus.ACCEPTED)
-                .group_by(Company.id)
-                .order_by(desc('accepted_count'))
-                .limit(limit)
-            )
+        column = {
+            'quote_count': QuoteCompanyDaily.quote_count,
+            'total_value': QuoteCompanyDaily.quoted_value_sum,
+        }.get(by, QuoteCompanyDaily.accepted_count)
+        metric = func.sum(column).label('metric_value')
         
-        result = await db.execute(query)
-        
-        top_customers = []
-        for company, metric_value in result:
-            top_customers.append({
-                'company': company,
-                'metric_value': metric_value
-            })
+        query = select(QuoteCompanyDaily.company_id, metric).group_by(QuoteCompanyDaily.company_id)
+        if days:
+            query = query.where(QuoteCompanyDaily.day >= since(days))
+        if by != 'quote_count':
+            # Only companies with accepted/valued quotes rank by those metrics
+            query = query.having(metric > 0)
+        result = await db.execute(query.order_by(desc(metric), QuoteCompanyDaily.company_id).limit(limit))
+        ranked = result.all()
+        
+        companies = await db.execute(
+            select(Company).where(Company.id.in_([company_id for company_id, _ in ranked]))
+        )
+        companies_by_id = {company.id: company for company in companies.scalars()}
+        top_customers = [
+            {'company': companies_by_id[company_id], 'metric_value': metric_value}
+            for company_id, metric_value in ranked
+            if company_id in companies_by_id
+        ]
+        
+        if by == 'quote_count' and len(top_customers) < limit:
+            # Companies without quotes have no rollup rows; fill with them at zero
+            quiet = await db.execute(
+                select(Company)
+                .where(Company.id.notin_([company_id for company_id, _ in ranked]))
+                .order_by(Company.id)
+                .limit(limit - len(top_customers))
+            )
+            top_customers.extend({'company': company, 'metric_value': 0} for company in quiet.scalars())
         
         return top_customers
     
     @staticmethod
-    async def get_conversion_rates(db: AsyncSession) -> Dict[str, float]:
+    async def _status_totals(db: AsyncSession, days: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Per-status sums from the daily rollups"""
+        query = select(
+            QuoteStatusDaily.status,
+            func.sum(QuoteStatusDaily.quote_count),
+            func.sum(QuoteStatusDaily.total_amount_sum),
+            func.sum(QuoteStatusDaily.quoted_price_sum),
+            func.sum(QuoteStatusDaily.quoted_price_count),
+        ).group_by(QuoteStatusDaily.status)
+        if days:
+            query = query.where(QuoteStatusDaily.day >= since(days))
+        result = await db.execute(query)
+        return {
+            status: {
+                'quote_count': int(count or 0),
+                'total_amount_sum': int(total or 0),
+                'quoted_price_sum': int(quoted or 0),
+                'quoted_price_count': int(quoted_count or 0),
+            }
+            for status, count, total, quoted, quoted_count in result
+        }
+    
+    @staticmethod
+    async def get_conversion_rates(db: AsyncSession, days: Optional[int] = None) -> Dict[str, float]:
         """
-        Calculate various conversion rates
+        Calculate various conversion rates (from the daily rollups)
+        
+        Args:
+            db: Database session
+            days: Only count quotes created in the last N days (None = all time)
         
         Returns:
             Dictionary with conversion rates
         """
-        rates = {}
+        totals = await AnalyticsService._status_totals(db, days)
+        counts = {status: row['quote_count'] for status, row in totals.items()}
+        total = sum(counts.values())
         
-        # Total quotes
-        total_quotes = await db.execute(select(func.count(Quote.id)))
-        total = total_quotes.scalar() or 0
+        if total <= 0:
+            return {'quote_to_accepted': 0, 'quote_to_declined': 0, 'pending_rate': 0}
         
-        if total > 0:
-            # Quote to Accepted rate
-            accepted = await db.execute(
-                select(func.count(Quote.id)).where(Quote.status == QuoteStatus.ACCEPTED)
-            )
-            rates['quote_to_accepted'] = (accepted.scalar() or 0) / total * 100
-            
-            # Quote to Declined rate
-            declined = await db.execute(
-                select(func.count(Quote.id)).where(Quote.status == QuoteStatus.DECLINED)
-            )
-            rates['quote_to_declined'] = (declined.scalar() or 0) / total * 100
-            
-            # Quotes awaiting response
-            pending = await db.execute(
-                select(func.count(Quote.id)).where(
-                    Quote.status.in_([QuoteStatus.SUBMITTED, QuoteStatus.UNDER_REVIEW])
-                )
-            )
-            rates['pending_rate'] = (pending.scalar() or 0) / total * 100
-        else:
-            rates['quote_to_accepted'] = 0
-            rates['quote_to_declined'] = 0
-            rates['pending_rate'] = 0
-        
-        return rates
+        pending = counts.get(QuoteStatus.SUBMITTED.value, 0) + counts.get(QuoteStatus.UNDER_REVIEW.value, 0)
+        return {
+            'quote_to_accepted': counts.get(QuoteStatus.ACCEPTED.value, 0) / total * 100,
+            'quote_to_declined': counts.get(QuoteStatus.DECLINED.value, 0) / total * 100,
+            'pending_rate': pending / total * 100,
+        }
     
     @staticmethod
     async def get_content_stats(db: AsyncSession) -> Dict[str, Any]:
@@ -435,48 +427,66 @@ class AnalyticsService:
             logger.debug(f"Tracked view for product {product_id}")
     
     @staticmethod
-    async def get_average_quote_value(db: AsyncSession) -> Dict[str, int]:
+    async def get_average_quote_value(db: AsyncSession, days: Optional[int] = None) -> Dict[str, int]:
         """
-        Calculate average quote values
+        Calculate average quote values (from the daily rollups)
+        
+        Args:
+            db: Database session
+            days: Only count quotes created in the last N days (None = all time)
         
         Returns:
             Dictionary with average values
         """
-        # Average total amount
-        avg_total = await db.execute(
-            select(func.avg(Quote.total_amount))
-        )
-        
-        # Average quoted price
-        avg_quoted = await db.execute(
-            select(func.avg(Quote.quoted_price)).where(Quote.quoted_price.isnot(None))
-        )
+        totals = await AnalyticsService._status_totals(db, days)
         
-        # Average for accepted quotes
-        avg_accepted = await db.execute(
-            select(func.avg(Quote.quoted_price)).where(Quote.status == QuoteStatus.ACCEPTED)
-        )
+        def average(amount: int, count: int) -> int:
+            return int(amount / count) if count > 0 else 0
         
+        accepted = totals.get(QuoteStatus.ACCEPTED.value, {})
         return {
-            'average_total_amount': int(avg_total.scalar() or 0),
-            'average_quoted_price': int(avg_quoted.scalar() or 0),
-            'average_accepted_value': int(avg_accepted.scalar() or 0)
+            'average_total_amount': average(
+                sum(row['total_amount_sum'] for row in totals.values()),
+                sum(row['quote_count'] for row in totals.values()),
+            ),
+            'average_quoted_price': average(
+                sum(row['quoted_price_sum'] for row in totals.values()),
+                sum(row['quoted_price_count'] for row in totals.values()),
+            ),
+            'average_accepted_value': average(
+                accepted.get('quoted_price_sum', 0), accepted.get('quoted_price_count', 0)
+            ),
         }
     
     @staticmethod
-    async def get_quote_response_time(db: AsyncSession) -> Dict[str, float]:
+    async def get_quote_response_time(db: AsyncSession, days: Optional[int] = None) -> Dict[str, Any]:
         """
-        Calculate average quote response times
+        Calculate quote response times: submission to first pricing
+        
+        Args:
+            db: Database session
+            days: Only count responses in the last N days (None = all time)
         
         Returns:
-            Dictionary with response time metrics (in hours)
+            Dictionary with response time metrics (in hours). The median is
+            not tracked by the rollups and is returned as None.
         """
-        # This would require actual datetime calculations
-        # For now, returning placeholder structure
+        query = select(
+            func.sum(QuoteResponseDaily.response_count),
+            func.sum(QuoteResponseDaily.response_seconds_sum),
+            func.min(QuoteResponseDaily.fastest_seconds),
+            func.max(QuoteResponseDaily.slowest_seconds),
+        )
+        if days:
+            query = query.where(QuoteResponseDaily.day >= since(days))
+        count, seconds, fastest, slowest = (await db.execute(query)).one()
+        
+        def hours(value: Optional[float]) -> float:
+            return round((value or 0) / 3600, 2)
+        
         return {
-            'average_response_time_hours': 0,
-            'median_response_time_hours': 0,
-            'fastest_response_hours': 0,
-            'slowest_response_hours': 0
+            'average_response_time_hours': hours(seconds / count) if count else 0,
+            'median_response_time_hours': None,
+            'fastest_response_hours': hours(fastest),
+            'slowest_response_hours': hours(slowest)
         }
-
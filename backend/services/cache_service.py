@@ -5,14 +5,21 @@ YokedCache-based caching service with fuzzy search for improved performance
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from yokedcache import CacheConfig, YokedCache
+from yokedcache.utils import serialize_data
 
 from backend.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the TTL of write-invalidated entries on the memory backend,
+# where an invalidation only reaches the process that made the write
+LOCAL_BACKEND_MAX_TTL = 60
+
 
 class CacheService:
     """Service for YokedCache caching operations with fuzzy search"""
@@ -38,6 +45,7 @@ class CacheService:
                 )
                 self.cache = YokedCache(config=config)
                 self.enabled = settings.ENABLE_CACHE
+                self.backend = "redis"
                 logger.info("YokedCache initialized successfully with fuzzy search")
             except Exception as e:
                 logger.warning(f"YokedCache unavailable, using memory backend: {e}")
@@ -52,11 +60,31 @@ class CacheService:
                     )
                     self.cache = YokedCache(config=config)
                     self.enabled = settings.ENABLE_CACHE
+                    self.backend = "memory"
                     logger.info("Using memory backend for YokedCache")
                 except Exception as mem_error:
                     logger.error(f"Failed to initialize cache: {mem_error}")
                     self.cache = None
                     self.enabled = False
+                    self.backend = None
+    
+    def shared_ttl(self, ttl: int) -> int:
+        """
+        TTL for an entry that write paths keep fresh by invalidating it
+        
+        On Redis the invalidation reaches every worker, so ``ttl`` is kept.
+        The memory backend is per process: other workers keep serving their
+        copy, so it is capped at LOCAL_BACKEND_MAX_TTL.
+        
+        Args:
+            ttl: Lifetime wanted when invalidations are shared
+            
+        Returns:
+            Lifetime to cache the entry for
+        """
+        if self.backend == "redis":
+            return ttl
+        return min(ttl, LOCAL_BACKEND_MAX_TTL)
     
     def _make_key(self, prefix: str, identifier: str) -> str:
         """Create a cache key with prefix"""
@@ -111,6 +139,102 @@ class CacheService:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    async def set_many(
+        self,
+        entries: Sequence[Tuple[str, Any, Optional[List[str]]]],
+        ttl: Optional[int] = None
+    ) -> int:
+        """
+        Set many values in one pipelined Redis round trip
+        
+        Entries are stored exactly as ``set`` stores them (same key prefix,
+        serialization and tag sets), so ``get``, tag invalidation and fuzzy
+        search see no difference. Falls back to one ``set`` per entry if the
+        pipeline cannot be used (e.g. the memory backend).
+        
+        Args:
+            entries: (key, value, tags) tuples
+            ttl: Time to live in seconds (default: settings.REDIS_CACHE_TTL)
+            
+        Returns:
+            Number of entries written
+        """
+        if not self.enabled or not self.cache or not entries:
+            return 0
+        
+        ttl = ttl or settings.REDIS_CACHE_TTL
+        try:
+            serialization = self.cache.config.default_serialization
+            tag_members: Dict[str, List[str]] = defaultdict(list)
+            async with self.cache._get_redis() as r:
+                pipe = r.pipeline(transaction=False)
+                for key, value, tags in entries:
+                    full_key = self.cache._build_key(key)
+                    pipe.set(full_key, serialize_data(value, serialization), ex=ttl)
+                    for tag in tags or ():
+                        tag_members[self.cache._build_tag_key(tag)].append(full_key)
+                for tag_key, keys in tag_members.items():
+                    pipe.sadd(tag_key, *keys)
+                    pipe.expire(tag_key, ttl + 60)
+                await pipe.execute()
+            return len(entries)
+        except Exception as e:
+            logger.warning(f"Pipelined cache set failed, falling back to single sets: {e}")
+        
+        written = 0
+        for key, value, tags in entries:
+            written += await self.set(key, value, ttl=ttl, tags=tags)
+        return written
+    
+    async def acquire_lock(self, name: str, ttl: int) -> Optional[str]:
+        """
+        Take a cluster-wide lock shared by all workers (Redis SET NX EX)
+        
+        Args:
+            name: Lock name
+            ttl: Seconds until the lock expires on its own
+            
+        Returns:
+            Token to release the lock with, or None if another worker holds
+            it or the cache is unavailable
+        """
+        if not self.enabled or not self.cache:
+            return None
+        
+        token = uuid.uuid4().hex
+        try:
+            async with self.cache._get_redis() as r:
+                if await r.set(self._make_key("lock", name), token, nx=True, ex=ttl):
+                    return token
+        except Exception as e:
+            logger.warning(f"Could not acquire lock {name}: {e}")
+        return None
+    
+    async def release_lock(self, name: str, token: str) -> bool:
+        """
+        Release a lock taken with ``acquire_lock`` (only if still ours)
+        
+        Args:
+            name: Lock name
+            token: Token returned by ``acquire_lock``
+            
+        Returns:
+            True if the lock was released
+        """
+        if not self.enabled or not self.cache:
+            return False
+        
+        try:
+            async with self.cache._get_redis() as r:
+                released = await r.eval(
+                    "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0",
+                    1, self._make_key("lock", name), token,
+                )
+            return bool(released)
+        except Exception as e:
+            logger.warning(f"Could not release lock {name}: {e}")
+            return False
+    
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache
@@ -274,6 +398,29 @@ class CacheService:
             logger.error(f"Error indexing product {product_id} for search: {e}")
             return False
     
+    async def index_products_for_search(
+        self,
+        products: Sequence[Tuple[int, str]],
+        ttl: int = 3600
+    ) -> int:
+        """
+        Index a batch of products for fuzzy search in one pipelined round trip
+        
+        Args:
+            products: (product_id, searchable_text) pairs
+            ttl: Time to live in seconds (default 1 hour)
+            
+        Returns:
+            Number of products indexed
+        """
+        return await self.set_many(
+            [
+                (self._make_key("product_search", str(product_id)), text, ["products", f"product:{product_id}"])
+                for product_id, text in products
+            ],
+            ttl=ttl,
+        )
+    
     async def get_cached_product(self, product_id: int) -> Optional[dict]:
         """Get cached product"""
         key = self._make_key("product", str(product_id))
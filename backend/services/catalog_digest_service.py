@@ -0,0 +1,499 @@
+"""
+Catalog Digest Service
+
+Precomputed catalog for the admin AI tools: the markdown returned by
+``get_product_catalog`` and an in-memory search index used by
+``search_catalog``, built together from one read of the catalog tables.
+
+A digest is keyed by the catalog version: the max ``updated_at`` and row
+count of every table it reads (counts catch hard deletes). Each tool call
+checks the version at most every ``VERSION_CHECK_SECONDS``; when it moved,
+the current digest keeps serving while a single background task rebuilds
+it. Built digests are also put in the shared cache under their version, so
+other workers pick them up instead of rebuilding. Writes made through the AI
+tools call ``invalidate`` so the next call in this process waits for a fresh
+build.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.base import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+DIGEST_TABLES = (
+    "categories",
+    "product_subcategories",
+    "product_families",
+    "chairs",
+    "product_variations",
+    "finishes",
+    "upholsteries",
+    "colors",
+)
+
+DIGEST_TTL = 6 * 3600  # Keyed by version, so the TTL only bounds memory use
+VERSION_CHECK_SECONDS = 5.0
+
+SEARCH_SECTIONS = ("families", "products", "variations", "finishes", "upholsteries", "colors", "categories")
+
+_MODEL_KEY_PATTERN = re.compile(r"[\s\-_.]")
+
+_digest: Optional[Dict[str, Any]] = None
+_version_checked_at: float = 0.0
+_rebuild_task: Optional[asyncio.Task] = None
+
+
+def _digest_key(version: str) -> str:
+    return f"eaglechair:catalog_digest:{version}"
+
+
+def _model_key(value: str) -> str:
+    """Normalise a model number / SKU for exact lookups (5242-P == 5242p)."""
+    return _MODEL_KEY_PATTERN.sub("", value or "").upper()
+
+
+def _haystack(*fields) -> str:
+    return "\x1f".join(str(f) for f in fields if f).lower()
+
+
+def _cents(value) -> Optional[str]:
+    return f"${value / 100:.2f}" if value else None
+
+
+def _render_markdown(data: Dict[str, list]) -> str:
+    """Format the full catalog as markdown (the get_product_catalog tool output)"""
+    cats = [c for c in data["categories"] if c.is_active]
+    cat_map = {c.id: c.name for c in cats}
+    subcats = [s for s in data["subcategories"] if s.is_active]
+    subcat_map = {s.id: s.name for s in subcats}
+    families = [f for f in data["families"] if f.is_active]
+    family_map = {f.id: f.name for f in families}
+    finishes = [f for f in data["finishes"] if f.is_active]
+    finish_map = {f.id: f.name for f in finishes}
+    upholsteries = [u for u in data["upholsteries"] if u.is_active]
+    upholstery_map = {u.id: u.name for u in upholsteries}
+    colors = [c for c in data["colors"] if c.is_active]
+    color_map = {c.id: c.name for c in colors}
+    products = [p for p in data["products"] if p.is_active]
+    variations = [v for v in data["variations"] if v.is_available]
+
+    lines = [
+        "# Eagle Chair — Live Product Catalog\n",
+        "## Product Naming & Units",
+        "- Base model: 4 digits (e.g., 5242, 6018). Suffixes: P, PB, WB, BX. Dashes optional (5242-P = 5242P).",
+        "- Variations: sku = full model (e.g., 5242PBX). Usually share base model with their product.",
+        "- Dimensions: inches. Weight: lbs. Upholstery amount: yards. Prices: dollars (displayed from cents).\n",
+    ]
+
+    lines.append("## Categories")
+    for c in [c for c in cats if not c.parent_id]:
+        lines.append(f"- **{c.name}** (id:{c.id}, slug:{c.slug})")
+        for ch in [ch for ch in cats if ch.parent_id == c.id]:
+            lines.append(f"  - {ch.name} (id:{ch.id})")
+    lines.append("")
+
+    if subcats:
+        lines.append("## Subcategories")
+        for s in subcats:
+            lines.append(f"- {s.name} (id:{s.id}, category:{cat_map.get(s.category_id, '?')})")
+        lines.append("")
+
+    lines.append("## Product Families")
+    lines.append("| ID | Name | Category | Subcategory | Featured | Overview |")
+    lines.append("|---|---|---|---|---|---|")
+    for f in families:
+        cat_name = cat_map.get(f.category_id, "-")
+        subcat_name = subcat_map.get(f.subcategory_id, "-") if f.subcategory_id else "-"
+        featured = "Yes" if f.is_featured else "No"
+        overview = (f.overview_text or "")[:80].replace("|", "/").replace("\n", " ")
+        lines.append(f"| {f.id} | {f.name} | {cat_name} | {subcat_name} | {featured} | {overview} |")
+    lines.append("")
+
+    lines.append("## Finishes (wood stains, paints, metal coatings)")
+    lines.append("| ID | Name | Code | Type | Grade | Additional Cost |")
+    lines.append("|---|---|---|---|---|---|")
+    for f in finishes:
+        cost = f"${f.additional_cost / 100:.2f}" if f.additional_cost else "$0.00"
+        lines.append(f"| {f.id} | {f.name} | {f.finish_code or '-'} | {f.finish_type or '-'} | {f.grade} | {cost} |")
+    lines.append("")
+
+    def fmt_cents(v: int) -> str:
+        return f"${v / 100:.2f}" if v else "$0.00"
+
+    lines.append("## Upholsteries (fabrics, vinyls, leathers)")
+    lines.append("| ID | Name | Code | Type | Grade | Base | Gr.A | Gr.B | Gr.C | Premium |")
+    lines.append("|---|---|---|---|---|---|---|---|---|---|")
+    for u in upholsteries:
+        lines.append(
+            f"| {u.id} | {u.name} | {u.material_code or '-'} | {u.material_type} "
+            f"| {u.grade or '-'} | {fmt_cents(u.additional_cost)} "
+            f"| {fmt_cents(u.grade_a_cost)} | {fmt_cents(u.grade_b_cost)} "
+            f"| {fmt_cents(u.grade_c_cost)} | {fmt_cents(u.premium_cost)} |"
+        )
+    lines.append("")
+
+    lines.append("## Colors")
+    lines.append("| ID | Name | Code | Hex | Category |")
+    lines.append("|---|---|---|---|---|")
+    for c in colors:
+        lines.append(f"| {c.id} | {c.name} | {c.color_code or '-'} | {c.hex_value or '-'} | {c.category or '-'} |")
+    lines.append("")
+
+    lines.append(f"## Products ({len(products)} active)")
+    lines.append("| ID | Model | Suffix | Name | Category | Family | Price | MSRP | W×D×H (in) | Seat H | Weight (lb) | Uph Yds | Frame | Stock | Features |")
+    lines.append("|---|---|---|---|---|---|---|---|---|---|---|---|---|---|---|")
+    for p in products:
+        cat_name = cat_map.get(p.category_id, f"?{p.category_id}")
+        fam_name = family_map.get(p.family_id, "-") if p.family_id else "-"
+        price = _cents(p.base_price) or "-"
+        msrp = _cents(p.msrp) or "-"
+        dims = f"{p.width or '?'}×{p.depth or '?'}×{p.height or '?'}"
+        seat_h = str(p.seat_height) if p.seat_height else "-"
+        weight_str = f"{p.weight}" if p.weight is not None else "-"
+        uph_str = f"{p.upholstery_amount}" if p.upholstery_amount is not None else "-"
+        features_str = ""
+        if p.features:
+            try:
+                feats = json.loads(p.features) if isinstance(p.features, str) else p.features
+                features_str = ", ".join(feats) if isinstance(feats, list) else str(feats)
+            except Exception:
+                features_str = str(p.features)
+        lines.append(
+            f"| {p.id} | {p.model_number} | {p.model_suffix or ''} | {p.name} "
+            f"| {cat_name} | {fam_name} "
+            f"| {price} | {msrp} | {dims} | {seat_h} | {weight_str} | {uph_str} "
+            f"| {p.frame_material or '-'} | {p.stock_status} | {features_str[:50]} |"
+        )
+    lines.append("")
+
+    lines.append(f"## Product Variations ({len(variations)} available)")
+    lines.append("| ID | SKU | Product ID | Name | Finish | Upholstery | Color | Price Adj | W×D×H | Weight | Uph Yds |")
+    lines.append("|---|---|---|---|---|---|---|---|---|---|---|")
+    for v in variations:
+        finish_name = finish_map.get(v.finish_id, "-") if v.finish_id else "-"
+        uph_name = upholstery_map.get(v.upholstery_id, "-") if v.upholstery_id else "-"
+        color_name = color_map.get(v.color_id, "-") if v.color_id else "-"
+        adj = f"${v.price_adjustment / 100:+.2f}" if v.price_adjustment else "$0.00"
+        if v.width or v.depth or v.height:
+            dims = f"{v.width or '?'}×{v.depth or '?'}×{v.height or '?'}"
+        else:
+            dims = "-"
+        weight_str = f"{v.weight}" if v.weight is not None else "-"
+        uph_str = f"{v.upholstery_amount}" if v.upholstery_amount is not None else "-"
+        lines.append(
+            f"| {v.id} | {v.sku} | {v.product_id} | {v.name or ''} "
+            f"| {finish_name} | {uph_name} | {color_name} | {adj} | {dims} | {weight_str} | {uph_str} |"
+        )
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def _build_index(data: Dict[str, list]) -> Dict[str, Any]:
+    """
+    Search entries per section, in the order the SQL search returned them
+
+    Each entry is ``[haystack, result]``: the lower-cased searchable fields
+    joined by a separator, and the dict ``search_catalog`` returns for it.
+    ``models`` maps normalised model numbers / SKUs to product and variation
+    positions for exact lookups.
+    """
+    cat_names = {c.id: c.name for c in data["categories"]}
+    subcat_names = {s.id: s.name for s in data["subcategories"]}
+    family_names = {f.id: f.name for f in data["families"]}
+    finish_names = {f.id: f.name for f in data["finishes"]}
+    upholstery_names = {u.id: u.name for u in data["upholsteries"]}
+    color_names = {c.id: c.name for c in data["colors"]}
+
+    index: Dict[str, Any] = {section: [] for section in SEARCH_SECTIONS}
+    models: Dict[str, Dict[str, List[int]]] = {}
+
+    def add_model(key: str, section: str, position: int) -> None:
+        if key:
+            models.setdefault(key, {}).setdefault(section, []).append(position)
+
+    for f in data["families"]:
+        if not f.is_active:
+            continue
+        index["families"].append([
+            _haystack(f.name, f.slug, f.overview_text),
+            {
+                "id": f.id, "name": f.name, "slug": f.slug,
+                "category_id": f.category_id, "subcategory_id": f.subcategory_id,
+                "category": cat_names.get(f.category_id),
+                "subcategory": subcat_names.get(f.subcategory_id),
+                "featured": f.is_featured, "overview": (f.overview_text or "")[:200],
+                "family_image": f.family_image,
+                "banner_image_url": f.banner_image_url,
+            },
+        ])
+
+    product_counts: Dict[int, int] = {}
+    all_models = []
+    for p in data["products"]:
+        if not p.is_active:
+            continue
+        if p.family_id:
+            product_counts[p.family_id] = product_counts.get(p.family_id, 0) + 1
+        family_name = family_names.get(p.family_id)
+        full_model = f"{p.model_number}{p.model_suffix or ''}"
+        all_models.append({"model": full_model, "name": p.name, "price": _cents(p.base_price)})
+        position = len(index["products"])
+        index["products"].append([
+            _haystack(p.model_number, p.model_suffix, p.name, family_name),
+            {
+                "id": p.id, "model": p.model_number, "suffix": p.model_suffix or "",
+                "name": p.name, "family": family_name, "category": cat_names.get(p.category_id),
+                "category_id": p.category_id, "subcategory_id": p.subcategory_id, "family_id": p.family_id,
+                "price": _cents(p.base_price),
+                "msrp": _cents(p.msrp),
+            },
+        ])
+        add_model(_model_key(p.model_number), "products", position)
+        add_model(_model_key(full_model), "products", position)
+
+    for v in data["variations"]:
+        if not v.is_available:
+            continue
+        finish = finish_names.get(v.finish_id)
+        upholstery = upholstery_names.get(v.upholstery_id)
+        color = color_names.get(v.color_id)
+        position = len(index["variations"])
+        index["variations"].append([
+            _haystack(v.sku, v.name, finish, upholstery, color),
+            {
+                "id": v.id, "sku": v.sku, "product_id": v.product_id,
+                "name": v.name or "", "finish": finish, "upholstery": upholstery,
+                "color": color,
+                "price_adj": f"${v.price_adjustment / 100:+.2f}" if v.price_adjustment else "$0",
+            },
+        ])
+        add_model(_model_key(v.sku), "variations", position)
+
+    for f in data["finishes"]:
+        if not f.is_active:
+            continue
+        index["finishes"].append([
+            _haystack(f.name, f.finish_code, f.finish_type),
+            {
+                "id": f.id, "name": f.name, "code": f.finish_code or "-",
+                "type": f.finish_type or "-", "grade": f.grade,
+                "cost": f"${f.additional_cost / 100:.2f}" if f.additional_cost else "$0",
+                "image_url": f.image_url,
+            },
+        ])
+
+    for u in data["upholsteries"]:
+        if not u.is_active:
+            continue
+        index["upholsteries"].append([
+            _haystack(u.name, u.material_code, u.material_type),
+            {
+                "id": u.id, "name": u.name, "code": u.material_code or "-",
+                "type": u.material_type, "grade": u.grade or "-",
+                "cost": f"${u.additional_cost / 100:.2f}" if u.additional_cost else "$0",
+                "image_url": u.image_url,
+                "swatch_image_url": u.swatch_image_url,
+            },
+        ])
+
+    for c in data["colors"]:
+        if not c.is_active:
+            continue
+        index["colors"].append([
+            _haystack(c.name, c.color_code, c.category),
+            {
+                "id": c.id, "name": c.name, "code": c.color_code or "-",
+                "hex": c.hex_value or "-", "category": c.category or "-",
+                "image_url": c.image_url,
+            },
+        ])
+
+    for c in data["categories"]:
+        if not c.is_active:
+            continue
+        index["categories"].append([
+            _haystack(c.name, c.slug),
+            {"id": c.id, "name": c.name, "slug": c.slug, "parent_id": c.parent_id},
+        ])
+
+    index["models"] = models
+    index["overview"] = {
+        "families": [
+            {
+                "id": f.id, "name": f.name, "slug": f.slug,
+                "category": cat_names.get(f.category_id),
+                "product_count": product_counts.get(f.id, 0),
+            }
+            for f in data["families"] if f.is_active
+        ],
+        "all_models": all_models,
+    }
+    return index
+
+
+def _log_rebuild_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Catalog digest rebuild failed: {task.exception()}")
+
+
+class CatalogDigestService:
+    """Build and serve the versioned catalog digest"""
+
+    @staticmethod
+    async def get_version(db: AsyncSession) -> str:
+        """Catalog version: max updated_at and row count of every digest table"""
+        columns = ", ".join(
+            f"(SELECT MAX(updated_at) FROM {t}) AS {t}_updated, (SELECT COUNT(*) FROM {t}) AS {t}_count"
+            for t in DIGEST_TABLES
+        )
+        row = (await db.execute(text(f"SELECT {columns}"))).one()
+        stamp = "|".join(str(value) for value in row)
+        return hashlib.sha1(stamp.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    async def load(db: AsyncSession) -> Dict[str, list]:
+        """Read every catalog row the digest needs (inactive rows included for name lookups)"""
+        queries = {
+            "categories": "SELECT id, name, slug, parent_id, is_active FROM categories ORDER BY display_order",
+            "subcategories": (
+                "SELECT id, name, slug, category_id, is_active FROM product_subcategories ORDER BY display_order"
+            ),
+            "families": (
+                "SELECT id, name, slug, category_id, subcategory_id, overview_text, is_featured, "
+                "family_image, banner_image_url, is_active FROM product_families ORDER BY display_order"
+            ),
+            "finishes": (
+                "SELECT id, name, finish_code, finish_type, grade, additional_cost, image_url, is_active "
+                "FROM finishes ORDER BY display_order"
+            ),
+            "upholsteries": (
+                "SELECT id, name, material_code, material_type, grade, additional_cost, grade_a_cost, "
+                "grade_b_cost, grade_c_cost, premium_cost, image_url, swatch_image_url, is_active "
+                "FROM upholsteries ORDER BY display_order"
+            ),
+            "colors": (
+                "SELECT id, name, color_code, hex_value, category, image_url, is_active "
+                "FROM colors ORDER BY display_order"
+            ),
+            "products": """
+                SELECT id, model_number, model_suffix, suffix_description, name,
+                       category_id, subcategory_id, family_id, base_price, msrp,
+                       width, depth, height, seat_height, weight, upholstery_amount,
+                       frame_material, features, stock_status, is_featured, is_new, is_outdoor_suitable,
+                       recommended_use, minimum_order_quantity, lead_time_days,
+                       ada_compliant, flame_certifications, warranty_info, is_active
+                FROM chairs ORDER BY display_order, model_number
+            """,
+            "variations": """
+                SELECT id, product_id, sku, name, finish_id, upholstery_id, color_id,
+                       price_adjustment, stock_status, is_available,
+                       width, depth, height, seat_height, weight, upholstery_amount
+                FROM product_variations ORDER BY product_id, display_order
+            """,
+        }
+        data = {}
+        for name, sql in queries.items():
+            data[name] = (await db.execute(text(sql))).fetchall()
+        return data
+
+    @staticmethod
+    async def build(db: AsyncSession, version: Optional[str] = None) -> Dict[str, Any]:
+        """Build the digest for the current catalog and publish it to the shared cache"""
+        from backend.services.cache_service import cache_service
+
+        started = time.perf_counter()
+        version = version or await CatalogDigestService.get_version(db)
+        data = await CatalogDigestService.load(db)
+        digest = {
+            "version": version,
+            "markdown": _render_markdown(data),
+            "index": _build_index(data),
+        }
+        await cache_service.set(_digest_key(version), digest, ttl=DIGEST_TTL)
+        logger.info(
+            f"Built catalog digest {version} in {(time.perf_counter() - started) * 1000:.0f}ms "
+            f"({len(digest['index']['products'])} products, {len(digest['index']['variations'])} variations)"
+        )
+        return digest
+
+    @staticmethod
+    async def _rebuild(version: str) -> Dict[str, Any]:
+        global _digest
+        from backend.services.cache_service import cache_service
+
+        digest = await cache_service.get(_digest_key(version))
+        if not (isinstance(digest, dict) and digest.get("version") == version):
+            async with AsyncSessionLocal() as db:
+                digest = await CatalogDigestService.build(db, version)
+        _digest = digest
+        return digest
+
+    @staticmethod
+    async def get_digest() -> Dict[str, Any]:
+        """
+        Current digest; serves the previous one while a newer version builds
+
+        Only the very first call in a process (or the first after
+        ``invalidate``) waits for a build.
+        """
+        global _version_checked_at, _rebuild_task
+
+        now = time.monotonic()
+        if _digest is not None and now - _version_checked_at < VERSION_CHECK_SECONDS:
+            return _digest
+
+        async with AsyncSessionLocal() as db:
+            version = await CatalogDigestService.get_version(db)
+        _version_checked_at = now
+        if _digest is not None and _digest["version"] == version:
+            return _digest
+
+        if _rebuild_task is None or _rebuild_task.done():
+            _rebuild_task = asyncio.create_task(CatalogDigestService._rebuild(version))
+            _rebuild_task.add_done_callback(_log_rebuild_failure)
+        if _digest is not None:
+            return _digest
+        return await asyncio.shield(_rebuild_task)
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop this process's digest so the next call waits for a fresh build"""
+        global _digest, _version_checked_at
+
+        _digest = None
+        _version_checked_at = 0.0
+
+    @staticmethod
+    def search(digest: Dict[str, Any], query: str, max_results: int = 50) -> Dict[str, Any]:
+        """
+        Case-insensitive partial match over the digest's search index
+
+        Exact model-number / SKU matches (dashes and spaces ignored) come first.
+        """
+        index = digest["index"]
+        term = query.strip().lower()
+        result: Dict[str, Any] = {"query": query}
+
+        exact = index["models"].get(_model_key(query), {})
+        for section in SEARCH_SECTIONS:
+            entries = index[section]
+            positions = list(exact.get(section, []))[:max_results]
+            seen = set(positions)
+            for position, (haystack, _) in enumerate(entries):
+                if len(positions) >= max_results:
+                    break
+                if position not in seen and term in haystack:
+                    positions.append(position)
+            result[section] = [entries[p][1] for p in positions]
+        return result
@@ -0,0 +1,266 @@
+"""
+Catalog Import Service
+
+Parse uploaded manufacturer catalogs into the tmp_* review tables and move
+approved records into production. Both run as background jobs in the worker
+process (see ``job_handlers``); the admin routes only enqueue them and report
+progress from ``CatalogUpload.status/current_step``.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.core.exceptions import BusinessLogicError
+from backend.models.chair import Chair, ProductFamily, ProductImage, ProductVariation
+from backend.models.tmp_catalog import CatalogUpload, TmpProductFamily
+from backend.services.family_index_service import refresh_family_index
+
+logger = logging.getLogger(__name__)
+
+TMP_IMAGES_DIR = Path(settings.FRONTEND_PATH) / "tmp" / "images"
+
+
+class CatalogImportService:
+    """Parse catalog uploads and import reviewed data to production"""
+
+    @staticmethod
+    def parse_upload(upload_id: str, file_path: str, max_pages: Optional[int] = None) -> Dict:
+        """
+        Parse an uploaded PDF into tmp_* tables (blocking; run in a thread)
+
+        Uses its own sync session because the parser is synchronous. The parser
+        reports progress through the upload's status/current_step fields; on
+        failure the upload is marked failed and the error is re-raised so the
+        job records it too.
+
+        Args:
+            upload_id: CatalogUpload.upload_id
+            file_path: Path to the saved PDF
+            max_pages: Optional page limit
+
+        Returns:
+            Parser results
+        """
+        from backend.database.base import SessionLocal
+        from backend.services.pdf_parser_service import CatalogParserService
+
+        db = SessionLocal()
+        try:
+            upload_record = db.query(CatalogUpload).filter(
+                CatalogUpload.upload_id == upload_id
+            ).first()
+            if not upload_record:
+                raise ValueError(f"Upload record {upload_id} not found")
+
+            logger.info(f"Parsing started for upload {upload_id}")
+            parser = CatalogParserService(db, tmp_images_dir=str(TMP_IMAGES_DIR))
+            results = parser.parse_catalog(file_path, upload_record, max_pages=max_pages)
+            logger.info(f"Parsing completed for {upload_id}: {results}")
+            return results
+
+        except Exception as e:
+            logger.error(f"Parsing failed for {upload_id}: {e}", exc_info=True)
+            db.rollback()
+            try:
+                upload_record = db.query(CatalogUpload).filter(
+                    CatalogUpload.upload_id == upload_id
+                ).first()
+                if upload_record:
+                    upload_record.status = 'failed'
+                    upload_record.current_step = 'Parsing failed'
+                    upload_record.error_message = str(e)
+                    db.commit()
+            except Exception as db_error:
+                logger.error(f"Failed to update error status: {db_error}")
+            raise
+
+        finally:
+            db.close()
+
+    @staticmethod
+    async def set_upload_step(
+        db: AsyncSession,
+        upload_id: str,
+        current_step: str,
+        status: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """Update progress fields of an upload without loading it"""
+        values = {"current_step": current_step[:100]}
+        if status:
+            values["status"] = status
+        if error_message is not None:
+            values["error_message"] = error_message
+        await db.execute(
+            update(CatalogUpload).where(CatalogUpload.upload_id == upload_id).values(**values)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def import_upload(db: AsyncSession, upload_id: str) -> Dict[str, int]:
+        """
+        Import approved tmp families/products of an upload into production
+
+        Everything is written in one transaction; on error nothing is imported.
+
+        Args:
+            db: Database session
+            upload_id: CatalogUpload.upload_id
+
+        Returns:
+            Counts of imported families, products, variations and images
+
+        Raises:
+            BusinessLogicError: Nothing approved, SKU conflicts or missing categories
+        """
+        stmt = select(TmpProductFamily).where(
+            TmpProductFamily.upload_id == upload_id,
+            TmpProductFamily.import_status == 'approved'
+        )
+        result = await db.execute(stmt)
+        tmp_families = result.scalars().all()
+
+        if not tmp_families:
+            raise BusinessLogicError("No approved families found for this upload")
+
+        imported_counts = {
+            'families': 0,
+            'products': 0,
+            'variations': 0,
+            'images': 0,
+        }
+        family_ids = []
+
+        # Pre-flight duplicate-SKU check: collect every variation SKU that would be
+        # inserted by this import and make sure none of them already exist in
+        # production. Doing this before any writes avoids an IntegrityError midway
+        # through the import rolling back the whole batch.
+        incoming_skus = []
+        for tmp_family in tmp_families:
+            for tmp_product in tmp_family.products:
+                if tmp_product.import_status != 'approved':
+                    continue
+                for tmp_var in tmp_product.variations:
+                    if tmp_var.sku:
+                        incoming_skus.append(tmp_var.sku)
+
+        if incoming_skus:
+            dup_stmt = select(ProductVariation.sku).where(ProductVariation.sku.in_(incoming_skus))
+            dup_result = await db.execute(dup_stmt)
+            conflicting_skus = sorted({row[0] for row in dup_result.all()})
+            if conflicting_skus:
+                raise BusinessLogicError(
+                    "Cannot import: the following SKUs already exist in production: "
+                    f"{', '.join(conflicting_skus)}"
+                )
+
+        try:
+            for tmp_family in tmp_families:
+                # Create production family
+                family = ProductFamily(
+                    name=tmp_family.name,
+                    slug=tmp_family.slug,
+                    description=tmp_family.description,
+                    features=tmp_family.features,
+                    wood_species=tmp_family.wood_species,
+                    options=tmp_family.options,
+                    environmental_info=tmp_family.environmental_info,
+                )
+                db.add(family)
+                await db.flush()
+                family_ids.append(family.id)
+                imported_counts['families'] += 1
+
+                # Import products
+                for tmp_product in tmp_family.products:
+                    if tmp_product.import_status != 'approved':
+                        continue
+
+                    # Chair.category_id and Chair.base_price are NOT NULL - resolve
+                    # from the product's tmp category, falling back to the family's.
+                    category_id = tmp_product.category_id or tmp_family.category_id
+                    if category_id is None:
+                        raise BusinessLogicError(
+                            f"Product '{tmp_product.name}' (model {tmp_product.model_number}) "
+                            "has no category assigned - assign a category before importing."
+                        )
+
+                    product = Chair(
+                        family_id=family.id,
+                        category_id=category_id,
+                        subcategory_id=tmp_product.subcategory_id,
+                        model_number=tmp_product.model_number,
+                        name=tmp_product.name,
+                        slug=tmp_product.slug,
+                        short_description=tmp_product.short_description,
+                        full_description=tmp_product.full_description,
+                        base_price=tmp_product.base_price or 0,
+                        height=tmp_product.height,
+                        width=tmp_product.width,
+                        depth=tmp_product.depth,
+                        weight=tmp_product.weight,
+                        frame_material=tmp_product.frame_material,
+                        stock_status=tmp_product.stock_status,
+                        primary_image_url=tmp_product.primary_image_url,
+                    )
+                    db.add(product)
+                    await db.flush()
+                    imported_counts['products'] += 1
+
+                    # Import variations
+                    for tmp_var in tmp_product.variations:
+                        variation = ProductVariation(
+                            product_id=product.id,
+                            sku=tmp_var.sku,
+                            price_adjustment=tmp_var.price_adjustment,
+                            stock_status=tmp_var.stock_status,
+                            is_available=tmp_var.is_available,
+                        )
+                        db.add(variation)
+                        imported_counts['variations'] += 1
+
+                    # Import images. `tmp_product.images` is a JSON array of URL
+                    # strings (not TmpProductImage rows), and ProductImage has no
+                    # `is_primary` column - the primary image lives on
+                    # Chair.primary_image_url instead (set above).
+                    image_urls = tmp_product.images if isinstance(tmp_product.images, list) else []
+                    for image_url in image_urls:
+                        if not image_url:
+                            continue
+                        image = ProductImage(
+                            product_id=product.id,
+                            image_url=image_url,
+                            image_type="gallery",
+                        )
+                        db.add(image)
+                        imported_counts['images'] += 1
+
+                    # Mark tmp product as imported
+                    tmp_product.import_status = 'imported'
+
+                # Mark tmp family as imported
+                tmp_family.import_status = 'imported'
+
+            # Update upload record in the same transaction
+            await db.execute(
+                update(CatalogUpload)
+                .where(CatalogUpload.upload_id == upload_id)
+                .values(status='imported', current_step='Imported to production')
+            )
+            await db.commit()
+
+        except Exception:
+            await db.rollback()
+            raise
+
+        # New families' members are only visible once their indexes are built
+        for family_id in family_ids:
+            await refresh_family_index(db, family_id)
+
+        logger.info(f"Imported upload {upload_id} to production: {imported_counts}")
+        return imported_counts
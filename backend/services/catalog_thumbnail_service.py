@@ -0,0 +1,158 @@
+"""
+Catalog Thumbnail Service
+
+Renders the first page of catalog PDFs to WebP previews once and keeps them
+on disk under ``uploads/images/catalogs/previews``, named by the PDF's
+content hash and variant (``<sha>-full.webp``, ``<sha>-small.webp``).
+
+Previews are rendered when an admin creates or updates a catalog. The public
+``/catalogs/{id}/pdf-thumbnail`` endpoint only serves files; if a preview is
+missing (older catalogs, files copied in by hand) it is rendered lazily, with
+a per-key lock so concurrent requests for the same PDF render it once.
+Rendering always runs in a worker thread, never on the event loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_SUBDIR = Path("images") / "catalogs" / "previews"
+
+# variant -> max width in pixels (None keeps the full 1.5x render)
+VARIANTS: Dict[str, Optional[int]] = {"full": None, "small": 480}
+DEFAULT_VARIANT = "full"
+
+RENDER_ZOOM = 1.5
+WEBP_QUALITY = 82
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# (path, mtime_ns, size) -> content hash; avoids re-hashing unchanged files
+_hash_cache: Dict[Tuple[str, int, int], str] = {}
+_render_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _upload_base_dir() -> Path:
+    from backend.api.v1.routes.admin.upload import UPLOAD_BASE_DIR
+
+    return UPLOAD_BASE_DIR
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def _render_variants(pdf_path: Path, content_hash: str, preview_dir: Path) -> None:
+    """Rasterize page 0 and write every WebP variant (runs in a thread)."""
+    import fitz
+    from PIL import Image
+
+    with fitz.open(str(pdf_path)) as doc:
+        if len(doc) == 0:
+            raise ValueError("PDF has no pages")
+        pix = doc[0].get_pixmap(matrix=fitz.Matrix(RENDER_ZOOM, RENDER_ZOOM), alpha=False)
+        image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+    preview_dir.mkdir(parents=True, exist_ok=True)
+    for variant, max_width in VARIANTS.items():
+        rendered = image
+        if max_width and image.width > max_width:
+            height = round(image.height * max_width / image.width)
+            rendered = image.resize((max_width, height), Image.LANCZOS)
+
+        target = preview_dir / f"{content_hash}-{variant}.webp"
+        # Write to a temp file and rename so other workers never see a partial file
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        rendered.save(tmp, "WEBP", quality=WEBP_QUALITY, method=4)
+        os.replace(tmp, target)
+
+
+class CatalogThumbnailService:
+    """Render, store and locate WebP previews of catalog PDFs"""
+
+    @staticmethod
+    def preview_dir() -> Path:
+        return _upload_base_dir() / PREVIEW_SUBDIR
+
+    @staticmethod
+    def pdf_path_for_url(file_url: Optional[str]) -> Optional[Path]:
+        """Local path of an uploaded catalog PDF, or None for external/non-PDF files."""
+        file_url = file_url or ""
+        if not file_url.lower().endswith(".pdf") or file_url.startswith("http"):
+            return None
+        return _upload_base_dir() / "documents" / "catalogs" / Path(file_url).name
+
+    @staticmethod
+    async def content_hash(pdf_path: Path) -> str:
+        """Content hash of a PDF, memoized per (path, mtime, size)."""
+        stat = pdf_path.stat()
+        key = (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        cached = _hash_cache.get(key)
+        if cached:
+            return cached
+
+        content_hash = await asyncio.to_thread(_hash_file, pdf_path)
+        _hash_cache[key] = content_hash
+        return content_hash
+
+    @staticmethod
+    def preview_path(content_hash: str, variant: str = DEFAULT_VARIANT) -> Path:
+        return CatalogThumbnailService.preview_dir() / f"{content_hash}-{variant}.webp"
+
+    @staticmethod
+    async def ensure_previews(pdf_path: Path) -> str:
+        """
+        Make sure every preview variant for a PDF exists, rendering at most
+        once per content hash even under concurrent calls.
+
+        Returns:
+            The PDF's content hash (the preview file key)
+        """
+        content_hash = await CatalogThumbnailService.content_hash(pdf_path)
+        preview_dir = CatalogThumbnailService.preview_dir()
+
+        def _complete() -> bool:
+            return all(
+                (preview_dir / f"{content_hash}-{variant}.webp").exists()
+                for variant in VARIANTS
+            )
+
+        if _complete():
+            return content_hash
+
+        lock = _render_locks.setdefault(content_hash, asyncio.Lock())
+        async with lock:
+            # Another request may have rendered it while we waited
+            if not _complete():
+                logger.info(f"Rendering catalog preview for {pdf_path.name} ({content_hash})")
+                await asyncio.to_thread(_render_variants, pdf_path, content_hash, preview_dir)
+        _render_locks.pop(content_hash, None)
+
+        return content_hash
+
+    @staticmethod
+    async def render_for_catalog(file_url: Optional[str]) -> Optional[str]:
+        """
+        Render previews after a catalog is created or updated. Failures are
+        logged, never raised - the endpoint falls back to lazy rendering.
+
+        Returns:
+            Content hash, or None when the catalog has no local PDF
+        """
+        pdf_path = CatalogThumbnailService.pdf_path_for_url(file_url)
+        if not pdf_path or not pdf_path.exists():
+            return None
+
+        try:
+            return await CatalogThumbnailService.ensure_previews(pdf_path)
+        except Exception as e:
+            logger.warning(f"Failed to render catalog preview for {file_url}: {e}")
+            return None
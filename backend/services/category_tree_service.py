@@ -0,0 +1,345 @@
+"""
+Category Tree Service
+
+Materialized snapshot of the storefront category tree: primary categories,
+their children (product subcategories and nested categories, each tagged with
+a ``type``) and active product counts.
+
+The snapshot is built from three statements - categories, subcategories and a
+single aggregate count query over primary and secondary assignments - and is
+held in the shared cache so the public API, the static content exporter and
+the sitemap all read the same structure. Admin routes that mutate categories,
+subcategories or product assignments call ``refresh`` with the parts they
+touched; only those parts are reloaded and merged into the cached snapshot.
+On the per-process memory backend a refresh only reaches the worker that
+made the write, so the snapshot is kept for ``cache_service.shared_ttl``
+(at most a minute) there instead of six hours.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, literal_column, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.chair import (
+    Category,
+    Chair,
+    ProductSubcategory,
+    chair_categories,
+    chair_subcategories,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = "eaglechair:category_tree:snapshot"
+SNAPSHOT_TTL = 6 * 3600  # Admin writes refresh the snapshot in place
+
+# Parts of the snapshot that can be reloaded independently
+PART_CATEGORIES = "categories"
+PART_SUBCATEGORIES = "subcategories"
+PART_COUNTS = "counts"
+ALL_PARTS = (PART_CATEGORIES, PART_SUBCATEGORIES, PART_COUNTS)
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _category_row(category: Category) -> Dict[str, Any]:
+    return {
+        "id": category.id,
+        "name": category.name,
+        "slug": category.slug,
+        "description": category.description,
+        "parent_id": category.parent_id,
+        "display_order": category.display_order,
+        "is_active": category.is_active,
+        "icon_url": category.icon_url,
+        "banner_image_url": category.banner_image_url,
+        "meta_title": category.meta_title,
+        "meta_description": category.meta_description,
+        "created_at": _iso(category.created_at),
+        "updated_at": _iso(category.updated_at),
+    }
+
+
+def _subcategory_row(subcategory: ProductSubcategory) -> Dict[str, Any]:
+    return {
+        "id": subcategory.id,
+        "name": subcategory.name,
+        "slug": subcategory.slug,
+        "description": subcategory.description,
+        "category_id": subcategory.category_id,
+        "display_order": subcategory.display_order,
+        "is_active": subcategory.is_active,
+        "updated_at": _iso(subcategory.updated_at),
+    }
+
+
+def _sort_key(row: Dict[str, Any]):
+    return (row["display_order"] or 0, row["name"] or "")
+
+
+def _build_children(snapshot: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group subcategories and nested categories under their parent.
+
+    Keys are stringified parent IDs because the snapshot round-trips through
+    JSON in the cache.
+    """
+    category_counts = snapshot["category_counts"]
+    subcategory_counts = snapshot["subcategory_counts"]
+    children: Dict[str, List[Dict[str, Any]]] = {}
+
+    for sub in snapshot["subcategories"]:
+        children.setdefault(str(sub["category_id"]), []).append(
+            {
+                "id": sub["id"],
+                "name": sub["name"],
+                "slug": sub["slug"],
+                "description": sub["description"],
+                "category_id": sub["category_id"],
+                "display_order": sub["display_order"],
+                "is_active": sub["is_active"],
+                "type": "subcategory",
+                "product_count": subcategory_counts.get(str(sub["id"]), 0),
+                "icon_url": None,
+                "banner_image_url": None,
+            }
+        )
+
+    for category in snapshot["categories"]:
+        if category["parent_id"] is None:
+            continue
+        children.setdefault(str(category["parent_id"]), []).append(
+            {
+                "id": category["id"],
+                "name": category["name"],
+                "slug": category["slug"],
+                "description": category["description"],
+                "category_id": category["parent_id"],
+                "display_order": category["display_order"],
+                "is_active": category["is_active"],
+                "type": "category",
+                "product_count": category_counts.get(str(category["id"]), 0),
+                "icon_url": category["icon_url"],
+                "banner_image_url": category["banner_image_url"],
+            }
+        )
+
+    for items in children.values():
+        items.sort(key=_sort_key)
+
+    return children
+
+
+class CategoryTreeService:
+    """Build, cache and incrementally refresh the category tree snapshot"""
+
+    # ========================================================================
+    # Loaders (one statement each)
+    # ========================================================================
+
+    @staticmethod
+    async def _load_categories(db: AsyncSession) -> List[Dict[str, Any]]:
+        result = await db.execute(
+            select(Category)
+            .where(Category.is_active == True)
+            .order_by(Category.display_order, Category.name)
+        )
+        return [_category_row(c) for c in result.scalars().all()]
+
+    @staticmethod
+    async def _load_subcategories(db: AsyncSession) -> List[Dict[str, Any]]:
+        result = await db.execute(
+            select(ProductSubcategory)
+            .where(ProductSubcategory.is_active == True)
+            .order_by(ProductSubcategory.display_order, ProductSubcategory.name)
+        )
+        return [_subcategory_row(s) for s in result.scalars().all()]
+
+    @staticmethod
+    async def _load_counts(db: AsyncSession) -> Dict[str, Dict[str, int]]:
+        """
+        Count active products per category and per subcategory in a single
+        aggregate query.
+
+        Primary and secondary assignments are UNIONed (not UNION ALL) per
+        kind, so a product assigned to the same node both ways counts once.
+        """
+        kind_category = literal_column("'category'").label("kind")
+        kind_subcategory = literal_column("'subcategory'").label("kind")
+
+        pairs = union(
+            select(
+                kind_category,
+                Chair.id.label("chair_id"),
+                Chair.category_id.label("node_id"),
+            ).where(Chair.is_active == True, Chair.category_id.is_not(None)),
+            select(
+                kind_category,
+                chair_categories.c.chair_id,
+                chair_categories.c.category_id,
+            )
+            .select_from(
+                chair_categories.join(Chair, Chair.id == chair_categories.c.chair_id)
+            )
+            .where(Chair.is_active == True),
+            select(
+                kind_subcategory,
+                Chair.id,
+                Chair.subcategory_id,
+            ).where(Chair.is_active == True, Chair.subcategory_id.is_not(None)),
+            select(
+                kind_subcategory,
+                chair_subcategories.c.chair_id,
+                chair_subcategories.c.subcategory_id,
+            )
+            .select_from(
+                chair_subcategories.join(
+                    Chair, Chair.id == chair_subcategories.c.chair_id
+                )
+            )
+            .where(Chair.is_active == True),
+        ).subquery()
+
+        result = await db.execute(
+            select(pairs.c.kind, pairs.c.node_id, func.count()).group_by(
+                pairs.c.kind, pairs.c.node_id
+            )
+        )
+
+        counts: Dict[str, Dict[str, int]] = {"category": {}, "subcategory": {}}
+        for kind, node_id, count in result.all():
+            if node_id is not None:
+                counts[kind][str(node_id)] = count
+        return counts
+
+    # ========================================================================
+    # Snapshot lifecycle
+    # ========================================================================
+
+    @staticmethod
+    async def _apply_parts(
+        db: AsyncSession, snapshot: Dict[str, Any], parts: Iterable[str]
+    ) -> Dict[str, Any]:
+        parts = set(parts)
+        if PART_CATEGORIES in parts:
+            snapshot["categories"] = await CategoryTreeService._load_categories(db)
+        if PART_SUBCATEGORIES in parts:
+            snapshot["subcategories"] = await CategoryTreeService._load_subcategories(db)
+        if PART_COUNTS in parts:
+            counts = await CategoryTreeService._load_counts(db)
+            snapshot["category_counts"] = counts["category"]
+            snapshot["subcategory_counts"] = counts["subcategory"]
+
+        snapshot["children"] = _build_children(snapshot)
+        snapshot["built_at"] = datetime.utcnow().isoformat()
+        return snapshot
+
+    @staticmethod
+    async def build(db: AsyncSession) -> Dict[str, Any]:
+        """
+        Build a full snapshot from the database and store it in the cache.
+
+        Returns:
+            Snapshot dictionary (``categories``, ``subcategories``,
+            ``category_counts``, ``subcategory_counts``, ``children``)
+        """
+        from backend.services.cache_service import cache_service
+
+        snapshot = await CategoryTreeService._apply_parts(db, {}, ALL_PARTS)
+        await cache_service.set(
+            SNAPSHOT_KEY, snapshot, ttl=cache_service.shared_ttl(SNAPSHOT_TTL), tags=["categories"]
+        )
+
+        logger.info(
+            f"Built category tree snapshot ({len(snapshot['categories'])} categories, "
+            f"{len(snapshot['subcategories'])} subcategories)"
+        )
+        return snapshot
+
+    @staticmethod
+    async def get_snapshot(db: AsyncSession) -> Dict[str, Any]:
+        """Return the cached snapshot, building it on a cache miss."""
+        from backend.services.cache_service import cache_service
+
+        snapshot = await cache_service.get(SNAPSHOT_KEY)
+        if snapshot and "children" in snapshot:
+            return snapshot
+
+        return await CategoryTreeService.build(db)
+
+    @staticmethod
+    async def refresh(db: AsyncSession, *parts: str) -> Dict[str, Any]:
+        """
+        Reload only the given parts of the snapshot after an admin write.
+
+        Args:
+            db: Database session (changes must already be committed/flushed)
+            parts: Any of ``"categories"``, ``"subcategories"``, ``"counts"``.
+                Reloads everything when omitted.
+
+        Returns:
+            The refreshed snapshot
+        """
+        from backend.services.cache_service import cache_service
+
+        unknown = set(parts) - set(ALL_PARTS)
+        if unknown:
+            raise ValueError(f"Unknown category tree parts: {sorted(unknown)}")
+
+        snapshot = await cache_service.get(SNAPSHOT_KEY)
+        if not parts or not snapshot or "children" not in snapshot:
+            return await CategoryTreeService.build(db)
+
+        snapshot = await CategoryTreeService._apply_parts(db, snapshot, parts)
+        await cache_service.set(
+            SNAPSHOT_KEY, snapshot, ttl=cache_service.shared_ttl(SNAPSHOT_TTL), tags=["categories"]
+        )
+
+        logger.info(f"Refreshed category tree snapshot parts: {sorted(parts)}")
+        return snapshot
+
+    # ========================================================================
+    # Read helpers
+    # ========================================================================
+
+    @staticmethod
+    def list_categories(
+        snapshot: Dict[str, Any],
+        parent_id: Optional[int] = None,
+        top_level_only: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Filter snapshot categories the same way ``ProductService.get_categories`` does."""
+        categories = snapshot["categories"]
+        if parent_id is not None:
+            return [c for c in categories if c["parent_id"] == parent_id]
+        if top_level_only:
+            return [c for c in categories if c["parent_id"] is None]
+        return list(categories)
+
+    @staticmethod
+    def children_of(
+        snapshot: Dict[str, Any], category_id: int
+    ) -> List[Dict[str, Any]]:
+        """Children (subcategories and nested categories) of one category."""
+        return snapshot["children"].get(str(category_id), [])
+
+    @staticmethod
+    def all_children(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Every child row across all parents."""
+        return [child for items in snapshot["children"].values() for child in items]
+
+
+async def refresh_category_tree(db: AsyncSession, *parts: str) -> None:
+    """
+    Convenience wrapper for admin routes: refresh the snapshot without
+    letting a cache failure break the write request.
+    """
+    try:
+        await CategoryTreeService.refresh(db, *parts)
+    except Exception as e:
+        logger.warning(f"Category tree refresh failed ({parts}): {e}")
@@ -1,13 +1,23 @@
 """
 Cleanup Service for Temporary Catalog Data
 Handles scheduled cleanup of expired records and files
+
+Runs as the recurring ``cleanup`` job in the background worker. Expired rows
+are deleted in chunks of ``batch_size``, one short transaction per chunk, so
+the tmp_* tables are never locked for long. Files and image directories are
+removed in worker threads, at most ``max_concurrent_deletes`` at a time.
+After every chunk the progress (phase, cursor, running totals) is saved as a
+checkpoint, so a retried or reclaimed job resumes where it stopped and still
+reports totals, including bytes reclaimed, for the whole run.
 """
 
+import asyncio
 import logging
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,26 +34,159 @@ from backend.models.tmp_catalog import (
 
 logger = logging.getLogger(__name__)
 
+CLEANUP_BATCH_SIZE = 500
+MAX_CONCURRENT_DELETES = 4
+
+# Children first, so no chunk ever references a row deleted by an earlier one
+EXPIRED_PHASES = (
+    (TmpProductImage, "images_deleted"),
+    (TmpProductVariation, "variations_deleted"),
+    (TmpChair, "products_deleted"),
+    (TmpProductFamily, "families_deleted"),
+    (CatalogUpload, "uploads_deleted"),
+)
+
+SaveCheckpoint = Callable[[AsyncSession, Dict[str, Any]], Awaitable[None]]
+
+
+async def _commit(db: AsyncSession, state: Dict[str, Any]) -> None:
+    await db.commit()
+
+
+def _remove_path(path: Path) -> int:
+    """Delete a file or directory tree; returns the bytes freed (0 if already gone)"""
+    try:
+        if path.is_dir() and not path.is_symlink():
+            size = 0
+            for dirpath, _, filenames in os.walk(path):
+                for name in filenames:
+                    try:
+                        size += os.lstat(os.path.join(dirpath, name)).st_size
+                    except OSError:
+                        pass
+            shutil.rmtree(path)
+            return size
+        size = path.lstat().st_size
+        path.unlink()
+        return size
+    except FileNotFoundError:
+        return 0
+
+
+def _list_names(folder: Path, directories: bool) -> List[str]:
+    if not folder.exists():
+        return []
+    with os.scandir(folder) as entries:
+        if directories:
+            return sorted(e.name for e in entries if e.is_dir())
+        return sorted(e.name for e in entries if e.is_file() and e.name.endswith(".pdf"))
+
 
 class CleanupService:
     """Service for cleaning up expired temporary catalog data"""
 
-    def __init__(self, tmp_upload_dir: Optional[str] = None, tmp_images_dir: Optional[str] = None):
+    def __init__(
+        self,
+        tmp_upload_dir: Optional[str] = None,
+        tmp_images_dir: Optional[str] = None,
+        batch_size: int = CLEANUP_BATCH_SIZE,
+        max_concurrent_deletes: int = MAX_CONCURRENT_DELETES,
+    ):
         # Use FRONTEND_PATH/tmp by default
         frontend_path = Path(settings.FRONTEND_PATH)
-        
+
         if tmp_upload_dir is None:
             tmp_upload_dir = str(frontend_path / "tmp" / "uploads")
         if tmp_images_dir is None:
             tmp_images_dir = str(frontend_path / "tmp" / "images")
-            
+
         self.tmp_upload_dir = Path(tmp_upload_dir)
         self.tmp_images_dir = Path(tmp_images_dir)
+        self.batch_size = batch_size
+        self.max_concurrent_deletes = max_concurrent_deletes
+
+    async def _remove_paths(self, paths: List[Path], stats: Dict) -> List[bool]:
+        """
+        Delete paths in worker threads, at most ``max_concurrent_deletes`` at once
+
+        Returns:
+            Per path, whether something was deleted
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_deletes)
 
-    async def cleanup_expired_data(self, db: AsyncSession = None) -> Dict:
+        async def _remove(path: Path) -> Tuple[Path, Any]:
+            async with semaphore:
+                try:
+                    exists = await asyncio.to_thread(os.path.lexists, path)
+                    return path, (await asyncio.to_thread(_remove_path, path)) if exists else None
+                except Exception as e:
+                    return path, e
+
+        deleted = []
+        for path, outcome in await asyncio.gather(*(_remove(p) for p in paths)):
+            if isinstance(outcome, Exception):
+                error_msg = f"Error deleting {path}: {outcome}"
+                logger.error(error_msg)
+                stats["errors"].append(error_msg)
+                deleted.append(False)
+            elif outcome is None:
+                deleted.append(False)
+            else:
+                stats["bytes_reclaimed"] += outcome
+                deleted.append(True)
+        return deleted
+
+    async def _delete_expired_uploads(self, db: AsyncSession, now: datetime, stats: Dict) -> int:
+        """Delete one chunk of expired uploads and their files; returns rows deleted"""
+        rows = (
+            await db.execute(
+                select(CatalogUpload.id, CatalogUpload.upload_id, CatalogUpload.file_path)
+                .where(CatalogUpload.expires_at < now)
+                .order_by(CatalogUpload.id)
+                .limit(self.batch_size)
+            )
+        ).all()
+        if not rows:
+            return 0
+
+        files = [Path(r.file_path) for r in rows if r.file_path]
+        dirs = [self.tmp_images_dir / r.upload_id for r in rows]
+        deleted = await self._remove_paths(files + dirs, stats)
+        stats["files_deleted"] += sum(deleted[:len(files)])
+        stats["directories_deleted"] += sum(deleted[len(files):])
+
+        result = await db.execute(
+            delete(CatalogUpload).where(CatalogUpload.id.in_([r.id for r in rows]))
+        )
+        return result.rowcount
+
+    async def _delete_expired_rows(self, db: AsyncSession, model, now: datetime) -> int:
+        """Delete one chunk of expired rows of a tmp table; returns rows deleted"""
+        ids = (
+            await db.execute(
+                select(model.id).where(model.expires_at < now).order_by(model.id).limit(self.batch_size)
+            )
+        ).scalars().all()
+        if not ids:
+            return 0
+        result = await db.execute(delete(model).where(model.id.in_(ids)))
+        return result.rowcount
+
+    async def cleanup_expired_data(
+        self,
+        db: AsyncSession = None,
+        checkpoint: Optional[Dict] = None,
+        save_checkpoint: Optional[SaveCheckpoint] = None,
+    ) -> Dict:
         """
         Clean up all expired temporary data (database records and files)
-        
+
+        Args:
+            db: Database session (a new one is opened if omitted)
+            checkpoint: State saved by an interrupted run, to resume from
+            save_checkpoint: Commits each chunk together with the new state
+                (default: plain commit)
+
         Returns:
             Dict with cleanup statistics
         """
@@ -51,76 +194,36 @@ class CleanupService:
         if db is None:
             db = AsyncSessionLocal()
             close_db = True
+        save = save_checkpoint or _commit
+
+        state = checkpoint or {}
+        phase = state.get("phase", 0)
+        stats = state.get("stats") or {
+            "uploads_deleted": 0,
+            "families_deleted": 0,
+            "products_deleted": 0,
+            "variations_deleted": 0,
+            "images_deleted": 0,
+            "files_deleted": 0,
+            "directories_deleted": 0,
+            "bytes_reclaimed": 0,
+            "errors": []
+        }
+        if checkpoint:
+            logger.info(f"Resuming expired data cleanup at phase {phase}")
 
         try:
             now = datetime.utcnow()
-            stats = {
-                "uploads_deleted": 0,
-                "families_deleted": 0,
-                "products_deleted": 0,
-                "variations_deleted": 0,
-                "images_deleted": 0,
-                "files_deleted": 0,
-                "errors": []
-            }
-
-            # Find expired uploads
-            stmt = select(CatalogUpload).where(CatalogUpload.expires_at < now)
-            result = await db.execute(stmt)
-            expired_uploads = result.scalars().all()
-
-            logger.info(f"Found {len(expired_uploads)} expired uploads")
-
-            for upload in expired_uploads:
-                try:
-                    # Delete associated files
-                    if upload.file_path:
-                        file_path = Path(upload.file_path)
-                        if file_path.exists():
-                            file_path.unlink()
-                            stats["files_deleted"] += 1
-                            logger.info(f"Deleted file: {file_path}")
-
-                    # Delete images directory for this upload
-                    upload_images_dir = self.tmp_images_dir / upload.upload_id
-                    if upload_images_dir.exists():
-                        shutil.rmtree(upload_images_dir)
-                        logger.info(f"Deleted images directory: {upload_images_dir}")
-
-                except Exception as e:
-                    error_msg = f"Error deleting files for upload {upload.upload_id}: {e}"
-                    logger.error(error_msg)
-                    stats["errors"].append(error_msg)
-
-            # Delete expired database records
-            # Delete in correct order (children first)
-            
-            # 1. Images
-            stmt = delete(TmpProductImage).where(TmpProductImage.expires_at < now)
-            result = await db.execute(stmt)
-            stats["images_deleted"] = result.rowcount
-
-            # 2. Variations
-            stmt = delete(TmpProductVariation).where(TmpProductVariation.expires_at < now)
-            result = await db.execute(stmt)
-            stats["variations_deleted"] = result.rowcount
-
-            # 3. Products
-            stmt = delete(TmpChair).where(TmpChair.expires_at < now)
-            result = await db.execute(stmt)
-            stats["products_deleted"] = result.rowcount
-
-            # 4. Families
-            stmt = delete(TmpProductFamily).where(TmpProductFamily.expires_at < now)
-            result = await db.execute(stmt)
-            stats["families_deleted"] = result.rowcount
-
-            # 5. Uploads
-            stats["uploads_deleted"] = len(expired_uploads)
-            for upload in expired_uploads:
-                db.delete(upload)
-
-            await db.commit()
+            while phase < len(EXPIRED_PHASES):
+                model, key = EXPIRED_PHASES[phase]
+                if model is CatalogUpload:
+                    count = await self._delete_expired_uploads(db, now, stats)
+                else:
+                    count = await self._delete_expired_rows(db, model, now)
+                stats[key] += count
+                if count < self.batch_size:
+                    phase += 1
+                await save(db, {"phase": phase, "stats": stats})
 
             logger.info(f"Cleanup completed: {stats}")
             return stats
@@ -134,86 +237,117 @@ class CleanupService:
             if close_db:
                 await db.close()
 
-    async def cleanup_orphaned_files(self) -> Dict:
+    async def cleanup_orphaned_files(
+        self,
+        checkpoint: Optional[Dict] = None,
+        save_checkpoint: Optional[SaveCheckpoint] = None,
+    ) -> Dict:
         """
         Clean up orphaned files (files without corresponding DB records)
-        
+
+        Upload PDFs, then image directories, are checked in sorted batches;
+        the checkpoint records the last name handled.
+
+        Args:
+            checkpoint: State saved by an interrupted run, to resume from
+            save_checkpoint: Persists the new state after each batch
+
         Returns:
             Dict with cleanup statistics
         """
-        stats = {
+        save = save_checkpoint or _commit
+        state = checkpoint or {}
+        stats = state.get("stats") or {
             "uploads_scanned": 0,
             "images_scanned": 0,
             "orphaned_deleted": 0,
+            "bytes_reclaimed": 0,
             "errors": []
         }
-
-        db = AsyncSessionLocal()
-        try:
-            # Get all upload IDs from database
-            stmt = select(CatalogUpload.upload_id)
-            result = await db.execute(stmt)
-            active_upload_ids = {row[0] for row in result.all()}
-
-            # Check upload files
-            if self.tmp_upload_dir.exists():
-                for file_path in self.tmp_upload_dir.glob("*.pdf"):
-                    stats["uploads_scanned"] += 1
-                    # Extract upload_id from filename (assuming format: {upload_id}_{original_name}.pdf)
-                    upload_id = file_path.stem.split("_")[0]
-                    
-                    if upload_id not in active_upload_ids:
-                        try:
-                            file_path.unlink()
-                            stats["orphaned_deleted"] += 1
-                            logger.info(f"Deleted orphaned file: {file_path}")
-                        except Exception as e:
-                            error_msg = f"Error deleting {file_path}: {e}"
-                            logger.error(error_msg)
-                            stats["errors"].append(error_msg)
-
-            # Check image directories
-            if self.tmp_images_dir.exists():
-                for upload_dir in self.tmp_images_dir.iterdir():
-                    if upload_dir.is_dir():
-                        stats["images_scanned"] += 1
-                        upload_id = upload_dir.name
-                        
-                        if upload_id not in active_upload_ids:
-                            try:
-                                shutil.rmtree(upload_dir)
-                                stats["orphaned_deleted"] += 1
-                                logger.info(f"Deleted orphaned directory: {upload_dir}")
-                            except Exception as e:
-                                error_msg = f"Error deleting {upload_dir}: {e}"
-                                logger.error(error_msg)
-                                stats["errors"].append(error_msg)
-
-            logger.info(f"Orphaned file cleanup completed: {stats}")
-            return stats
-
-        finally:
-            await db.close()
+        stages = (
+            ("uploads", self.tmp_upload_dir, False, "uploads_scanned"),
+            ("images", self.tmp_images_dir, True, "images_scanned"),
+        )
+
+        async with AsyncSessionLocal() as db:
+            for stage, folder, directories, scanned_key in stages:
+                if state.get("done_stages") and stage in state["done_stages"]:
+                    continue
+                after = state.get("after") if state.get("stage") == stage else None
+                names = await asyncio.to_thread(_list_names, folder, directories)
+                if after is not None:
+                    names = [n for n in names if n > after]
+
+                for start in range(0, len(names), self.batch_size):
+                    batch = names[start:start + self.batch_size]
+                    # Upload PDFs are saved as {upload_id}_{original_name}.pdf
+                    ids = {n: (n if directories else Path(n).stem.split("_")[0]) for n in batch}
+                    result = await db.execute(
+                        select(CatalogUpload.upload_id).where(CatalogUpload.upload_id.in_(set(ids.values())))
+                    )
+                    active = set(result.scalars().all())
+                    orphans = [folder / n for n in batch if ids[n] not in active]
+
+                    stats[scanned_key] += len(batch)
+                    deleted = await self._remove_paths(orphans, stats)
+                    stats["orphaned_deleted"] += sum(deleted)
+                    for path, ok in zip(orphans, deleted):
+                        if ok:
+                            logger.info(f"Deleted orphaned {'directory' if directories else 'file'}: {path}")
+
+                    state = {**state, "stage": stage, "after": batch[-1], "stats": stats}
+                    await save(db, state)
+
+                state = {
+                    **state,
+                    "done_stages": [*state.get("done_stages", []), stage],
+                    "stage": None,
+                    "after": None,
+                    "stats": stats,
+                }
+                await save(db, state)
+
+        logger.info(f"Orphaned file cleanup completed: {stats}")
+        return stats
 
 
 # Global instance
 cleanup_service = CleanupService()
 
 
-async def run_cleanup():
+async def run_cleanup(
+    include_orphaned: bool = True,
+    checkpoint: Optional[Dict] = None,
+    save_checkpoint: Optional[SaveCheckpoint] = None,
+) -> Dict:
     """
     Run full cleanup (expired data + orphaned files)
     Can be called from scheduled job or manual trigger
+
+    Args:
+        include_orphaned: Also sweep files without DB records
+        checkpoint: Combined state saved by an interrupted run
+        save_checkpoint: Persists the combined state (e.g. JobQueueService.save_checkpoint)
     """
     logger.info("Starting scheduled cleanup")
-    
-    # Cleanup expired data
-    expired_stats = await cleanup_service.cleanup_expired_data()
-    
-    # Cleanup orphaned files
-    orphaned_stats = await cleanup_service.cleanup_orphaned_files()
-    
-    return {
-        "expired": expired_stats,
-        "orphaned": orphaned_stats
+    state: Dict[str, Any] = dict(checkpoint or {})
+    outer_save = save_checkpoint or _commit
+
+    def _part(key: str) -> SaveCheckpoint:
+        async def _save(db: AsyncSession, part: Dict[str, Any]) -> None:
+            state[key] = part
+            await outer_save(db, state)
+        return _save
+
+    result = {
+        "expired": await cleanup_service.cleanup_expired_data(
+            checkpoint=state.get("expired"), save_checkpoint=_part("expired")
+        )
     }
+    if include_orphaned:
+        result["orphaned"] = await cleanup_service.cleanup_orphaned_files(
+            checkpoint=state.get("orphaned"), save_checkpoint=_part("orphaned")
+        )
+    result["bytes_reclaimed"] = sum(part["bytes_reclaimed"] for part in result.values())
+    logger.info(f"Cleanup reclaimed {result['bytes_reclaimed']} bytes")
+    return result
@@ -31,6 +31,7 @@ from backend.models.legal import (
     ShippingPolicy,
     WarrantyInformation,
 )
+from backend.services.email_service import template_registry
 from backend.utils.static_content_exporter import export_content_after_update
 
 logger = logging.getLogger(__name__)
@@ -81,6 +82,9 @@ class CMSAdminService:
             await db.commit()
             await db.refresh(settings)
             
+            # Emails render the footer from site settings
+            template_registry.invalidate_site_settings()
+            
             # Export to static file
             settings_dict = {
                 'companyName': settings.company_name,
@@ -1,26 +1,38 @@
 """
 Email Service
 
-Handles email sending with SMTP and template management
+Handles email sending with SMTP and template management.
+
+Templates are compiled once per process by ``EmailTemplateRegistry`` (one
+Jinja ``Environment`` carrying the ``button``/``code``/``image`` helpers) and
+reused until the ``EmailTemplate`` row or ``SiteSettings`` change. Each send
+checks both ``updated_at`` values in a single query, so edits made by other
+workers are picked up; ``update_template``/``create_template`` and
+``CMSAdminService.update_site_settings`` also invalidate the registry
+directly. ``render_bulk``/``send_bulk_email`` resolve a template once for a
+whole batch of recipients.
 """
 
+import asyncio
 import logging
 import smtplib
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from jinja2 import Environment, Template
-from sqlalchemy import select
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.config import settings
 from backend.core.exceptions import ResourceNotFoundError
-from backend.models.content import EmailTemplate
+from backend.models.content import EmailTemplate, SiteSettings
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +40,183 @@ logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).parent
 TEMPLATES_DIR = BASE_DIR / "email_templates"
 
+FALLBACK_BASE_TEMPLATE = """<!DOCTYPE html><html><head><meta charset="UTF-8"><title>{{ subject }}</title></head><body>{{ content|safe }}</body></html>"""
+
+# Compiled custom subjects/bodies kept per process (admin test sends, overrides)
+ADHOC_TEMPLATE_CACHE_SIZE = 256
+
+
+def _button(url: str, text: str, style: str = 'primary') -> str:
+    """Generate button HTML with absolute URL"""
+    # Ensure URL is absolute
+    absolute_url = EmailService._ensure_absolute_url(url)
+    
+    style_class = 'button' if style == 'primary' else 'button button-secondary'
+    bg_color = "#8b7355" if style == "primary" else "#d4c5b0"
+    text_color = "#ffffff" if style == "primary" else "#2c2c2c"
+    return f'<div class="button-container"><a href="{absolute_url}" class="{style_class}" style="display: inline-block; padding: 14px 32px; background-color: {bg_color}; color: {text_color}; text-decoration: none; border-radius: 6px; font-size: 16px; font-weight: 500; max-width: 100%; box-sizing: border-box;">{text}</a></div>'
+
+
+def _code(value: str) -> str:
+    """Generate verification code HTML"""
+    return f'<div class="code-container"><div class="verification-code" style="display: inline-block; padding: 20px 40px; background-color: #f8f6f3; border: 2px dashed #d4c5b0; border-radius: 8px; font-size: 32px; font-weight: 600; letter-spacing: 8px; color: #2c2c2c; font-family: \'Courier New\', monospace;">{value}</div></div>'
+
+
+def _image(url: str, alt: str = '') -> str:
+    """Generate image HTML with absolute URL"""
+    # Ensure URL is absolute
+    absolute_url = EmailService._ensure_absolute_url(url)
+    return f'<img src="{absolute_url}" alt="{alt}" class="content-image" style="max-width: 100%; height: auto; border-radius: 6px; margin: 20px 0; display: block;">'
+
+
+@dataclass(frozen=True)
+class CompiledEmailTemplate:
+    """Compiled subject and body of one template type"""
+
+    template_type: str
+    version: Optional[datetime]  # EmailTemplate.updated_at; None for built-in defaults
+    subject: Template
+    body: Template
+
+    @property
+    def is_default(self) -> bool:
+        return self.version is None
+
+
+@dataclass(frozen=True)
+class SiteContext:
+    """Base template variables derived from one version of SiteSettings"""
+
+    version: Optional[datetime]
+    values: Dict[str, Any]
+
+
+@dataclass
+class BulkSendResult:
+    """Recipients of a bulk send, by outcome"""
+
+    sent: List[str] = field(default_factory=list)
+    refused: List[str] = field(default_factory=list)  # rejected by the server
+    unsent: List[str] = field(default_factory=list)  # not attempted (no connection, or it failed mid-batch)
+
+
+class EmailTemplateRegistry:
+    """
+    Process-wide cache of compiled email templates
+    
+    Compiled templates are keyed by template type and ``updated_at`` and the
+    site context by ``SiteSettings.updated_at``; ``resolve`` reloads either
+    one only when its timestamp moved.
+    """
+
+    def __init__(self, templates_dir: Path):
+        self.env = Environment(loader=FileSystemLoader(str(templates_dir)), auto_reload=False)
+        self.env.globals.update(button=_button, code=_code, image=_image)
+        self._templates: Dict[str, CompiledEmailTemplate] = {}
+        self._site: Optional[SiteContext] = None
+        self._base: Optional[Template] = None
+        self._adhoc: "OrderedDict[str, Template]" = OrderedDict()
+
+    @property
+    def base(self) -> Template:
+        """The compiled base.html layout"""
+        if self._base is None:
+            try:
+                self._base = self.env.get_template("base.html")
+            except TemplateNotFound:
+                logger.warning(f"Base template not found in {TEMPLATES_DIR}, using fallback")
+                self._base = self.env.from_string(FALLBACK_BASE_TEMPLATE)
+        return self._base
+
+    def compile(self, source: str) -> Template:
+        """Compile an ad-hoc template string, reusing recent compilations"""
+        template = self._adhoc.get(source)
+        if template is not None:
+            self._adhoc.move_to_end(source)
+            return template
+        template = self.env.from_string(source)
+        self._adhoc[source] = template
+        if len(self._adhoc) > ADHOC_TEMPLATE_CACHE_SIZE:
+            self._adhoc.popitem(last=False)
+        return template
+
+    async def resolve(
+        self,
+        db: AsyncSession,
+        template_type: str
+    ) -> Tuple[Optional[CompiledEmailTemplate], SiteContext]:
+        """
+        Compiled template and site context for a send
+        
+        Args:
+            db: Database session
+            template_type: Type of template to use
+            
+        Returns:
+            The compiled template (None if the type is neither in the database
+            nor a default) and the current site context
+        """
+        template_version = select(EmailTemplate.updated_at).where(
+            EmailTemplate.template_type == template_type,
+            EmailTemplate.is_active.is_(True)
+        ).scalar_subquery()
+        site_version = select(SiteSettings.updated_at).limit(1).scalar_subquery()
+        template_updated, site_updated = (
+            await db.execute(select(template_version, site_version))
+        ).one()
+
+        compiled = self._templates.get(template_type)
+        if compiled is None or compiled.version != template_updated:
+            compiled = await self._load_template(db, template_type, template_updated)
+
+        site = self._site
+        if site is None or site.version != site_updated:
+            site_settings = await EmailService._get_site_settings(db)
+            site = self._site = SiteContext(site_updated, EmailService._site_context(site_settings))
+
+        return compiled, site
+
+    async def _load_template(
+        self,
+        db: AsyncSession,
+        template_type: str,
+        version: Optional[datetime]
+    ) -> Optional[CompiledEmailTemplate]:
+        db_template = await EmailService.get_template(db, template_type) if version is not None else None
+        if db_template:
+            compiled = CompiledEmailTemplate(
+                template_type,
+                db_template.updated_at,
+                self.env.from_string(str(db_template.subject)),
+                self.env.from_string(str(db_template.body)),
+            )
+        elif template_type in EmailService.DEFAULT_TEMPLATES:
+            default = EmailService.DEFAULT_TEMPLATES[template_type]
+            compiled = CompiledEmailTemplate(
+                template_type,
+                None,
+                self.env.from_string(default['subject']),
+                self.env.from_string(default['body']),
+            )
+        else:
+            self._templates.pop(template_type, None)
+            return None
+
+        self._templates[template_type] = compiled
+        logger.debug(f"Compiled email template {template_type}")
+        return compiled
+
+    def invalidate_template(self, template_type: Optional[str] = None) -> None:
+        """Drop one compiled template type, or all of them"""
+        if template_type is None:
+            self._templates.clear()
+        else:
+            self._templates.pop(template_type, None)
+
+    def invalidate_site_settings(self) -> None:
+        """Drop the cached site context; it is reloaded on the next send"""
+        self._site = None
+
 
 class EmailService:
     """Service for sending emails with template support"""
@@ -258,6 +447,7 @@ class EmailService:
         db.add(template)
         await db.commit()
         await db.refresh(template)
+        template_registry.invalidate_template(template_type)
         logger.info(f"Created email template: {template_type}")
         return template
     
@@ -276,12 +466,15 @@ class EmailService:
         if not template:
             raise ResourceNotFoundError(resource_type="Email Template", resource_id=template_id)
         
+        previous_type = template.template_type
         for key, value in updates.items():
             if hasattr(template, key):
                 setattr(template, key, value)
         
         await db.commit()
         await db.refresh(template)
+        template_registry.invalidate_template(previous_type)
+        template_registry.invalidate_template(template.template_type)
         logger.info(f"Updated email template {template_id}")
         return template
     
@@ -301,23 +494,9 @@ class EmailService:
         result = await db.execute(query)
         return list(result.scalars().all())
     
-    @staticmethod
-    def _load_base_template() -> str:
-        """Load the base email template"""
-        base_template_path = TEMPLATES_DIR / "base.html"
-        if base_template_path.exists():
-            return base_template_path.read_text(encoding='utf-8')
-        else:
-            logger.warning(f"Base template not found at {base_template_path}, using fallback")
-            return """<!DOCTYPE html><html><head><meta charset="UTF-8"><title>{{ subject }}</title></head><body>{{ content|safe }}</body></html>"""
-    
     @staticmethod
     async def _get_site_settings(db: AsyncSession) -> Dict[str, Any]:
         """Get site settings from database"""
-        from sqlalchemy import select
-
-        from backend.models.content import SiteSettings
-        
         result = await db.execute(select(SiteSettings).limit(1))
         site_settings = result.scalar_one_or_none()
         
@@ -360,25 +539,13 @@ class EmailService:
         }
     
     @staticmethod
-    async def _render_with_base_template(
-        content: str, 
-        context: Dict[str, Any], 
-        db: AsyncSession
-    ) -> str:
+    def _site_context(site_settings: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Wrap content in base email template
+        Base template variables derived from site settings
         
         Args:
-            content: Inner HTML content
-            context: Template context (will be merged with base template context)
-            db: Database session for fetching site settings
+            site_settings: Result of ``_get_site_settings``
         """
-        base_template_html = EmailService._load_base_template()
-        base_template = Template(base_template_html)
-        
-        # Get site settings from database
-        site_settings = await EmailService._get_site_settings(db)
-        
         # Build address string
         address_parts = []
         if site_settings.get('address_line1'):
@@ -398,19 +565,11 @@ class EmailService:
             address_parts.append(site_settings['country'])
         
         address_string = ' | '.join(address_parts) if address_parts else None
+        logo_url = site_settings.get('logo_url')
         
-        # Merge context with base template defaults
-        # Ensure URLs are absolute
-        logo_url = context.get('logo_url') or site_settings.get('logo_url')
-        unsubscribe_url = context.get('unsubscribe_url')
-        
-        base_context = {
-            'content': content,
-            'subject': context.get('subject', site_settings.get('company_name', 'EagleChair')),
-            'frontend_url': settings.FRONTEND_URL,
-            'current_year': datetime.now().year,
+        return {
             'logo_url': EmailService._ensure_absolute_url(logo_url) if logo_url else None,
-            'unsubscribe_url': EmailService._ensure_absolute_url(unsubscribe_url) if unsubscribe_url else None,
+            'unsubscribe_url': None,
             'site_company_name': site_settings.get('company_name', 'EagleChair'),
             'company_tagline': site_settings.get('company_tagline', 'Premium Office Furniture'),
             'primary_email': site_settings.get('primary_email'),
@@ -420,10 +579,142 @@ class EmailService:
             'support_email': site_settings.get('support_email'),
             'support_phone': site_settings.get('support_phone'),
             'address_string': address_string,
-            **context  # Allow context to override defaults
         }
+    
+    @staticmethod
+    def _render(
+        subject_template: Template,
+        body_template: Template,
+        site: SiteContext,
+        context: Dict[str, Any],
+        current_year: int
+    ) -> Tuple[str, str]:
+        """
+        Render subject and body, wrapping the body in the base template
+        
+        Args:
+            subject_template: Compiled subject
+            body_template: Compiled body (helper functions available)
+            site: Site context from the registry
+            context: Variables for template rendering; they override the
+                base template defaults (``logo_url``/``unsubscribe_url`` are
+                made absolute)
+            current_year: Year shown in the footer
+            
+        Returns:
+            Tuple of (subject, html)
+        """
+        subject = subject_template.render(context)
+        content = body_template.render(context)
+        urls = {
+            key: EmailService._ensure_absolute_url(context[key])
+            for key in ('logo_url', 'unsubscribe_url')
+            if context.get(key)
+        }
+        html = template_registry.base.render({
+            'frontend_url': settings.FRONTEND_URL,
+            'current_year': current_year,
+            **site.values,
+            **context,
+            **urls,
+            'content': content,
+            'subject': subject,
+        })
+        return subject, html
+    
+    @staticmethod
+    async def render_email(
+        db: AsyncSession,
+        template_type: str,
+        context: Dict[str, Any],
+        custom_subject: Optional[str] = None,
+        custom_body: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Render one email without sending it
         
-        return base_template.render(**base_context)
+        Args:
+            db: Database session
+            template_type: Type of template to use
+            context: Variables for template rendering
+            custom_subject: Override template subject
+            custom_body: Override template body
+            
+        Returns:
+            Tuple of (subject, html)
+            
+        Raises:
+            ResourceNotFoundError: If the template type does not exist
+        """
+        rendered, _ = await EmailService._render_many(
+            db, template_type, [context], custom_subject, custom_body
+        )
+        return rendered[0]
+    
+    @staticmethod
+    async def render_bulk(
+        db: AsyncSession,
+        template_type: str,
+        contexts: List[Dict[str, Any]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Render one template for many recipients
+        
+        The template and site settings are resolved once for the batch, so
+        cost per message is just the Jinja render.
+        
+        Args:
+            db: Database session
+            template_type: Type of template to use
+            contexts: One context per message
+            
+        Returns:
+            (subject, html) tuples in the order of ``contexts``
+            
+        Raises:
+            ResourceNotFoundError: If the template type does not exist
+        """
+        rendered, _ = await EmailService._render_many(db, template_type, contexts)
+        return rendered
+    
+    @staticmethod
+    async def _render_many(
+        db: AsyncSession,
+        template_type: str,
+        contexts: List[Dict[str, Any]],
+        custom_subject: Optional[str] = None,
+        custom_body: Optional[str] = None
+    ) -> Tuple[List[Tuple[str, str]], CompiledEmailTemplate]:
+        compiled, site = await template_registry.resolve(db, template_type)
+        if compiled is None:
+            raise ResourceNotFoundError(resource_type="Email Template", resource_id=template_type)
+        
+        # Override with custom content if provided
+        subject_template = template_registry.compile(custom_subject) if custom_subject else compiled.subject
+        body_template = template_registry.compile(custom_body) if custom_body else compiled.body
+        
+        current_year = datetime.now().year
+        rendered = [
+            EmailService._render(subject_template, body_template, site, context, current_year)
+            for context in contexts
+        ]
+        return rendered, compiled
+    
+    @staticmethod
+    async def _record_sent(db: AsyncSession, compiled: CompiledEmailTemplate, count: int) -> None:
+        """Update template usage tracking without bumping ``updated_at`` (the registry's cache key)"""
+        if compiled.is_default or count <= 0:
+            return
+        await db.execute(
+            update(EmailTemplate)
+            .where(EmailTemplate.template_type == compiled.template_type)
+            .values(
+                times_sent=EmailTemplate.times_sent + count,
+                last_sent_at=datetime.utcnow(),
+                updated_at=EmailTemplate.updated_at,
+            )
+        )
+        await db.commit()
     
     @staticmethod
     def _ensure_absolute_url(url: str) -> str:
@@ -493,34 +784,7 @@ class EmailService:
         - {{ code(value) }}
         - {{ image(url, alt) }}
         """
-        # Create Jinja2 environment with custom functions
-        env = Environment()
-        
-        def button(url: str, text: str, style: str = 'primary') -> str:
-            """Generate button HTML with absolute URL"""
-            # Ensure URL is absolute
-            absolute_url = EmailService._ensure_absolute_url(url)
-            
-            style_class = 'button' if style == 'primary' else 'button button-secondary'
-            bg_color = "#8b7355" if style == "primary" else "#d4c5b0"
-            text_color = "#ffffff" if style == "primary" else "#2c2c2c"
-            return f'<div class="button-container"><a href="{absolute_url}" class="{style_class}" style="display: inline-block; padding: 14px 32px; background-color: {bg_color}; color: {text_color}; text-decoration: none; border-radius: 6px; font-size: 16px; font-weight: 500; max-width: 100%; box-sizing: border-box;">{text}</a></div>'
-        
-        def code(value: str) -> str:
-            """Generate verification code HTML"""
-            return f'<div class="code-container"><div class="verification-code" style="display: inline-block; padding: 20px 40px; background-color: #f8f6f3; border: 2px dashed #d4c5b0; border-radius: 8px; font-size: 32px; font-weight: 600; letter-spacing: 8px; color: #2c2c2c; font-family: \'Courier New\', monospace;">{value}</div></div>'
-        
-        def image(url: str, alt: str = '') -> str:
-            """Generate image HTML with absolute URL"""
-            # Ensure URL is absolute
-            absolute_url = EmailService._ensure_absolute_url(url)
-            return f'<img src="{absolute_url}" alt="{alt}" class="content-image" style="max-width: 100%; height: auto; border-radius: 6px; margin: 20px 0; display: block;">'
-        
-        env.globals['button'] = button
-        env.globals['code'] = code
-        env.globals['image'] = image
-        
-        return env.from_string(template_string)
+        return template_registry.compile(template_string)
     
     @staticmethod
     async def send_email(
@@ -549,63 +813,15 @@ class EmailService:
             custom_body: Override template body
         """
         try:
-            # Get template from database or use default
-            db_template = await EmailService.get_template(db, template_type)
-            
-            if db_template:
-                subject_template = Template(str(db_template.subject))
-                body_template_str = str(db_template.body)
-            elif template_type in EmailService.DEFAULT_TEMPLATES:
-                default = EmailService.DEFAULT_TEMPLATES[template_type]
-                subject_template = Template(default['subject'])
-                body_template_str = default['body']
-            else:
+            try:
+                [(subject, body)], compiled = await EmailService._render_many(
+                    db, template_type, [context], custom_subject, custom_body
+                )
+            except ResourceNotFoundError:
                 logger.error(f"Email template not found: {template_type}")
                 return False
             
-            # Override with custom content if provided
-            if custom_subject:
-                subject_template = Template(custom_subject)
-            if custom_body:
-                body_template_str = custom_body
-            
-            # Create body template with helper functions available
-            body_template = EmailService._create_template_with_helpers(body_template_str)
-            
-            # Render subject
-            subject = subject_template.render(**context)
-            
-            # Render body with helper functions (now available in template)
-            body_content = body_template.render(**context)
-            
-            # Wrap in base template
-            body = await EmailService._render_with_base_template(body_content, {**context, 'subject': subject}, db)
-            
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL}>"
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            if cc:
-                msg['Cc'] = ', '.join(cc)
-            if bcc:
-                msg['Bcc'] = ', '.join(bcc)
-            
-            # Attach body
-            msg.attach(MIMEText(body, 'html'))
-            
-            # Attach files if provided
-            if attachments:
-                for attachment in attachments:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment['content'])
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        'Content-Disposition',
-                        f"attachment; filename= {attachment['filename']}"
-                    )
-                    msg.attach(part)
+            msg = EmailService._build_message(to_email, subject, body, cc, bcc, attachments)
             
             # Validate SMTP configuration before attempting to send
             if not settings.SMTP_HOST or not settings.SMTP_USER or not settings.SMTP_PASSWORD:
@@ -615,20 +831,11 @@ class EmailService:
             # Get authenticated SMTP connection
             server = EmailService._get_smtp_connection()
             
-            recipients = [to_email]
-            if cc:
-                recipients.extend(cc)
-            if bcc:
-                recipients.extend(bcc)
-            
             server.send_message(msg)
             server.quit()
             
             # Update template usage tracking
-            if db_template:
-                db_template.times_sent += 1
-                db_template.last_sent_at = datetime.utcnow()
-                await db.commit()
+            await EmailService._record_sent(db, compiled, 1)
             
             logger.info(f"Email sent to {to_email} using template {template_type}")
             return True
@@ -637,6 +844,129 @@ class EmailService:
             logger.error(f"Failed to send email: {e}", exc_info=True)
             return False
     
+    @staticmethod
+    def _build_message(
+        to_email: str,
+        subject: str,
+        body: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        attachments: Optional[List[Dict[str, Any]]] = None
+    ) -> MIMEMultipart:
+        """Build the MIME message for a rendered email"""
+        msg = MIMEMultipart()
+        msg['From'] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL}>"
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        if cc:
+            msg['Cc'] = ', '.join(cc)
+        if bcc:
+            msg['Bcc'] = ', '.join(bcc)
+        
+        # Attach body
+        msg.attach(MIMEText(body, 'html'))
+        
+        # Attach files if provided
+        if attachments:
+            for attachment in attachments:
+                part = MIMEBase('application', 'octet-stream')
+                part.set_payload(attachment['content'])
+                encoders.encode_base64(part)
+                part.add_header(
+                    'Content-Disposition',
+                    f"attachment; filename= {attachment['filename']}"
+                )
+                msg.attach(part)
+        
+        return msg
+    
+    @staticmethod
+    def _send_messages(messages: List[MIMEMultipart]) -> BulkSendResult:
+        """
+        Send messages over one SMTP connection (blocking)
+        
+        A message refused by the server is logged and skipped. Any other SMTP
+        or network error ends the batch; that message and the rest are
+        returned as unsent.
+        """
+        result = BulkSendResult()
+        try:
+            server = EmailService._get_smtp_connection()
+        except (smtplib.SMTPException, OSError) as e:
+            logger.error(f"SMTP connection failed: {e}", exc_info=True)
+            result.unsent = [msg['To'] for msg in messages]
+            return result
+        try:
+            for i, msg in enumerate(messages):
+                try:
+                    server.send_message(msg)
+                    result.sent.append(msg['To'])
+                except smtplib.SMTPRecipientsRefused as e:
+                    logger.warning(f"Recipient refused for {msg['To']}: {e}")
+                    result.refused.append(msg['To'])
+                except (smtplib.SMTPException, OSError) as e:
+                    logger.error(
+                        f"SMTP error after {len(result.sent)} of {len(messages)} messages: {e}",
+                        exc_info=True
+                    )
+                    result.unsent = [m['To'] for m in messages[i:]]
+                    break
+        finally:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+        return result
+    
+    @staticmethod
+    async def send_bulk_email(
+        db: AsyncSession,
+        template_type: str,
+        recipients: List[Tuple[str, Dict[str, Any]]]
+    ) -> BulkSendResult:
+        """
+        Send one template to many recipients
+        
+        Renders the whole batch against a single template/site-settings
+        lookup, then sends it over one SMTP connection in a worker thread.
+        Usage tracking counts the messages actually sent, also when the
+        batch stops part-way.
+        
+        Args:
+            db: Database session
+            template_type: Type of template to use
+            recipients: (to_email, context) pairs
+            
+        Returns:
+            BulkSendResult (everything unsent if the template or SMTP
+            configuration is missing)
+        """
+        if not recipients:
+            return BulkSendResult()
+        
+        try:
+            rendered, compiled = await EmailService._render_many(
+                db, template_type, [context for _, context in recipients]
+            )
+        except ResourceNotFoundError:
+            logger.error(f"Email template not found: {template_type}")
+            return BulkSendResult(unsent=[to_email for to_email, _ in recipients])
+        
+        if not settings.SMTP_HOST or not settings.SMTP_USER or not settings.SMTP_PASSWORD:
+            logger.error("SMTP not properly configured. SMTP_HOST, SMTP_USER, and SMTP_PASSWORD are required.")
+            return BulkSendResult(unsent=[to_email for to_email, _ in recipients])
+        
+        messages = [
+            EmailService._build_message(to_email, subject, body)
+            for (to_email, _), (subject, body) in zip(recipients, rendered)
+        ]
+        result = await asyncio.to_thread(EmailService._send_messages, messages)
+        
+        await EmailService._record_sent(db, compiled, len(result.sent))
+        logger.info(f"Sent {len(result.sent)}/{len(messages)} emails using template {template_type}")
+        return result
+    
     @staticmethod
     async def send_welcome_email(
         db: AsyncSession,
@@ -852,6 +1182,35 @@ class EmailService:
             context=context
         )
     
+    @staticmethod
+    async def send_company_invites(
+        db: AsyncSession,
+        invites: List[Tuple[str, str]],
+        registration_url: str,
+        inviter_name: Optional[str] = None
+    ) -> BulkSendResult:
+        """
+        Send company invitation emails in bulk
+        
+        Args:
+            db: Database session
+            invites: (to_email, company_name) pairs
+            registration_url: Registration page URL
+            inviter_name: Name shown as the inviter
+            
+        Returns:
+            BulkSendResult
+        """
+        registration_url = EmailService._ensure_absolute_url(registration_url)
+        recipients = []
+        for to_email, company_name in invites:
+            context = {'company_name': company_name, 'registration_url': registration_url}
+            if inviter_name:
+                context['inviter_name'] = inviter_name
+            recipients.append((to_email, context))
+        
+        return await EmailService.send_bulk_email(db, 'company_invite', recipients)
+    
     @staticmethod
     async def send_custom_email(
         db: AsyncSession,
@@ -876,3 +1235,5 @@ class EmailService:
             attachments=attachments
         )
 
+
+template_registry = EmailTemplateRegistry(TEMPLATES_DIR)
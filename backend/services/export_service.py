@@ -0,0 +1,339 @@
+"""
+Export Service
+
+Streams admin reports (quotes, companies, products) as CSV, or as Parquet
+when pyarrow is installed, without paging or ORM hydration.
+
+Each export selects a fixed column projection, applies the same filters as
+the admin list endpoints (``AdminService.*_filters``) and is read with a
+server-side cursor (``yield_per``) in batches of ``EXPORT_BATCH_SIZE`` rows.
+Every batch is encoded and handed to the response before the next one is
+fetched, so memory stays flat regardless of the row count.
+"""
+
+import csv
+import enum
+import io
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import asc, desc, func, select
+from sqlalchemy.sql import Select
+
+from backend.core.exceptions import ValidationError
+from backend.database.base import AsyncSessionLocal
+from backend.models.chair import Category, Chair
+from backend.models.company import Company
+from backend.models.quote import Quote, QuoteItem
+from backend.services.admin_service import AdminService
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 5000
+# Rows buffered per Parquet row group
+PARQUET_ROW_GROUP_ROWS = 50000
+
+FORMAT_CSV = "csv"
+FORMAT_PARQUET = "parquet"
+
+MEDIA_TYPES = {
+    FORMAT_CSV: "text/csv; charset=utf-8",
+    FORMAT_PARQUET: "application/vnd.apache.parquet",
+}
+
+# (column name, SQL expression, kind) - kind picks the Parquet type
+ExportColumn = Tuple[str, Any, str]
+
+
+def _load_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def available_formats() -> List[str]:
+    """Formats supported by this installation"""
+    return [FORMAT_CSV, FORMAT_PARQUET] if _load_pyarrow() else [FORMAT_CSV]
+
+
+def _order_by(columns: Sequence[ExportColumn], sort_by: Optional[str], sort_dir: Optional[str],
+              aliases: Optional[Dict[str, List[str]]] = None) -> List[Any]:
+    """Sort by exported column names (or aliases for several columns)"""
+    direction = desc if (sort_dir or "asc").lower() == "desc" else asc
+    by_name = {name: expr for name, expr, _ in columns}
+    names = (aliases or {}).get(sort_by) or ([sort_by] if sort_by in by_name else [])
+    if not names:
+        return [desc(by_name["created_at"]), desc(by_name["id"])]
+    return [direction(by_name[name]) for name in names] + [direction(by_name["id"])]
+
+
+def _quote_columns() -> Tuple[List[ExportColumn], Any]:
+    items = (
+        select(QuoteItem.quote_id, func.count(QuoteItem.id).label("items_count"))
+        .group_by(QuoteItem.quote_id)
+        .subquery()
+    )
+    return [
+        ("id", Quote.id, "int"),
+        ("quote_number", Quote.quote_number, "str"),
+        ("status", Quote.status, "str"),
+        ("company_id", Quote.company_id, "int"),
+        ("company_name", func.coalesce(Company.company_name, "Guest"), "str"),
+        ("contact_name", Quote.contact_name, "str"),
+        ("contact_email", Quote.contact_email, "str"),
+        ("contact_phone", Quote.contact_phone, "str"),
+        ("project_name", Quote.project_name, "str"),
+        ("project_type", Quote.project_type, "str"),
+        ("items_count", func.coalesce(items.c.items_count, 0), "int"),
+        ("subtotal", Quote.subtotal, "int"),
+        ("tax_amount", Quote.tax_amount, "int"),
+        ("shipping_cost", Quote.shipping_cost, "int"),
+        ("discount_amount", Quote.discount_amount, "int"),
+        ("total_amount", Quote.total_amount, "int"),
+        ("quoted_price", Quote.quoted_price, "int"),
+        ("submitted_at", Quote.submitted_at, "str"),
+        ("quoted_at", Quote.quoted_at, "str"),
+        ("accepted_at", Quote.accepted_at, "str"),
+        ("created_at", Quote.created_at, "datetime"),
+    ], items
+
+
+def quotes_export(status=None, company_id=None, sort_by=None, sort_dir=None) -> Tuple[List[ExportColumn], Select]:
+    """Quote export projection with the admin quote list filters"""
+    columns, items = _quote_columns()
+    stmt = (
+        select(*(expr.label(name) for name, expr, _ in columns))
+        .select_from(Quote)
+        .outerjoin(Company, Quote.company_id == Company.id)
+        .outerjoin(items, Quote.id == items.c.quote_id)
+        .where(*AdminService.quote_filters(status, company_id))
+        .order_by(*_order_by(columns, sort_by, sort_dir))
+    )
+    return columns, stmt
+
+
+def companies_export(search=None, status=None, sort_by=None, sort_dir=None) -> Tuple[List[ExportColumn], Select]:
+    """Company export projection with the admin company list filters"""
+    columns: List[ExportColumn] = [
+        ("id", Company.id, "int"),
+        ("company_name", Company.company_name, "str"),
+        ("legal_name", Company.legal_name, "str"),
+        ("industry", Company.industry, "str"),
+        ("rep_first_name", Company.rep_first_name, "str"),
+        ("rep_last_name", Company.rep_last_name, "str"),
+        ("rep_email", Company.rep_email, "str"),
+        ("rep_phone", Company.rep_phone, "str"),
+        ("billing_city", Company.billing_city, "str"),
+        ("billing_state", Company.billing_state, "str"),
+        ("billing_country", Company.billing_country, "str"),
+        ("status", Company.status, "str"),
+        ("is_verified", Company.is_verified, "bool"),
+        ("is_active", Company.is_active, "bool"),
+        ("pricing_tier_id", Company.pricing_tier_id, "int"),
+        ("credit_limit", Company.credit_limit, "int"),
+        ("payment_terms", Company.payment_terms, "str"),
+        ("created_at", Company.created_at, "datetime"),
+    ]
+    stmt = (
+        select(*(expr.label(name) for name, expr, _ in columns))
+        .where(*AdminService.company_filters(search, status))
+        .order_by(*_order_by(columns, sort_by, sort_dir, {"contact": ["rep_last_name", "rep_first_name"]}))
+    )
+    return columns, stmt
+
+
+def products_export(search=None, category_id=None, is_active=None, sort_by=None,
+                    sort_dir=None) -> Tuple[List[ExportColumn], Select]:
+    """Product export projection with the admin product list filters"""
+    columns: List[ExportColumn] = [
+        ("id", Chair.id, "int"),
+        ("model_number", Chair.model_number, "str"),
+        ("model_suffix", Chair.model_suffix, "str"),
+        ("name", Chair.name, "str"),
+        ("slug", Chair.slug, "str"),
+        ("category", Category.name, "str"),
+        ("family_id", Chair.family_id, "int"),
+        ("base_price", Chair.base_price, "int"),
+        ("msrp", Chair.msrp, "int"),
+        ("is_active", Chair.is_active, "bool"),
+        ("view_count", Chair.view_count, "int"),
+        ("quote_count", Chair.quote_count, "int"),
+        ("created_at", Chair.created_at, "datetime"),
+        ("updated_at", Chair.updated_at, "datetime"),
+    ]
+    stmt = (
+        select(*(expr.label(name) for name, expr, _ in columns))
+        .select_from(Chair)
+        .outerjoin(Category, Chair.category_id == Category.id)
+        .where(*AdminService.product_filters(search, category_id, is_active))
+        .order_by(*_order_by(columns, sort_by, sort_dir))
+    )
+    return columns, stmt
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    value = _plain(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back in chunks"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def writable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ExportService:
+    """Stream admin report exports"""
+
+    @staticmethod
+    def check_format(fmt: str) -> None:
+        """
+        Reject unknown formats, and Parquet when pyarrow is not installed
+
+        Raises:
+            ValidationError: Format not available
+        """
+        if fmt not in available_formats():
+            raise ValidationError(
+                f"Export format '{fmt}' is not available",
+                details={"available_formats": available_formats()},
+            )
+
+    @staticmethod
+    async def _batches(stmt: Select, batch_size: int) -> AsyncIterator[Sequence[Any]]:
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(stmt.execution_options(yield_per=batch_size))
+            async for rows in result.partitions():
+                yield rows
+
+    @staticmethod
+    async def stream_csv(columns: Sequence[ExportColumn], stmt: Select,
+                         batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+        """Yield the export as CSV, one encoded chunk per batch"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([name for name, _, _ in columns])
+        yield buffer.getvalue().encode("utf-8")
+
+        async for rows in ExportService._batches(stmt, batch_size):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(v) for v in row] for row in rows)
+            yield buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    async def stream_parquet(columns: Sequence[ExportColumn], stmt: Select,
+                             batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+        """Yield the export as a Parquet file, one chunk per row group"""
+        pa = _load_pyarrow()
+        import pyarrow.parquet as pq
+
+        types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+            "str": pa.string(),
+            "datetime": pa.timestamp("us"),
+        }
+        schema = pa.schema([(name, types[kind]) for name, _, kind in columns])
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="zstd")
+
+        def write(pending: List[Sequence[Any]]) -> None:
+            values = list(zip(*pending))
+            arrays = [
+                pa.array([_plain(v) for v in values[i]], type=schema.field(i).type)
+                for i in range(len(columns))
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+        pending: List[Sequence[Any]] = []
+        async for rows in ExportService._batches(stmt, batch_size):
+            pending.extend(rows)
+            if len(pending) >= PARQUET_ROW_GROUP_ROWS:
+                write(pending)
+                pending = []
+                yield sink.drain()
+        if pending:
+            write(pending)
+        writer.close()
+        yield sink.drain()
+
+    @staticmethod
+    async def stream(dataset: str, fmt: str, columns: Sequence[ExportColumn], stmt: Select,
+                     batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+        """
+        Stream an export and log its size and throughput
+
+        Args:
+            dataset: Report name (for logging)
+            fmt: FORMAT_CSV or FORMAT_PARQUET (see check_format)
+            columns: Export columns
+            stmt: Projection built by one of the *_export functions
+            batch_size: Rows fetched per server-side cursor batch
+
+        Yields:
+            Encoded file chunks
+        """
+        encoder = ExportService.stream_parquet if fmt == FORMAT_PARQUET else ExportService.stream_csv
+        started = time.perf_counter()
+        total_bytes = 0
+        async for chunk in encoder(columns, stmt, batch_size):
+            total_bytes += len(chunk)
+            yield chunk
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Exported {dataset} as {fmt}: {total_bytes} bytes in {elapsed:.2f}s "
+            f"({total_bytes / elapsed / 1e6 if elapsed else 0:.1f} MB/s)"
+        )
+
+    @staticmethod
+    def streaming_response(dataset: str, fmt: str, columns: Sequence[ExportColumn],
+                           stmt: Select) -> StreamingResponse:
+        """Attachment response streaming the export (call check_format first)"""
+        filename = f"{dataset}-{datetime.utcnow():%Y%m%d-%H%M%S}.{fmt}"
+        return StreamingResponse(
+            ExportService.stream(dataset, fmt, columns, stmt),
+            media_type=MEDIA_TYPES[fmt],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
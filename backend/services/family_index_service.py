@@ -0,0 +1,300 @@
+"""
+Family Index Service
+
+Precomputed family membership index: family_id -> ordered member rows
+(products and variations) with resolved image URL, SKU and price, plus the
+product-ID set and per-product variation overlay used by
+``ProductService.get_products(family_id=...)``.
+
+Each family's index is built from three column-only statements and held in
+the shared cache. Entries are tagged with every member product, so the
+existing ``cache_service.invalidate_product`` call in admin product and
+variation routes drops every index the product used to belong to; those
+routes then call ``refresh_family_index_for_product`` to rebuild the
+families it belongs to now. Family writes and catalog imports rebuild the
+entries of the families they touch; empty indexes get a short TTL. On the
+per-process memory backend those rebuilds only reach the worker that made
+the write, so entries are kept for ``cache_service.shared_ttl`` there.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.chair import (
+    Category,
+    Chair,
+    ProductFamily,
+    ProductVariation,
+    chair_secondary_families,
+    variation_families,
+)
+
+logger = logging.getLogger(__name__)
+
+FAMILY_INDEX_TTL = 6 * 3600  # Rebuilt by product, variation and family writes
+# Empty families are usually about to be filled by a write that may bypass
+# the refresh hooks (e.g. a bulk SQL import), so they are not trusted for long
+EMPTY_FAMILY_INDEX_TTL = 300
+
+
+def _family_index_key(family_id: int) -> str:
+    return f"eaglechair:family_members:{family_id}"
+
+
+def _variation_image_urls(images) -> Optional[List[str]]:
+    """URLs from a variation's images JSON (strings or {"url": ...} dicts)."""
+    if not images or not isinstance(images, list):
+        return None
+    urls = []
+    for img in images:
+        if isinstance(img, str):
+            urls.append(img)
+        elif isinstance(img, dict) and img.get("url"):
+            urls.append(img["url"])
+    return urls or None
+
+
+def _first_variation_image(row) -> Optional[str]:
+    """Image used when a variation stands in for its product in a listing."""
+    if row.primary_image_url:
+        return row.primary_image_url
+    images = row.images
+    if isinstance(images, list) and images:
+        first = images[0]
+        return first.get("url", first) if isinstance(first, dict) else first
+    return None
+
+
+class FamilyIndexService:
+    """Build, cache and maintain per-family membership indexes"""
+
+    @staticmethod
+    async def build(db: AsyncSession, family_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Build the index for one family and store it in the cache.
+
+        Returns:
+            Index dictionary, or None when the family does not exist
+        """
+        from backend.services.cache_service import cache_service
+
+        exists = await db.execute(
+            select(ProductFamily.id).where(ProductFamily.id == family_id)
+        )
+        if exists.scalar_one_or_none() is None:
+            return None
+
+        # Product-level members: primary family or chair_secondary_families
+        secondary = select(chair_secondary_families.c.chair_id).where(
+            chair_secondary_families.c.family_id == family_id
+        )
+        product_rows = (
+            await db.execute(
+                select(
+                    Chair.id,
+                    Chair.slug,
+                    Chair.name,
+                    Chair.model_number,
+                    Chair.primary_image_url,
+                    Chair.display_order,
+                    Chair.short_description,
+                    Chair.base_price,
+                    Chair.hover_images,
+                    Chair.lead_time_days,
+                    Chair.is_active,
+                    Category.name.label("category_name"),
+                )
+                .outerjoin(Category, Category.id == Chair.category_id)
+                .where(or_(Chair.family_id == family_id, Chair.id.in_(secondary)))
+            )
+        ).all()
+
+        # Variation-level members, with the columns of their parent product
+        variation_rows = (
+            await db.execute(
+                select(
+                    ProductVariation.id,
+                    ProductVariation.product_id,
+                    ProductVariation.name,
+                    ProductVariation.sku,
+                    ProductVariation.primary_image_url,
+                    ProductVariation.images,
+                    ProductVariation.display_order,
+                    ProductVariation.price_adjustment,
+                    ProductVariation.lead_time_days,
+                    ProductVariation.is_available,
+                    Chair.slug.label("product_slug"),
+                    Chair.name.label("product_name"),
+                    Chair.primary_image_url.label("product_image_url"),
+                    Chair.short_description,
+                    Chair.base_price,
+                    Chair.lead_time_days.label("product_lead_time_days"),
+                    Chair.is_active.label("product_is_active"),
+                    Category.name.label("category_name"),
+                )
+                .join(
+                    variation_families,
+                    variation_families.c.variation_id == ProductVariation.id,
+                )
+                .join(Chair, Chair.id == ProductVariation.product_id)
+                .outerjoin(Category, Category.id == Chair.category_id)
+                .where(variation_families.c.family_id == family_id)
+                .order_by(ProductVariation.display_order, ProductVariation.id)
+            )
+        ).all()
+
+        # get_products(family_id=...) filters on every product in the family
+        # (active or not - it applies its own is_active filter) and overlays
+        # the first family variation's id and image on each product.
+        product_ids: Set[int] = {row.id for row in product_rows}
+        variation_overlay: Dict[str, Dict[str, Any]] = {}
+        for row in variation_rows:
+            product_ids.add(row.product_id)
+            key = str(row.product_id)
+            if key not in variation_overlay:
+                variation_overlay[key] = {
+                    "variation_id": row.id,
+                    "image_url": _first_variation_image(row),
+                }
+
+        # Members endpoint: available variations of active products replace
+        # their base product; remaining active products are listed as-is.
+        member_variations = [
+            row for row in variation_rows if row.is_available and row.product_is_active
+        ]
+        product_ids_via_variations = {row.product_id for row in member_variations}
+
+        members = []
+        for p in product_rows:
+            if not p.is_active or p.id in product_ids_via_variations:
+                continue
+            members.append({
+                "type": "product",
+                "id": p.id,
+                "product_id": p.id,
+                "product_slug": p.slug,
+                "name": p.name,
+                "sku": p.model_number or "",
+                "primary_image_url": p.primary_image_url,
+                "variation_id": None,
+                "display_order": p.display_order,
+                "short_description": p.short_description,
+                "base_price": p.base_price,
+                "category": p.category_name,
+                "hover_images": p.hover_images,
+                "lead_time_days": p.lead_time_days,
+            })
+
+        for v in member_variations:
+            primary_image = v.primary_image_url or v.product_image_url
+            var_images = _variation_image_urls(v.images)
+            hover_images = var_images if var_images else ([primary_image] if primary_image else None)
+            members.append({
+                "type": "variation",
+                "id": v.id,
+                "product_id": v.product_id,
+                "product_slug": v.product_slug,
+                "name": v.name if v.name else v.product_name,
+                "sku": v.sku,
+                "primary_image_url": primary_image,
+                "variation_id": v.id,
+                "variation_has_own_image": bool(v.primary_image_url or var_images),
+                "display_order": v.display_order,
+                "short_description": v.short_description,
+                "base_price": (v.base_price or 0) + (v.price_adjustment or 0),
+                "category": v.category_name,
+                "hover_images": hover_images,
+                "lead_time_days": (
+                    v.lead_time_days
+                    if v.lead_time_days is not None
+                    else v.product_lead_time_days
+                ),
+            })
+
+        members.sort(key=lambda m: (m["display_order"] or 0, m["name"] or ""))
+        for member in members:
+            del member["display_order"]
+
+        index = {
+            "family_id": family_id,
+            "members": members,
+            "product_ids": sorted(product_ids),
+            "variation_overlay": variation_overlay,
+        }
+
+        tags = ["family_members", f"family:{family_id}"]
+        tags.extend(f"product:{pid}" for pid in sorted(product_ids))
+        ttl = cache_service.shared_ttl(
+            FAMILY_INDEX_TTL if product_ids else EMPTY_FAMILY_INDEX_TTL
+        )
+        await cache_service.set(_family_index_key(family_id), index, ttl=ttl, tags=tags)
+
+        logger.info(
+            f"Built family index for family {family_id} ({len(members)} members)"
+        )
+        return index
+
+    @staticmethod
+    async def get_index(db: AsyncSession, family_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached index for a family, building it on a miss."""
+        from backend.services.cache_service import cache_service
+
+        index = await cache_service.get(_family_index_key(family_id))
+        if index and "members" in index:
+            return index
+
+        return await FamilyIndexService.build(db, family_id)
+
+    @staticmethod
+    async def get_family_ids_for_product(db: AsyncSession, product_id: int) -> List[int]:
+        """Every family a product currently belongs to, directly or via a variation."""
+        families = union(
+            select(Chair.family_id.label("family_id")).where(
+                Chair.id == product_id, Chair.family_id.is_not(None)
+            ),
+            select(chair_secondary_families.c.family_id).where(
+                chair_secondary_families.c.chair_id == product_id
+            ),
+            select(variation_families.c.family_id)
+            .join(
+                ProductVariation,
+                ProductVariation.id == variation_families.c.variation_id,
+            )
+            .where(ProductVariation.product_id == product_id),
+        ).subquery()
+
+        result = await db.execute(select(families.c.family_id))
+        return sorted({row[0] for row in result.all() if row[0] is not None})
+
+    @staticmethod
+    async def invalidate(family_id: int) -> None:
+        """Drop one family's index; it is rebuilt on the next read."""
+        from backend.services.cache_service import cache_service
+
+        await cache_service.delete(_family_index_key(family_id))
+
+
+async def refresh_family_index(db: AsyncSession, family_id: int) -> None:
+    """Rebuild one family's index after a family write (cache errors are logged)."""
+    try:
+        await FamilyIndexService.invalidate(family_id)
+        await FamilyIndexService.build(db, family_id)
+    except Exception as e:
+        logger.warning(f"Family index refresh failed for family {family_id}: {e}")
+
+
+async def refresh_family_index_for_product(db: AsyncSession, product_id: int) -> None:
+    """
+    Rebuild the indexes of every family a product belongs to after a product
+    or variation write. Call after ``cache_service.invalidate_product``,
+    which drops the indexes of families the product used to belong to.
+    """
+    try:
+        family_ids = await FamilyIndexService.get_family_ids_for_product(db, product_id)
+        for family_id in family_ids:
+            await FamilyIndexService.build(db, family_id)
+    except Exception as e:
+        logger.warning(f"Family index refresh failed for product {product_id}: {e}")
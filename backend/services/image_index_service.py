@@ -0,0 +1,448 @@
+"""
+Image Index Service
+
+Perceptual fingerprints for image files, computed once per file and kept in
+a SQLite index keyed by (path, mtime_ns, size).
+
+A fingerprint holds the image's dimensions, a 64-bit difference hash (dHash)
+and a sharpness score (variance of the Laplacian of a fixed-size grayscale
+copy, so it is comparable across resolutions). The same photo re-encoded,
+resized or converted to WebP lands a few dHash bits away from the original.
+
+The dHash is computed on a grayscale copy, so colour variants of one photo
+(e.g. the same chair in two finishes) match as near-duplicates. Near-
+duplicates are therefore only reported: the admin upload route returns a
+``possible_duplicate`` hint, and the catalog sync scripts use the index to
+pick the best-quality asset per model and to report duplicate and orphaned
+files under ``/uploads`` in one pass (``python -m backend.scripts.image_index``).
+An existing file is reused instead of a new upload only when its bytes are
+identical.
+"""
+
+import io
+import logging
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+HASH_SIZE = 8
+SHARPNESS_SIZE = 512
+DUPLICATE_DISTANCE = 3  # dHash bits out of 64
+ASPECT_TOLERANCE = 0.02
+MAX_QUALITY_PIXELS = 2000 * 2000  # uploads are resized to 2000px anyway
+POOL_MIN_FILES = 8
+SQLITE_MAX_PARAMS = 500
+
+DEFAULT_INDEX_PATH = Path(
+    os.environ.get("IMAGE_INDEX_PATH")
+    or Path(__file__).resolve().parents[2] / ".cache" / "image_index.sqlite"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    dhash TEXT,
+    sharpness REAL
+);
+"""
+
+Source = Union[str, Path, bytes]
+
+
+@dataclass(frozen=True)
+class ImageFingerprint:
+    """Dimensions, perceptual hash and sharpness of one image"""
+
+    path: str
+    width: int
+    height: int
+    dhash: int
+    sharpness: float
+
+    @property
+    def aspect(self) -> float:
+        return self.width / self.height if self.height else 0.0
+
+    @property
+    def quality(self) -> Tuple[int, float]:
+        """Sort key: usable resolution first, then sharpness."""
+        return (min(self.width * self.height, MAX_QUALITY_PIXELS), self.sharpness)
+
+
+@dataclass(frozen=True)
+class DuplicateCheck:
+    """Result of ImageIndexService.check_duplicate"""
+
+    identical: Optional[Path] = None  # existing file with the same bytes
+    similar: Optional[Path] = None  # closest indexed near-duplicate (a hint only)
+    fingerprint: Optional[ImageFingerprint] = None  # of the new image
+    unindexed: int = 0  # files in the folder not yet fingerprinted
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def is_near_duplicate(a: ImageFingerprint, b: ImageFingerprint, distance: int = DUPLICATE_DISTANCE) -> bool:
+    if hamming(a.dhash, b.dhash) > distance:
+        return False
+    return abs(a.aspect - b.aspect) <= ASPECT_TOLERANCE * max(a.aspect, b.aspect, 1e-9)
+
+
+def compute_fingerprint(source: Source, path: str = "") -> ImageFingerprint:
+    """
+    Fingerprint an image file or in-memory image.
+
+    Args:
+        source: File path or image bytes
+        path: Path recorded on the fingerprint (defaults to ``source`` for files)
+
+    Returns:
+        ImageFingerprint; raises if Pillow cannot decode the image
+    """
+    from PIL import Image, ImageFilter, ImageOps, ImageStat
+
+    fh = io.BytesIO(source) if isinstance(source, bytes) else source
+    with Image.open(fh) as img:
+        width, height = img.size
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):  # EXIF orientation: rotated 90/270
+            width, height = height, width
+        img.draft("L", (SHARPNESS_SIZE, SHARPNESS_SIZE))  # JPEG: decode at reduced scale
+        gray = ImageOps.exif_transpose(img).convert("L")
+    gray.thumbnail((SHARPNESS_SIZE, SHARPNESS_SIZE))
+
+    small = list(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS).getdata())
+    dhash = 0
+    for row in range(HASH_SIZE):
+        for col in range(HASH_SIZE):
+            i = row * (HASH_SIZE + 1) + col
+            dhash = (dhash << 1) | (small[i] > small[i + 1])
+
+    laplacian = gray.filter(ImageFilter.Kernel((3, 3), (0, 1, 0, 1, -4, 1, 0, 1, 0), scale=1, offset=128))
+    sharpness = round(ImageStat.Stat(laplacian).var[0], 3)
+
+    return ImageFingerprint(
+        path=path or ("" if isinstance(source, bytes) else str(source)),
+        width=width,
+        height=height,
+        dhash=dhash,
+        sharpness=sharpness,
+    )
+
+
+def _fingerprint_worker(path: str) -> Tuple[str, Optional[ImageFingerprint]]:
+    try:
+        return path, compute_fingerprint(path)
+    except Exception as e:
+        logger.warning("Cannot fingerprint %s: %s", path, e)
+        return path, None
+
+
+def iter_image_files(root: Path) -> Iterable[Path]:
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if Path(name).suffix.lower() in IMAGE_EXTENSIONS:
+                yield Path(dirpath) / name
+
+
+class ImageIndex:
+    """SQLite store of fingerprints, refreshed only for new or changed files."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else DEFAULT_INDEX_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "ImageIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    @staticmethod
+    def _row_to_fingerprint(row) -> Optional[ImageFingerprint]:
+        path, width, height, dhash, sharpness = row
+        if dhash is None:
+            return None
+        return ImageFingerprint(path, width, height, int(dhash, 16), sharpness)
+
+    def put(self, fingerprint: Optional[ImageFingerprint], path: Union[str, Path]) -> None:
+        """Store a fingerprint (None marks the file unreadable) for the file as it is now."""
+        stat = os.stat(path)
+        fp = fingerprint
+        self._conn.execute(
+            "INSERT OR REPLACE INTO images (path, mtime_ns, size, width, height, dhash, sharpness) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(path), stat.st_mtime_ns, stat.st_size,
+                fp.width if fp else None, fp.height if fp else None,
+                f"{fp.dhash:016x}" if fp else None, fp.sharpness if fp else None,
+            ),
+        )
+
+    def stale(self, paths: Iterable[Union[str, Path]]) -> List[str]:
+        """Existing files among ``paths`` that are not indexed or changed since they were."""
+        stale: List[str] = []
+        for path in paths:
+            key = str(path)
+            try:
+                stat = os.stat(key)
+            except FileNotFoundError:
+                continue
+            row = self._conn.execute(
+                "SELECT 1 FROM images WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (key, stat.st_mtime_ns, stat.st_size),
+            ).fetchone()
+            if not row:
+                stale.append(key)
+        return stale
+
+    def update(self, paths: Iterable[Union[str, Path]], workers: Optional[int] = None) -> int:
+        """
+        Fingerprint files that are not indexed or changed since they were.
+
+        Args:
+            paths: Image files
+            workers: Processes for fingerprinting (default: CPU count)
+
+        Returns:
+            Number of files fingerprinted
+        """
+        stale = self.stale(paths)
+        if not stale:
+            return 0
+
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(stale) < POOL_MIN_FILES:
+            for path, fp in map(_fingerprint_worker, stale):
+                self.put(fp, path)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as pool:
+                for path, fp in pool.map(_fingerprint_worker, stale, chunksize=16):
+                    self.put(fp, path)
+        self._conn.commit()
+        logger.info("Fingerprinted %s images", len(stale))
+        return len(stale)
+
+    def get_many(self, paths: Iterable[Union[str, Path]]) -> Dict[str, ImageFingerprint]:
+        """Indexed fingerprints for ``paths`` (unreadable and unindexed files are left out)."""
+        keys = [str(p) for p in paths]
+        found: Dict[str, ImageFingerprint] = {}
+        for i in range(0, len(keys), SQLITE_MAX_PARAMS):
+            chunk = keys[i:i + SQLITE_MAX_PARAMS]
+            rows = self._conn.execute(
+                "SELECT path, width, height, dhash, sharpness FROM images "
+                f"WHERE path IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for row in rows:
+                fp = self._row_to_fingerprint(row)
+                if fp:
+                    found[fp.path] = fp
+        return found
+
+    def fingerprints(
+        self, paths: Iterable[Union[str, Path]], workers: Optional[int] = None
+    ) -> Dict[str, ImageFingerprint]:
+        """Update, then return fingerprints for ``paths``."""
+        paths = list(paths)
+        self.update(paths, workers=workers)
+        return self.get_many(paths)
+
+    def scan(self, root: Union[str, Path], workers: Optional[int] = None) -> Dict[str, ImageFingerprint]:
+        """
+        Index every image under ``root`` and forget files that are gone.
+
+        Returns:
+            Dict of path -> fingerprint for readable images under ``root``
+        """
+        root = Path(root)
+        files = [str(p) for p in iter_image_files(root)]
+        prefix = str(root).rstrip(os.sep) + os.sep
+        present = set(files)
+        indexed = [p for (p,) in self._conn.execute(
+            "SELECT path FROM images WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+        )]
+        gone = [p for p in indexed if p not in present]
+        for i in range(0, len(gone), SQLITE_MAX_PARAMS):
+            chunk = gone[i:i + SQLITE_MAX_PARAMS]
+            self._conn.execute(f"DELETE FROM images WHERE path IN ({','.join('?' * len(chunk))})", chunk)
+        return self.fingerprints(files, workers=workers)
+
+
+class ImageIndexService:
+    """Duplicate detection, best-image selection and orphan detection"""
+
+    @staticmethod
+    def group_duplicates(
+        fingerprints: Iterable[ImageFingerprint], distance: int = DUPLICATE_DISTANCE
+    ) -> List[List[ImageFingerprint]]:
+        """
+        Group near-identical images.
+
+        The 64 hash bits are split into ``distance + 1`` bands; two hashes at
+        most ``distance`` bits apart agree on at least one band, so only
+        images sharing a band are compared.
+
+        Args:
+            fingerprints: Images to group
+            distance: Max differing dHash bits for a duplicate
+
+        Returns:
+            Groups of two or more images, best quality first
+        """
+        fps = list(fingerprints)
+        parent = list(range(len(fps)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        bits = HASH_SIZE * HASH_SIZE
+        bands = distance + 1
+        edges = [bits * b // bands for b in range(bands + 1)]
+        for b in range(bands):
+            lo, hi = edges[b], edges[b + 1]
+            mask = (1 << (hi - lo)) - 1
+            buckets: Dict[int, List[int]] = {}
+            for i, fp in enumerate(fps):
+                buckets.setdefault((fp.dhash >> lo) & mask, []).append(i)
+            for members in buckets.values():
+                for n, i in enumerate(members):
+                    for j in members[n + 1:]:
+                        if find(i) != find(j) and is_near_duplicate(fps[i], fps[j], distance):
+                            parent[find(j)] = find(i)
+
+        groups: Dict[int, List[ImageFingerprint]] = {}
+        for i, fp in enumerate(fps):
+            groups.setdefault(find(i), []).append(fp)
+        return [
+            sorted(g, key=lambda fp: (fp.quality, fp.path), reverse=True)
+            for g in groups.values() if len(g) > 1
+        ]
+
+    @staticmethod
+    def check_duplicate(
+        content: bytes,
+        folder: Path,
+        index_path: Optional[Union[str, Path]] = None,
+        distance: int = DUPLICATE_DISTANCE,
+    ) -> DuplicateCheck:
+        """
+        Compare an image about to be stored with the images in ``folder`` (not recursive).
+
+        Only ``content`` is fingerprinted; files in ``folder`` that are not
+        indexed yet are counted in ``unindexed`` and left for ``index_folder``.
+        Blocking; call through ``asyncio.to_thread`` from request handlers.
+
+        Args:
+            content: Image bytes about to be stored
+            folder: Folder the image would be written to
+            index_path: Index file (default: DEFAULT_INDEX_PATH)
+            distance: Max differing dHash bits for a near-duplicate
+
+        Returns:
+            DuplicateCheck (``fingerprint`` is None if ``content`` is unreadable)
+        """
+        try:
+            fingerprint = compute_fingerprint(content)
+        except Exception:
+            fingerprint = None
+        if not folder.is_dir():
+            return DuplicateCheck(fingerprint=fingerprint)
+
+        files = [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS]
+        identical = next(
+            (p for p in sorted(files) if p.stat().st_size == len(content) and p.read_bytes() == content),
+            None,
+        )
+        if identical or fingerprint is None:
+            return DuplicateCheck(identical=identical, fingerprint=fingerprint)
+
+        try:
+            with ImageIndex(index_path) as index:
+                stale = set(index.stale(files))
+                existing = index.get_many(p for p in map(str, files) if p not in stale)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Image index unavailable, skipping duplicate check: %s", e)
+            return DuplicateCheck(fingerprint=fingerprint)
+        matches = [fp for fp in existing.values() if is_near_duplicate(fp, fingerprint, distance)]
+        similar = None
+        if matches:
+            best = min(matches, key=lambda fp: (hamming(fp.dhash, fingerprint.dhash), fp.path))
+            similar = Path(best.path)
+        return DuplicateCheck(similar=similar, fingerprint=fingerprint, unindexed=len(stale))
+
+    @staticmethod
+    def index_folder(folder: Union[str, Path], index_path: Optional[Union[str, Path]] = None) -> int:
+        """Fingerprint new or changed images in ``folder`` (not recursive); returns how many."""
+        folder = Path(folder)
+        if not folder.is_dir():
+            return 0
+        files = [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS]
+        with ImageIndex(index_path) as index:
+            return index.update(files)
+
+    @staticmethod
+    def record(path: Path, fingerprint: Optional[ImageFingerprint], index_path: Optional[Union[str, Path]] = None) -> None:
+        """Index a file just written with the fingerprint already computed for it."""
+        if fingerprint is None:
+            return
+        try:
+            with ImageIndex(index_path) as index:
+                index.put(fingerprint, path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not index %s: %s", path, e)
+
+    @staticmethod
+    def pick_best(paths: List[Path], index: ImageIndex) -> Optional[Path]:
+        """Highest-quality readable image among ``paths``."""
+        fps = index.fingerprints(paths)
+        if not fps:
+            return None
+        return Path(max(fps.values(), key=lambda fp: (fp.quality, fp.path)).path)
+
+    @staticmethod
+    def upload_url(path: Union[str, Path], uploads_dir: Path) -> str:
+        return "/uploads/" + Path(path).relative_to(uploads_dir).as_posix()
+
+    @staticmethod
+    def find_orphans(paths: Iterable[Union[str, Path]], uploads_dir: Path, referenced_urls: Set[str]) -> List[Path]:
+        """
+        Files under ``uploads_dir`` that no stored URL points to.
+
+        Args:
+            paths: Files under ``uploads_dir``
+            uploads_dir: Directory served at ``/uploads``
+            referenced_urls: URLs from the database; absolute URLs are matched by their path
+
+        Returns:
+            Unreferenced files, sorted
+        """
+        referenced: Set[str] = set()
+        for url in referenced_urls:
+            cut = url.find("/uploads/")
+            if cut >= 0:
+                referenced.add(url[cut:].split("?", 1)[0])
+        return sorted(
+            Path(p) for p in paths
+            if ImageIndexService.upload_url(p, uploads_dir) not in referenced
+        )
@@ -0,0 +1,146 @@
+"""
+Background Job Handlers
+
+Maps each job type to the coroutine that executes it in the worker process.
+Handlers open their own sessions, receive the job's JSON payload and return
+a JSON-serialisable result that is stored on the job. Raising marks the
+attempt failed (and retries it if the type's policy allows).
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import select, update
+
+from backend.database.base import AsyncSessionLocal
+from backend.services.catalog_import_service import CatalogImportService
+from backend.services.job_queue_service import (
+    CATALOG_IMPORT,
+    CATALOG_PARSE,
+    CLEANUP,
+    COMPANY_INVITES,
+    IMAGE_INDEX,
+    PRODUCT_IMPORT,
+    TRAINING_DOCUMENT,
+    JobQueueService,
+)
+
+logger = logging.getLogger(__name__)
+
+INVITE_BATCH_SIZE = 200
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+async def handle_catalog_parse(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse an uploaded catalog PDF (the parser is sync, so it runs in a thread)"""
+    return await asyncio.to_thread(
+        CatalogImportService.parse_upload,
+        payload["upload_id"],
+        payload["file_path"],
+        payload.get("max_pages"),
+    )
+
+
+async def handle_catalog_import(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Import the approved records of an upload to production"""
+    upload_id = payload["upload_id"]
+    async with AsyncSessionLocal() as db:
+        await CatalogImportService.set_upload_step(db, upload_id, "Importing to production")
+        try:
+            counts = await CatalogImportService.import_upload(db, upload_id)
+        except Exception as e:
+            # The tmp data is untouched, so the upload stays reviewable
+            await CatalogImportService.set_upload_step(
+                db, upload_id, "Import failed", error_message=str(e)
+            )
+            raise
+    return {"imported": counts}
+
+
+async def handle_cleanup(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove expired tmp catalog data and orphaned files, resuming a saved checkpoint"""
+    from backend.services.cleanup_service import run_cleanup
+
+    async with AsyncSessionLocal() as db:
+        checkpoint = await JobQueueService.load_checkpoint(db)
+    return await run_cleanup(
+        include_orphaned=payload.get("include_orphaned", True),
+        checkpoint=checkpoint,
+        save_checkpoint=JobQueueService.save_checkpoint,
+    )
+
+
+async def handle_training_document(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract, chunk and analyse an AI training document"""
+    from backend.services.ai_prompt_service import FRAGMENT_TRAINING, invalidate_prompt_fragment
+    from backend.services.training_ingestion_service import TrainingIngestionService
+
+    try:
+        return await TrainingIngestionService.ingest(payload["document_id"])
+    finally:
+        await invalidate_prompt_fragment(FRAGMENT_TRAINING)
+
+
+async def handle_product_import(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a bulk product import job"""
+    from backend.services.product_import_service import run_product_import
+
+    await run_product_import(payload["job_id"])
+    return {"job_id": payload["job_id"]}
+
+
+async def handle_image_index(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Fingerprint the images of an upload folder for duplicate hints"""
+    from backend.services.image_index_service import ImageIndexService
+
+    indexed = await asyncio.to_thread(ImageIndexService.index_folder, payload["folder"])
+    return {"indexed": indexed}
+
+
+async def handle_company_invites(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send bulk company invitations in batches, checkpointing who was sent
+
+    An SMTP failure fails the attempt after saving progress; the retry sends
+    only to recipients not yet sent or refused.
+    """
+    from backend.services.email_service import EmailService
+
+    invites = [tuple(invite) for invite in payload["invites"]]
+    async with AsyncSessionLocal() as db:
+        checkpoint = await JobQueueService.load_checkpoint(db) or {}
+        sent = list(checkpoint.get("sent", []))
+        refused = list(checkpoint.get("refused", []))
+        done = set(sent) | set(refused)
+        pending = [invite for invite in invites if invite[0] not in done]
+
+        for start in range(0, len(pending), INVITE_BATCH_SIZE):
+            result = await EmailService.send_company_invites(
+                db,
+                pending[start:start + INVITE_BATCH_SIZE],
+                registration_url=payload["registration_url"],
+                inviter_name=payload.get("inviter_name"),
+            )
+            sent += result.sent
+            refused += result.refused
+            await JobQueueService.save_checkpoint(db, {"sent": sent, "refused": refused})
+            if result.unsent:
+                raise RuntimeError(
+                    f"Sending stopped after {len(sent)} of {len(invites)} invitations"
+                )
+
+    return {"total": len(invites), "sent": sent, "refused": refused}
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    CATALOG_PARSE: handle_catalog_parse,
+    CATALOG_IMPORT: handle_catalog_import,
+    CLEANUP: handle_cleanup,
+    TRAINING_DOCUMENT: handle_training_document,
+    PRODUCT_IMPORT: handle_product_import,
+    IMAGE_INDEX: handle_image_index,
+    COMPANY_INVITES: handle_company_invites,
+}
@@ -0,0 +1,401 @@
+"""
+Job Queue Service
+
+Durable background jobs stored in the ``background_jobs`` table and executed
+by the separate ``python -m backend.worker`` process, so long-running work
+(PDF parsing, imports, cleanup, training documents) no longer occupies web
+workers and survives restarts.
+
+Claiming is a conditional UPDATE guarded by the row's current status/lease,
+which works the same on PostgreSQL, MySQL and SQLite: whichever worker's
+UPDATE matches the row first owns the job. Workers extend their lease with
+heartbeats; a job whose lease expired is picked up again by the next poll.
+
+Long jobs can save progress with ``save_checkpoint`` (stored in the job's
+``result`` until it completes) and read it back with ``load_checkpoint``
+when a retried or reclaimed attempt starts. The worker also keeps the
+``RECURRING_JOBS`` scheduled (see ``schedule_recurring``).
+"""
+
+import logging
+import os
+import socket
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.job import BackgroundJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+# Job types
+CATALOG_PARSE = "catalog_parse"
+CATALOG_IMPORT = "catalog_import"
+CLEANUP = "cleanup"
+TRAINING_DOCUMENT = "training_document"
+PRODUCT_IMPORT = "product_import"
+IMAGE_INDEX = "image_index"
+COMPANY_INVITES = "company_invites"
+
+# Per-type policy. ``concurrency`` is per worker process; ``lease_seconds``
+# is how long a job stays owned without a heartbeat before it is reclaimed.
+# Parsing is not retried: a half-finished parse leaves tmp_* rows behind and
+# the admin re-uploads instead. Imports commit in a single transaction, so a
+# retry after a crash is safe. Bulk invites checkpoint the recipients already
+# sent, so a retry after an SMTP failure only sends the rest.
+JOB_POLICIES: Dict[str, Dict[str, int]] = {
+    CATALOG_PARSE: {"max_attempts": 1, "backoff_seconds": 60, "concurrency": 1, "lease_seconds": 300},
+    CATALOG_IMPORT: {"max_attempts": 2, "backoff_seconds": 30, "concurrency": 1, "lease_seconds": 300},
+    CLEANUP: {"max_attempts": 3, "backoff_seconds": 300, "concurrency": 1, "lease_seconds": 600},
+    TRAINING_DOCUMENT: {"max_attempts": 3, "backoff_seconds": 30, "concurrency": 2, "lease_seconds": 300},
+    PRODUCT_IMPORT: {"max_attempts": 1, "backoff_seconds": 60, "concurrency": 1, "lease_seconds": 300},
+    IMAGE_INDEX: {"max_attempts": 2, "backoff_seconds": 60, "concurrency": 1, "lease_seconds": 600},
+    COMPANY_INVITES: {"max_attempts": 3, "backoff_seconds": 300, "concurrency": 1, "lease_seconds": 300},
+}
+DEFAULT_POLICY: Dict[str, int] = {
+    "max_attempts": 3,
+    "backoff_seconds": 60,
+    "concurrency": 1,
+    "lease_seconds": 300,
+}
+
+MAX_BACKOFF_SECONDS = 3600
+
+# Jobs the worker keeps scheduled: the next run is queued ``interval_seconds``
+# after the previous scheduled run finished.
+RECURRING_REFERENCE = "schedule"
+RECURRING_JOBS: Dict[str, Dict[str, Any]] = {
+    CLEANUP: {"interval_seconds": 6 * 3600, "payload": {"include_orphaned": True}},
+}
+
+# (job id, worker id) of the job the current task is executing; set by the worker
+current_job: ContextVar[Optional[Tuple[int, str]]] = ContextVar("current_job", default=None)
+
+
+def get_policy(job_type: str) -> Dict[str, int]:
+    return JOB_POLICIES.get(job_type, DEFAULT_POLICY)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobQueueService:
+    """Enqueue, claim and settle background jobs"""
+
+    @staticmethod
+    async def enqueue(
+        db: AsyncSession,
+        job_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        reference_id: Optional[str] = None,
+        delay_seconds: int = 0,
+        commit: bool = True,
+    ) -> BackgroundJob:
+        """
+        Add a job to the queue
+
+        Args:
+            db: Database session
+            job_type: One of the job type constants
+            payload: JSON-serialisable handler arguments
+            reference_id: Domain record the job works on (for lookups)
+            delay_seconds: Do not run before this many seconds from now
+            commit: Commit immediately (False lets callers enqueue atomically
+                with their own changes)
+
+        Returns:
+            The queued job
+        """
+        policy = get_policy(job_type)
+        job = BackgroundJob(
+            job_type=job_type,
+            status=JobStatus.QUEUED.value,
+            payload=payload or {},
+            reference_id=str(reference_id) if reference_id is not None else None,
+            max_attempts=policy["max_attempts"],
+            run_after=datetime.utcnow() + timedelta(seconds=delay_seconds),
+        )
+        db.add(job)
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
+
+        logger.info(f"Enqueued {job_type} job {job.id} (ref={reference_id})")
+        return job
+
+    @staticmethod
+    async def claim(
+        db: AsyncSession,
+        worker_id: str,
+        job_types: Iterable[str],
+        limit: int = 1,
+    ) -> List[BackgroundJob]:
+        """
+        Claim up to ``limit`` runnable jobs of the given types
+
+        A job is runnable when it is queued and due, or running with an expired
+        lease. Jobs reclaimed after their final attempt are marked failed
+        instead of being returned.
+
+        Args:
+            db: Database session
+            worker_id: Lease owner
+            job_types: Job types this caller can execute
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            Claimed jobs, already marked running
+        """
+        job_types = list(job_types)
+        if not job_types or limit <= 0:
+            return []
+
+        now = datetime.utcnow()
+        runnable = or_(
+            and_(BackgroundJob.status == JobStatus.QUEUED.value, BackgroundJob.run_after <= now),
+            and_(BackgroundJob.status == JobStatus.RUNNING.value, BackgroundJob.locked_until < now),
+        )
+        candidates = await db.execute(
+            select(BackgroundJob.id, BackgroundJob.job_type)
+            .where(BackgroundJob.job_type.in_(job_types), runnable)
+            .order_by(BackgroundJob.run_after, BackgroundJob.id)
+            .limit(limit * 4)
+        )
+
+        claimed_ids = []
+        for job_id, job_type in candidates.all():
+            if len(claimed_ids) >= limit:
+                break
+            lease = get_policy(job_type)["lease_seconds"]
+            result = await db.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job_id, runnable)
+                .values(
+                    status=JobStatus.RUNNING.value,
+                    locked_by=worker_id,
+                    locked_until=now + timedelta(seconds=lease),
+                    heartbeat_at=now,
+                    started_at=now,
+                    attempts=BackgroundJob.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1:
+                claimed_ids.append(job_id)
+        await db.commit()
+
+        if not claimed_ids:
+            return []
+
+        result = await db.execute(
+            select(BackgroundJob)
+            .where(BackgroundJob.id.in_(claimed_ids))
+            .order_by(BackgroundJob.id)
+            .execution_options(populate_existing=True)
+        )
+        jobs = []
+        for job in result.scalars().all():
+            if job.attempts > job.max_attempts:
+                # Reclaimed after the worker running its last attempt died
+                job.status = JobStatus.FAILED.value
+                job.last_error = job.last_error or "Lease expired (worker stopped while running)"
+                job.finished_at = now
+                job.locked_by = None
+                job.locked_until = None
+                logger.warning(f"Job {job.id} ({job.job_type}) exhausted its attempts")
+                continue
+            jobs.append(job)
+        await db.commit()
+        return jobs
+
+    @staticmethod
+    async def heartbeat(db: AsyncSession, job_id: int, worker_id: str, lease_seconds: int) -> bool:
+        """
+        Extend a running job's lease
+
+        Returns:
+            False if the lease was lost (another worker reclaimed the job)
+        """
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.id == job_id,
+                BackgroundJob.locked_by == worker_id,
+                BackgroundJob.status == JobStatus.RUNNING.value,
+            )
+            .values(
+                heartbeat_at=now,
+                locked_until=now + timedelta(seconds=lease_seconds),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    @staticmethod
+    async def complete(
+        db: AsyncSession, job_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Mark a job as succeeded and release its lease"""
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.locked_by == worker_id)
+            .values(
+                status=JobStatus.SUCCEEDED.value,
+                result=result,
+                finished_at=datetime.utcnow(),
+                locked_by=None,
+                locked_until=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def fail(db: AsyncSession, job_id: int, worker_id: str, error: str) -> bool:
+        """
+        Record a failed attempt, re-queueing with exponential backoff while
+        attempts remain
+
+        Returns:
+            True if the job will be retried
+        """
+        job = await db.get(BackgroundJob, job_id, populate_existing=True)
+        if not job or job.locked_by != worker_id:
+            return False
+
+        now = datetime.utcnow()
+        job.last_error = error[:5000]
+        job.locked_by = None
+        job.locked_until = None
+
+        retry = job.attempts < job.max_attempts
+        if retry:
+            backoff = get_policy(job.job_type)["backoff_seconds"] * 2 ** max(job.attempts - 1, 0)
+            job.status = JobStatus.QUEUED.value
+            job.run_after = now + timedelta(seconds=min(backoff, MAX_BACKOFF_SECONDS))
+        else:
+            job.status = JobStatus.FAILED.value
+            job.finished_at = now
+        await db.commit()
+        return retry
+
+    @staticmethod
+    async def release(db: AsyncSession, job_id: int, worker_id: str) -> None:
+        """
+        Hand an interrupted job back to the queue without consuming an attempt
+        (used on graceful shutdown)
+        """
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.locked_by == worker_id)
+            .values(
+                status=JobStatus.QUEUED.value,
+                attempts=BackgroundJob.attempts - 1,
+                run_after=datetime.utcnow(),
+                locked_by=None,
+                locked_until=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def get_latest_for_reference(
+        db: AsyncSession, reference_id: str, job_type: Optional[str] = None
+    ) -> Optional[BackgroundJob]:
+        """Most recent job for a domain record, optionally of one type"""
+        stmt = select(BackgroundJob).where(BackgroundJob.reference_id == str(reference_id))
+        if job_type:
+            stmt = stmt.where(BackgroundJob.job_type == job_type)
+        result = await db.execute(stmt.order_by(BackgroundJob.id.desc()).limit(1))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def save_checkpoint(db: AsyncSession, state: Dict[str, Any]) -> None:
+        """
+        Store progress for the job running in this task
+
+        Written into ``result`` as ``{"checkpoint": state}`` and committed
+        together with whatever the caller has pending in ``db``, so progress
+        and the work it describes land atomically. No-op outside a job.
+        """
+        job = current_job.get()
+        if job is None:
+            await db.commit()
+            return
+        job_id, worker_id = job
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.locked_by == worker_id)
+            .values(result={"checkpoint": state})
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def load_checkpoint(db: AsyncSession) -> Optional[Dict[str, Any]]:
+        """Progress saved by an earlier attempt of the job running in this task"""
+        job = current_job.get()
+        if job is None:
+            return None
+        result = await db.execute(select(BackgroundJob.result).where(BackgroundJob.id == job[0]))
+        saved = result.scalar_one_or_none()
+        if isinstance(saved, dict) and isinstance(saved.get("checkpoint"), dict):
+            return saved["checkpoint"]
+        return None
+
+    @staticmethod
+    async def schedule_recurring(
+        db: AsyncSession,
+        job_type: str,
+        interval_seconds: int,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Optional[BackgroundJob]:
+        """
+        Queue the next run of a recurring job unless one is already pending
+
+        Args:
+            db: Database session
+            job_type: Job type to keep scheduled
+            interval_seconds: Time between the end of one run and the next
+            payload: Handler arguments
+
+        Returns:
+            The newly queued job, or None if one was pending
+        """
+        pending = await db.execute(
+            select(BackgroundJob.id)
+            .where(
+                BackgroundJob.job_type == job_type,
+                BackgroundJob.reference_id == RECURRING_REFERENCE,
+                BackgroundJob.status.in_([JobStatus.QUEUED.value, JobStatus.RUNNING.value]),
+            )
+            .limit(1)
+        )
+        if pending.first():
+            return None
+
+        last_finished = (
+            await db.execute(
+                select(func.max(BackgroundJob.finished_at)).where(
+                    BackgroundJob.job_type == job_type,
+                    BackgroundJob.reference_id == RECURRING_REFERENCE,
+                )
+            )
+        ).scalar()
+        delay = 0
+        if last_finished is not None:
+            due = last_finished + timedelta(seconds=interval_seconds)
+            delay = max(0, int((due - datetime.utcnow()).total_seconds()))
+        return await JobQueueService.enqueue(
+            db, job_type, payload=payload, reference_id=RECURRING_REFERENCE, delay_seconds=delay
+        )
@@ -106,41 +106,46 @@ class PricingService:
         }
     
     @staticmethod
-    async def _get_company_tier_adjustment(
+    async def get_company_pricing_tier(
         db: AsyncSession,
-        company_id: int,
-        product_category_id: int,
-        base_price: int
-    ) -> tuple[int, int]:
-        """
-        Get company pricing tier adjustment
-        
-        Returns:
-            tuple: (adjustment_in_cents, percentage)
-        """
-        # Get company with active pricing tier
+        company_id: int
+    ) -> Optional[CompanyPricing]:
+        """Pricing tier assigned to a company, or None"""
         stmt = (
-            select(Company, CompanyPricing)
-            .outerjoin(CompanyPricing, Company.pricing_tier_id == CompanyPricing.id)
+            select(CompanyPricing)
+            .join(Company, Company.pricing_tier_id == CompanyPricing.id)
             .where(Company.id == company_id)
         )
         result = await db.execute(stmt)
-        row = result.first()
-        
-        if not row or not row[1]:  # No pricing tier assigned
-            return 0, 0
-        
-        company, pricing_tier = row
-        
-        # Check if pricing tier is active and within date range
-        today = date.today()
-        if not pricing_tier.is_active:
-            return 0, 0
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    def tier_in_effect(pricing_tier: Optional[CompanyPricing], today: Optional[date] = None) -> bool:
+        """Whether a pricing tier is active and within its date range"""
+        if not pricing_tier or not pricing_tier.is_active:
+            return False
         
+        today = today or date.today()
         if pricing_tier.effective_from and pricing_tier.effective_from > today:
-            return 0, 0
-            
+            return False
         if pricing_tier.expires_at and pricing_tier.expires_at < today:
+            return False
+        return True
+    
+    @staticmethod
+    def tier_adjustment(
+        pricing_tier: Optional[CompanyPricing],
+        product_category_id: Optional[int],
+        base_price: int,
+        today: Optional[date] = None
+    ) -> tuple[int, int]:
+        """
+        Tier adjustment for one product, without touching the database
+        
+        Returns:
+            tuple: (adjustment_in_cents, percentage)
+        """
+        if not PricingService.tier_in_effect(pricing_tier, today):
             return 0, 0
         
         # Check if applies to this product category
@@ -152,12 +157,32 @@ class PricingService:
         # Calculate adjustment (percentage is stored as integer, e.g., 10 = 10%)
         percentage = pricing_tier.percentage_adjustment
         adjustment = int((base_price * percentage) / 100)
+        return adjustment, percentage
+    
+    @staticmethod
+    async def _get_company_tier_adjustment(
+        db: AsyncSession,
+        company_id: int,
+        product_category_id: int,
+        base_price: int
+    ) -> tuple[int, int]:
+        """
+        Get company pricing tier adjustment
         
-        logger.info(
-            f"Company {company_id} pricing tier '{pricing_tier.pricing_tier_name}': "
-            f"{percentage}% = ${adjustment/100:.2f} on ${base_price/100:.2f}"
+        Returns:
+            tuple: (adjustment_in_cents, percentage)
+        """
+        pricing_tier = await PricingService.get_company_pricing_tier(db, company_id)
+        adjustment, percentage = PricingService.tier_adjustment(
+            pricing_tier, product_category_id, base_price
         )
         
+        if percentage:
+            logger.info(
+                f"Company {company_id} pricing tier '{pricing_tier.pricing_tier_name}': "
+                f"{percentage}% = ${adjustment/100:.2f} on ${base_price/100:.2f}"
+            )
+        
         return adjustment, percentage
     
     @staticmethod
@@ -0,0 +1,554 @@
+"""
+Product Import Service
+
+Bulk product import/update from NDJSON or CSV files uploaded to
+``/admin/products/bulk``.
+
+Rows are validated one at a time while the file is streamed from disk and
+written in batches: chairs and variations with a single dialect-native upsert
+per batch (``ON CONFLICT`` on PostgreSQL/SQLite, ``ON DUPLICATE KEY UPDATE``
+on MySQL), category/subcategory/secondary-family assignments with one delete
+and one multi-row insert. Each batch is committed on its own, so a bad batch
+does not roll back earlier ones, and progress is written to a
+``ProductImportJob`` row. Cache and static-export invalidation run once when
+the job finishes.
+"""
+
+import csv
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.v1.schemas.admin import BulkProductRow
+from backend.core.exceptions import BusinessLogicError
+from backend.models.chair import (
+    Category,
+    Chair,
+    Color,
+    Finish,
+    ProductFamily,
+    ProductSubcategory,
+    ProductVariation,
+    Upholstery,
+    chair_categories,
+    chair_secondary_families,
+    chair_subcategories,
+)
+from backend.models.tmp_catalog import ProductImportJob
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 100  # Row errors kept on the job record
+
+SUPPORTED_FORMATS = ("ndjson", "csv")
+# Databases with a native upsert (_upsert_statement)
+UPSERT_DIALECTS = ("mysql", "mariadb", "postgresql", "sqlite")
+
+CHAIR_COLUMNS = set(Chair.__table__.columns.keys()) - {"id", "created_at", "updated_at"}
+VARIATION_COLUMNS = set(ProductVariation.__table__.columns.keys()) - {
+    "id",
+    "created_at",
+    "updated_at",
+}
+
+
+def detect_format(filename: str) -> Optional[str]:
+    """Infer the import format from a file name."""
+    suffix = Path(filename).suffix.lower()
+    if suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    if suffix == ".csv":
+        return "csv"
+    return None
+
+
+def _csv_cell(key: str, value: str) -> Any:
+    """
+    Decode one CSV cell: JSON arrays/objects are parsed, ``*_ids`` columns
+    accept ``1|2|3``. Everything else is left to pydantic coercion.
+    """
+    value = value.strip()
+    if value[:1] in ("[", "{"):
+        return json.loads(value)
+    if key.endswith("_ids"):
+        return [part.strip() for part in value.replace(",", "|").split("|") if part.strip()]
+    return value
+
+
+def iter_rows(path: str, file_format: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Stream raw rows from an import file.
+
+    Yields:
+        (row_number, row_dict, error) - ``row_dict`` is None when the row
+        could not be decoded
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as fh:
+        if file_format == "ndjson":
+            for row_number, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield row_number, None, f"Invalid JSON: {e.msg}"
+                    continue
+                if not isinstance(data, dict):
+                    yield row_number, None, "Row must be a JSON object"
+                    continue
+                yield row_number, data, None
+        else:
+            reader = csv.DictReader(fh)
+            for row_number, record in enumerate(reader, start=1):
+                try:
+                    data = {
+                        key.strip(): _csv_cell(key.strip(), value)
+                        for key, value in record.items()
+                        if key and value is not None and value.strip() != ""
+                    }
+                except json.JSONDecodeError as e:
+                    yield row_number, None, f"Invalid JSON cell: {e.msg}"
+                    continue
+                yield row_number, data, None
+
+
+def count_rows(path: str, file_format: str) -> int:
+    """Count data rows without decoding them (used for progress reporting)."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as fh:
+        if file_format == "ndjson":
+            return sum(1 for line in fh if line.strip())
+        return max(sum(1 for _ in csv.reader(fh)) - 1, 0)
+
+
+def check_upsert_support(dialect: str) -> None:
+    """Refuse bulk imports up front on a database without a native upsert."""
+    if dialect not in UPSERT_DIALECTS:
+        raise BusinessLogicError(
+            f"Bulk product import is not supported on {dialect}; "
+            f"it needs one of: {', '.join(UPSERT_DIALECTS)}"
+        )
+
+
+def _upsert_statement(dialect: str, table, index_elements: List[str], update_columns: List[str]):
+    """Dialect-native INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE."""
+    check_upsert_support(dialect)
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update_columns})
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+    stmt = dialect_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={c: stmt.excluded[c] for c in update_columns},
+    )
+
+
+class ProductImportService:
+    """Validate and apply bulk product imports in batches"""
+
+    @staticmethod
+    async def _existing_ids(db: AsyncSession, model, ids: Set[int], known: Set[int]) -> Set[int]:
+        """IDs of ``model`` that exist, querying only those not already known."""
+        unknown = ids - known
+        if unknown:
+            result = await db.execute(select(model.id).where(model.id.in_(unknown)))
+            known.update(result.scalars().all())
+        return ids & known
+
+    @staticmethod
+    async def _upsert_rows(
+        db: AsyncSession, table, key: str, rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Upsert rows grouped by their column set so each group is one
+        executemany statement.
+
+        Each row is ``{"values": ..., "supplied": ...}``: ``values`` is what
+        gets inserted, ``supplied`` the columns the import row actually set -
+        only those (plus ``updated_at``) are overwritten on conflict.
+        """
+        dialect = db.get_bind().dialect.name
+        groups: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[Dict[str, Any]]] = {}
+        for row in rows:
+            group_key = (tuple(sorted(row["values"])), tuple(sorted(row["supplied"])))
+            groups.setdefault(group_key, []).append(row["values"])
+
+        for (_, supplied), params in groups.items():
+            update_columns = [c for c in supplied if c != key] + ["updated_at"]
+            stmt = _upsert_statement(dialect, table, [key], update_columns)
+            await db.execute(stmt, params)
+
+    @staticmethod
+    async def _apply_batch(
+        db: AsyncSession,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        known: Dict[str, Set[int]],
+    ) -> Dict[str, Any]:
+        """
+        Validate references for one batch and write it.
+
+        Returns:
+            Dictionary with ``created``, ``updated``, ``variations`` counts and
+            ``errors`` (list of ``{"row", "error"}``)
+        """
+        errors: List[Dict[str, Any]] = []
+
+        # Later rows for the same slug win, matching row-by-row semantics
+        by_slug: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for row_number, data in batch:
+            if data["slug"] in by_slug:
+                merged = {**by_slug[data["slug"]][1], **data}
+                by_slug[data["slug"]] = (row_number, merged)
+            else:
+                by_slug[data["slug"]] = (row_number, data)
+
+        existing_rows = await db.execute(
+            select(
+                Chair.slug,
+                Chair.id,
+                Chair.name,
+                Chair.model_number,
+                Chair.base_price,
+                Chair.category_id,
+                Chair.subcategory_id,
+            ).where(Chair.slug.in_(list(by_slug)))
+        )
+        existing = {row.slug: row for row in existing_rows.all()}
+
+        # Reference checks, one query per referenced table per batch
+        def _ids(*fields) -> Set[int]:
+            found = set()
+            for _, data in by_slug.values():
+                for field in fields:
+                    value = data.get(field)
+                    if isinstance(value, list):
+                        found.update(value)
+                    elif value is not None:
+                        found.add(value)
+            return found
+
+        def _variation_ids(field) -> Set[int]:
+            return {
+                v[field]
+                for _, data in by_slug.values()
+                for v in data.get("variations") or []
+                if v.get(field) is not None
+            }
+
+        valid = {
+            "category": await ProductImportService._existing_ids(
+                db, Category, _ids("category_id", "category_ids"), known["category"]
+            ),
+            "subcategory": await ProductImportService._existing_ids(
+                db, ProductSubcategory, _ids("subcategory_id", "subcategory_ids"), known["subcategory"]
+            ),
+            "family": await ProductImportService._existing_ids(
+                db, ProductFamily, _ids("family_id", "secondary_family_ids"), known["family"]
+            ),
+            "finish": await ProductImportService._existing_ids(
+                db, Finish, _variation_ids("finish_id"), known["finish"]
+            ),
+            "upholstery": await ProductImportService._existing_ids(
+                db, Upholstery, _variation_ids("upholstery_id"), known["upholstery"]
+            ),
+            "color": await ProductImportService._existing_ids(
+                db, Color, _variation_ids("color_id"), known["color"]
+            ),
+        }
+        references = (
+            ("category", ("category_id", "category_ids")),
+            ("subcategory", ("subcategory_id", "subcategory_ids")),
+            ("family", ("family_id", "secondary_family_ids")),
+        )
+
+        chair_rows = []
+        accepted: Dict[str, Dict[str, Any]] = {}
+        created = updated = 0
+
+        for slug, (row_number, data) in by_slug.items():
+            error = None
+            for kind, fields in references:
+                for field in fields:
+                    value = data.get(field)
+                    ids = value if isinstance(value, list) else ([value] if value is not None else [])
+                    missing = [i for i in ids if i not in valid[kind]]
+                    if missing:
+                        error = f"{kind.title()} ID {missing[0]} not found"
+                        break
+                if error:
+                    break
+            for v in data.get("variations") or []:
+                for kind in ("finish", "upholstery", "color"):
+                    if v.get(f"{kind}_id") is not None and v[f"{kind}_id"] not in valid[kind]:
+                        error = f"{kind.title()} ID {v[f'{kind}_id']} not found (variation {v['sku']})"
+                        break
+                if error:
+                    break
+
+            current = existing.get(slug)
+
+            # Same rules as AdminService._sync_product_categories: the primary
+            # category/subcategory is always part of the submitted set
+            for single, multiple in (("category_id", "category_ids"), ("subcategory_id", "subcategory_ids")):
+                if data.get(multiple) is None:
+                    continue
+                ids = list(dict.fromkeys(data[multiple]))
+                primary = data.get(single) or (getattr(current, single) if current else None)
+                if ids:
+                    if primary not in ids:
+                        data[single] = ids[0]
+                elif single == "category_id" and primary:
+                    ids = [primary]
+                else:
+                    data[single] = None
+                data[multiple] = ids
+
+            if not error and current is None:
+                missing_fields = [f for f in ("name", "model_number", "category_id") if not data.get(f)]
+                if missing_fields:
+                    error = f"New product requires {', '.join(missing_fields)}"
+
+            if error:
+                errors.append({"row": row_number, "error": error})
+                continue
+
+            supplied = {k: v for k, v in data.items() if k in CHAIR_COLUMNS}
+            values = dict(supplied)
+            if current is not None:
+                # Columns the INSERT half needs even when the row only updates
+                values.setdefault("name", current.name)
+                values.setdefault("model_number", current.model_number)
+                values.setdefault("base_price", current.base_price)
+                values.setdefault("category_id", current.category_id)
+                updated += 1
+            else:
+                values.setdefault("base_price", 0)
+                created += 1
+            values["updated_at"] = datetime.utcnow()
+
+            chair_rows.append({"values": values, "supplied": supplied})
+            accepted[slug] = data
+
+        if not chair_rows:
+            return {"created": 0, "updated": 0, "variations": 0, "errors": errors}
+
+        await ProductImportService._upsert_rows(db, Chair.__table__, "slug", chair_rows)
+
+        id_rows = await db.execute(
+            select(Chair.slug, Chair.id).where(Chair.slug.in_(list(accepted)))
+        )
+        ids_by_slug = dict(id_rows.all())
+
+        # Category / subcategory / secondary family assignments replace the set
+        associations = (
+            (chair_categories, "category_id", "category_ids"),
+            (chair_subcategories, "subcategory_id", "subcategory_ids"),
+            (chair_secondary_families, "family_id", "secondary_family_ids"),
+        )
+        for table, column, field in associations:
+            chair_ids = [ids_by_slug[s] for s, d in accepted.items() if d.get(field) is not None]
+            if not chair_ids:
+                continue
+            await db.execute(delete(table).where(table.c.chair_id.in_(chair_ids)))
+            pairs = [
+                {"chair_id": ids_by_slug[slug], column: assigned_id}
+                for slug, data in accepted.items()
+                for assigned_id in data.get(field) or []
+            ]
+            if pairs:
+                await db.execute(insert(table), pairs)
+
+        # One row per SKU - a multi-row upsert cannot touch the same key twice
+        variations_by_sku: Dict[str, Dict[str, Any]] = {}
+        now = datetime.utcnow()
+        for slug, data in accepted.items():
+            for variation in data.get("variations") or []:
+                supplied = {k: v for k, v in variation.items() if k in VARIATION_COLUMNS}
+                supplied["product_id"] = ids_by_slug[slug]
+                variations_by_sku[supplied["sku"]] = {
+                    "values": {**supplied, "updated_at": now},
+                    "supplied": supplied,
+                }
+
+        variation_rows = list(variations_by_sku.values())
+        if variation_rows:
+            await ProductImportService._upsert_rows(
+                db, ProductVariation.__table__, "sku", variation_rows
+            )
+
+        return {
+            "created": created,
+            "updated": updated,
+            "variations": len(variation_rows),
+            "errors": errors,
+        }
+
+    @staticmethod
+    async def import_file(
+        db: AsyncSession, job: ProductImportJob, batch_size: int = BATCH_SIZE
+    ) -> ProductImportJob:
+        """
+        Run an import job: stream, validate and write rows batch by batch.
+
+        Args:
+            db: Database session
+            job: Job record (``file_path`` and ``file_format`` must be set)
+            batch_size: Rows per upsert batch
+
+        Returns:
+            The updated job record
+        """
+        # Plain locals: job attributes are expired if a batch is rolled back
+        job_id, file_path, file_format = job.job_id, job.file_path, job.file_format
+        total_rows = count_rows(file_path, file_format)
+
+        job.status = "importing"
+        job.started_at = datetime.utcnow()
+        job.current_step = "Counting rows"
+        job.total_rows = total_rows
+        await db.commit()
+
+        known: Dict[str, Set[int]] = {
+            kind: set() for kind in ("category", "subcategory", "family", "finish", "upholstery", "color")
+        }
+        errors: List[Dict[str, Any]] = []
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        counts = {"processed": 0, "failed": 0, "created": 0, "updated": 0, "variations": 0}
+
+        def _record_error(row_number: int, message: str) -> None:
+            counts["failed"] += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": row_number, "error": message})
+
+        async def _flush() -> None:
+            first_row = batch[0][0]
+            try:
+                result = await ProductImportService._apply_batch(db, batch, known)
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Import {job_id}: batch starting at row {first_row} failed: {e}")
+                for row_number, _ in batch:
+                    _record_error(row_number, f"Batch failed: {e}")
+            else:
+                counts["created"] += result["created"]
+                counts["updated"] += result["updated"]
+                counts["variations"] += result["variations"]
+                for error in result["errors"]:
+                    _record_error(error["row"], error["error"])
+
+            counts["processed"] += len(batch)
+            batch.clear()
+
+            job.rows_processed = counts["processed"]
+            job.rows_failed = counts["failed"]
+            job.products_created = counts["created"]
+            job.products_updated = counts["updated"]
+            job.variations_upserted = counts["variations"]
+            job.row_errors = list(errors)
+            job.current_step = f"Imported {counts['processed']} of {total_rows} rows"
+            if total_rows:
+                job.progress_percentage = min(99, int(counts["processed"] * 100 / total_rows))
+            await db.commit()
+
+        for row_number, raw, decode_error in iter_rows(file_path, file_format):
+            if decode_error:
+                counts["processed"] += 1
+                _record_error(row_number, decode_error)
+                continue
+            try:
+                row = BulkProductRow.model_validate(raw)
+            except PydanticValidationError as e:
+                counts["processed"] += 1
+                first = e.errors()[0]
+                location = ".".join(str(part) for part in first["loc"])
+                _record_error(row_number, f"{location}: {first['msg']}")
+                continue
+
+            batch.append((row_number, row.model_dump(exclude_unset=True)))
+            if len(batch) >= batch_size:
+                await _flush()
+
+        if batch:
+            await _flush()
+
+        job.current_step = "Refreshing caches"
+        await db.commit()
+        await ProductImportService.invalidate_after_import(db)
+
+        job.status = "completed"
+        job.progress_percentage = 100
+        job.rows_processed = counts["processed"]
+        job.rows_failed = counts["failed"]
+        job.row_errors = list(errors)
+        job.current_step = "Completed"
+        job.completed_at = datetime.utcnow()
+        await db.commit()
+
+        logger.info(
+            f"Import {job_id} completed: {counts['created']} created, "
+            f"{counts['updated']} updated, {counts['variations']} variations, "
+            f"{counts['failed']} failed rows"
+        )
+        return job
+
+    @staticmethod
+    async def invalidate_after_import(db: AsyncSession) -> None:
+        """One cache / static-export invalidation for the whole import."""
+        from backend.services.cache_service import cache_service
+        from backend.services.category_tree_service import refresh_category_tree
+        from backend.utils.static_content_exporter import export_content_after_update
+
+        try:
+            await cache_service.invalidate_all_products()
+            await cache_service.invalidate_tags(["family_members"])
+        except Exception as e:
+            logger.warning(f"Cache invalidation after import failed: {e}")
+
+        await refresh_category_tree(db, "counts")
+        await export_content_after_update("categories", db)
+
+
+async def run_product_import(job_id: str) -> None:
+    """
+    Background task entry point: runs an import job with its own session and
+    removes the uploaded file when done.
+    """
+    from backend.database.base import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ProductImportJob).where(ProductImportJob.job_id == job_id)
+        )
+        job = result.scalar_one_or_none()
+        if not job:
+            logger.error(f"Import job {job_id} not found")
+            return
+
+        file_path = job.file_path
+        try:
+            await ProductImportService.import_file(db, job)
+        except Exception as e:
+            logger.error(f"Import job {job_id} failed: {e}", exc_info=True)
+            await db.rollback()
+            job.status = "failed"
+            job.error_message = str(e)
+            job.completed_at = datetime.utcnow()
+            await db.commit()
+        finally:
+            if file_path:
+                Path(file_path).unlink(missing_ok=True)
@@ -4,7 +4,9 @@ Product Service
 Handles product catalog operations (chairs, categories, finishes, upholstery)
 """
 
+import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import and_, case, cast, func, or_, select
@@ -25,15 +27,32 @@ from backend.models.chair import (
     ProductVariation,
     Upholstery,
     chair_categories,
-    chair_secondary_families,
     chair_subcategories,
-    variation_families,
 )
+from backend.models.loaders import ChairLoad
+from backend.services.family_index_service import FamilyIndexService
 from backend.utils.pagination import PaginationParams, paginate
 from backend.utils.slug import slugify
 
 logger = logging.getLogger(__name__)
 
+# Product search index (fuzzy search entries in the cache)
+SEARCH_INDEX_TTL = 3600
+# Rebuilt well before the entries expire; also the lifetime of the
+# cluster-wide warm-up lock, so one worker rebuilds per interval
+SEARCH_REFRESH_SECONDS = SEARCH_INDEX_TTL * 2 // 3
+SEARCH_WARM_LOCK = "search_warm"
+SEARCH_WARM_BATCH_SIZE = 500
+SEARCH_WARM_MAX_INFLIGHT = 4  # Pipelined cache writes in flight while streaming
+
+
+def _searchable_text(name, model_number, short_description, full_description, category_name, keywords) -> str:
+    """Text a product is fuzzy-matched on"""
+    parts = [name, model_number, short_description, full_description, category_name]
+    if isinstance(keywords, list):
+        parts.append(" ".join(str(k) for k in keywords if k))
+    return " ".join(filter(None, parts))
+
 
 def _chair_in_category(category_id: int):
     """
@@ -65,42 +84,6 @@ def _chair_in_subcategory(subcategory_id: int):
     )
 
 
-def category_child_from_category(category: Category, product_count: int = 0) -> Dict[str, Any]:
-    """Serialize a nested category as a child of its parent category."""
-    return {
-        "id": category.id,
-        "name": category.name,
-        "slug": category.slug,
-        "description": category.description,
-        "category_id": category.parent_id,
-        "display_order": category.display_order,
-        "is_active": category.is_active,
-        "type": "category",
-        "product_count": product_count,
-        "icon_url": category.icon_url,
-        "banner_image_url": category.banner_image_url,
-    }
-
-
-def category_child_from_subcategory(
-    subcategory: ProductSubcategory, product_count: int = 0
-) -> Dict[str, Any]:
-    """Serialize a product subcategory as a child of its category."""
-    return {
-        "id": subcategory.id,
-        "name": subcategory.name,
-        "slug": subcategory.slug,
-        "description": subcategory.description,
-        "category_id": subcategory.category_id,
-        "display_order": subcategory.display_order,
-        "is_active": subcategory.is_active,
-        "type": "subcategory",
-        "product_count": product_count,
-        "icon_url": None,
-        "banner_image_url": None,
-    }
-
-
 def _is_model_like_query(query: str) -> bool:
     q = (query or "").strip()
     if not q or len(q) > 10:
@@ -188,161 +171,6 @@ class ProductService:
         logger.info(f"Retrieved {len(categories)} categories")
         return list(categories)
 
-    @staticmethod
-    async def get_child_categories_by_parent(
-        db: AsyncSession,
-        parent_ids: Optional[List[int]] = None,
-        include_inactive: bool = False,
-    ) -> Dict[int, List[Category]]:
-        """
-        Get nested (child) categories grouped by their parent category ID.
-
-        Child categories are a second way of expressing a subcategory (the
-        other being the ``product_subcategories`` table). Both must be shown
-        as children of their parent, never as primary categories.
-
-        Args:
-            db: Database session
-            parent_ids: Restrict to these parent category IDs (all when None)
-            include_inactive: Include inactive categories
-
-        Returns:
-            Mapping of parent category ID -> list of child categories
-        """
-        query = select(Category).where(Category.parent_id.is_not(None))
-
-        if not include_inactive:
-            query = query.where(Category.is_active == True)
-
-        if parent_ids is not None:
-            if not parent_ids:
-                return {}
-            query = query.where(Category.parent_id.in_(parent_ids))
-
-        query = query.order_by(Category.display_order, Category.name)
-
-        result = await db.execute(query)
-
-        children: Dict[int, List[Category]] = {}
-        for category in result.scalars().all():
-            children.setdefault(category.parent_id, []).append(category)
-
-        return children
-
-    @staticmethod
-    async def get_category_product_counts(db: AsyncSession) -> Dict[int, int]:
-        """
-        Count active products per category, counting both the primary category
-        and any additional categories assigned through chair_categories.
-        """
-        primary = select(
-            Chair.id.label("chair_id"), Chair.category_id.label("cat_id")
-        ).where(Chair.is_active == True, Chair.category_id.is_not(None))
-        extra = (
-            select(
-                chair_categories.c.chair_id.label("chair_id"),
-                chair_categories.c.category_id.label("cat_id"),
-            )
-            .select_from(
-                chair_categories.join(Chair, Chair.id == chair_categories.c.chair_id)
-            )
-            .where(Chair.is_active == True)
-        )
-        pairs = primary.union(extra).subquery()
-
-        result = await db.execute(
-            select(pairs.c.cat_id, func.count()).group_by(pairs.c.cat_id)
-        )
-        return {row[0]: row[1] for row in result.all() if row[0] is not None}
-
-    @staticmethod
-    async def get_subcategory_product_counts(db: AsyncSession) -> Dict[int, int]:
-        """
-        Count active products per subcategory, counting both the primary
-        subcategory and any assigned through chair_subcategories.
-        """
-        primary = select(
-            Chair.id.label("chair_id"), Chair.subcategory_id.label("sub_id")
-        ).where(Chair.is_active == True, Chair.subcategory_id.is_not(None))
-        extra = (
-            select(
-                chair_subcategories.c.chair_id.label("chair_id"),
-                chair_subcategories.c.subcategory_id.label("sub_id"),
-            )
-            .select_from(
-                chair_subcategories.join(
-                    Chair, Chair.id == chair_subcategories.c.chair_id
-                )
-            )
-            .where(Chair.is_active == True)
-        )
-        pairs = primary.union(extra).subquery()
-
-        result = await db.execute(
-            select(pairs.c.sub_id, func.count()).group_by(pairs.c.sub_id)
-        )
-        return {row[0]: row[1] for row in result.all() if row[0] is not None}
-
-    @staticmethod
-    async def get_category_children(
-        db: AsyncSession,
-        category_id: Optional[int] = None,
-        include_inactive: bool = False,
-        with_counts: bool = False,
-    ) -> Dict[int, List[Dict[str, Any]]]:
-        """
-        Get the children of categories, grouped by parent category ID.
-
-        Children are the union of ``product_subcategories`` rows and nested
-        categories (categories with a ``parent_id``), each tagged with a
-        ``type`` so callers can build the right link for them.
-
-        Args:
-            db: Database session
-            category_id: Only return children of this category (all when None)
-            include_inactive: Include inactive children
-            with_counts: Populate ``product_count`` on each child
-
-        Returns:
-            Mapping of parent category ID -> list of child dictionaries
-        """
-        subcategories = await ProductService.get_subcategories(
-            db=db, category_id=category_id, include_inactive=include_inactive
-        )
-        child_categories = await ProductService.get_child_categories_by_parent(
-            db=db,
-            parent_ids=[category_id] if category_id else None,
-            include_inactive=include_inactive,
-        )
-
-        subcategory_counts: Dict[int, int] = {}
-        category_counts: Dict[int, int] = {}
-        if with_counts:
-            subcategory_counts = await ProductService.get_subcategory_product_counts(db)
-            category_counts = await ProductService.get_category_product_counts(db)
-
-        children: Dict[int, List[Dict[str, Any]]] = {}
-
-        for sub in subcategories:
-            children.setdefault(sub.category_id, []).append(
-                category_child_from_subcategory(
-                    sub, subcategory_counts.get(sub.id, 0)
-                )
-            )
-
-        for parent_id, categories in child_categories.items():
-            for category in categories:
-                children.setdefault(parent_id, []).append(
-                    category_child_from_category(
-                        category, category_counts.get(category.id, 0)
-                    )
-                )
-
-        for items in children.values():
-            items.sort(key=lambda c: (c["display_order"] or 0, c["name"] or ""))
-
-        return children
-
     @staticmethod
     async def get_category_by_id(db: AsyncSession, category_id: int) -> Category:
         """
@@ -454,11 +282,7 @@ class ProductService:
         Returns:
             Paginated response dictionary
         """
-        query = select(Chair).options(
-            selectinload(Chair.category).selectinload(Category.parent),
-            selectinload(Chair.family),
-            selectinload(Chair.subcategory),
-        )
+        query = select(Chair).options(*ChairLoad.LIST)
 
         if not include_inactive:
             query = query.where(Chair.is_active)
@@ -469,25 +293,13 @@ class ProductService:
         if subcategory_id:
             query = query.where(_chair_in_subcategory(subcategory_id))
 
+        family_index = None
         if family_id:
-            chair_in_family = or_(
-                Chair.family_id == family_id,
-                Chair.id.in_(
-                    select(chair_secondary_families.c.chair_id).where(
-                        chair_secondary_families.c.family_id == family_id
-                    )
-                ),
-                Chair.id.in_(
-                    select(ProductVariation.product_id)
-                    .select_from(variation_families)
-                    .join(
-                        ProductVariation,
-                        variation_families.c.variation_id == ProductVariation.id,
-                    )
-                    .where(variation_families.c.family_id == family_id)
-                ),
-            )
-            query = query.where(chair_in_family)
+            # Membership (primary, secondary and via variations) comes from the
+            # precomputed family index instead of a three-way OR of subqueries
+            family_index = await FamilyIndexService.get_index(db, family_id)
+            family_product_ids = family_index["product_ids"] if family_index else []
+            query = query.where(Chair.id.in_(family_product_ids))
 
         if is_featured is not None:
             query = query.where(Chair.is_featured == is_featured)
@@ -561,15 +373,20 @@ class ProductService:
         if max_width is not None:
             query = query.where(Chair.width <= max_width)
 
-        # Feature filters
+        # Feature filters ("Stackable" is an entry in the features JSON array)
         if is_stackable is not None:
-            query = query.where(Chair.is_stackable == is_stackable)
+            stackable = cast(Chair.features, String).ilike('%"stackable"%')
+            query = query.where(
+                stackable
+                if is_stackable
+                else or_(Chair.features.is_(None), ~stackable)
+            )
 
         if is_outdoor is not None:
-            query = query.where(Chair.is_outdoor == is_outdoor)
+            query = query.where(Chair.is_outdoor_suitable == is_outdoor)
 
         if is_ada_compliant is not None:
-            query = query.where(Chair.is_ada_compliant == is_ada_compliant)
+            query = query.where(Chair.ada_compliant == is_ada_compliant)
 
         # Lead time filter
         if max_lead_time_days is not None:
@@ -577,7 +394,7 @@ class ProductService:
 
         # Stock filter
         if in_stock_only:
-            query = query.where(Chair.stock_quantity > 0)
+            query = query.where(Chair.stock_status == "In Stock")
 
         if search_query:
             search_term = f"%{search_query}%"
@@ -626,40 +443,13 @@ class ProductService:
             if product.category and product.category.parent:
                 product.category.parent_slug = product.category.parent.slug
 
-        if family_id and result["items"]:
-            chair_ids = [p.id for p in result["items"]]
-            vf_stmt = (
-                select(ProductVariation)
-                .join(
-                    variation_families,
-                    variation_families.c.variation_id == ProductVariation.id,
-                )
-                .where(
-                    variation_families.c.family_id == family_id,
-                    ProductVariation.product_id.in_(chair_ids),
-                )
-                .order_by(ProductVariation.display_order, ProductVariation.id)
-            )
-            vf_result = await db.execute(vf_stmt)
-            vf_rows = vf_result.scalars().all()
-            chair_to_variation = {}
-            for v in vf_rows:
-                if v.product_id not in chair_to_variation:
-                    chair_to_variation[v.product_id] = v
+        if family_index and result["items"]:
+            overlay = family_index["variation_overlay"]
             for product in result["items"]:
-                v = chair_to_variation.get(product.id)
-                if v:
-                    setattr(product, "variation_id", v.id)
-                    var_img = v.primary_image_url
-                    if not var_img and v.images:
-                        imgs = v.images
-                        if isinstance(imgs, list) and imgs:
-                            first = imgs[0]
-                            var_img = (
-                                first.get("url", first)
-                                if isinstance(first, dict)
-                                else first
-                            )
+                entry = overlay.get(str(product.id))
+                if entry:
+                    setattr(product, "variation_id", entry["variation_id"])
+                    var_img = entry["image_url"]
                     if var_img:
                         setattr(product, "primary_image_url", var_img)
                         setattr(product, "primary_image", var_img)
@@ -690,20 +480,7 @@ class ProductService:
             ResourceNotFoundError: If product not found
         """
         result = await db.execute(
-            select(Chair)
-            .options(
-                selectinload(Chair.category).selectinload(Category.parent),
-                selectinload(Chair.subcategory),
-                selectinload(Chair.family),
-                selectinload(Chair.secondary_families),
-                selectinload(Chair.variations).selectinload(ProductVariation.finish),
-                selectinload(Chair.variations).selectinload(
-                    ProductVariation.upholstery
-                ),
-                selectinload(Chair.variations).selectinload(ProductVariation.color),
-                selectinload(Chair.variations).selectinload(ProductVariation.families),
-            )
-            .where(Chair.id == product_id)
+            select(Chair).options(*ChairLoad.DETAIL).where(Chair.id == product_id)
         )
         product = result.scalar_one_or_none()
 
@@ -718,7 +495,9 @@ class ProductService:
         if increment_view:
             product.view_count += 1
             await db.commit()
-            await db.refresh(product)
+            # Only the updated columns; a full refresh would expire the
+            # relationships the loader profile just loaded
+            await db.refresh(product, ["view_count", "updated_at"])
 
         return product
 
@@ -742,7 +521,7 @@ class ProductService:
         """
         result = await db.execute(
             select(Chair)
-            .options(selectinload(Chair.category))
+            .options(*ChairLoad.DETAIL)
             .where(Chair.model_number == model_number)
         )
         product = result.scalar_one_or_none()
@@ -752,11 +531,17 @@ class ProductService:
                 resource_type="Product", resource_id=model_number
             )
 
+        # Populate parent_slug for frontend routing
+        if product.category and product.category.parent:
+            product.category.parent_slug = product.category.parent.slug
+
         # Increment view count
         if increment_view:
             product.view_count += 1
             await db.commit()
-            await db.refresh(product)
+            # Only the updated columns; a full refresh would expire the
+            # relationships the loader profile just loaded
+            await db.refresh(product, ["view_count", "updated_at"])
 
         return product
 
@@ -779,18 +564,7 @@ class ProductService:
             ResourceNotFoundError: If product not found
         """
         result = await db.execute(
-            select(Chair)
-            .options(
-                selectinload(Chair.category).selectinload(Category.parent),
-                selectinload(Chair.subcategory),
-                selectinload(Chair.family),
-                selectinload(Chair.variations).selectinload(ProductVariation.finish),
-                selectinload(Chair.variations).selectinload(
-                    ProductVariation.upholstery
-                ),
-                selectinload(Chair.variations).selectinload(ProductVariation.color),
-            )
-            .where(Chair.slug == slug)
+            select(Chair).options(*ChairLoad.DETAIL).where(Chair.slug == slug)
         )
         product = result.scalar_one_or_none()
 
@@ -805,7 +579,9 @@ class ProductService:
         if increment_view:
             product.view_count += 1
             await db.commit()
-            await db.refresh(product)
+            # Only the updated columns; a full refresh would expire the
+            # relationships the loader profile just loaded
+            await db.refresh(product, ["view_count", "updated_at"])
 
         return product
 
@@ -852,7 +628,7 @@ class ProductService:
             if product_ids:
                 query = (
                     select(Chair)
-                    .options(selectinload(Chair.category))
+                    .options(*ChairLoad.SEARCH)
                     .where(and_(Chair.id.in_(product_ids), Chair.is_active))
                 )
                 result = await db.execute(query)
@@ -883,7 +659,7 @@ class ProductService:
         keyword_match = cast(Chair.keywords, String).ilike(search_term)
         query = (
             select(Chair)
-            .options(selectinload(Chair.category))
+            .options(*ChairLoad.SEARCH)
             .where(
                 and_(
                     Chair.is_active,
@@ -907,28 +683,24 @@ class ProductService:
                 key=lambda p: -_rank_by_model_match(p, search_query),
             )
 
-        for product in products:
-            searchable_parts = [
-                product.name or "",
-                product.model_number or "",
-                product.short_description or "",
-                product.full_description or "",
-            ]
-            if product.category:
-                searchable_parts.append(product.category.name or "")
-            kw = product.keywords
-            if isinstance(kw, list):
-                searchable_parts.append(" ".join(str(k) for k in kw if k))
-            searchable_text = " ".join(filter(None, searchable_parts))
-
-            # Index asynchronously (don't await to avoid slowing down the response)
-            try:
-                await cache_service.index_product_for_search(
-                    product_id=product.id, searchable_text=searchable_text, ttl=3600
-                )
-            except Exception as e:
-                # Don't let cache errors affect search results
-                logger.debug(f"Failed to cache product {product.id} for search: {e}")
+        try:
+            await cache_service.index_products_for_search(
+                [
+                    (
+                        product.id,
+                        _searchable_text(
+                            product.name, product.model_number, product.short_description,
+                            product.full_description, product.category.name if product.category else None,
+                            product.keywords,
+                        ),
+                    )
+                    for product in products
+                ],
+                ttl=SEARCH_INDEX_TTL,
+            )
+        except Exception as e:
+            # Don't let cache errors affect search results
+            logger.debug(f"Failed to cache search results for indexing: {e}")
 
         logger.info(
             f"Fuzzy search (database fallback) for '{search_query}' returned {len(products)} results"
@@ -1088,17 +860,7 @@ class ProductService:
         # Load variations with their finish, upholstery, and color relationships
         stmt = (
             select(Chair)
-            .options(
-                selectinload(Chair.category),
-                selectinload(Chair.subcategory),
-                selectinload(Chair.family),
-                selectinload(Chair.variations).selectinload(ProductVariation.finish),
-                selectinload(Chair.variations).selectinload(
-                    ProductVariation.upholstery
-                ),
-                selectinload(Chair.variations).selectinload(ProductVariation.color),
-                selectinload(Chair.variations).selectinload(ProductVariation.families),
-            )
+            .options(*ChairLoad.ADMIN)
             .where(Chair.id == product_id)
         )
         result = await db.execute(stmt)
@@ -1268,11 +1030,7 @@ class ProductService:
         Returns:
             Paginated product results
         """
-        query = select(Chair).options(
-            selectinload(Chair.category),
-            selectinload(Chair.subcategory),
-            selectinload(Chair.family),
-        )
+        query = select(Chair).options(*ChairLoad.LIST)
 
         # Apply filters
         if is_active:
@@ -1284,25 +1042,13 @@ class ProductService:
         if subcategory_id:
             query = query.where(_chair_in_subcategory(subcategory_id))
 
+        family_index = None
         if family_id:
-            chair_in_family = or_(
-                Chair.family_id == family_id,
-                Chair.id.in_(
-                    select(chair_secondary_families.c.chair_id).where(
-                        chair_secondary_families.c.family_id == family_id
-                    )
-                ),
-                Chair.id.in_(
-                    select(ProductVariation.product_id)
-                    .select_from(variation_families)
-                    .join(
-                        ProductVariation,
-                        variation_families.c.variation_id == ProductVariation.id,
-                    )
-                    .where(variation_families.c.family_id == family_id)
-                ),
-            )
-            query = query.where(chair_in_family)
+            # Membership (primary, secondary and via variations) comes from the
+            # precomputed family index instead of a three-way OR of subqueries
+            family_index = await FamilyIndexService.get_index(db, family_id)
+            family_product_ids = family_index["product_ids"] if family_index else []
+            query = query.where(Chair.id.in_(family_product_ids))
 
         if search:
             search_term = f"%{search}%"
@@ -1358,27 +1104,34 @@ class ProductService:
         if not source_keywords:
             return []
 
-        query = (
-            select(Chair)
-            .options(selectinload(Chair.category))
-            .where(Chair.id != product_id, Chair.is_active == True)
+        # Score on the keyword columns alone, then load only the winners
+        query = select(Chair.id, Chair.keywords, Chair.display_order, Chair.name).where(
+            Chair.id != product_id, Chair.is_active == True
         )
         result = await db.execute(query)
-        candidates = list(result.scalars().all())
 
+        source = set(source_keywords)
         scored = []
-        for c in candidates:
+        for c in result:
             c_keywords = (
                 [str(k).strip().lower() for k in c.keywords if k]
                 if isinstance(c.keywords, list)
                 else []
             )
-            match_count = len(set(source_keywords) & set(c_keywords))
+            match_count = len(source & set(c_keywords))
             if match_count > 0:
                 scored.append((c, match_count))
 
         scored.sort(key=lambda x: (-x[1], x[0].display_order or 0, x[0].name or ""))
-        return [c for c, _ in scored[:limit]]
+        related_ids = [c.id for c, _ in scored[:limit]]
+        if not related_ids:
+            return []
+
+        result = await db.execute(
+            select(Chair).options(*ChairLoad.SEARCH).where(Chair.id.in_(related_ids))
+        )
+        by_id = {c.id: c for c in result.scalars().all()}
+        return [by_id[i] for i in related_ids if i in by_id]
 
     # ========================================================================
     # Family & Subcategory Methods (NEW)
@@ -1540,16 +1293,20 @@ class ProductService:
     # ========================================================================
 
     @staticmethod
-    async def warm_search_cache(db: AsyncSession) -> int:
+    async def warm_search_cache(db: AsyncSession, batch_size: int = SEARCH_WARM_BATCH_SIZE) -> int:
         """
         Populate the search cache with all active products
 
-        This should be called during application startup to enable
-        fast fuzzy search. Products are indexed with searchable text
-        (name, model number, descriptions) for YokedCache fuzzy matching.
+        Products are streamed in batches of ``batch_size`` with a column-only
+        select (no ORM objects or relationship loads), and each batch is
+        written to the cache in one pipelined round trip. Up to
+        ``SEARCH_WARM_MAX_INFLIGHT`` batch writes overlap with reading the
+        next batches. Indexed text covers name, model number, descriptions,
+        category and keywords for YokedCache fuzzy matching.
 
         Args:
             db: Database session
+            batch_size: Products per fetched batch / cache pipeline
 
         Returns:
             int: Number of products indexed
@@ -1557,49 +1314,76 @@ class ProductService:
         from backend.services.cache_service import cache_service
 
         logger.info("Starting product search cache warm-up...")
+        started = time.perf_counter()
 
         try:
-            # Fetch all active products
             query = (
-                select(Chair)
+                select(
+                    Chair.id,
+                    Chair.name,
+                    Chair.model_number,
+                    Chair.short_description,
+                    Chair.full_description,
+                    Category.name,
+                    Chair.keywords,
+                )
+                .outerjoin(Category, Chair.category_id == Category.id)
                 .where(Chair.is_active == True)
-                .options(selectinload(Chair.category))
+                .execution_options(yield_per=batch_size)
             )
 
-            result = await db.execute(query)
-            products = list(result.scalars().all())
-
-            indexed_count = 0
-
-            for product in products:
-                searchable_parts = [
-                    product.name or "",
-                    product.model_number or "",
-                    product.short_description or "",
-                    product.full_description or "",
-                ]
-                if product.category:
-                    searchable_parts.append(product.category.name or "")
-                kw = product.keywords
-                if isinstance(kw, list):
-                    searchable_parts.append(" ".join(str(k) for k in kw if k))
-                searchable_text = " ".join(filter(None, searchable_parts))
-
-                # Index for fuzzy search
-                success = await cache_service.index_product_for_search(
-                    product_id=product.id,
-                    searchable_text=searchable_text,
-                    ttl=3600,  # 1 hour
-                )
+            inflight = asyncio.Semaphore(SEARCH_WARM_MAX_INFLIGHT)
+            writes = []
 
-                if success:
-                    indexed_count += 1
+            async def _write(batch):
+                try:
+                    return await cache_service.index_products_for_search(batch, ttl=SEARCH_INDEX_TTL)
+                finally:
+                    inflight.release()
+
+            result = await db.stream(query)
+            async for rows in result.partitions():
+                batch = [(row[0], _searchable_text(*row[1:])) for row in rows]
+                await inflight.acquire()
+                writes.append(asyncio.create_task(_write(batch)))
 
+            indexed_count = sum(await asyncio.gather(*writes))
+
+            elapsed = time.perf_counter() - started
             logger.info(
-                f"Product search cache warm-up complete: {indexed_count} products indexed"
+                f"Product search cache warm-up complete: {indexed_count} products indexed "
+                f"in {elapsed:.2f}s ({len(writes)} batches)"
             )
             return indexed_count
 
         except Exception as e:
             logger.error(f"Error warming search cache: {e}")
             return 0
+
+    @staticmethod
+    async def refresh_search_cache(db: AsyncSession) -> Optional[int]:
+        """
+        Rebuild the search cache unless another worker already did this interval
+
+        The warm-up lock lives for ``SEARCH_REFRESH_SECONDS`` and is not
+        released after a successful run, so across all workers the index is
+        rebuilt once per interval, before its entries expire. A run that
+        indexes nothing gives the lock back so the next attempt can retry.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of products indexed, or None if the lock was held elsewhere
+            (or the cache is unavailable)
+        """
+        from backend.services.cache_service import cache_service
+
+        token = await cache_service.acquire_lock(SEARCH_WARM_LOCK, ttl=SEARCH_REFRESH_SECONDS)
+        if not token:
+            return None
+
+        indexed = await ProductService.warm_search_cache(db)
+        if not indexed:
+            await cache_service.release_lock(SEARCH_WARM_LOCK, token)
+        return indexed
@@ -0,0 +1,270 @@
+"""
+Quote Rollup Service
+
+Maintains the daily analytics rollups (``backend.models.analytics``) so the
+admin dashboard aggregates a few rows per day instead of the quote history.
+
+Rollups are updated incrementally from Quote mapper events: on every
+insert, update or delete the quote's old contribution is subtracted and its
+new one added, in the same transaction as the quote change. Updates and
+deletes are handled before their statement runs, so values that were
+assigned without being loaded are read from the still-unchanged row. The
+fastest/slowest response times only ever widen; ``rebuild`` tightens them
+after removals.
+
+This covers quote creation (``QuoteService.create_quote_request`` and the
+guest path), status changes (``AdminService.update_quote_status``,
+accept/decline), pricing and item edits that change totals. Bulk SQL
+updates bypass the hooks; ``rebuild``
+(``python -m backend.scripts.backfill_quote_rollups``) recomputes
+everything from ``quotes``.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, event, func, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.analytics import QuoteCompanyDaily, QuoteResponseDaily, QuoteStatusDaily
+from backend.models.quote import Quote, QuoteStatus
+
+logger = logging.getLogger(__name__)
+
+TRACKED_FIELDS = ("created_at", "status", "company_id", "total_amount", "quoted_price", "submitted_at", "quoted_at")
+
+# Statuses whose quoted price counts toward a company's value
+VALUED_STATUSES = {QuoteStatus.QUOTED.value, QuoteStatus.ACCEPTED.value}
+
+STATUS_SUMS = ("quote_count", "total_amount_sum", "quoted_price_sum", "quoted_price_count")
+COMPANY_SUMS = ("quote_count", "accepted_count", "quoted_value_sum")
+RESPONSE_SUMS = ("response_count", "response_seconds_sum")
+
+REBUILD_BATCH_SIZE = 5000
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+        except ValueError:
+            return None
+    return None
+
+
+def _status_value(status: Any) -> Optional[str]:
+    return getattr(status, "value", status)
+
+
+class QuoteRollupDelta:
+    """Accumulated rollup changes, applied with one upsert per table"""
+
+    def __init__(self):
+        self.status: Dict[Tuple[date, str], Dict[str, int]] = defaultdict(lambda: dict.fromkeys(STATUS_SUMS, 0))
+        self.company: Dict[Tuple[date, int], Dict[str, int]] = defaultdict(lambda: dict.fromkeys(COMPANY_SUMS, 0))
+        self.response: Dict[date, Dict[str, Any]] = {}
+
+    def add_quote(self, values: Dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one quote's contribution"""
+        day = (values["created_at"] or datetime.utcnow()).date()
+        status = _status_value(values["status"])
+        quoted_price = values["quoted_price"]
+
+        row = self.status[(day, status)]
+        row["quote_count"] += sign
+        row["total_amount_sum"] += sign * (values["total_amount"] or 0)
+        if quoted_price is not None:
+            row["quoted_price_sum"] += sign * quoted_price
+            row["quoted_price_count"] += sign
+
+        if values["company_id"] is not None:
+            row = self.company[(day, values["company_id"])]
+            row["quote_count"] += sign
+            row["accepted_count"] += sign * (status == QuoteStatus.ACCEPTED.value)
+            if status in VALUED_STATUSES:
+                row["quoted_value_sum"] += sign * (quoted_price or 0)
+
+    def add_response(self, values: Dict[str, Any], sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) a quote's first response (the time it was priced)"""
+        quoted_at = _parse_time(values["quoted_at"])
+        submitted_at = _parse_time(values["submitted_at"]) or values["created_at"]
+        if not quoted_at or not submitted_at:
+            return
+        seconds = max(int((quoted_at - submitted_at).total_seconds()), 0)
+        row = self.response.setdefault(
+            quoted_at.date(),
+            {"response_count": 0, "response_seconds_sum": 0, "fastest_seconds": None, "slowest_seconds": None},
+        )
+        row["response_count"] += sign
+        row["response_seconds_sum"] += sign * seconds
+        if sign > 0:
+            row["fastest_seconds"] = min(row["fastest_seconds"] if row["fastest_seconds"] is not None else seconds, seconds)
+            row["slowest_seconds"] = max(row["slowest_seconds"] or 0, seconds)
+
+    def apply(self, connection: Connection) -> None:
+        """Upsert the accumulated changes (no-op rows are skipped)"""
+        status_rows = [
+            {"day": day, "status": status, **sums}
+            for (day, status), sums in self.status.items() if any(sums.values())
+        ]
+        company_rows = [
+            {"day": day, "company_id": company_id, **sums}
+            for (day, company_id), sums in self.company.items() if any(sums.values())
+        ]
+        response_rows = [{"day": day, **sums} for day, sums in self.response.items() if any(sums.values())]
+
+        if status_rows:
+            connection.execute(_increment_upsert(connection, QuoteStatusDaily.__table__, ["day", "status"], STATUS_SUMS), status_rows)
+        if company_rows:
+            connection.execute(_increment_upsert(connection, QuoteCompanyDaily.__table__, ["day", "company_id"], COMPANY_SUMS), company_rows)
+        if response_rows:
+            connection.execute(_increment_upsert(connection, QuoteResponseDaily.__table__, ["day"], RESPONSE_SUMS, minmax=True), response_rows)
+
+
+def _increment_upsert(connection: Connection, table, keys: Iterable[str], sums: Iterable[str], minmax: bool = False):
+    """INSERT ... ON CONFLICT that adds to the existing counters"""
+    dialect = connection.dialect.name
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"Rollup upsert is not supported on {dialect}")
+
+    stmt = dialect_insert(table)
+    new = stmt.inserted if dialect in ("mysql", "mariadb") else stmt.excluded
+    values = {c: table.c[c] + new[c] for c in sums}
+    values["updated_at"] = datetime.utcnow()
+    if minmax:
+        least, greatest = (func.min, func.max) if dialect == "sqlite" else (func.least, func.greatest)
+        # A removal carries NULL bounds, which must leave the stored ones alone
+        for column, pick in (("fastest_seconds", least), ("slowest_seconds", greatest)):
+            values[column] = pick(
+                func.coalesce(table.c[column], new[column]), func.coalesce(new[column], table.c[column])
+            )
+
+    if dialect in ("mysql", "mariadb"):
+        return stmt.on_duplicate_key_update(values)
+    return stmt.on_conflict_do_update(index_elements=list(keys), set_=values)
+
+
+def _quote_values(connection: Connection, target: Quote) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Tracked field values before and after the pending flush
+
+    Must run before the quote's UPDATE/DELETE is emitted: a value assigned
+    without the old one being loaded (or never loaded) has no usable history,
+    so the committed value is read from the row.
+    """
+    state = inspect(target)
+    missing = [
+        key for key in TRACKED_FIELDS
+        if not state.attrs[key].history.deleted and (key not in state.dict or state.attrs[key].history.added)
+    ]
+    committed = {}
+    if missing and target.id is not None:
+        table = Quote.__table__
+        row = connection.execute(select(*(table.c[key] for key in missing)).where(table.c.id == target.id)).one()
+        committed = dict(zip(missing, row))
+
+    old, new = {}, {}
+    for key in TRACKED_FIELDS:
+        history = state.attrs[key].history
+        if history.deleted:
+            old[key] = history.deleted[0]
+        elif key in committed:
+            old[key] = committed[key]
+        else:
+            old[key] = state.dict[key]
+        new[key] = state.dict[key] if key in state.dict else committed.get(key)
+    return old, new
+
+
+@event.listens_for(Quote, "after_insert")
+def _quote_inserted(mapper, connection: Connection, target: Quote) -> None:
+    values = {key: getattr(target, key) for key in TRACKED_FIELDS}
+    delta = QuoteRollupDelta()
+    delta.add_quote(values, 1)
+    if values["quoted_at"]:
+        delta.add_response(values)
+    delta.apply(connection)
+
+
+@event.listens_for(Quote, "before_update")
+def _quote_updated(mapper, connection: Connection, target: Quote) -> None:
+    state = inspect(target)
+    if not any(state.attrs[key].history.has_changes() for key in TRACKED_FIELDS):
+        return
+    old, new = _quote_values(connection, target)
+    delta = QuoteRollupDelta()
+    delta.add_quote(old, -1)
+    delta.add_quote(new, 1)
+    if any(old[key] != new[key] for key in ("quoted_at", "submitted_at", "created_at")):
+        delta.add_response(old, -1)
+        delta.add_response(new, 1)
+    delta.apply(connection)
+
+
+@event.listens_for(Quote, "before_delete")
+def _quote_deleted(mapper, connection: Connection, target: Quote) -> None:
+    old, _ = _quote_values(connection, target)
+    delta = QuoteRollupDelta()
+    delta.add_quote(old, -1)
+    delta.add_response(old, -1)
+    delta.apply(connection)
+
+
+def since(days: Optional[int]) -> Optional[date]:
+    """First day of a trailing ``days`` window (None = all time)"""
+    return date.today() - timedelta(days=days) if days else None
+
+
+class QuoteRollupService:
+    """Rebuild the daily quote rollups"""
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> Dict[str, int]:
+        """
+        Recompute all rollups from the quotes table
+
+        Quotes are streamed in batches; only the aggregates are held in memory.
+
+        Args:
+            db: Database session (committed on success)
+
+        Returns:
+            Number of quotes and rollup rows written
+        """
+        delta = QuoteRollupDelta()
+        quotes = 0
+        columns = [getattr(Quote, key) for key in TRACKED_FIELDS]
+        result = await db.stream(select(*columns).execution_options(yield_per=REBUILD_BATCH_SIZE))
+        async for rows in result.partitions():
+            for row in rows:
+                values = dict(zip(TRACKED_FIELDS, row))
+                delta.add_quote(values, 1)
+                if values["quoted_at"]:
+                    delta.add_response(values)
+                quotes += 1
+
+        for model in (QuoteStatusDaily, QuoteCompanyDaily, QuoteResponseDaily):
+            await db.execute(delete(model))
+        connection = await db.connection()
+        await connection.run_sync(delta.apply)
+        await db.commit()
+
+        stats = {
+            "quotes": quotes,
+            "status_rows": len(delta.status),
+            "company_rows": len(delta.company),
+            "response_rows": len(delta.response),
+        }
+        logger.info(f"Rebuilt quote rollups: {stats}")
+        return stats
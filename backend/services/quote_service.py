@@ -4,14 +4,15 @@ Quote Service
 Handles quote requests, cart operations, and saved configurations
 """
 
+import hashlib
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from backend.core.exceptions import (
     AuthorizationError,
@@ -20,7 +21,7 @@ from backend.core.exceptions import (
     ValidationError,
 )
 from backend.models.chair import Chair
-from backend.models.company import Company, CompanyShippingAddress
+from backend.models.company import Company, CompanyPricing, CompanyShippingAddress
 from backend.models.quote import (
     Cart,
     CartItem,
@@ -33,6 +34,7 @@ from backend.models.quote import (
     QuoteStatus,
     SavedConfiguration,
 )
+from backend.services import quote_rollup_service  # noqa: F401  (registers the quote rollup hooks)
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +136,9 @@ class QuoteService:
         """
         Get cart with items, ensuring it belongs to the company
         
+        Prices come from the cart's price snapshot; they are only recomputed
+        (and written) when the snapshot is stale, see refresh_cart_prices.
+        
         Args:
             db: Database session
             cart_id: Cart ID
@@ -150,9 +155,9 @@ class QuoteService:
             select(Cart)
             .options(
                 selectinload(Cart.items).selectinload(CartItem.product).options(
-                    selectinload(Chair.category),
-                    selectinload(Chair.subcategory),
-                    selectinload(Chair.family),
+                    joinedload(Chair.category),
+                    joinedload(Chair.subcategory),
+                    joinedload(Chair.family),
                 )
             )
             .where(Cart.id == cart_id)
@@ -169,24 +174,87 @@ class QuoteService:
             )
             raise AuthorizationError("You don't have permission to access this cart")
 
+        await QuoteService.refresh_cart_prices(db, cart)
+        
+        return cart
+    
+    @staticmethod
+    def _cart_price_version(cart: Cart, pricing_tier: Optional[CompanyPricing]) -> str:
+        """
+        Stamp of every input the cart's cached prices depend on: the company's
+        pricing tier (while in effect) and each item's product price fields
+        and quantity.
+        """
         from backend.services.pricing_service import PricingService
-        company_result = await db.execute(
-            select(Company).where(Company.id == company_id)
-        )
-        company = company_result.scalar_one_or_none()
+
+        tier_key = None
+        if PricingService.tier_in_effect(pricing_tier):
+            tier_key = (
+                pricing_tier.id,
+                pricing_tier.percentage_adjustment,
+                pricing_tier.applies_to_all_products,
+                sorted(str(c) for c in pricing_tier.specific_categories or []),
+                str(pricing_tier.updated_at),
+            )
+        items_key = [
+            (
+                item.id,
+                item.product_id,
+                item.quantity,
+                item.customization_cost,
+                item.product.base_price,
+                item.product.category_id,
+                str(item.product.updated_at),
+            )
+            for item in cart.items
+        ]
+        return hashlib.sha1(repr((tier_key, items_key)).encode()).hexdigest()
+    
+    @staticmethod
+    async def refresh_cart_prices(db: AsyncSession, cart: Cart) -> bool:
+        """
+        Reprice a cart (items and totals) if its price snapshot is stale
+        
+        Reads are free when nothing changed: only the pricing tier is
+        queried and nothing is written. Otherwise every item is repriced in
+        one pass from that single tier lookup and committed once.
+        
+        Args:
+            db: Database session
+            cart: Cart with items and their products loaded
+            
+        Returns:
+            True if prices were recomputed
+        """
+        from backend.services.pricing_service import PricingService
+
+        pricing_tier = await PricingService.get_company_pricing_tier(db, cart.company_id)
+        version = QuoteService._cart_price_version(cart, pricing_tier)
+        if cart.price_version == version:
+            return False
+
+        today = date.today()
+        subtotal = 0
         for item in cart.items:
             base_price = item.product.base_price or 0
             unit_price = base_price
-            if company and base_price and item.product.category_id:
-                tier_adjustment, _ = await PricingService._get_company_tier_adjustment(
-                    db, company_id, item.product.category_id, base_price
+            if base_price and item.product.category_id:
+                tier_adjustment, _ = PricingService.tier_adjustment(
+                    pricing_tier, item.product.category_id, base_price, today
                 )
                 unit_price = base_price + tier_adjustment
             item.unit_price = unit_price
             item.line_total = item.quantity * (unit_price + (item.customization_cost or 0))
+            subtotal += item.line_total
+
+        cart.subtotal = subtotal
+        cart.estimated_total = subtotal + (cart.estimated_tax or 0) + (cart.estimated_shipping or 0)
+        cart.price_version = version
+        cart.priced_at = datetime.utcnow()
         await db.commit()
-        
-        return cart
+
+        logger.info(f"Repriced cart {cart.id} ({len(cart.items)} items)")
+        return True
     
     @staticmethod
     async def add_to_cart(
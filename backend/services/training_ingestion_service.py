@@ -0,0 +1,269 @@
+"""
+Training Ingestion Service
+
+Turns an uploaded AI training document into summary, key facts and tables.
+Runs inside the ``training_document`` job in the background worker:
+
+1. Text extraction (pdfplumber/pandas, CPU bound) runs in a process pool so
+   concurrent jobs don't serialise on the GIL or block the worker's loop.
+2. The extracted text is split into chunks of at most
+   ``AI_TRAINING_CHUNK_CHARS`` instead of one prompt truncated at 120k chars.
+3. Chunks are analysed concurrently; a per-process semaphore caps in-flight
+   model calls at ``AI_TRAINING_MODEL_CONCURRENCY`` across all jobs.
+4. Each chunk's result is saved as it completes (``chunk_results``), so the
+   admin sees progress and a retried job only analyses the missing chunks.
+
+Per-document timings and throughput are logged, stored on the document and
+returned as the job result.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import update
+
+from backend.core.config import settings
+from backend.database.base import AsyncSessionLocal
+from backend.models.ai_chat import AITrainingDocument, TrainingStatus
+
+logger = logging.getLogger(__name__)
+
+# Extraction limits for training documents (higher than chat attachments)
+EXTRACT_LIMITS = {"max_csv_rows": 2000, "max_excel_rows": 2000, "max_pdf_pages": 200}
+
+_extract_pool: Optional[ProcessPoolExecutor] = None
+_model_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def chunk_content(content: str, max_chars: int) -> List[str]:
+    """
+    Split text into chunks of at most ``max_chars``
+
+    Splits on blank lines (pages, tables, paragraphs), then on lines, and
+    only hard-cuts a single line longer than a chunk.
+    """
+    def pieces(text: str, separators: tuple) -> List[str]:
+        if len(text) <= max_chars:
+            return [text]
+        if not separators:
+            return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+        result = []
+        for part in text.split(separators[0]):
+            result.extend(pieces(part, separators[1:]))
+        return result
+
+    chunks: List[str] = []
+    current = ""
+    for piece in pieces(content, ("\n\n", "\n")):
+        if not piece.strip():
+            continue
+        if current and len(current) + 2 + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    global _extract_pool
+    if _extract_pool is None:
+        # spawn: children must not inherit the worker's event loop or DB connections
+        _extract_pool = ProcessPoolExecutor(
+            max_workers=settings.AI_TRAINING_EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _extract_pool
+
+
+def shutdown_extract_pool() -> None:
+    """Stop the extraction processes (called when the worker exits)"""
+    global _extract_pool
+    if _extract_pool is not None:
+        _extract_pool.shutdown(wait=False, cancel_futures=True)
+        _extract_pool = None
+
+
+def _get_model_semaphore() -> asyncio.Semaphore:
+    global _model_semaphore
+    if _model_semaphore is None:
+        _model_semaphore = asyncio.Semaphore(max(settings.AI_TRAINING_MODEL_CONCURRENCY, 1))
+    return _model_semaphore
+
+
+class TrainingIngestionService:
+    """Extract, chunk and analyse training documents"""
+
+    @staticmethod
+    async def extract(file_path: str, file_type: str, original_filename: str) -> str:
+        """Extract a document's text in the process pool (or a thread if disabled)"""
+        global _extract_pool
+        from backend.services.ai_service import extract_file_content
+
+        job = partial(extract_file_content, file_path, file_type, original_filename, **EXTRACT_LIMITS)
+        if settings.AI_TRAINING_EXTRACT_WORKERS > 0:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(_get_extract_pool(), job)
+            except BrokenProcessPool:
+                logger.warning("Extraction pool broke; extracting in a thread instead")
+                _extract_pool = None
+        return await asyncio.to_thread(job)
+
+    @staticmethod
+    async def _save_progress(document_id: str, content_hash: str, parts: Dict[str, Any]) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(AITrainingDocument)
+                .where(AITrainingDocument.id == document_id)
+                .values(
+                    chunks_done=len(parts),
+                    chunk_results={"content_hash": content_hash, "parts": dict(parts)},
+                )
+            )
+            await db.commit()
+
+    @staticmethod
+    async def ingest(document_id: str) -> Dict[str, Any]:
+        """
+        Process one training document end to end
+
+        Args:
+            document_id: AITrainingDocument.id
+
+        Returns:
+            Processing stats (stored on the document as well)
+
+        Raises:
+            ValueError: Unknown document
+            RuntimeError: Extraction or analysis failed (the document is
+                marked failed; finished chunks are kept for the retry)
+        """
+        from backend.services import ai_service
+
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            doc = await db.get(AITrainingDocument, document_id)
+            if not doc:
+                raise ValueError(f"Training document {document_id} not found")
+            file_path, filename, name = doc.file_path, doc.original_filename, doc.name
+            file_type = getattr(doc.file_type, "value", doc.file_type)
+            previous = doc.chunk_results or {}
+            doc.status = TrainingStatus.PROCESSING
+            doc.error_message = None
+            await db.commit()
+
+        try:
+            raw_content = await TrainingIngestionService.extract(file_path, file_type, filename)
+            extract_ms = (time.perf_counter() - started) * 1000
+            if not raw_content or raw_content.startswith("[Error") or raw_content.startswith("[File not"):
+                raise RuntimeError(raw_content or "No content could be extracted")
+
+            chunks = chunk_content(raw_content, settings.AI_TRAINING_CHUNK_CHARS)
+            content_hash = hashlib.sha1(raw_content.encode("utf-8")).hexdigest()
+            parts: Dict[str, Any] = {}
+            if previous.get("content_hash") == content_hash:
+                parts = dict(previous.get("parts") or {})
+            resumed = len(parts)
+
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(AITrainingDocument)
+                    .where(AITrainingDocument.id == document_id)
+                    .values(
+                        processed_content=raw_content,
+                        chunks_total=len(chunks),
+                        chunks_done=len(parts),
+                        chunk_results={"content_hash": content_hash, "parts": parts},
+                    )
+                )
+                await db.commit()
+
+            semaphore = _get_model_semaphore()
+            save_lock = asyncio.Lock()
+
+            async def analyze(index: int, chunk: str) -> None:
+                async with semaphore:
+                    result = await ai_service.analyze_training_chunk(
+                        name, file_type, chunk, part=index + 1, parts=len(chunks)
+                    )
+                async with save_lock:
+                    parts[str(index)] = result
+                    await TrainingIngestionService._save_progress(document_id, content_hash, parts)
+
+            analyze_started = time.perf_counter()
+            outcomes = await asyncio.gather(
+                *(analyze(i, chunk) for i, chunk in enumerate(chunks) if str(i) not in parts),
+                return_exceptions=True,
+            )
+            errors = [o for o in outcomes if isinstance(o, BaseException)]
+            if errors:
+                raise RuntimeError(
+                    f"{len(errors)} of {len(chunks)} chunks failed: {errors[0]}"
+                ) from errors[0]
+
+            ordered = [parts[str(i)] for i in range(len(chunks))]
+            summaries = [p.get("summary", "") for p in ordered]
+            if len(ordered) > 1:
+                summary = await ai_service.merge_training_summaries(name, summaries)
+            else:
+                summary = summaries[0]
+            key_facts = [fact for p in ordered for fact in (p.get("key_facts") or [])]
+            structured_data = "\n\n".join(p["structured_data"] for p in ordered if p.get("structured_data"))
+            analyze_ms = (time.perf_counter() - analyze_started) * 1000
+
+        except Exception as e:
+            logger.error(f"Training document {document_id} failed: {e}")
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(AITrainingDocument)
+                    .where(AITrainingDocument.id == document_id)
+                    .values(status=TrainingStatus.FAILED, error_message=str(e))
+                )
+                await db.commit()
+            raise RuntimeError(str(e)) from e
+
+        total_ms = (time.perf_counter() - started) * 1000
+        stats = {
+            "document_id": document_id,
+            "chars": len(raw_content),
+            "chunks": len(chunks),
+            "chunks_resumed": resumed,
+            "extract_ms": round(extract_ms, 1),
+            "analyze_ms": round(analyze_ms, 1),
+            "total_ms": round(total_ms, 1),
+            "chars_per_second": round(len(raw_content) / (total_ms / 1000), 1) if total_ms else None,
+        }
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(AITrainingDocument)
+                .where(AITrainingDocument.id == document_id)
+                .values(
+                    status=TrainingStatus.COMPLETED,
+                    summary=summary,
+                    key_facts=key_facts,
+                    structured_data=structured_data,
+                    processed_at=datetime.utcnow(),
+                    chunks_done=len(chunks),
+                    chunk_results=None,
+                    processing_stats=stats,
+                )
+            )
+            await db.commit()
+
+        logger.info(
+            f"Ingested training document {document_id}: {stats['chars']} chars in "
+            f"{stats['chunks']} chunks ({stats['chunks_resumed']} resumed), "
+            f"extract {stats['extract_ms']}ms, analyze {stats['analyze_ms']}ms, "
+            f"{stats['chars_per_second']} chars/s"
+        )
+        return stats
@@ -0,0 +1,162 @@
+"""
+Pre-compressed Static Files
+
+Writes Brotli and gzip siblings (``file.br``, ``file.gz``) next to a generated
+file once, at export time, and serves whichever sibling the client accepts as
+a FileResponse, so serving the file costs no compression work per request.
+
+Brotli needs the optional ``brotli`` package; without it only ``.gz``
+siblings are written and clients that accept ``br`` get the gzip file.
+"""
+
+import gzip
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Preferred first; (Content-Encoding token, file suffix)
+ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _load_brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    temp_file = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    temp_file.write_bytes(data)
+    os.replace(temp_file, path)
+
+
+def sibling(path: Path, suffix: str) -> Path:
+    """``contentData.json`` -> ``contentData.json.gz``"""
+    return path.with_name(path.name + suffix)
+
+
+def write_precompressed(path: Path, data: Optional[bytes] = None) -> List[Path]:
+    """
+    Write compressed siblings of ``path``
+
+    A stale ``.br`` is removed when brotli is not installed, so it is never
+    served for newer content.
+
+    Args:
+        path: File that was just written
+        data: Its content (read from ``path`` if omitted)
+
+    Returns:
+        Sibling files written
+    """
+    if data is None:
+        data = path.read_bytes()
+
+    # mtime=0 keeps the .gz bytes identical for identical content
+    written = [sibling(path, ".gz")]
+    _write_atomic(written[0], gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0))
+
+    brotli = _load_brotli()
+    br_path = sibling(path, ".br")
+    if brotli is not None:
+        _write_atomic(br_path, brotli.compress(data, quality=BROTLI_QUALITY))
+        written.append(br_path)
+    else:
+        br_path.unlink(missing_ok=True)
+    return written
+
+
+def remove_precompressed(path: Path) -> None:
+    """Delete ``path`` and its compressed siblings"""
+    path.unlink(missing_ok=True)
+    for _, suffix in ENCODINGS:
+        sibling(path, suffix).unlink(missing_ok=True)
+
+
+def _accepted(accept_encoding: str) -> Dict[str, float]:
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token.strip()] = q
+    return accepted
+
+
+def choose_file(path: Path, accept_encoding: Optional[str]) -> Tuple[Path, Optional[str]]:
+    """
+    Best existing variant of ``path`` for an Accept-Encoding header
+
+    Siblings older than ``path`` are ignored (an export may have been
+    interrupted between writing the file and its siblings).
+
+    Returns:
+        (file to send, Content-Encoding or None for the original)
+    """
+    accepted = _accepted(accept_encoding or "")
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return path, None
+    for token, suffix in ENCODINGS:
+        if accepted.get(token, accepted.get("*", 0.0)) <= 0:
+            continue
+        candidate = sibling(path, suffix)
+        try:
+            if candidate.stat().st_mtime_ns >= mtime:
+                return candidate, token
+        except FileNotFoundError:
+            continue
+    return path, None
+
+
+def precompressed_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    FileResponse for ``path`` using the best pre-compressed sibling
+
+    Answers a matching If-None-Match with 304. The ETag is per file, so each
+    encoding has its own.
+
+    Args:
+        request: Incoming request (Accept-Encoding, If-None-Match)
+        path: Uncompressed file
+        media_type: Content-Type of the uncompressed file
+        headers: Extra headers, e.g. Cache-Control
+    """
+    file_path, encoding = choose_file(path, request.headers.get("accept-encoding"))
+    response_headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+
+    stat = file_path.stat()
+    response = FileResponse(
+        file_path,
+        media_type=media_type,
+        headers={**response_headers, "Content-Encoding": encoding} if encoding else response_headers,
+        stat_result=stat,
+    )
+    etag = response.headers["etag"]
+    if_none_match = request.headers.get("if-none-match", "")
+    if any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={**response_headers, "ETag": etag})
+    return response
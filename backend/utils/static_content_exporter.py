@@ -9,18 +9,30 @@ Handles both development and production environments.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from backend.utils.precompressed import remove_precompressed, write_precompressed
+
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# Each export also writes contentData.<hash>.json (named by content hash, so it
+# can be cached forever) and a small no-cache manifest pointing at it. The
+# last few hashed bundles are kept for clients still holding an older manifest.
+CONTENT_HASH_LENGTH = 12
+HASHED_BUNDLES_KEPT = 3
+HASHED_BUNDLE_RE = re.compile(rf"^contentData\.[0-9a-f]{{{CONTENT_HASH_LENGTH}}}\.json$")
+MANIFEST_NAME = "contentData.manifest.json"
+
 # Guards the read-modify-write sequence in export_content_after_update() so that
 # concurrent exports (e.g. two admin saves for different content sections landing
 # in the same worker process at nearly the same time) don't race on the shared
@@ -265,6 +277,7 @@ class StaticContentExporter:
             # Write to the correct location based on environment
             # (already determined in __init__)
             self._write_content_file(self.content_file, json_content)
+            self._write_bundle(json_content)
 
             # Update cache for easier reading
             self._update_cache(content_data)
@@ -314,6 +327,50 @@ class StaticContentExporter:
                         )
                         raise
 
+    def _write_bundle(self, content: str) -> Optional[Path]:
+        """
+        Write compressed siblings, the content-hashed copy and the manifest.
+
+        Failures are logged, not raised: contentData.json itself is already
+        written, and a sibling older than it is never served.
+
+        Args:
+            content: Content just written to self.content_file
+
+        Returns:
+            Path of the hashed bundle, or None if it could not be written
+        """
+        try:
+            data = content.encode("utf-8")
+            write_precompressed(self.content_file, data)
+
+            digest = hashlib.sha256(data).hexdigest()[:CONTENT_HASH_LENGTH]
+            hashed_file = self.data_dir / f"contentData.{digest}.json"
+            self._write_content_file(hashed_file, content)
+            write_precompressed(hashed_file, data)
+
+            manifest = {
+                "file": hashed_file.name,
+                "hash": digest,
+                "lastUpdated": datetime.utcnow().isoformat(),
+            }
+            self._write_content_file(self.data_dir / MANIFEST_NAME, json.dumps(manifest))
+
+            self._prune_hashed_bundles(keep=hashed_file)
+            return hashed_file
+        except Exception as e:
+            logger.warning(f"Could not write compressed/hashed content bundle: {e}")
+            return None
+
+    def _prune_hashed_bundles(self, keep: Path):
+        """Remove all but the newest HASHED_BUNDLES_KEPT hashed bundles."""
+        bundles = [
+            path for path in self.data_dir.glob("contentData.*.json") if HASHED_BUNDLE_RE.match(path.name)
+        ]
+        bundles.sort(key=lambda path: (path == keep, path.stat().st_mtime_ns), reverse=True)
+        for path in bundles[HASHED_BUNDLES_KEPT:]:
+            remove_precompressed(path)
+
     def _generate_json_file(self, content_data: Dict[str, Any]) -> str:
         """
         Generate the complete JSON file content.
@@ -924,12 +981,12 @@ async def export_content_after_update(content_type: str, db: "AsyncSession") ->
                 # product subcategories and nested categories (categories
                 # with a parent_id) — a nested category is a child and must
                 # never be exported as a primary category.
-                from backend.services.product_service import ProductService
-
-                children_by_category = await ProductService.get_category_children(
-                    db=db, include_inactive=False, with_counts=False
+                from backend.services.category_tree_service import (
+                    CategoryTreeService,
                 )
 
+                snapshot = await CategoryTreeService.get_snapshot(db)
+
                 def _child_payload(child):
                     return {
                         "id": child["id"],
@@ -942,31 +999,27 @@ async def export_content_after_update(content_type: str, db: "AsyncSession") ->
                         "type": child["type"],
                     }
 
-                # Fetch active top-level categories
-                result = await db.execute(
-                    select(Category)
-                    .where(Category.is_active == True, Category.parent_id.is_(None))
-                    .order_by(Category.display_order)
-                )
-                categories = result.scalars().all()
-
                 data = [
                     {
-                        "id": c.id,
-                        "name": c.name,
-                        "slug": c.slug,
-                        "description": c.description,
-                        "parentId": c.parent_id,
-                        "displayOrder": c.display_order,
-                        "isActive": c.is_active,
-                        "iconUrl": c.icon_url,
-                        "bannerImageUrl": c.banner_image_url,
+                        "id": c["id"],
+                        "name": c["name"],
+                        "slug": c["slug"],
+                        "description": c["description"],
+                        "parentId": c["parent_id"],
+                        "displayOrder": c["display_order"],
+                        "isActive": c["is_active"],
+                        "iconUrl": c["icon_url"],
+                        "bannerImageUrl": c["banner_image_url"],
                         "subcategories": [
                             _child_payload(child)
-                            for child in children_by_category.get(c.id, [])
+                            for child in CategoryTreeService.children_of(
+                                snapshot, c["id"]
+                            )
                         ],
                     }
-                    for c in categories
+                    for c in CategoryTreeService.list_categories(
+                        snapshot, top_level_only=True
+                    )
                 ]
                 return exporter.export_categories(data)
 
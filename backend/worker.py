@@ -0,0 +1,233 @@
+"""
+EagleChair Background Worker
+
+Executes jobs from the ``background_jobs`` table outside the web workers:
+
+    python -m backend.worker                      # all job types
+    python -m backend.worker --types catalog_parse,catalog_import
+    python -m backend.worker --once               # drain due jobs and exit
+    python -m backend.worker --no-schedule        # don't queue recurring jobs
+
+Each job type has its own concurrency limit (see ``JOB_POLICIES``). The
+worker keeps the ``RECURRING_JOBS`` it handles (periodic cleanup) queued,
+so nothing periodic runs inside the web workers. Running
+jobs heartbeat to keep their lease; on SIGTERM/SIGINT the worker stops
+claiming, waits for running jobs up to ``--shutdown-timeout`` and hands any
+still-running job back to the queue.
+
+In production it runs as its own supervised service
+(``deploy/systemd/eaglechair-worker.service``), separate from the API.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from backend.database.base import AsyncSessionLocal
+from backend.models.job import BackgroundJob
+from backend.services.job_handlers import JOB_HANDLERS
+from backend.services.job_queue_service import (
+    RECURRING_JOBS,
+    JobQueueService,
+    current_job,
+    default_worker_id,
+    get_policy,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_CHECK_SECONDS = 60.0
+
+
+class Worker:
+    """Poll the job table and run jobs with per-type concurrency limits"""
+
+    def __init__(
+        self,
+        job_types: Optional[Iterable[str]] = None,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        shutdown_timeout: float = 60.0,
+        schedule: bool = True,
+    ):
+        self.job_types = list(job_types or JOB_HANDLERS.keys())
+        unknown = [t for t in self.job_types if t not in JOB_HANDLERS]
+        if unknown:
+            raise ValueError(f"Unknown job types: {', '.join(unknown)}")
+
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = poll_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.schedule = schedule
+        self._next_schedule_check = 0.0
+        self._running: Dict[int, asyncio.Task] = {}
+        self._running_by_type: Dict[str, Set[int]] = {t: set() for t in self.job_types}
+        self._stop = asyncio.Event()
+
+    def request_stop(self) -> None:
+        if not self._stop.is_set():
+            logger.info(f"Worker {self.worker_id} stopping")
+            self._stop.set()
+
+    def _free_slots(self, job_type: str) -> int:
+        return get_policy(job_type)["concurrency"] - len(self._running_by_type[job_type])
+
+    async def poll_once(self) -> int:
+        """
+        Claim and start as many due jobs as the free slots allow
+
+        Returns:
+            Number of jobs started
+        """
+        started = 0
+        for job_type in self.job_types:
+            slots = self._free_slots(job_type)
+            if slots <= 0:
+                continue
+            async with AsyncSessionLocal() as db:
+                jobs = await JobQueueService.claim(db, self.worker_id, [job_type], limit=slots)
+            for job in jobs:
+                self._start(job)
+                started += 1
+        return started
+
+    async def schedule_recurring(self) -> None:
+        """Queue the next run of each recurring job type this worker handles"""
+        for job_type, spec in RECURRING_JOBS.items():
+            if job_type not in self.job_types:
+                continue
+            try:
+                async with AsyncSessionLocal() as db:
+                    await JobQueueService.schedule_recurring(
+                        db, job_type, spec["interval_seconds"], spec.get("payload")
+                    )
+            except Exception as e:
+                logger.warning(f"Could not schedule {job_type}: {e}")
+
+    def _start(self, job: BackgroundJob) -> None:
+        task = asyncio.create_task(self._execute(job.id, job.job_type, job.payload or {}))
+        self._running[job.id] = task
+        self._running_by_type[job.job_type].add(job.id)
+
+        def _done(_task: asyncio.Task, job_id=job.id, job_type=job.job_type) -> None:
+            self._running.pop(job_id, None)
+            self._running_by_type[job_type].discard(job_id)
+
+        task.add_done_callback(_done)
+
+    async def _heartbeat(self, job_id: int, lease_seconds: int) -> None:
+        interval = max(lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with AsyncSessionLocal() as db:
+                    if not await JobQueueService.heartbeat(db, job_id, self.worker_id, lease_seconds):
+                        logger.warning(f"Lost lease on job {job_id}")
+                        return
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {job_id} failed: {e}")
+
+    async def _execute(self, job_id: int, job_type: str, payload: dict) -> None:
+        policy = get_policy(job_type)
+        current_job.set((job_id, self.worker_id))
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, policy["lease_seconds"]))
+        logger.info(f"Running {job_type} job {job_id}")
+        try:
+            result = await JOB_HANDLERS[job_type](payload)
+        except asyncio.CancelledError:
+            async with AsyncSessionLocal() as db:
+                await JobQueueService.release(db, job_id, self.worker_id)
+            logger.info(f"Released interrupted {job_type} job {job_id}")
+            raise
+        except Exception as e:
+            logger.error(f"{job_type} job {job_id} failed: {e}", exc_info=True)
+            async with AsyncSessionLocal() as db:
+                retry = await JobQueueService.fail(db, job_id, self.worker_id, str(e) or repr(e))
+            if retry:
+                logger.info(f"{job_type} job {job_id} will be retried")
+        else:
+            async with AsyncSessionLocal() as db:
+                await JobQueueService.complete(db, job_id, self.worker_id, result)
+            logger.info(f"{job_type} job {job_id} succeeded")
+        finally:
+            heartbeat.cancel()
+
+    async def drain(self) -> None:
+        """Wait for running jobs; cancel (and release) those exceeding the timeout"""
+        if not self._running:
+            return
+        tasks = list(self._running.values())
+        _, pending = await asyncio.wait(tasks, timeout=self.shutdown_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def run(self, once: bool = False) -> None:
+        """
+        Main loop
+
+        Args:
+            once: Process the jobs that are due right now and return
+        """
+        logger.info(
+            f"Worker {self.worker_id} started (types: {', '.join(self.job_types)})"
+        )
+        try:
+            while not self._stop.is_set():
+                if self.schedule and time.monotonic() >= self._next_schedule_check:
+                    await self.schedule_recurring()
+                    self._next_schedule_check = time.monotonic() + SCHEDULE_CHECK_SECONDS
+                started = await self.poll_once()
+                if once and not started and not self._running:
+                    break
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.drain()
+            logger.info(f"Worker {self.worker_id} stopped")
+
+
+async def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="EagleChair background job worker")
+    parser.add_argument("--types", help="Comma-separated job types (default: all)")
+    parser.add_argument("--poll-interval", type=float, default=2.0)
+    parser.add_argument("--shutdown-timeout", type=float, default=60.0)
+    parser.add_argument("--once", action="store_true", help="Drain due jobs and exit")
+    parser.add_argument("--no-schedule", action="store_true", help="Don't queue recurring jobs")
+    args = parser.parse_args(argv)
+
+    worker = Worker(
+        job_types=args.types.split(",") if args.types else None,
+        poll_interval=args.poll_interval,
+        shutdown_timeout=args.shutdown_timeout,
+        schedule=not args.no_schedule,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, worker.request_stop)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        await worker.run(once=args.once)
+    finally:
+        from backend.database.base import close_db
+        from backend.services.training_ingestion_service import shutdown_extract_pool
+
+        shutdown_extract_pool()
+        await close_db()
+
+
+if __name__ == "__main__":
+    from backend.core.logging_config import init_logging
+
+    init_logging()
+    asyncio.run(main())
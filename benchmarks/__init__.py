@@ -0,0 +1,3 @@
+"""
+API performance benchmarks (see benchmarks/run.py)
+"""
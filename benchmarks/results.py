@@ -0,0 +1,125 @@
+"""
+Benchmark Results
+
+Result files are JSON:
+
+    {
+      "version": 1,
+      "created_at": "...",
+      "environment": {"python": "...", "platform": "...", "database": "sqlite"},
+      "settings": {"iterations": 50, "warmup": 5, "cache": false},
+      "catalogs": {
+        "1000": {
+          "seed_seconds": 4.2,
+          "rows": {"chairs": 1000, "variations": 1512, ...},
+          "endpoints": {
+            "products:default": {"method": "GET", "path": "...", "status": 200,
+                                 "p50_ms": 9.1, "p95_ms": 11.0,
+                                 "queries": 8, "peak_kib": 812.4},
+            ...
+          }
+        }
+      }
+    }
+
+``compare`` checks a run against a baseline: SQL statement counts and
+status codes must not change for the worse, latency and memory may not grow
+by more than the threshold.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+RESULTS_VERSION = 1
+
+# Metrics compared with the relative threshold, and the absolute growth
+# below which a change counts as noise
+TIMED_METRICS = {"p50_ms": 1.0, "p95_ms": 2.0, "peak_kib": 64.0}
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline allows"""
+
+    size: str
+    endpoint: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.size:>6} {self.endpoint:<28} {self.metric:<9} {self.baseline:>10} -> {self.current}"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (``pct`` between 0 and 1)"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def load_results(path: Path) -> dict:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {data.get('version')!r}")
+    return data
+
+
+def save_results(results: dict, path: Path) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[Regression]:
+    """
+    Regressions of ``current`` against ``baseline``
+
+    Only catalog sizes and endpoints present in both runs are compared.
+
+    Args:
+        baseline: Baseline results
+        current: Results of this run
+        threshold: Allowed relative growth of latency and memory (0.25 = 25%)
+
+    Returns:
+        Regressions, empty when the run is within the baseline
+    """
+    regressions = []
+    for size, catalog in current["catalogs"].items():
+        base_endpoints: Dict[str, dict] = baseline["catalogs"].get(size, {}).get("endpoints", {})
+        for name, result in catalog["endpoints"].items():
+            base = base_endpoints.get(name)
+            if base is None:
+                continue
+            if result["status"] != base["status"]:
+                regressions.append(Regression(size, name, "status", base["status"], result["status"]))
+            if result["queries"] > base["queries"]:
+                regressions.append(Regression(size, name, "queries", base["queries"], result["queries"]))
+            for metric, noise in TIMED_METRICS.items():
+                allowed = max(base[metric] * (1 + threshold), base[metric] + noise)
+                if result[metric] > allowed:
+                    regressions.append(Regression(size, name, metric, base[metric], result[metric]))
+    return regressions
+
+
+def format_table(results: dict, baseline: dict = None) -> str:
+    """Human-readable summary, with baseline values alongside when given"""
+    lines = []
+    for size, catalog in results["catalogs"].items():
+        rows = ", ".join(f"{count:,} {table}" for table, count in catalog["rows"].items())
+        lines.append(f"\n{int(size):,} chairs ({rows}; seeded in {catalog['seed_seconds']:.1f}s)")
+        lines.append(f"{'endpoint':<28}{'status':>7}{'p50 ms':>9}{'p95 ms':>9}{'queries':>9}{'peak KiB':>10}")
+        base_endpoints = (baseline or {}).get("catalogs", {}).get(size, {}).get("endpoints", {})
+        for name, result in catalog["endpoints"].items():
+            lines.append(
+                f"{name:<28}{result['status']:>7}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+                f"{result['queries']:>9}{result['peak_kib']:>10.0f}"
+            )
+            base = base_endpoints.get(name)
+            if base:
+                lines.append(
+                    f"{'  baseline':<28}{base['status']:>7}{base['p50_ms']:>9.1f}{base['p95_ms']:>9.1f}"
+                    f"{base['queries']:>9}{base['peak_kib']:>10.0f}"
+                )
+    return "\n".join(lines)
@@ -0,0 +1,213 @@
+"""
+API Benchmark Runner
+
+Seeds a catalog per size into a throwaway SQLite database, drives the ASGI
+app in-process with httpx and records, per scenario (see scenarios.py):
+
+- p50/p95 latency over ``--iterations`` timed requests
+- SQL statements per request (median, via backend.database.query_counter)
+- peak Python memory allocated while serving one request (tracemalloc,
+  measured in a separate pass so it does not skew latency)
+
+Each catalog size runs in a fresh interpreter, because the app binds its
+engine and settings at import time. The cache is disabled unless
+``--with-cache`` is given, so numbers measure the database path.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 1k,10k,50k --save benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.run --only products: --only search --iterations 100
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.results import RESULTS_VERSION, compare, format_table, load_results, percentile, save_results
+
+
+def parse_size(value: str) -> int:
+    value = value.strip().lower()
+    return int(float(value[:-1]) * 1000) if value.endswith("k") else int(value)
+
+
+async def send(client, scenario):
+    if scenario.setup is not None:
+        await scenario.setup(client)
+    return await client.request(
+        scenario.method, scenario.path, json=scenario.json, headers=scenario.headers
+    )
+
+
+async def measure(client, scenario, options: dict) -> dict:
+    """Time one scenario; see the module docstring for the metrics"""
+    from backend.database.query_counter import count_queries
+
+    for _ in range(options["warmup"]):
+        await send(client, scenario)
+
+    latencies, queries, statuses = [], [], set()
+    for _ in range(options["iterations"]):
+        if scenario.setup is not None:
+            await scenario.setup(client)
+        with count_queries() as counter:
+            started = time.perf_counter()
+            response = await client.request(
+                scenario.method, scenario.path, json=scenario.json, headers=scenario.headers
+            )
+            latencies.append(time.perf_counter() - started)
+        queries.append(counter.count)
+        statuses.add(response.status_code)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(options["memory_samples"]):
+            if scenario.setup is not None:
+                await scenario.setup(client)
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await client.request(scenario.method, scenario.path, json=scenario.json, headers=scenario.headers)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+
+    # Report the worst status seen, so one failing iteration is not hidden
+    status = max(statuses, key=lambda code: (code != scenario.expected_status, code))
+    if status != scenario.expected_status:
+        print(f"  {scenario.name}: HTTP {status} (expected {scenario.expected_status})", file=sys.stderr)
+    return {
+        "method": scenario.method,
+        "path": scenario.path,
+        "status": status,
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "queries": statistics.median_low(queries),
+        "peak_kib": round(statistics.median(peaks) / 1024, 1),
+    }
+
+
+async def benchmark_catalog(size: int, options: dict) -> dict:
+    import httpx
+
+    from backend.database.base import AsyncSessionLocal, Base, engine
+    from benchmarks.scenarios import build_scenarios
+    from benchmarks.seed import seed_catalog
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        catalog = await seed_catalog(db, size)
+    seed_seconds = time.perf_counter() - started
+    print(f"seeded {size:,} chairs in {seed_seconds:.1f}s", file=sys.stderr)
+
+    from backend.main import app
+
+    # DEBUG=true (needed outside production) logs at DEBUG; match production's
+    # WARNING level so logging does not dominate the timings
+    logging.disable(logging.INFO)
+
+    endpoints = {}
+    # A handler exception becomes a 500 (as in production) instead of aborting
+    # the run; measure() reports unexpected statuses
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=120) as client:
+        for scenario in build_scenarios(catalog):
+            if options["only"] and not any(part in scenario.name for part in options["only"]):
+                continue
+            endpoints[scenario.name] = await measure(client, scenario, options)
+
+    await engine.dispose()
+    return {"seed_seconds": round(seed_seconds, 1), "rows": catalog.counts, "endpoints": endpoints}
+
+
+def run_catalog(size: int, options: dict) -> dict:
+    """Benchmark one catalog size (runs in a fresh interpreter)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # Must be set before backend modules read settings
+        os.environ.update({
+            "DATABASE_URL": f"sqlite+aiosqlite:///{os.path.join(tmp, 'benchmark.db')}",
+            "DEBUG": "true",
+            "LOG_DIR": os.path.join(tmp, "logs"),
+            "RATE_LIMIT_ENABLED": "false",
+            # The DDoS middleware bans at twice this many requests per minute
+            "RATE_LIMIT_PER_MINUTE": "1000000",
+            "ENABLE_CACHE": "true" if options["with_cache"] else "false",
+        })
+        os.environ.pop("TESTING", None)
+        return asyncio.run(benchmark_catalog(size, options))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the public API against seeded catalogs")
+    parser.add_argument("--sizes", default="1k", help="Comma-separated catalog sizes, e.g. 1k,10k,50k")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed requests per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed requests per scenario")
+    parser.add_argument("--memory-samples", type=int, default=5, help="Requests traced for peak memory")
+    parser.add_argument("--only", action="append", default=[], help="Run scenarios whose name contains this")
+    parser.add_argument("--with-cache", action="store_true", help="Leave the Redis cache enabled")
+    parser.add_argument("--save", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed latency/memory growth (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    baseline = load_results(args.compare) if args.compare else None
+    options = {
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "memory_samples": args.memory_samples,
+        "only": args.only,
+        "with_cache": args.with_cache,
+    }
+    results = {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": "sqlite",
+        },
+        "settings": {k: v for k, v in options.items() if k != "only"},
+        "catalogs": {},
+    }
+
+    for size in (parse_size(s) for s in args.sizes.split(",")):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            results["catalogs"][str(size)] = pool.submit(run_catalog, size, options).result()
+
+    print(format_table(results, baseline))
+
+    if args.save:
+        save_results(results, args.save)
+        print(f"\nresults written to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare} (threshold {args.threshold:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nno regressions against {args.compare} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark Scenarios
+
+One scenario per public API request the suite measures. Paths are built
+from the seeded ``Catalog`` so every catalog size requests the same shape
+of data.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.seed import SEARCH_TERM, Catalog
+
+API = "/api/v1"
+
+# Optional untimed request run before every timed one (e.g. filling the cart)
+Setup = Callable[[httpx.AsyncClient], Awaitable[None]]
+
+
+@dataclass
+class Scenario:
+    """A request to time"""
+
+    name: str
+    method: str
+    path: str
+    json: Optional[Dict[str, Any]] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    setup: Optional[Setup] = None
+    expected_status: int = 200
+
+
+def _ids(values: List[int]) -> str:
+    return ",".join(str(v) for v in values)
+
+
+# /products with each filter the endpoint supports, one at a time
+PRODUCT_FILTERS = {
+    "default": "",
+    "page-10": "page=10",
+    "per-page-100": "per_page=100",
+    "category": "category_id={parent_category_id}",
+    "child-category": "category_id={category_id}",
+    "subcategory": "subcategory_id={subcategory_id}",
+    "family": "family_id={family_id}",
+    "search": f"search={SEARCH_TERM}",
+    "featured": "featured=true",
+    "new": "new=true",
+    "finishes": "finish_ids={finish_ids}",
+    "upholsteries": "upholstery_ids={upholstery_ids}",
+    "colors": "color_ids={color_ids}",
+    "seat-height": "min_seat_height=17&max_seat_height=19",
+    "width": "min_width=18&max_width=22",
+    "stackable": "stackable=true",
+    "outdoor": "outdoor=true",
+    "ada": "ada_compliant=true",
+    "lead-time": "max_lead_time=21",
+    "in-stock": "in_stock_only=true",
+    "base-only": "exclude_variations=true",
+    "smart-sort": "smart_sort=true",
+    "name-desc": "sort=name-desc",
+}
+
+
+def build_scenarios(catalog: Catalog) -> List[Scenario]:
+    """
+    Scenarios for a seeded catalog
+
+    Args:
+        catalog: Result of ``benchmarks.seed.seed_catalog``
+
+    Returns:
+        Scenarios in execution order; the cart and quote scenarios write, so
+        they run last
+    """
+    params = {
+        "parent_category_id": catalog.parent_category_id,
+        "category_id": catalog.category_id,
+        "subcategory_id": catalog.subcategory_id,
+        "family_id": catalog.family_id,
+        "finish_ids": _ids(catalog.finish_ids),
+        "upholstery_ids": _ids(catalog.upholstery_ids),
+        "color_ids": _ids(catalog.color_ids),
+    }
+    auth = {"Authorization": f"Bearer {catalog.company_token}"}
+
+    scenarios = [
+        Scenario(f"products:{name}", "GET", f"{API}/products?{query.format(**params)}".rstrip("?"))
+        for name, query in PRODUCT_FILTERS.items()
+    ]
+    scenarios += [
+        Scenario("products:company-pricing", "GET", f"{API}/products", headers=auth),
+        Scenario("search", "GET", f"{API}/products/search?q={SEARCH_TERM.lower()}"),
+        Scenario("categories", "GET", f"{API}/categories"),
+        Scenario("family-members", "GET", f"{API}/families/{catalog.family_id}/members"),
+    ]
+
+    cart_item = {"product_id": catalog.product_id, "quantity": 4}
+
+    async def fill_cart(client: httpx.AsyncClient) -> None:
+        response = await client.post(f"{API}/quotes/cart/items", json=cart_item, headers=auth)
+        if response.status_code != 201:
+            raise RuntimeError(f"filling the cart failed: HTTP {response.status_code} {response.text}")
+
+    address = {"line1": "100 Benchmark Way", "city": "Miami", "state": "FL", "zip": "33101"}
+    scenarios += [
+        Scenario("cart:add-item", "POST", f"{API}/quotes/cart/items", json=cart_item, headers=auth,
+                 expected_status=201),
+        Scenario("cart:get", "GET", f"{API}/quotes/cart", headers=auth),
+        Scenario(
+            "quote:from-cart", "POST", f"{API}/quotes/request",
+            json={
+                "shipping_address_line1": address["line1"],
+                "shipping_city": address["city"],
+                "shipping_state": address["state"],
+                "shipping_zip": address["zip"],
+                "project_name": "Benchmark project",
+            },
+            headers=auth, setup=fill_cart, expected_status=201,
+        ),
+        Scenario(
+            "quote:guest", "POST", f"{API}/quotes/request-guest",
+            json={
+                "contact_email": "benchmark@example.com",
+                "contact_name": "Benchmark",
+                "contact_phone": "5550100",
+                "billing_address": address,
+                "shipping_destinations": [address],
+                "project_name": "Benchmark project",
+                "items": [
+                    {"product_id": catalog.product_id, "quantity": 12},
+                    {"product_id": catalog.product_id + 1, "quantity": 6},
+                ],
+            },
+            expected_status=201,
+        ),
+    ]
+    return scenarios
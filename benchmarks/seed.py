@@ -0,0 +1,226 @@
+"""
+Benchmark Catalog Seeding
+
+Seeds a catalog shaped like production (nested categories, subcategories,
+families, finishes/upholsteries/colors, chairs with variations, secondary
+families and multi-category assignments) through the test factories.
+Reference data goes through the ``create_*`` factories; chairs and
+variations use the ``build_*`` factories and are committed in batches so
+50k-chair catalogs seed in minutes.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.security import SecurityManager
+from backend.models.chair import Chair
+from backend.models.company import CompanyStatus
+from tests.factories import (
+    build_chair,
+    build_product_variation,
+    create_category,
+    create_color,
+    create_company,
+    create_finish,
+    create_product_family,
+    create_product_subcategory,
+    create_upholstery,
+)
+
+PARENT_CATEGORIES = ["Seating", "Tables", "Barstools", "Lounge", "Outdoor", "Healthcare"]
+CHILDREN_PER_PARENT = 4
+SUBCATEGORIES_PER_CATEGORY = 2
+CHAIRS_PER_FAMILY = 20
+OPTION_COUNT = 24
+MAX_VARIATIONS = 4
+BATCH_SIZE = 1000
+
+NAME_WORDS = ["Bistro", "Harbor", "Milano", "Aspen", "Crescent", "Nordic", "Lido", "Vienna", "Sierra", "Tulip"]
+PRODUCT_TYPES = ["Side Chair", "Arm Chair", "Barstool", "Counter Stool", "Lounge Chair", "Booth"]
+FEATURES = ["Stackable", "Ganging", "Swivel", "Arms", "Commercial Grade", "Healthcare"]
+
+# One of NAME_WORDS (about a tenth of the chair names), for the search scenarios
+SEARCH_TERM = "Bistro"
+
+
+@dataclass
+class Catalog:
+    """Ids of the seeded rows the scenarios request"""
+
+    size: int
+    parent_category_id: int
+    category_id: int
+    subcategory_id: int
+    family_id: int
+    product_id: int
+    finish_ids: List[int]
+    upholstery_ids: List[int]
+    color_ids: List[int]
+    company_id: int
+    company_token: str
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+async def seed_catalog(db: AsyncSession, size: int, seed: int = 42) -> Catalog:
+    """
+    Seed ``size`` chairs and everything they reference
+
+    Args:
+        db: Session on an empty database (``expire_on_commit=False``)
+        size: Number of chairs
+        seed: Random seed, so catalogs of the same size are identical in shape
+
+    Returns:
+        Catalog describing the seeded rows
+    """
+    rng = random.Random(seed)
+
+    parents, categories = [], []
+    for order, name in enumerate(PARENT_CATEGORIES):
+        parent = await create_category(db, name=name, display_order=order)
+        parents.append(parent)
+        for child in range(CHILDREN_PER_PARENT):
+            categories.append(await create_category(
+                db, parent_id=parent.id, name=f"{name} {child + 1}", display_order=child,
+            ))
+
+    subcategories = {}
+    for category in categories:
+        subcategories[category.id] = [
+            await create_product_subcategory(db, category_id=category.id, display_order=n)
+            for n in range(SUBCATEGORIES_PER_CATEGORY)
+        ]
+
+    families = []
+    for n in range(max(1, size // CHAIRS_PER_FAMILY)):
+        category = categories[n % len(categories)]
+        families.append(await create_product_family(db, category_id=category.id, display_order=n))
+
+    colors = [await create_color(db, display_order=n) for n in range(OPTION_COUNT // 2)]
+    finishes = [
+        await create_finish(db, color_id=rng.choice(colors).id, display_order=n) for n in range(OPTION_COUNT)
+    ]
+    upholsteries = [
+        await create_upholstery(db, color_id=rng.choice(colors).id, display_order=n) for n in range(OPTION_COUNT)
+    ]
+
+    parents_by_id = {parent.id: parent for parent in parents}
+    variation_count = 0
+    for start in range(0, size, BATCH_SIZE):
+        batch = []
+        for i in range(start, min(start + BATCH_SIZE, size)):
+            chair, variations = _build_chair(
+                rng, i, parents_by_id, categories, subcategories, families, finishes, upholsteries, colors,
+            )
+            batch.append(chair)
+            batch.extend(variations)
+            variation_count += len(variations)
+        db.add_all(batch)
+        await db.commit()
+        # Keep the identity map (and memory) flat across batches
+        for obj in batch:
+            db.expunge(obj)
+
+    company = await create_company(db, status=CompanyStatus.ACTIVE, is_active=True, is_verified=True)
+    token = SecurityManager().create_access_token(
+        data={"sub": str(company.id), "type": "company", "email": company.rep_email}
+    )
+
+    # The benchmarked family is the largest one (primary members plus variations)
+    family_id = (
+        await db.execute(
+            select(Chair.family_id)
+            .where(Chair.family_id.is_not(None))
+            .group_by(Chair.family_id)
+            .order_by(func.count(Chair.id).desc(), Chair.family_id)
+            .limit(1)
+        )
+    ).scalar_one()
+    product_id = (await db.execute(select(func.min(Chair.id)))).scalar_one()
+
+    category = categories[0]
+    return Catalog(
+        size=size,
+        parent_category_id=parents[0].id,
+        category_id=category.id,
+        subcategory_id=subcategories[category.id][0].id,
+        family_id=family_id,
+        product_id=product_id,
+        finish_ids=[f.id for f in finishes[:2]],
+        upholstery_ids=[u.id for u in upholsteries[:2]],
+        color_ids=[c.id for c in colors[:2]],
+        company_id=company.id,
+        company_token=token,
+        counts={
+            "chairs": size,
+            "variations": variation_count,
+            "categories": len(parents) + len(categories),
+            "subcategories": len(categories) * SUBCATEGORIES_PER_CATEGORY,
+            "families": len(families),
+        },
+    )
+
+
+def _build_chair(rng, i, parents_by_id, categories, subcategories, families, finishes, upholsteries, colors):
+    category = rng.choice(categories)
+    subcategory = rng.choice(subcategories[category.id])
+    family = rng.choice(families) if rng.random() < 0.8 else None
+    extra_categories = rng.sample([c for c in categories if c is not category], rng.randint(0, 2))
+    model_number = f"{5000 + i}"
+    name = f"{rng.choice(NAME_WORDS)} {rng.choice(PRODUCT_TYPES)} {model_number}"
+    images = [
+        {"url": f"/images/products/{model_number}-{view}.webp", "type": view, "order": n}
+        for n, view in enumerate(("front", "side", "back")[: rng.randint(0, 3)])
+    ]
+
+    chair = build_chair(
+        category.id,
+        subcategory.id,
+        family.id if family else None,
+        model_number=model_number,
+        model_suffix=rng.choice(["", "", "", "", "A", "P"]),
+        name=name,
+        slug=f"chair-{model_number}",
+        seat_height=round(rng.uniform(16, 31), 1),
+        width=round(rng.uniform(16, 30), 1),
+        depth=round(rng.uniform(18, 28), 1),
+        height=round(rng.uniform(28, 46), 1),
+        features=rng.sample(FEATURES, rng.randint(0, 3)),
+        keywords=[w.lower() for w in rng.sample(NAME_WORDS, 3)],
+        available_finishes=[f.id for f in rng.sample(finishes, rng.randint(1, 6))],
+        available_upholsteries=[u.id for u in rng.sample(upholsteries, rng.randint(0, 6))],
+        available_colors=[c.id for c in rng.sample(colors, rng.randint(0, 4))],
+        images=images,
+        primary_image_url=images[0]["url"] if images else None,
+        lead_time_days=rng.choice([14, 21, 30, 42, 56]),
+        minimum_order_quantity=1,
+        stock_status=rng.choice(["In Stock", "In Stock", "Made to Order", "Backordered"]),
+        is_featured=rng.random() < 0.05,
+        is_new=rng.random() < 0.1,
+        is_outdoor_suitable=rng.random() < 0.15,
+        ada_compliant=rng.random() < 0.2,
+        display_order=i,
+        view_count=rng.randint(0, 5000),
+        # Listed under the parent category too, as the admin assigns them
+        categories=[category, parents_by_id[category.parent_id]] + extra_categories,
+        subcategories=[subcategory],
+        secondary_families=[rng.choice(families)] if rng.random() < 0.1 else [],
+    )
+
+    variations = [
+        build_product_variation(
+            finish_id=rng.choice(finishes).id,
+            upholstery_id=rng.choice(upholsteries).id if rng.random() < 0.6 else None,
+            color_id=rng.choice(colors).id,
+            product=chair,
+            sku=f"{model_number}-V{n + 1}",
+            display_order=n,
+        )
+        for n in range(rng.randint(0, MAX_VARIATIONS))
+    ]
+    return chair, variations
+
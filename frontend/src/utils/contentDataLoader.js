@@ -27,6 +27,24 @@ const validateContent = (content) => {
   return required.every(key => content[key] !== undefined);
 };
 
+/**
+ * Fetch the content-hashed bundle named by /data/contentData.manifest.json.
+ * Only the tiny manifest is revalidated; a bundle URL never changes content,
+ * so the browser keeps it cached. Returns null if there is no manifest.
+ */
+const fetchHashedBundle = async () => {
+  const manifestResponse = await fetch('/data/contentData.manifest.json', { cache: 'no-cache' });
+  if (!manifestResponse.ok) {
+    return null;
+  }
+  const manifest = await manifestResponse.json();
+  if (!manifest?.file) {
+    return null;
+  }
+  const response = await fetch(`/data/${manifest.file}`);
+  return response.ok ? response : null;
+};
+
 /**
  * Load contentData.json dynamically from /data/ path
  * In development: served from public/data/contentData.json
@@ -42,15 +60,18 @@ export const loadContentData = async () => {
   }
   
   try {
-    // Try JSON format first (new secure format)
+    // Try JSON format first (new secure format): hashed bundle, then the plain file
     const timestamp = now;
-    let response = await fetch(`/data/contentData.json?t=${timestamp}`, {
-      cache: 'no-store',
-      headers: {
-        'Cache-Control': 'no-cache, no-store, must-revalidate',
-        'Pragma': 'no-cache'
-      }
-    });
+    let response = await fetchHashedBundle().catch(() => null);
+    if (!response) {
+      response = await fetch(`/data/contentData.json?t=${timestamp}`, {
+        cache: 'no-store',
+        headers: {
+          'Cache-Control': 'no-cache, no-store, must-revalidate',
+          'Pragma': 'no-cache'
+        }
+      });
+    }
     
     // Fallback to .js for backward compatibility during migration
     if (!response.ok) {
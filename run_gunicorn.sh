@@ -4,12 +4,16 @@
 # Ensure you are in the project root directory
 
 echo "Starting EagleChair API with Gunicorn..."
-echo "Workers: 2"
+echo "Workers: $(python -c 'from backend.database.pool import pool_plan; print(pool_plan().workers)') (WEB_WORKERS / DATABASE_CONNECTION_BUDGET)"
 echo "Worker Class: backend.core.worker.AsyncioUvicornWorker (Forces asyncio loop)"
 echo "Config: backend/gunicorn_conf.py"
 
 # Add project root to PYTHONPATH to ensure imports work correctly
 export PYTHONPATH=$PYTHONPATH:$(pwd)
 
-# Run gunicorn
+# Background jobs (catalog parsing, imports, cleanup, AI training documents)
+# run in a separate process: python -m backend.worker
+# (deploy/systemd/eaglechair-worker.service in production)
+
+# Run gunicorn (exec so it receives SIGTERM directly and shuts down gracefully)
 exec gunicorn -c backend/gunicorn_conf.py backend.main:app
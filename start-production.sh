@@ -5,10 +5,13 @@
 # Set environment to production
 export ENVIRONMENT=production
 
+# Background jobs (catalog parsing, imports, cleanup, AI training documents)
+# run in their own supervised service, see deploy/systemd/eaglechair-worker.service
+
 # Start uvicorn with proxy headers enabled
 # The backend runs on HTTP (port 8000) locally
 # The reverse proxy (Apache/Nginx) handles HTTPS termination
-python3 -m uvicorn backend.main:app \
+exec python3 -m uvicorn backend.main:app \
   --host 0.0.0.0 \
   --port 8000 \
   --proxy-headers \
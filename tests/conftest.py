@@ -11,6 +11,7 @@ from typing import AsyncGenerator, Generator
 # Set test environment variables BEFORE importing app
 os.environ["RATE_LIMIT_ENABLED"] = "false"
 os.environ["TESTING"] = "true"
+os.environ["DATABASE_RAISE_ON_LAZY_LOAD"] = "true"
 
 import pytest
 import pytest_asyncio
@@ -19,7 +20,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from backend.core.config import get_settings
-from backend.database.base import Base, get_db
+from backend.database.base import Base, get_db, get_read_db
 
 # Clear settings cache and reload with test environment
 get_settings.cache_clear()
@@ -105,6 +106,7 @@ def client(db_session: AsyncSession) -> TestClient:
         return db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     
     with TestClient(app) as test_client:
         yield test_client
@@ -125,6 +127,7 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
         return db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -242,11 +245,26 @@ async def company_token(test_company):
 
 
 @pytest_asyncio.fixture
-async def admin_token(test_admin):
-    """Generate a JWT token for test admin."""
+async def admin_token(test_admin, db_session: AsyncSession, async_client: AsyncClient):
+    """
+    Generate a JWT token for test admin.
+    
+    Admin routes also require the session and admin tokens issued at login;
+    they are stored on the admin and set as cookies on ``async_client``.
+    """
+    import secrets
+
     from backend.core.security import SecurityManager
     
     security_manager = SecurityManager()
+    session_token = secrets.token_urlsafe(32)
+    admin_session_token = secrets.token_urlsafe(32)
+    test_admin.session_token = security_manager.hash_password(session_token)
+    test_admin.admin_token = security_manager.hash_password(admin_session_token)
+    await db_session.commit()
+    async_client.cookies.set("session_token", session_token)
+    async_client.cookies.set("admin_token", admin_session_token)
+    
     token_data = {
         "sub": str(test_admin.id),
         "type": "admin",
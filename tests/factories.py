@@ -94,7 +94,7 @@ async def create_company(db_session, **kwargs):
         "rep_last_name": fake.last_name(),
         "rep_title": fake.job(),
         "rep_email": f"test-{unique_id}@{fake.domain_name()}",
-        "rep_phone": fake.phone_number(),
+        "rep_phone": fake.numerify("(###) ###-####"),
         "billing_address_line1": fake.street_address(),
         "billing_address_line2": fake.secondary_address(),
         "billing_city": fake.city(),
@@ -320,15 +320,11 @@ async def create_upholstery(db_session, color_id=None, **kwargs):
     return upholstery
 
 
-async def create_chair(db_session, category_id=None, subcategory_id=None, family_id=None, **kwargs):
-    """Create a Chair instance."""
+def build_chair(category_id, subcategory_id=None, family_id=None, **kwargs):
+    """Build an unsaved Chair instance (for bulk seeding)."""
     import uuid
     unique_id = uuid.uuid4().hex[:8]
     model_id = uuid.uuid4().hex[:6].upper()
-    if category_id is None:
-        category = await create_category(db_session)
-        category_id = category.id
-    
     defaults = {
         "name": fake.random_element([
         "Executive Chair", "Office Chair", "Conference Chair", 
@@ -351,15 +347,24 @@ async def create_chair(db_session, category_id=None, subcategory_id=None, family
     if family_id:
         defaults["family_id"] = family_id
     defaults.update(kwargs)
-    chair = Chair(**defaults)
+    return Chair(**defaults)
+
+
+async def create_chair(db_session, category_id=None, subcategory_id=None, family_id=None, **kwargs):
+    """Create a Chair instance."""
+    if category_id is None:
+        category = await create_category(db_session)
+        category_id = category.id
+
+    chair = build_chair(category_id, subcategory_id, family_id, **kwargs)
     db_session.add(chair)
     await db_session.commit()
     await db_session.refresh(chair)
     return chair
 
 
-async def create_product_variation(db_session, product_id, finish_id=None, upholstery_id=None, color_id=None, **kwargs):
-    """Create a ProductVariation instance."""
+def build_product_variation(product_id=None, finish_id=None, upholstery_id=None, color_id=None, **kwargs):
+    """Build an unsaved ProductVariation instance (for bulk seeding)."""
     defaults = {
         "product_id": product_id,
         "sku": fake.bothify(text="SKU-########"),
@@ -375,7 +380,12 @@ async def create_product_variation(db_session, product_id, finish_id=None, uphol
     if color_id:
         defaults["color_id"] = color_id
     defaults.update(kwargs)
-    variation = ProductVariation(**defaults)
+    return ProductVariation(**defaults)
+
+
+async def create_product_variation(db_session, product_id, finish_id=None, upholstery_id=None, color_id=None, **kwargs):
+    """Create a ProductVariation instance."""
+    variation = build_product_variation(product_id, finish_id, upholstery_id, color_id, **kwargs)
     db_session.add(variation)
     await db_session.commit()
     await db_session.refresh(variation)
@@ -474,7 +484,7 @@ async def create_quote(db_session, company_id=None, **kwargs):
         "quote_number": fake.bothify(text="Q-########"),
         "contact_name": fake.name(),
         "contact_email": fake.email(),
-        "contact_phone": fake.phone_number(),
+        "contact_phone": fake.numerify("(###) ###-####"),
         "project_name": fake.catch_phrase(),
         "project_description": fake.text(max_nb_chars=500),
         "project_type": fake.random_element(["Restaurant", "Hotel", "Office", "Retail", "Healthcare"]),
@@ -708,7 +718,7 @@ async def create_team_member(db_session, **kwargs):
         "title": fake.job(),
         "bio": fake.text(max_nb_chars=300),
         "email": fake.email(),
-        "phone": fake.phone_number(),
+        "phone": fake.numerify("(###) ###-####"),
         "photo_url": fake.image_url(),
         "is_active": True,
         "display_order": fake.random_int(min=1, max=100),
@@ -751,7 +761,7 @@ async def create_contact_location(db_session, **kwargs):
         "state": fake.state_abbr(),
         "zip_code": fake.zipcode(),
         "country": "USA",
-        "phone": fake.phone_number(),
+        "phone": fake.numerify("(###) ###-####"),
         "email": fake.email(),
         "business_hours": "Monday-Friday: 9AM-5PM",
         "location_type": fake.random_element(["office", "showroom", "warehouse"]),
@@ -914,7 +924,7 @@ async def create_sales_representative(db_session, **kwargs):
     defaults = {
         "name": fake.name(),
         "email": fake.email(),
-        "phone": fake.phone_number(),
+        "phone": fake.numerify("(###) ###-####"),
         "territory_name": fake.state_abbr() + " Territory",
         "states_covered": [fake.state_abbr()],
         "title": fake.job(),
@@ -938,7 +948,7 @@ async def create_site_settings(db_session, **kwargs):
         "company_tagline": fake.sentence(nb_words=6),
         "logo_url": fake.image_url(),
         "primary_email": fake.email(),
-        "primary_phone": fake.phone_number(),
+        "primary_phone": fake.numerify("(###) ###-####"),
         "address_line1": fake.street_address(),
         "city": fake.city(),
         "state": fake.state_abbr(),
@@ -1044,7 +1054,7 @@ async def create_feedback(db_session, **kwargs):
     defaults = {
         "name": fake.name(),
         "email": fake.email(),
-        "phone": fake.phone_number(),
+        "phone": fake.numerify("(###) ###-####"),
         "company_name": fake.company(),
         "subject": fake.sentence(nb_words=4),
         "message": fake.text(max_nb_chars=500),
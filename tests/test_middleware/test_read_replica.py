@@ -0,0 +1,108 @@
+"""
+Unit Tests for Read Replica Routing
+
+Runs a small app against two SQLite databases (primary and replica) to check
+get_read_db routing, read-your-writes stickiness and replica fallback
+"""
+
+import time
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import backend.database.base as db_base
+from backend.core.middleware.read_your_writes import ReadYourWritesMiddleware
+from backend.database.base import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER, Base, get_read_db
+from backend.models.chair import Category
+
+
+async def _database(path, name):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Category.__table__])
+        await conn.execute(insert(Category).values(name=name, slug=name.lower()))
+    return engine
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=10)
+
+    @app.get("/categories")
+    async def categories(db: AsyncSession = Depends(get_read_db)):
+        result = await db.execute(select(Category.name))
+        return {"names": list(result.scalars())}
+
+    @app.post("/categories")
+    async def create_category():
+        return {"ok": True}
+
+    return app
+
+
+@pytest_asyncio.fixture
+async def databases(tmp_path, monkeypatch):
+    """Primary and replica with different rows, so reads show where they went"""
+    primary = await _database(tmp_path / "primary.db", "Primary")
+    replica = await _database(tmp_path / "replica.db", "Replica")
+    monkeypatch.setattr(db_base, "AsyncSessionLocal", async_sessionmaker(primary, expire_on_commit=False))
+    monkeypatch.setattr(db_base, "read_engine", replica)
+    monkeypatch.setattr(db_base, "ReadSessionLocal", async_sessionmaker(replica, expire_on_commit=False))
+    monkeypatch.setattr(db_base, "_replica_down_until", 0.0)
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(databases):
+    transport = ASGITransport(app=_app())
+    async with AsyncClient(transport=transport, base_url="https://test") as ac:
+        yield ac
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReadReplicaRouting:
+    """Test cases for get_read_db and ReadYourWritesMiddleware"""
+
+    async def test_reads_go_to_replica(self, client: AsyncClient):
+        response = await client.get("/categories")
+        assert response.json() == {"names": ["Replica"]}
+        assert READ_PRIMARY_HEADER not in response.headers
+
+    async def test_reads_stick_to_primary_after_mutation(self, client: AsyncClient):
+        response = await client.post("/categories")
+        assert READ_PRIMARY_COOKIE in response.cookies
+        assert float(response.headers[READ_PRIMARY_HEADER]) > time.time()
+
+        response = await client.get("/categories")
+        assert response.json() == {"names": ["Primary"]}
+
+    async def test_header_window_routes_to_primary(self, client: AsyncClient):
+        until = str(time.time() + 5)
+        response = await client.get("/categories", headers={READ_PRIMARY_HEADER: until})
+        assert response.json() == {"names": ["Primary"]}
+
+        expired = str(time.time() - 5)
+        response = await client.get("/categories", headers={READ_PRIMARY_HEADER: expired})
+        assert response.json() == {"names": ["Replica"]}
+
+    async def test_unhealthy_replica_falls_back_to_primary(self, client: AsyncClient, tmp_path, monkeypatch):
+        broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        monkeypatch.setattr(db_base, "read_engine", broken)
+        monkeypatch.setattr(db_base, "ReadSessionLocal", async_sessionmaker(broken))
+
+        response = await client.get("/categories")
+        assert response.json() == {"names": ["Primary"]}
+        assert db_base._replica_down_until > time.monotonic()
+        await broken.dispose()
+
+    async def test_without_replica_reads_use_primary(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(db_base, "read_engine", None)
+        response = await client.get("/categories")
+        assert response.json() == {"names": ["Primary"]}
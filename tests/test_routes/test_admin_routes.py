@@ -4,6 +4,10 @@ Test Admin Routes
 Integration tests for admin routes
 """
 
+import csv
+import io
+from contextlib import asynccontextmanager
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -510,3 +514,60 @@ class TestAdminRoutes:
         assert data["quoted_price"] == 95000
         assert data["quoted_lead_time"] == "4-6 weeks"
         assert data["id"] == quote.id
+
+    @pytest.mark.asyncio
+    async def test_export_companies_csv(self, async_client: AsyncClient, admin_token, db_session: AsyncSession, monkeypatch):
+        """Test streaming a filtered company export."""
+        import backend.services.export_service as export_module
+
+        @asynccontextmanager
+        async def _session():
+            yield db_session
+
+        monkeypatch.setattr(export_module, "AsyncSessionLocal", _session)
+        await create_company(db_session, company_name="Export Target Inc")
+        await create_company(db_session, company_name="Someone Else")
+
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = await async_client.get(
+            "/api/v1/admin/companies/export", params={"search": "export target"}, headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["company_name"] for row in rows] == ["Export Target Inc"]
+        assert rows[0]["status"] == "pending"
+        assert "hashed_password" not in rows[0]
+
+    @pytest.mark.asyncio
+    async def test_export_companies_parquet(self, async_client: AsyncClient, admin_token, db_session: AsyncSession, monkeypatch):
+        """Test the Parquet export when pyarrow is installed."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        import backend.services.export_service as export_module
+
+        @asynccontextmanager
+        async def _session():
+            yield db_session
+
+        monkeypatch.setattr(export_module, "AsyncSessionLocal", _session)
+        company = await create_company(db_session, company_name="Parquet Co")
+
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = await async_client.get(
+            "/api/v1/admin/companies/export", params={"format": "parquet"}, headers=headers
+        )
+
+        assert response.status_code == 200
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.column("id").to_pylist() == [company.id]
+        assert table.column("company_name").to_pylist() == ["Parquet Co"]
+
+    @pytest.mark.asyncio
+    async def test_export_quotes_rejects_unknown_format(self, async_client: AsyncClient, admin_token):
+        """Test export format validation."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = await async_client.get("/api/v1/admin/quotes/export", params={"format": "xlsx"}, headers=headers)
+
+        assert response.status_code == 422
@@ -325,3 +325,69 @@ class TestMultiCategoryProducts:
         item = next(i for i in response.json()["items"] if i["id"] == chair.id)
         assert item["category_ids"][0] == chairs.id
         assert sorted(item["category_ids"]) == sorted([chairs.id, stools.id])
+
+
+@pytest.mark.integration
+@pytest.mark.products
+class TestCategoryTreeSnapshot:
+    """The materialized category tree shared by the API, exporter and sitemap."""
+
+    @pytest.mark.asyncio
+    async def test_counts_union_primary_and_secondary_assignments(
+        self, db_session: AsyncSession
+    ):
+        from backend.services.category_tree_service import CategoryTreeService
+
+        parent = await create_category(db_session, name="Seating", slug="seating-tree")
+        chairs = await create_category(
+            db_session, name="Chairs", slug="chairs-tree", parent_id=parent.id
+        )
+        stools = await create_category(
+            db_session, name="Stools", slug="stools-tree", parent_id=parent.id
+        )
+        chair = await create_chair(db_session, category_id=chairs.id)
+
+        # Primary category is repeated in chair_categories - it must count once
+        await AdminService.update_product(
+            db=db_session,
+            product_id=chair.id,
+            update_data={"category_ids": [chairs.id, stools.id]},
+        )
+
+        snapshot = await CategoryTreeService.build(db_session)
+
+        children = {
+            c["slug"]: c for c in CategoryTreeService.children_of(snapshot, parent.id)
+        }
+        assert children["chairs-tree"]["product_count"] == 1
+        assert children["stools-tree"]["product_count"] == 1
+        assert [c["slug"] for c in CategoryTreeService.list_categories(
+            snapshot, top_level_only=True
+        )] == ["seating-tree"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_rejects_unknown_parts(self, db_session: AsyncSession):
+        from backend.services.category_tree_service import CategoryTreeService
+
+        with pytest.raises(ValueError):
+            await CategoryTreeService.refresh(db_session, "families")
+
+    @pytest.mark.asyncio
+    async def test_snapshot_ttl_capped_on_memory_backend(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        from backend.services import cache_service as cache_module
+        from backend.services.cache_service import cache_service
+        from backend.services.category_tree_service import SNAPSHOT_TTL, CategoryTreeService
+
+        ttls = []
+
+        async def fake_set(key, value, ttl=None, tags=None):
+            ttls.append(ttl)
+
+        monkeypatch.setattr(cache_service, "set", fake_set)
+        for backend in ("redis", "memory"):
+            monkeypatch.setattr(cache_service, "backend", backend)
+            await CategoryTreeService.build(db_session)
+
+        assert ttls == [SNAPSHOT_TTL, cache_module.LOCAL_BACKEND_MAX_TTL]
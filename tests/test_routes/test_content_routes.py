@@ -4,11 +4,15 @@ Test Content Routes
 Integration tests for content routes
 """
 
+import io
+
 import pytest
 from httpx import AsyncClient
+from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.factories import (
+    create_catalog,
     create_company_info,
     create_contact_location,
     create_faq,
@@ -165,3 +169,62 @@ class TestContentRoutes:
         assert response.status_code == 200
         data = response.json()
         assert len([m for m in data if m.get("is_active", True)]) >= 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestCatalogPdfThumbnail:
+    """PDF first-page previews are rendered once and served from disk"""
+
+    @pytest.fixture
+    def upload_dir(self, tmp_path, monkeypatch):
+        import fitz
+
+        from backend.services import catalog_thumbnail_service
+
+        monkeypatch.setattr(catalog_thumbnail_service, "_upload_base_dir", lambda: tmp_path)
+
+        pdf_dir = tmp_path / "documents" / "catalogs"
+        pdf_dir.mkdir(parents=True)
+        doc = fitz.open()
+        page = doc.new_page(width=600, height=800)
+        page.insert_text((50, 50), "Eagle Chair Catalog")
+        doc.save(str(pdf_dir / "spring.pdf"))
+        doc.close()
+        return tmp_path
+
+    async def test_preview_rendered_once_and_revalidated(
+        self, async_client: AsyncClient, db_session: AsyncSession, upload_dir
+    ):
+        catalog = await create_catalog(
+            db_session, file_url="/uploads/documents/catalogs/spring.pdf", file_type="PDF"
+        )
+        url = f"/api/v1/content/catalogs/{catalog.id}/pdf-thumbnail"
+
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        etag = response.headers["etag"]
+
+        previews = sorted(p.name for p in (upload_dir / "images" / "catalogs" / "previews").iterdir())
+        assert len(previews) == 2
+        assert all(name.endswith(".webp") for name in previews)
+
+        small = await async_client.get(url, params={"size": "small"})
+        assert small.status_code == 200
+        assert Image.open(io.BytesIO(response.content)).width == 900
+        assert Image.open(io.BytesIO(small.content)).width == 480
+
+        not_modified = await async_client.get(url, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+
+    async def test_unknown_size_rejected(
+        self, async_client: AsyncClient, db_session: AsyncSession, upload_dir
+    ):
+        catalog = await create_catalog(
+            db_session, file_url="/uploads/documents/catalogs/spring.pdf", file_type="PDF"
+        )
+        response = await async_client.get(
+            f"/api/v1/content/catalogs/{catalog.id}/pdf-thumbnail", params={"size": "huge"}
+        )
+        assert response.status_code == 400
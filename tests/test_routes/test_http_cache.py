@@ -0,0 +1,185 @@
+"""
+Test HTTP Conditional Requests
+
+Integration tests for ETag / 304 handling and CDN headers on public GET routes
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api import http_cache
+from backend.api.http_cache import etag_matches
+from backend.database.query_counter import count_queries
+from backend.models.chair import Finish
+from tests.factories import (
+    create_category,
+    create_chair,
+    create_company_pricing,
+    create_finish,
+    create_legal_document,
+)
+
+
+@pytest.mark.unit
+class TestEtagMatches:
+    """Test cases for If-None-Match comparison"""
+
+    def test_weak_and_listed_tags_match(self):
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"old", "abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+
+    def test_other_tags_do_not_match(self):
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches('"abcd"', '"abc"')
+
+
+@pytest.fixture(autouse=True)
+def fresh_table_versions():
+    http_cache._table_versions.clear()
+    yield
+    http_cache._table_versions.clear()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestConditionalRoutes:
+    """Test cases for conditional GET on public routes"""
+
+    async def test_not_modified_skips_handler_queries(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test a matching If-None-Match gets a 304 without running any query."""
+        await create_finish(db_session, name="Walnut")
+
+        response = await async_client.get("/api/v1/finishes")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["surrogate-key"] == "finishes"
+        assert response.headers["cache-control"].startswith("public, max-age=0, s-maxage=")
+
+        with count_queries() as counter:
+            cached = await async_client.get("/api/v1/finishes", headers={"If-None-Match": etag})
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+        assert cached.headers["surrogate-key"] == "finishes"
+        assert counter.count == 0
+
+    async def test_version_check_is_constant_queries(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test the version vector costs one statement per TTL, not per request or table."""
+        await create_category(db_session)
+        url = "/api/v1/categories"
+
+        response = await async_client.get(url)
+        etag = response.headers["etag"]
+        assert len(response.headers["surrogate-key"].split()) > 1
+
+        with count_queries() as counter:
+            for _ in range(5):
+                cached = await async_client.get(url, headers={"If-None-Match": etag})
+                assert cached.status_code == 304
+        assert counter.count == 0
+
+        # Once dropped (by a write, or when the TTL passes) the vector of all
+        # five tables is read again in one statement
+        http_cache.forget_table_versions(["categories"])
+        with count_queries() as counter:
+            cached = await async_client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert counter.count == 1
+
+    async def test_etag_tracks_writes_and_params(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test updates, deletes and query params each change the ETag."""
+        finish = await create_finish(db_session, name="Walnut", finish_type="Wood Stain")
+        extra = await create_finish(db_session, name="Oak", finish_type="Wood Stain")
+        first = (await async_client.get("/api/v1/finishes")).headers["etag"]
+
+        filtered = await async_client.get("/api/v1/finishes", params={"finish_type": "Paint"})
+        assert filtered.headers["etag"] != first
+
+        finish.name = "Dark Walnut"
+        await db_session.commit()
+        renamed = await async_client.get("/api/v1/finishes", headers={"If-None-Match": first})
+        assert renamed.status_code == 200
+        assert renamed.headers["etag"] != first
+
+        # A hard delete of an older row leaves max(updated_at) unchanged
+        await db_session.execute(
+            update(Finish).where(Finish.id == extra.id).values(updated_at=Finish.created_at)
+        )
+        await db_session.commit()
+        before = (await async_client.get("/api/v1/finishes")).headers["etag"]
+        await db_session.execute(delete(Finish).where(Finish.id == extra.id))
+        await db_session.commit()
+        after = await async_client.get("/api/v1/finishes", headers={"If-None-Match": before})
+        assert after.status_code == 200
+
+    async def test_product_list_headers(
+        self, async_client: AsyncClient, db_session: AsyncSession, company_token: str
+    ):
+        """Test the product list is public for anonymous callers and private when priced."""
+        category = await create_category(db_session)
+        await create_chair(db_session, category_id=category.id)
+
+        anonymous = await async_client.get("/api/v1/products")
+        assert anonymous.status_code == 200
+        assert "chairs" in anonymous.headers["surrogate-key"].split()
+        assert "Authorization" in anonymous.headers["vary"]
+
+        priced = await async_client.get(
+            "/api/v1/products",
+            headers={"Authorization": f"Bearer {company_token}", "If-None-Match": anonymous.headers["etag"]},
+        )
+        assert priced.status_code == 200
+        assert priced.headers["etag"] != anonymous.headers["etag"]
+        assert priced.headers["cache-control"] == "private, no-cache"
+        assert "surrogate-key" not in priced.headers
+
+    async def test_priced_etag_changes_daily_with_tier(
+        self, async_client: AsyncClient, db_session: AsyncSession, test_company, company_token: str,
+        monkeypatch
+    ):
+        """Test a tier's effective dates are honoured by rolling the ETag each day."""
+        tier = await create_company_pricing(db_session, effective_from=date.today() + timedelta(days=1))
+        test_company.pricing_tier_id = tier.id
+        await db_session.commit()
+        headers = {"Authorization": f"Bearer {company_token}"}
+
+        today = (await async_client.get("/api/v1/products", headers=headers)).headers["etag"]
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.today() + timedelta(days=1)
+
+        monkeypatch.setattr(http_cache, "date", Tomorrow)
+        tomorrow = await async_client.get("/api/v1/products", headers={**headers, "If-None-Match": today})
+        assert tomorrow.status_code == 200
+        assert tomorrow.headers["etag"] != today
+
+    async def test_legal_documents_not_modified(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test CMS legal documents answer 304 and leave 404s uncached."""
+        await create_legal_document(db_session)
+        url = "/api/v1/content/legal-documents"
+
+        response = await async_client.get(url)
+        assert response.headers["surrogate-key"] == "legal_documents"
+        cached = await async_client.get(url, headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
+
+        missing = await async_client.get("/api/v1/families/999999")
+        assert missing.status_code == 404
+        assert "etag" not in missing.headers
@@ -12,6 +12,8 @@ from tests.factories import (
     create_category,
     create_chair,
     create_finish,
+    create_product_family,
+    create_product_variation,
     create_upholstery,
 )
 
@@ -208,7 +210,35 @@ class TestProductRoutes:
         data = response.json()
         assert len(data["items"]) >= 1
         assert all(item.get("category_id") == category1.id for item in data["items"])
-    
+
+    @pytest.mark.asyncio
+    async def test_get_products_feature_filters(self, async_client: AsyncClient, db_session: AsyncSession):
+        """Test the stackable, outdoor, ADA and in-stock filters."""
+        category = await create_category(db_session)
+        featured = await create_chair(
+            db_session,
+            category_id=category.id,
+            features=["Stackable", "Arms"],
+            is_outdoor_suitable=True,
+            ada_compliant=True,
+        )
+        plain = await create_chair(
+            db_session, category_id=category.id, features=None, stock_status="Made to Order"
+        )
+
+        expected = {
+            "stackable=true": {featured.id},
+            "stackable=false": {plain.id},
+            "outdoor=true": {featured.id},
+            "ada_compliant=true": {featured.id},
+            "in_stock_only=true": {featured.id},
+        }
+        for query, ids in expected.items():
+            response = await async_client.get(f"/api/v1/products?{query}")
+
+            assert response.status_code == 200, query
+            assert {item["id"] for item in response.json()["items"]} == ids, query
+
     @pytest.mark.asyncio
     async def test_get_product_by_id_success(self, async_client: AsyncClient, db_session: AsyncSession):
         """Test successful product retrieval by ID."""
@@ -347,3 +377,121 @@ class TestProductRoutes:
         upholstery_names = [u["name"] for u in data]
         assert "Leather" in upholstery_names
         assert "Fabric" in upholstery_names
+
+
+@pytest.mark.integration
+@pytest.mark.products
+class TestFamilyMembers:
+    """Family members and family product listings backed by the family index"""
+
+    async def _seed_family(self, db_session: AsyncSession):
+        from backend.models.chair import chair_secondary_families, variation_families
+
+        family = await create_product_family(db_session)
+        primary = await create_chair(
+            db_session, family_id=family.id, name="Primary Chair", display_order=1
+        )
+        secondary = await create_chair(db_session, name="Secondary Chair", display_order=2)
+        via_variation = await create_chair(
+            db_session, name="Variation Parent", base_price=10000, display_order=3
+        )
+        variation = await create_product_variation(
+            db_session,
+            via_variation.id,
+            name="Walnut",
+            price_adjustment=500,
+            primary_image_url="/img/walnut.jpg",
+            display_order=0,
+        )
+        await create_chair(db_session, name="Unrelated Chair")
+
+        await db_session.execute(
+            chair_secondary_families.insert().values(
+                chair_id=secondary.id, family_id=family.id
+            )
+        )
+        await db_session.execute(
+            variation_families.insert().values(
+                variation_id=variation.id, family_id=family.id
+            )
+        )
+        await db_session.commit()
+        return family, primary, secondary, via_variation, variation
+
+    @pytest.mark.asyncio
+    async def test_family_members_merge_products_and_variations(
+        self, async_client: AsyncClient, db_session: AsyncSession
+    ):
+        family, primary, secondary, via_variation, variation = await self._seed_family(
+            db_session
+        )
+
+        response = await async_client.get(f"/api/v1/families/{family.id}/members")
+
+        assert response.status_code == 200
+        members = response.json()
+        assert [(m["type"], m["id"]) for m in members] == [
+            ("variation", variation.id),
+            ("product", primary.id),
+            ("product", secondary.id),
+        ]
+        walnut = members[0]
+        assert walnut["product_id"] == via_variation.id
+        assert walnut["name"] == "Walnut"
+        assert walnut["base_price"] == 10500
+        assert walnut["primary_image_url"] == "/img/walnut.jpg"
+        assert walnut["variation_has_own_image"] is True
+
+    @pytest.mark.asyncio
+    async def test_family_members_unknown_family(self, async_client: AsyncClient):
+        response = await async_client.get("/api/v1/families/99999/members")
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_product_listing_uses_family_index(self, db_session: AsyncSession):
+        from backend.services.product_service import ProductService
+        from backend.utils.pagination import PaginationParams
+
+        family, primary, secondary, via_variation, variation = await self._seed_family(
+            db_session
+        )
+
+        result = await ProductService.get_products(
+            db=db_session,
+            pagination=PaginationParams(page=1, page_size=20),
+            family_id=family.id,
+        )
+
+        products = {p.id: p for p in result["items"]}
+        assert set(products) == {primary.id, secondary.id, via_variation.id}
+        assert products[via_variation.id].variation_id == variation.id
+        assert products[via_variation.id].primary_image_url == "/img/walnut.jpg"
+
+    @pytest.mark.asyncio
+    async def test_family_index_ttl(self, db_session: AsyncSession, monkeypatch):
+        from backend.services import family_index_service
+        from backend.services.cache_service import cache_service
+        from backend.services.family_index_service import FamilyIndexService
+
+        ttls = []
+
+        async def fake_set(key, value, ttl=None, tags=None):
+            ttls.append(ttl)
+
+        monkeypatch.setattr(cache_service, "set", fake_set)
+        monkeypatch.setattr(cache_service, "backend", "redis")
+        family = await create_product_family(db_session)
+        await FamilyIndexService.build(db_session, family.id)
+        await create_chair(db_session, family_id=family.id)
+        await FamilyIndexService.build(db_session, family.id)
+
+        # Writes only refresh this worker's copy on the memory backend
+        monkeypatch.setattr(cache_service, "backend", "memory")
+        await FamilyIndexService.build(db_session, family.id)
+
+        assert ttls == [
+            family_index_service.EMPTY_FAMILY_INDEX_TTL,
+            family_index_service.FAMILY_INDEX_TTL,
+            cache_service.shared_ttl(family_index_service.FAMILY_INDEX_TTL),
+        ]
+        assert ttls[2] < family_index_service.EMPTY_FAMILY_INDEX_TTL
@@ -0,0 +1,95 @@
+"""
+Contract Tests for the Fast-path Product Serializers
+
+The catalog list endpoints return ``backend.api.v1.serializers`` output
+instead of validating through ``ChairResponse``; these tests pin the bytes
+to what FastAPI renders for the declared ``response_model``.
+"""
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.v1.schemas.product import ChairResponse
+from backend.api.v1.serializers import chair_list_response, chair_page_response
+from backend.models.chair import Chair
+from backend.models.loaders import ChairLoad
+from backend.utils.pagination import PaginatedResponse
+from tests.factories import create_category, create_chair, create_product_subcategory
+
+
+def _fastapi_json(annotation, content) -> bytes:
+    """Bytes FastAPI produces for ``content`` with ``response_model=annotation``"""
+    adapter = TypeAdapter(annotation)
+    validated = adapter.validate_python(content, from_attributes=True)
+    return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+
+async def _catalog(db_session: AsyncSession) -> list:
+    """Products covering every validator and runtime attribute ChairResponse handles"""
+    primary = await create_category(db_session, name="Sièges de Café")
+    secondary = await create_category(db_session, name="Outdoor")
+    subcategory = await create_product_subcategory(db_session, category_id=primary.id)
+
+    await create_chair(
+        db_session,
+        category_id=primary.id,
+        subcategory_id=subcategory.id,
+        name="Silla “Añil” — 6010",
+        categories=[secondary, primary],
+        subcategories=[subcategory],
+        images=[
+            {"url": "/images/6010-front.jpg", "type": "front", "order": 1, "extra": "dropped"},
+            {"url": "/images/6010-side.jpg"},
+        ],
+        hover_images='["/images/6010-hover.jpg"]',
+        primary_image_url="/images/6010-front.jpg",
+        width=18.5,
+        seat_height=17.75,
+        features=["Stackable", "Ships in 2–3 weeks"],
+        additional_dimensions={"COM": 1.5, "notes": "line\nbreak"},
+        available_finishes=[3, 1],
+        keywords=["café", "bistro"],
+        is_featured=True,
+    )
+    await create_chair(db_session, category_id=secondary.id, images=["/a.jpg", "/b.jpg"], hover_images=None)
+    await create_chair(db_session, category_id=secondary.id, images="[]", msrp=49900)
+
+    result = await db_session.execute(select(Chair).options(*ChairLoad.LIST).order_by(Chair.id))
+    products = list(result.scalars().all())
+
+    # Attributes the routes set at runtime
+    products[0].category.parent_slug = "seating"
+    products[0].customizations = {"finishes": [{"id": 3, "name": "Walnut"}], "colors": []}
+    products[0].adjusted_price = 22500
+    products[0].pricing_tier_name = "Dealer"
+    products[0].pricing_tier_adjustment = -10
+    products[1].variation_id = 7
+    # Freshly assigned ints in float columns still serialize as floats
+    products[1].width = 20
+    return products
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProductSerializerContract:
+    """Byte-equivalence of the fast path with ChairResponse"""
+
+    async def test_list_matches_chair_response(self, db_session: AsyncSession):
+        products = await _catalog(db_session)
+
+        assert chair_list_response(products).body == _fastapi_json(list[ChairResponse], products)
+
+    async def test_page_matches_paginated_chair_response(self, db_session: AsyncSession):
+        products = await _catalog(db_session)
+        page = {
+            "items": products, "total": 23, "page": 2, "per_page": 3,
+            "total_pages": 8, "has_next": True, "has_prev": True,
+        }
+
+        assert chair_page_response(page).body == _fastapi_json(PaginatedResponse[ChairResponse], page)
+
+    async def test_empty_list(self, db_session: AsyncSession):
+        assert chair_list_response([]).body == _fastapi_json(list[ChairResponse], [])
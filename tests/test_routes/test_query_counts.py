@@ -0,0 +1,130 @@
+"""
+Query Count Regression Tests
+
+Pins the number of SQL statements each catalog endpoint issues. Every
+endpoint is measured against a small and a larger catalog: the counts must
+match (no per-product lazy loads) and equal the pinned value, so adding a
+relationship to a response without adding it to its loader profile in
+backend/models/loaders.py fails here. Tests run with
+DATABASE_RAISE_ON_LAZY_LOAD, so a missed relationship raises outright.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.query_counter import count_queries
+from backend.models.chair import Chair
+from backend.models.loaders import ChairLoad
+from backend.services.admin_service import AdminService
+from tests.factories import (
+    create_category,
+    create_chair,
+    create_finish,
+    create_product_family,
+    create_product_subcategory,
+    create_product_variation,
+)
+
+
+async def _add_products(db_session: AsyncSession, count: int) -> list:
+    """Products with every relationship the catalog responses render"""
+    parent = await create_category(db_session, name="Seating")
+    category = await create_category(db_session, name="Side Chairs", parent_id=parent.id)
+    extra = await create_category(db_session, name="Outdoor")
+    subcategory = await create_product_subcategory(db_session, category_id=category.id)
+    family = await create_product_family(db_session, category_id=category.id)
+    finish = await create_finish(db_session)
+
+    products = []
+    for i in range(count):
+        chair = await create_chair(
+            db_session,
+            category_id=category.id,
+            subcategory_id=subcategory.id,
+            family_id=family.id,
+            name=f"Bistro Chair {i}",
+            keywords=["bistro", "stacking"],
+            categories=[category, extra],
+            subcategories=[subcategory],
+        )
+        await create_product_variation(db_session, product_id=chair.id, finish_id=finish.id)
+        products.append(chair)
+    return products
+
+
+async def _count(async_client: AsyncClient, db_session: AsyncSession, url: str) -> int:
+    # The app shares the test session: start from an empty identity map so
+    # nothing the factories loaded hides a query, and warm the in-process
+    # snapshots (category tree, family index) before counting
+    db_session.expunge_all()
+    assert (await async_client.get(url)).status_code == 200
+    with count_queries() as counter:
+        response = await async_client.get(url)
+    assert response.status_code == 200
+    return counter.count
+
+
+@pytest.mark.integration
+@pytest.mark.products
+@pytest.mark.asyncio
+class TestCatalogQueryCounts:
+    """SQL statements per catalog endpoint, independent of catalog size"""
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("/api/v1/products", 8),
+            ("/api/v1/products?per_page=100", 8),
+            ("/api/v1/products/search?q=bistro", 4),
+            ("/api/v1/products/{id}", 19),
+            ("/api/v1/products/slug/{slug}", 19),
+            ("/api/v1/products/{id}/related", 6),
+            ("/api/v1/seo/sitemap.xml", 7),
+        ],
+    )
+    async def test_endpoint_query_count(
+        self, async_client: AsyncClient, db_session: AsyncSession, path, expected
+    ):
+        first, _ = await _add_products(db_session, 2)
+        url = path.format(id=first.id, slug=first.slug)
+        small = await _count(async_client, db_session, url)
+
+        await _add_products(db_session, 6)
+        large = await _count(async_client, db_session, url)
+
+        assert small == large, f"{url}: {small} queries for 2 products, {large} for 8"
+        assert large == expected
+
+    async def test_admin_product_list_query_count(self, db_session: AsyncSession):
+        await _add_products(db_session, 2)
+        db_session.expunge_all()
+        with count_queries() as small:
+            await AdminService.get_all_products(db=db_session, page=1, page_size=50)
+
+        await _add_products(db_session, 6)
+        db_session.expunge_all()
+        with count_queries() as large:
+            products, _ = await AdminService.get_all_products(db=db_session, page=1, page_size=50)
+            for product in products:
+                [variation.finish for variation in product.variations]
+
+        assert small.count == large.count == 8
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLoaderProfiles:
+    """Strict loading in tests"""
+
+    async def test_unloaded_relationship_raises(self, db_session: AsyncSession):
+        await _add_products(db_session, 1)
+        db_session.expunge_all()
+        result = await db_session.execute(select(Chair).options(*ChairLoad.EXPORT))
+        product = result.scalar_one()
+
+        assert product.category.name == "Side Chairs"
+        with pytest.raises(sa_exc.InvalidRequestError):
+            product.variations
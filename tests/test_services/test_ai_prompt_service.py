@@ -0,0 +1,186 @@
+"""
+Test AI Prompt Service
+
+Unit tests for cached prompt fragments and incremental chat history
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import backend.services.ai_prompt_service as prompt_module
+import backend.services.ai_service as ai_service
+from backend.database.query_counter import count_queries
+from backend.models.ai_chat import AIChatMessage, AIChatSession, AIMemory, MessageRole
+from backend.services.ai_prompt_service import (
+    FRAGMENT_MEMORY,
+    FRAGMENT_TRAINING,
+    HISTORY_KEEP_MESSAGES,
+    AIPromptService,
+    invalidate_prompt_fragment,
+)
+from backend.services.cache_service import cache_service
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """Dict-backed stand-in for the shared cache (Redis is not available in tests)"""
+    store = {}
+
+    async def _get(key):
+        return store.get(key)
+
+    async def _set(key, value, ttl=None, tags=None):
+        store[key] = value
+        return True
+
+    async def _delete(key):
+        store.pop(key, None)
+        return True
+
+    monkeypatch.setattr(cache_service, "get", _get)
+    monkeypatch.setattr(cache_service, "set", _set)
+    monkeypatch.setattr(cache_service, "delete", _delete)
+    return store
+
+
+async def _create_chat(db: AsyncSession, message_count: int) -> AIChatSession:
+    session = AIChatSession(title="Test chat")
+    db.add(session)
+    await db.flush()
+
+    start = datetime.utcnow() - timedelta(hours=1)
+    for i in range(message_count):
+        db.add(AIChatMessage(
+            session_id=session.id,
+            role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+            content=f"message {i}",
+            created_at=start + timedelta(seconds=i),
+        ))
+    await db.commit()
+    return session
+
+
+@pytest.mark.unit
+class TestPromptFragments:
+    """Test cases for fragment caching and invalidation"""
+
+    @pytest.fixture(autouse=True)
+    def _static_live_data(self, monkeypatch):
+        async def _context(db):
+            return "Current EagleChair Data: 3 active products."
+
+        monkeypatch.setattr(ai_service, "get_eaglechair_context", _context)
+        prompt_module._assembled_prompts.clear()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_turn_runs_no_queries(self, db_session: AsyncSession, memory_cache):
+        db_session.add(AIMemory(key="preferred_wood", value="White oak"))
+        await db_session.commit()
+
+        with count_queries() as first:
+            prompt, versions = await AIPromptService.build_system_prompt(db_session, None, mode="ask")
+        assert "White oak" in prompt
+        assert "## Live Data" in prompt
+        assert first.count >= 2
+
+        with count_queries() as second:
+            cached_prompt, cached_versions = await AIPromptService.build_system_prompt(
+                db_session, None, mode="ask"
+            )
+        assert second.count == 0
+        assert cached_prompt == prompt
+        assert cached_versions == versions
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reloads_only_that_fragment(self, db_session: AsyncSession, memory_cache):
+        memory = AIMemory(key="preferred_wood", value="White oak")
+        db_session.add(memory)
+        await db_session.commit()
+
+        _, versions = await AIPromptService.build_system_prompt(db_session, None, mode="ask")
+
+        memory.value = "Walnut"
+        await db_session.commit()
+        await invalidate_prompt_fragment(FRAGMENT_MEMORY, None)
+
+        with count_queries() as counter:
+            prompt, new_versions = await AIPromptService.build_system_prompt(db_session, None, mode="ask")
+        assert "Walnut" in prompt
+        assert counter.count == 1
+        assert new_versions[FRAGMENT_MEMORY] != versions[FRAGMENT_MEMORY]
+        assert new_versions[FRAGMENT_TRAINING] == versions[FRAGMENT_TRAINING]
+
+    @pytest.mark.asyncio
+    async def test_history_summary_is_appended(self, db_session: AsyncSession, memory_cache):
+        prompt, _ = await AIPromptService.build_system_prompt(
+            db_session, None, mode="ask", history_summary="Admin is repricing the Aria line."
+        )
+        assert prompt.endswith("Admin is repricing the Aria line.")
+
+        plain, _ = await AIPromptService.build_system_prompt(db_session, None, mode="ask")
+        assert "Aria" not in plain
+
+
+@pytest.mark.unit
+class TestChatHistory:
+    """Test cases for incremental history and the rolling summary"""
+
+    @pytest.fixture(autouse=True)
+    def _use_test_session(self, db_session: AsyncSession, monkeypatch):
+        @asynccontextmanager
+        async def _session():
+            yield db_session
+
+        monkeypatch.setattr(prompt_module, "AsyncSessionLocal", _session)
+
+    @pytest.mark.asyncio
+    async def test_load_history_skips_summarised_messages(self, db_session: AsyncSession):
+        session = await _create_chat(db_session, 5)
+        history = await AIPromptService.load_history(db_session, session)
+        assert [m["content"] for m in history] == [f"message {i}" for i in range(5)]
+        assert history[0]["role"] == "user"
+
+        session.history_summary_until = datetime.utcnow() - timedelta(hours=1) + timedelta(seconds=1)
+        await db_session.commit()
+
+        history = await AIPromptService.load_history(db_session, session)
+        assert [m["content"] for m in history] == ["message 2", "message 3", "message 4"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_summary_folds_older_messages(self, db_session: AsyncSession, monkeypatch):
+        folded = []
+
+        async def _summarize(previous_summary, messages):
+            folded.extend(m["content"] for m in messages)
+            return f"Summary of {len(messages)} messages"
+
+        monkeypatch.setattr(ai_service, "summarize_conversation", _summarize)
+        session = await _create_chat(db_session, HISTORY_KEEP_MESSAGES + 5)
+
+        assert await AIPromptService.refresh_history_summary(session.id) is True
+        assert folded == [f"message {i}" for i in range(5)]
+
+        await db_session.refresh(session)
+        assert session.history_summary == "Summary of 5 messages"
+        history = await AIPromptService.load_history(db_session, session)
+        assert len(history) == HISTORY_KEEP_MESSAGES
+        assert history[0]["content"] == "message 5"
+
+        # Nothing left to fold
+        assert await AIPromptService.refresh_history_summary(session.id) is False
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_keeps_history(self, db_session: AsyncSession, monkeypatch):
+        async def _summarize(previous_summary, messages):
+            return None
+
+        monkeypatch.setattr(ai_service, "summarize_conversation", _summarize)
+        session = await _create_chat(db_session, HISTORY_KEEP_MESSAGES + 3)
+
+        assert await AIPromptService.refresh_history_summary(session.id) is False
+        await db_session.refresh(session)
+        assert session.history_summary is None
+        assert session.history_summary_until is None
@@ -0,0 +1,143 @@
+"""
+Test Catalog Digest Service
+
+Unit tests for the versioned catalog digest behind the AI catalog tools
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import backend.services.catalog_digest_service as digest_module
+from backend.database.query_counter import count_queries
+from backend.services.ai_service import fetch_product_catalog, search_catalog
+from backend.services.cache_service import cache_service
+from backend.services.catalog_digest_service import CatalogDigestService
+from tests.factories import (
+    create_category,
+    create_chair,
+    create_finish,
+    create_product_family,
+    create_product_variation,
+)
+
+
+@pytest.fixture(autouse=True)
+def _digest_state(db_session: AsyncSession, monkeypatch):
+    """Fresh module state, the test session and a dict-backed cache"""
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    store = {}
+
+    async def _get(key):
+        return store.get(key)
+
+    async def _set(key, value, ttl=None, tags=None):
+        store[key] = value
+        return True
+
+    monkeypatch.setattr(digest_module, "AsyncSessionLocal", _session)
+    monkeypatch.setattr(digest_module, "_digest", None)
+    monkeypatch.setattr(digest_module, "_version_checked_at", 0.0)
+    monkeypatch.setattr(digest_module, "_rebuild_task", None)
+    monkeypatch.setattr(cache_service, "get", _get)
+    monkeypatch.setattr(cache_service, "set", _set)
+    return store
+
+
+async def _catalog(db: AsyncSession):
+    category = await create_category(db, name="Seating")
+    family = await create_product_family(db, category_id=category.id, name="Abruzzo")
+    chair = await create_chair(
+        db, category_id=category.id, family_id=family.id,
+        model_number="5242", model_suffix="P", name="Abruzzo Side Chair",
+    )
+    await create_chair(db, category_id=category.id, model_number="6018", name="Bar Stool")
+    await create_chair(db, category_id=category.id, model_number="7777", name="Retired Chair", is_active=False)
+    finish = await create_finish(db, name="Walnut Stain")
+    await create_product_variation(db, chair.id, finish_id=finish.id, sku="5242PBX")
+    return chair
+
+
+@pytest.mark.unit
+class TestCatalogDigestService:
+    """Test cases for CatalogDigestService"""
+
+    @pytest.mark.asyncio
+    async def test_search_matches_models_names_and_related_names(self, db_session: AsyncSession):
+        chair = await _catalog(db_session)
+
+        result = await search_catalog("5242-p")
+        assert result["query"] == "5242-p"
+        assert [p["id"] for p in result["products"]] == [chair.id]
+
+        result = await search_catalog("5242")
+        assert [p["model"] for p in result["products"]] == ["5242"]
+        assert [v["sku"] for v in result["variations"]] == ["5242PBX"]
+        assert result["variations"][0]["finish"] == "Walnut Stain"
+
+        result = await search_catalog("abruzzo")
+        assert [f["name"] for f in result["families"]] == ["Abruzzo"]
+        assert result["products"][0]["family"] == "Abruzzo"
+
+        assert (await search_catalog("7777"))["products"] == []
+
+    @pytest.mark.asyncio
+    async def test_broad_query_returns_overview(self, db_session: AsyncSession):
+        await _catalog(db_session)
+
+        result = await search_catalog("all")
+        assert result["broad_overview"] is True
+        assert result["total_products"] == 2
+        assert result["families"][0]["product_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_markdown_lists_active_products(self, db_session: AsyncSession):
+        await _catalog(db_session)
+
+        markdown = await fetch_product_catalog()
+        assert "## Products (2 active)" in markdown
+        assert "Abruzzo Side Chair" in markdown
+        assert "Retired Chair" not in markdown
+
+    @pytest.mark.asyncio
+    async def test_repeat_calls_reuse_digest(self, db_session: AsyncSession):
+        await _catalog(db_session)
+        await search_catalog("5242")
+
+        with count_queries() as counter:
+            await search_catalog("6018")
+            await fetch_product_catalog()
+        assert counter.count == 0
+
+    @pytest.mark.asyncio
+    async def test_version_change_rebuilds_in_background(self, db_session: AsyncSession):
+        chair = await _catalog(db_session)
+        first = await CatalogDigestService.get_digest()
+
+        chair.name = "Abruzzo Armchair"
+        await db_session.commit()
+        digest_module._version_checked_at = 0.0
+
+        # The stale digest keeps serving while the new version builds
+        stale = await CatalogDigestService.get_digest()
+        assert stale is first
+        fresh = await digest_module._rebuild_task
+        assert fresh["version"] != first["version"]
+        assert "Abruzzo Armchair" in fresh["markdown"]
+        assert await CatalogDigestService.get_digest() is fresh
+
+    @pytest.mark.asyncio
+    async def test_invalidate_waits_for_fresh_build(self, db_session: AsyncSession):
+        chair = await _catalog(db_session)
+        await CatalogDigestService.get_digest()
+
+        chair.model_number = "5243"
+        await db_session.commit()
+        CatalogDigestService.invalidate()
+
+        result = await search_catalog("5243")
+        assert [p["id"] for p in result["products"]] == [chair.id]
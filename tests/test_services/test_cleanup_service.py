@@ -0,0 +1,144 @@
+"""
+Unit Tests for Cleanup Service
+
+Tests chunked deletion of expired tmp catalog data, orphan sweeping and
+resuming from a checkpoint
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.tmp_catalog import CatalogUpload, TmpProductFamily
+from backend.services import cleanup_service as cleanup_module
+from backend.services.cleanup_service import CleanupService
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    uploads = tmp_path / "uploads"
+    images = tmp_path / "images"
+    uploads.mkdir()
+    images.mkdir()
+    return uploads, images
+
+
+@pytest.fixture
+def service(dirs):
+    uploads, images = dirs
+    return CleanupService(str(uploads), str(images), batch_size=2, max_concurrent_deletes=2)
+
+
+@pytest.fixture(autouse=True)
+def _use_test_session(db_session: AsyncSession, monkeypatch):
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    monkeypatch.setattr(cleanup_module, "AsyncSessionLocal", _session)
+
+
+async def _upload(db_session, dirs, upload_id, expired=True, pdf_bytes=100, image_bytes=50):
+    uploads, images = dirs
+    pdf = uploads / f"{upload_id}_catalog.pdf"
+    pdf.write_bytes(b"x" * pdf_bytes)
+    (images / upload_id).mkdir()
+    (images / upload_id / "page1.png").write_bytes(b"x" * image_bytes)
+
+    offset = timedelta(hours=-1 if expired else 24)
+    db_session.add(CatalogUpload(
+        upload_id=upload_id, filename="catalog.pdf", file_size=pdf_bytes,
+        file_path=str(pdf), expires_at=datetime.utcnow() + offset,
+    ))
+    db_session.add(TmpProductFamily(name=f"Family {upload_id}", upload_id=upload_id,
+                                    expires_at=datetime.utcnow() + offset))
+    await db_session.commit()
+    return pdf
+
+
+async def _count(db_session, model) -> int:
+    return (await db_session.execute(select(func.count()).select_from(model))).scalar()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCleanupService:
+    """Test cases for CleanupService"""
+
+    async def test_expired_data_in_chunks(self, db_session: AsyncSession, service, dirs):
+        """Test expired rows and files go in chunks and bytes are reported."""
+        for i in range(5):
+            await _upload(db_session, dirs, f"old{i}")
+        kept_pdf = await _upload(db_session, dirs, "fresh", expired=False)
+
+        saved = []
+
+        async def _save(db, state):
+            saved.append(state["phase"])
+            await db.commit()
+
+        stats = await service.cleanup_expired_data(db_session, save_checkpoint=_save)
+
+        assert stats["uploads_deleted"] == 5
+        assert stats["families_deleted"] == 5
+        assert stats["files_deleted"] == 5
+        assert stats["directories_deleted"] == 5
+        assert stats["bytes_reclaimed"] == 5 * 150
+        assert stats["errors"] == []
+        assert await _count(db_session, CatalogUpload) == 1
+        assert await _count(db_session, TmpProductFamily) == 1
+        assert kept_pdf.exists()
+        # 3 chunks of families, 3 of uploads, plus the empty phases
+        assert len(saved) == 9
+
+    async def test_resume_from_checkpoint(self, db_session: AsyncSession, service, dirs):
+        """Test a resumed run skips finished phases and keeps earlier totals."""
+        await _upload(db_session, dirs, "old0")
+        checkpoint = {
+            "phase": 4,
+            "stats": {
+                "uploads_deleted": 2, "families_deleted": 7, "products_deleted": 0,
+                "variations_deleted": 0, "images_deleted": 0, "files_deleted": 2,
+                "directories_deleted": 2, "bytes_reclaimed": 1000, "errors": [],
+            },
+        }
+
+        stats = await service.cleanup_expired_data(db_session, checkpoint=checkpoint)
+
+        assert stats["families_deleted"] == 7  # phase already done, not re-run
+        assert await _count(db_session, TmpProductFamily) == 1
+        assert stats["uploads_deleted"] == 3
+        assert stats["bytes_reclaimed"] == 1150
+
+    async def test_orphaned_files(self, db_session: AsyncSession, service, dirs):
+        """Test files and directories without an upload row are removed."""
+        uploads, images = dirs
+        kept_pdf = await _upload(db_session, dirs, "live", expired=False)
+        for name in ("a", "b", "c"):
+            (uploads / f"{name}_stale.pdf").write_bytes(b"x" * 10)
+        (images / "gone").mkdir()
+        (images / "gone" / "p.png").write_bytes(b"x" * 20)
+
+        stats = await service.cleanup_orphaned_files()
+
+        assert stats["uploads_scanned"] == 4
+        assert stats["images_scanned"] == 2
+        assert stats["orphaned_deleted"] == 4
+        assert stats["bytes_reclaimed"] == 50
+        assert sorted(p.name for p in uploads.iterdir()) == [kept_pdf.name]
+        assert [p.name for p in images.iterdir()] == ["live"]
+
+    async def test_orphan_sweep_resumes_after_cursor(self, db_session: AsyncSession, service, dirs):
+        """Test the orphan sweep continues after the last handled name."""
+        uploads, _ = dirs
+        for name in ("a", "b", "c"):
+            (uploads / f"{name}_stale.pdf").write_bytes(b"x")
+        checkpoint = {"stage": "uploads", "after": "a_stale.pdf", "stats": None}
+
+        stats = await service.cleanup_orphaned_files(checkpoint=checkpoint)
+
+        assert stats["uploads_scanned"] == 2
+        assert (uploads / "a_stale.pdf").exists()
@@ -0,0 +1,261 @@
+"""
+Unit Tests for Email Service
+
+Tests template rendering, the compiled template registry and bulk sending
+"""
+
+import smtplib
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.exceptions import ResourceNotFoundError
+from backend.database.query_counter import count_queries
+from backend.models.content import EmailTemplate, SiteSettings
+from backend.services import job_handlers
+from backend.services.email_service import EmailService, template_registry
+from backend.services.job_queue_service import COMPANY_INVITES, JobQueueService, current_job
+from tests.factories import create_email_template, create_site_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Each test starts with nothing compiled"""
+    template_registry.invalidate_template()
+    template_registry.invalidate_site_settings()
+    yield
+    template_registry.invalidate_template()
+    template_registry.invalidate_site_settings()
+
+
+class FakeSMTP:
+    """Records messages instead of sending them"""
+
+    def __init__(self, fail_at=None, refuse=()):
+        self.sent = []
+        self.closed = False
+        self.fail_at = fail_at
+        self.refuse = set(refuse)
+
+    def send_message(self, msg):
+        if msg["To"] in self.refuse:
+            raise smtplib.SMTPRecipientsRefused({msg["To"]: (550, b"No such user")})
+        if len(self.sent) == self.fail_at:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(msg)
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEmailTemplateRendering:
+    """Test cases for EmailService rendering and the template registry"""
+
+    async def test_render_default_template(self, db_session: AsyncSession):
+        """Test a built-in template renders inside the base layout with site settings."""
+        await create_site_settings(db_session, company_name="Eagle Test Co", city="Miami", state="FL", zip_code="33101")
+
+        subject, html = await EmailService.render_email(
+            db_session, "quote_updated", {"company_name": "Acme", "quote_number": "Q-1", "status": "Quoted"}
+        )
+
+        assert subject == "Quote #Q-1 Updated"
+        assert "Your quote #Q-1 has been updated." in html
+        assert "Eagle Test Co" in html
+        assert "Miami, FL, 33101" in html
+
+    async def test_compiled_once_and_one_query_per_send(self, db_session: AsyncSession):
+        """Test repeat renders reuse compiled templates and only check versions."""
+        await create_email_template(
+            db_session, template_type="welcome", subject="Hi {{ company_name }}",
+            body="{{ button('/register', 'Register') }}"
+        )
+        await create_site_settings(db_session)
+
+        await EmailService.render_email(db_session, "welcome", {"company_name": "Acme"})
+        compiled = template_registry._templates["welcome"]
+
+        with count_queries() as counter:
+            subject, html = await EmailService.render_email(db_session, "welcome", {"company_name": "Beta"})
+
+        assert counter.count == 1
+        assert template_registry._templates["welcome"] is compiled
+        assert subject == "Hi Beta"
+        assert 'href="https://' in html and '/register"' in html
+
+    async def test_update_template_invalidates(self, db_session: AsyncSession):
+        """Test update_template makes the next render use the new content."""
+        template = await create_email_template(db_session, template_type="welcome", subject="Old {{ company_name }}")
+        assert (await EmailService.render_email(db_session, "welcome", {"company_name": "A"}))[0] == "Old A"
+
+        await EmailService.update_template(db_session, template.id, subject="New {{ company_name }}")
+
+        assert (await EmailService.render_email(db_session, "welcome", {"company_name": "A"}))[0] == "New A"
+
+    async def test_changes_from_other_processes_are_picked_up(self, db_session: AsyncSession):
+        """Test rows changed without invalidation are reloaded by updated_at."""
+        await create_email_template(db_session, template_type="welcome", subject="Old")
+        await create_site_settings(db_session, company_name="Before Co")
+        await EmailService.render_email(db_session, "welcome", {})
+
+        await db_session.execute(
+            update(EmailTemplate).where(EmailTemplate.template_type == "welcome").values(subject="Edited")
+        )
+        await db_session.execute(update(SiteSettings).values(company_name="After Co"))
+        await db_session.commit()
+
+        subject, html = await EmailService.render_email(db_session, "welcome", {})
+
+        assert subject == "Edited"
+        assert "After Co" in html
+
+    async def test_deactivated_template_falls_back_to_default(self, db_session: AsyncSession):
+        """Test a deactivated row stops being used in favour of the default."""
+        template = await create_email_template(db_session, template_type="welcome", subject="Custom welcome")
+        await EmailService.render_email(db_session, "welcome", {})
+
+        await EmailService.update_template(db_session, template.id, is_active=False)
+
+        subject, _ = await EmailService.render_email(db_session, "welcome", {})
+        assert subject == "Welcome to EagleChair"
+
+    async def test_custom_subject_and_body(self, db_session: AsyncSession):
+        """Test custom overrides are rendered with the helpers available."""
+        subject, html = await EmailService.render_email(
+            db_session, "custom", {"name": "Acme"},
+            custom_subject="Note for {{ name }}", custom_body="{{ code('123456') }}"
+        )
+
+        assert subject == "Note for Acme"
+        assert "123456" in html and "verification-code" in html
+
+    async def test_unknown_template(self, db_session: AsyncSession):
+        """Test an unknown template type raises."""
+        with pytest.raises(ResourceNotFoundError):
+            await EmailService.render_email(db_session, "does_not_exist", {})
+
+        assert await EmailService.send_email(db_session, "a@example.com", "does_not_exist", {}) is False
+
+    async def test_render_bulk(self, db_session: AsyncSession):
+        """Test bulk rendering resolves the template once for the batch."""
+        await create_site_settings(db_session)
+        contexts = [{"company_name": f"Company {i}", "login_url": "/login"} for i in range(200)]
+
+        with count_queries() as counter:
+            rendered = await EmailService.render_bulk(db_session, "company_approved", contexts)
+
+        assert counter.count <= 2
+        assert len(rendered) == 200
+        assert "Company 0" in rendered[0][1]
+        assert "Company 199" in rendered[199][1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkEmail:
+    """Test cases for EmailService.send_bulk_email"""
+
+    @pytest.fixture
+    def smtp(self, monkeypatch):
+        from backend.services import email_service
+
+        server = FakeSMTP()
+        monkeypatch.setattr(email_service.settings, "SMTP_HOST", "smtp.example.com")
+        monkeypatch.setattr(email_service.settings, "SMTP_USER", "user")
+        monkeypatch.setattr(email_service.settings, "SMTP_PASSWORD", "secret")
+        monkeypatch.setattr(EmailService, "_get_smtp_connection", staticmethod(lambda: server))
+        return server
+
+    async def test_send_company_invites(self, db_session: AsyncSession, smtp: FakeSMTP):
+        """Test invites go out over one connection and usage tracking keeps updated_at."""
+        template = await create_email_template(
+            db_session, template_type="company_invite",
+            subject="Join us, {{ company_name }}", body="{{ button(registration_url, 'Register') }}"
+        )
+        updated_at = template.updated_at
+
+        sent = await EmailService.send_company_invites(
+            db_session,
+            [(f"buyer{i}@example.com", f"Company {i}") for i in range(25)],
+            registration_url="/register",
+        )
+
+        assert len(sent.sent) == 25
+        assert smtp.closed
+        assert smtp.sent[3]["To"] == "buyer3@example.com"
+        assert smtp.sent[3]["Subject"] == "Join us, Company 3"
+
+        row = (await db_session.execute(
+            select(EmailTemplate.times_sent, EmailTemplate.updated_at).where(EmailTemplate.id == template.id)
+        )).one()
+        assert row.times_sent == 25
+        assert row.updated_at == updated_at
+
+    async def test_send_bulk_without_recipients(self, db_session: AsyncSession, smtp: FakeSMTP):
+        """Test an empty batch sends nothing."""
+        result = await EmailService.send_bulk_email(db_session, "welcome", [])
+        assert (result.sent, result.refused, result.unsent) == ([], [], [])
+        assert smtp.sent == []
+
+    async def test_partial_send_is_reported_and_counted(self, db_session: AsyncSession, smtp: FakeSMTP):
+        """Test an SMTP error mid-batch keeps what was sent and records usage for it."""
+        template = await create_email_template(db_session, template_type="company_invite")
+        smtp.fail_at = 3
+        smtp.refuse = {"buyer1@example.com"}
+
+        result = await EmailService.send_company_invites(
+            db_session, [(f"buyer{i}@example.com", f"Company {i}") for i in range(6)], "/register"
+        )
+
+        assert result.sent == ["buyer0@example.com", "buyer2@example.com", "buyer3@example.com"]
+        assert result.refused == ["buyer1@example.com"]
+        assert result.unsent == ["buyer4@example.com", "buyer5@example.com"]
+        assert smtp.closed
+        times_sent = (await db_session.execute(
+            select(EmailTemplate.times_sent).where(EmailTemplate.id == template.id)
+        )).scalar_one()
+        assert times_sent == 3
+
+    async def test_invite_job_resumes_after_smtp_failure(
+        self, db_session: AsyncSession, smtp: FakeSMTP, monkeypatch
+    ):
+        """Test a retried invite job only sends to recipients not yet handled."""
+        @asynccontextmanager
+        async def _session():
+            yield db_session
+
+        monkeypatch.setattr(job_handlers, "AsyncSessionLocal", _session)
+        await create_email_template(db_session, template_type="company_invite")
+        invites = [[f"buyer{i}@example.com", f"Company {i}"] for i in range(5)]
+        job = await JobQueueService.enqueue(
+            db_session, COMPANY_INVITES, payload={"invites": invites, "registration_url": "/register"}
+        )
+        await JobQueueService.claim(db_session, "test-worker", [COMPANY_INVITES])
+        smtp.fail_at = 2
+
+        token = current_job.set((job.id, "test-worker"))
+        try:
+            with pytest.raises(RuntimeError):
+                await job_handlers.handle_company_invites(job.payload)
+            smtp.fail_at = None
+            result = await job_handlers.handle_company_invites(job.payload)
+        finally:
+            current_job.reset(token)
+
+        assert result["sent"] == [email for email, _ in invites]
+        assert [msg["To"] for msg in smtp.sent] == [email for email, _ in invites]
+
+    async def test_context_urls_are_made_absolute(self, db_session: AsyncSession):
+        """Test logo and unsubscribe URLs passed in the context are absolute in the layout."""
+        _, html = await EmailService.render_email(
+            db_session, "welcome", {"logo_url": "/uploads/logo.png", "unsubscribe_url": "/unsubscribe"}
+        )
+
+        assert 'src="/uploads/logo.png"' not in html
+        assert "/uploads/logo.png" in html
+        assert 'href="/unsubscribe"' not in html
+        assert '/unsubscribe" style' in html
@@ -0,0 +1,114 @@
+"""
+Test Export Service
+
+Unit tests for streamed CSV/Parquet admin exports
+"""
+
+import csv
+import io
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import backend.services.export_service as export_module
+from backend.core.exceptions import ValidationError
+from backend.models.company import CompanyStatus
+from backend.models.quote import QuoteStatus
+from backend.services.admin_service import AdminService
+from backend.services.export_service import (
+    FORMAT_CSV,
+    FORMAT_PARQUET,
+    ExportService,
+    companies_export,
+    products_export,
+    quotes_export,
+)
+from tests.factories import create_category, create_chair, create_company, create_quote, create_quote_item
+
+
+@pytest.fixture(autouse=True)
+def _use_test_session(db_session: AsyncSession, monkeypatch):
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    monkeypatch.setattr(export_module, "AsyncSessionLocal", _session)
+
+
+async def _read_csv(columns, stmt, batch_size=2):
+    chunks = [chunk async for chunk in ExportService.stream_csv(columns, stmt, batch_size=batch_size)]
+    return chunks, list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+
+
+@pytest.mark.unit
+class TestExportService:
+    """Test cases for ExportService"""
+
+    @pytest.mark.asyncio
+    async def test_quotes_csv_streams_in_batches(self, db_session: AsyncSession):
+        company = await create_company(db_session, company_name="Acme Dining")
+        for _ in range(4):
+            await create_quote(db_session, company_id=company.id, status=QuoteStatus.SUBMITTED)
+        guest = await create_quote(db_session, status=QuoteStatus.DRAFT)
+        await create_quote_item(db_session, guest.id)
+
+        chunks, rows = await _read_csv(*quotes_export())
+
+        # header + one chunk per 2-row batch
+        assert len(chunks) == 4
+        assert len(rows) == 5
+        guest_row = next(r for r in rows if r["id"] == str(guest.id))
+        assert guest_row["company_name"] == "Guest"
+        assert guest_row["items_count"] == "1"
+        assert guest_row["status"] == QuoteStatus.DRAFT.value
+
+    @pytest.mark.asyncio
+    async def test_filters_match_admin_lists(self, db_session: AsyncSession):
+        company = await create_company(db_session, company_name="Harbor Hotels", status=CompanyStatus.ACTIVE)
+        await create_company(db_session, company_name="Pending Co", status=CompanyStatus.PENDING)
+        await create_quote(db_session, company_id=company.id, status=QuoteStatus.SUBMITTED)
+        await create_quote(db_session, status=QuoteStatus.SUBMITTED)
+        await create_quote(db_session, company_id=company.id, status=QuoteStatus.DRAFT)
+
+        listed, total = await AdminService.get_all_quotes(
+            db_session, page_size=100, status=QuoteStatus.SUBMITTED, company_id=company.id
+        )
+        _, rows = await _read_csv(*quotes_export(status=QuoteStatus.SUBMITTED, company_id=company.id))
+        assert total == 1
+        assert [int(r["id"]) for r in rows] == [q.id for q in listed]
+
+        listed, _ = await AdminService.get_all_companies(db_session, page_size=100, search="harbor")
+        _, rows = await _read_csv(*companies_export(search="harbor"))
+        assert [int(r["id"]) for r in rows] == [c.id for c in listed]
+        assert "hashed_password" not in rows[0]
+
+    @pytest.mark.asyncio
+    async def test_products_sorted_by_exported_column(self, db_session: AsyncSession):
+        category = await create_category(db_session, name="Seating")
+        for name in ("Bravo", "Alpha", "Charlie"):
+            await create_chair(db_session, category_id=category.id, name=name)
+        await create_chair(db_session, category_id=category.id, name="Delta", is_active=False)
+
+        _, rows = await _read_csv(*products_export(is_active=True, sort_by="name", sort_dir="asc"))
+        assert [r["name"] for r in rows] == ["Alpha", "Bravo", "Charlie"]
+        assert rows[0]["category"] == "Seating"
+
+    def test_unavailable_format_rejected(self, monkeypatch):
+        monkeypatch.setattr(export_module, "_load_pyarrow", lambda: None)
+        ExportService.check_format(FORMAT_CSV)
+        with pytest.raises(ValidationError):
+            ExportService.check_format(FORMAT_PARQUET)
+
+    @pytest.mark.asyncio
+    async def test_parquet_round_trip(self, db_session: AsyncSession):
+        pq = pytest.importorskip("pyarrow.parquet")
+        company = await create_company(db_session)
+        await create_quote(db_session, company_id=company.id)
+        await create_quote(db_session)
+
+        columns, stmt = quotes_export()
+        data = b"".join([c async for c in ExportService.stream_parquet(columns, stmt, batch_size=1)])
+        table = pq.read_table(io.BytesIO(data))
+        assert table.num_rows == 2
+        assert table.column_names == [name for name, _, _ in columns]
@@ -0,0 +1,157 @@
+"""
+Unit Tests for Image Index Service
+
+Tests perceptual fingerprints, the incremental index and duplicate/orphan detection
+"""
+
+import io
+import os
+import random
+
+import pytest
+from PIL import Image, ImageDraw, ImageFilter
+
+from backend.services.image_index_service import (
+    ImageIndex,
+    ImageIndexService,
+    compute_fingerprint,
+    hamming,
+)
+
+
+def _picture(seed: int, size=(800, 600)) -> Image.Image:
+    rng = random.Random(seed)
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(30):
+        x, y = rng.randrange(size[0]), rng.randrange(size[1])
+        w, h = rng.randrange(40, 200), rng.randrange(40, 200)
+        draw.ellipse([x, y, x + w, y + h], fill=tuple(rng.randrange(256) for _ in range(3)))
+    return img
+
+
+def _encode(img: Image.Image, fmt: str, **kwargs) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format=fmt, **kwargs)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return tmp_path / "index.sqlite"
+
+
+@pytest.mark.unit
+class TestFingerprints:
+    """Test cases for compute_fingerprint"""
+
+    def test_reencoded_copies_match(self):
+        original = compute_fingerprint(_encode(_picture(1), "PNG"))
+        smaller_jpeg = compute_fingerprint(_encode(_picture(1).resize((400, 300)), "JPEG", quality=60))
+        webp = compute_fingerprint(_encode(_picture(1), "WEBP", quality=85))
+        other = compute_fingerprint(_encode(_picture(2), "PNG"))
+
+        assert (original.width, original.height) == (800, 600)
+        assert (smaller_jpeg.width, smaller_jpeg.height) == (400, 300)
+        assert hamming(original.dhash, smaller_jpeg.dhash) <= 3
+        assert hamming(original.dhash, webp.dhash) <= 3
+        assert hamming(original.dhash, other.dhash) > 10
+
+    def test_blur_lowers_sharpness(self):
+        sharp = compute_fingerprint(_encode(_picture(1), "PNG"))
+        blurred = compute_fingerprint(_encode(_picture(1).filter(ImageFilter.GaussianBlur(3)), "PNG"))
+
+        assert blurred.sharpness < sharp.sharpness
+        assert blurred.quality < sharp.quality
+
+
+@pytest.mark.unit
+class TestImageIndex:
+    """Test cases for ImageIndex and ImageIndexService"""
+
+    def test_incremental_scan(self, tmp_path, index_path):
+        folder = tmp_path / "uploads"
+        folder.mkdir()
+        for i in range(3):
+            _picture(i).save(folder / f"{i}.png")
+
+        with ImageIndex(index_path) as index:
+            assert len(index.scan(folder, workers=1)) == 3
+            assert index.update([folder / "0.png", folder / "1.png"]) == 0
+
+            _picture(9).save(folder / "1.png")
+            stat = (folder / "1.png").stat()
+            os.utime(folder / "1.png", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            (folder / "2.png").unlink()
+
+            assert set(index.scan(folder, workers=1)) == {str(folder / "0.png"), str(folder / "1.png")}
+            assert index._conn.execute("SELECT COUNT(*) FROM images").fetchone()[0] == 2
+
+    def test_unreadable_files_are_remembered(self, tmp_path, index_path):
+        broken = tmp_path / "broken.jpg"
+        broken.write_bytes(b"not an image")
+
+        with ImageIndex(index_path) as index:
+            assert index.fingerprints([broken], workers=1) == {}
+            assert index.update([broken], workers=1) == 0
+
+    def test_group_duplicates_keeps_best(self, tmp_path, index_path):
+        _picture(1).save(tmp_path / "a.png")
+        _picture(1).resize((400, 300)).save(tmp_path / "a_small.jpg", quality=70)
+        _picture(2).save(tmp_path / "b.png")
+
+        with ImageIndex(index_path) as index:
+            fps = index.scan(tmp_path, workers=1)
+        [group] = ImageIndexService.group_duplicates(fps.values())
+
+        assert [os.path.basename(fp.path) for fp in group] == ["a.png", "a_small.jpg"]
+
+    def test_check_duplicate_and_record(self, tmp_path, index_path):
+        folder = tmp_path / "products"
+        folder.mkdir()
+        stored = _encode(_picture(1), "WEBP", quality=85)
+        (folder / "chair_1.webp").write_bytes(stored)
+
+        # Only the new image is fingerprinted; the folder is left for index_folder
+        check = ImageIndexService.check_duplicate(_encode(_picture(1), "PNG"), folder, index_path)
+        assert (check.identical, check.similar, check.unindexed) == (None, None, 1)
+        assert ImageIndexService.index_folder(folder, index_path) == 1
+
+        check = ImageIndexService.check_duplicate(_encode(_picture(1), "PNG"), folder, index_path)
+        assert (check.identical, check.similar, check.unindexed) == (None, folder / "chair_1.webp", 0)
+        assert ImageIndexService.check_duplicate(stored, folder, index_path).identical == folder / "chair_1.webp"
+
+        new_content = _encode(_picture(2), "WEBP")
+        check = ImageIndexService.check_duplicate(new_content, folder, index_path)
+        assert check.similar is None
+        (folder / "chair_2.webp").write_bytes(new_content)
+        ImageIndexService.record(folder / "chair_2.webp", check.fingerprint, index_path)
+
+        with ImageIndex(index_path) as index:
+            assert index.update([folder / "chair_2.webp"]) == 0
+        again = ImageIndexService.check_duplicate(_encode(_picture(2), "PNG"), folder, index_path)
+        assert again.similar == folder / "chair_2.webp"
+
+    def test_pick_best(self, tmp_path, index_path):
+        _picture(1).filter(ImageFilter.GaussianBlur(3)).save(tmp_path / "soft.png")
+        _picture(1).save(tmp_path / "sharp.png")
+        _picture(1).resize((200, 150)).save(tmp_path / "tiny.png")
+
+        with ImageIndex(index_path) as index:
+            best = ImageIndexService.pick_best(sorted(tmp_path.glob("*.png")), index)
+
+        assert best == tmp_path / "sharp.png"
+
+    def test_find_orphans(self, tmp_path):
+        uploads = tmp_path / "uploads"
+        (uploads / "images" / "products").mkdir(parents=True)
+        used = uploads / "images" / "products" / "used.webp"
+        orphan = uploads / "images" / "products" / "orphan.webp"
+        for p in (used, orphan):
+            p.write_bytes(b"x")
+
+        orphans = ImageIndexService.find_orphans(
+            [used, orphan], uploads, {"https://example.com/uploads/images/products/used.webp?v=2"}
+        )
+
+        assert orphans == [orphan]
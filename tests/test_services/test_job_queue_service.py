@@ -0,0 +1,208 @@
+"""
+Test Job Queue Service
+
+Unit tests for the durable background job queue and worker execution
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import backend.worker as worker_module
+from backend.models.job import BackgroundJob, JobStatus
+from backend.services.job_handlers import JOB_HANDLERS
+from backend.services.job_queue_service import (
+    CLEANUP,
+    RECURRING_REFERENCE,
+    JobQueueService,
+    current_job,
+)
+
+WORKER = "test-worker"
+
+
+@pytest.mark.unit
+class TestJobQueueService:
+    """Test cases for JobQueueService"""
+
+    @pytest.mark.asyncio
+    async def test_claim_marks_running_and_is_exclusive(self, db_session: AsyncSession):
+        job = await JobQueueService.enqueue(db_session, CLEANUP, payload={"include_orphaned": False})
+        assert job.status == JobStatus.QUEUED.value
+
+        claimed = await JobQueueService.claim(db_session, WORKER, [CLEANUP])
+        assert [j.id for j in claimed] == [job.id]
+        assert claimed[0].status == JobStatus.RUNNING.value
+        assert claimed[0].attempts == 1
+        assert claimed[0].locked_by == WORKER
+        assert claimed[0].locked_until > datetime.utcnow()
+
+        assert await JobQueueService.claim(db_session, "other-worker", [CLEANUP]) == []
+
+    @pytest.mark.asyncio
+    async def test_claim_respects_types_limit_and_delay(self, db_session: AsyncSession):
+        first = await JobQueueService.enqueue(db_session, CLEANUP)
+        second = await JobQueueService.enqueue(db_session, CLEANUP)
+        await JobQueueService.enqueue(db_session, CLEANUP, delay_seconds=3600)
+
+        assert await JobQueueService.claim(db_session, WORKER, ["catalog_parse"]) == []
+
+        claimed = await JobQueueService.claim(db_session, WORKER, [CLEANUP], limit=5)
+        assert [j.id for j in claimed] == [first.id, second.id]
+
+    @pytest.mark.asyncio
+    async def test_fail_retries_with_backoff_then_fails(self, db_session: AsyncSession):
+        job = await JobQueueService.enqueue(db_session, CLEANUP)
+        max_attempts = job.max_attempts
+        assert max_attempts > 1
+
+        await JobQueueService.claim(db_session, WORKER, [CLEANUP])
+        assert await JobQueueService.fail(db_session, job.id, WORKER, "boom") is True
+
+        await db_session.refresh(job)
+        assert job.status == JobStatus.QUEUED.value
+        assert job.last_error == "boom"
+        assert job.run_after > datetime.utcnow()
+        # Not due yet
+        assert await JobQueueService.claim(db_session, WORKER, [CLEANUP]) == []
+
+        for _ in range(max_attempts - 1):
+            job.run_after = datetime.utcnow() - timedelta(seconds=1)
+            await db_session.commit()
+            assert await JobQueueService.claim(db_session, WORKER, [CLEANUP])
+            retry = await JobQueueService.fail(db_session, job.id, WORKER, "boom")
+
+        assert retry is False
+        await db_session.refresh(job)
+        assert job.status == JobStatus.FAILED.value
+        assert job.attempts == max_attempts
+        assert job.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, db_session: AsyncSession):
+        job = await JobQueueService.enqueue(db_session, CLEANUP)
+        await JobQueueService.claim(db_session, "crashed-worker", [CLEANUP])
+
+        job.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        await db_session.commit()
+
+        claimed = await JobQueueService.claim(db_session, WORKER, [CLEANUP])
+        assert [j.id for j in claimed] == [job.id]
+        assert claimed[0].locked_by == WORKER
+        assert claimed[0].attempts == 2
+
+        # The crashed worker no longer owns it
+        assert await JobQueueService.heartbeat(db_session, job.id, "crashed-worker", 60) is False
+        assert await JobQueueService.heartbeat(db_session, job.id, WORKER, 60) is True
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_on_last_attempt_fails_job(self, db_session: AsyncSession):
+        job = await JobQueueService.enqueue(db_session, "catalog_parse", payload={})
+        assert job.max_attempts == 1
+        await JobQueueService.claim(db_session, "crashed-worker", ["catalog_parse"])
+
+        job.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        await db_session.commit()
+
+        assert await JobQueueService.claim(db_session, WORKER, ["catalog_parse"]) == []
+        await db_session.refresh(job)
+        assert job.status == JobStatus.FAILED.value
+
+    @pytest.mark.asyncio
+    async def test_release_does_not_consume_attempt(self, db_session: AsyncSession):
+        job = await JobQueueService.enqueue(db_session, CLEANUP)
+        await JobQueueService.claim(db_session, WORKER, [CLEANUP])
+
+        await JobQueueService.release(db_session, job.id, WORKER)
+
+        await db_session.refresh(job)
+        assert job.status == JobStatus.QUEUED.value
+        assert job.attempts == 0
+        assert job.locked_by is None
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_survives_retry(self, db_session: AsyncSession):
+        job = await JobQueueService.enqueue(db_session, CLEANUP)
+        await JobQueueService.claim(db_session, WORKER, [CLEANUP])
+
+        token = current_job.set((job.id, WORKER))
+        try:
+            assert await JobQueueService.load_checkpoint(db_session) is None
+            await JobQueueService.save_checkpoint(db_session, {"phase": 2})
+            await JobQueueService.fail(db_session, job.id, WORKER, "interrupted")
+            assert await JobQueueService.load_checkpoint(db_session) == {"phase": 2}
+        finally:
+            current_job.reset(token)
+
+        assert await JobQueueService.load_checkpoint(db_session) is None
+
+    @pytest.mark.asyncio
+    async def test_schedule_recurring(self, db_session: AsyncSession):
+        first = await JobQueueService.schedule_recurring(db_session, CLEANUP, 3600)
+        assert first.reference_id == RECURRING_REFERENCE
+        assert first.run_after <= datetime.utcnow()
+        assert await JobQueueService.schedule_recurring(db_session, CLEANUP, 3600) is None
+
+        await JobQueueService.claim(db_session, WORKER, [CLEANUP])
+        await JobQueueService.complete(db_session, first.id, WORKER, {"ok": True})
+
+        second = await JobQueueService.schedule_recurring(db_session, CLEANUP, 3600)
+        assert second.run_after > datetime.utcnow() + timedelta(minutes=59)
+
+
+@pytest.mark.unit
+class TestWorker:
+    """Test cases for the background worker"""
+
+    @pytest.fixture(autouse=True)
+    def _use_test_session(self, db_session: AsyncSession, monkeypatch):
+        @asynccontextmanager
+        async def _session():
+            yield db_session
+
+        monkeypatch.setattr(worker_module, "AsyncSessionLocal", _session)
+
+    @pytest.mark.asyncio
+    async def test_execute_stores_result(self, db_session: AsyncSession, monkeypatch):
+        calls = []
+
+        async def _handler(payload):
+            calls.append(payload)
+            return {"removed": 3}
+
+        monkeypatch.setitem(JOB_HANDLERS, CLEANUP, _handler)
+        job = await JobQueueService.enqueue(db_session, CLEANUP, payload={"include_orphaned": True})
+
+        worker = worker_module.Worker(job_types=[CLEANUP], worker_id=WORKER)
+        assert await worker.poll_once() == 1
+        await worker.drain()
+
+        await db_session.refresh(job)
+        assert calls == [{"include_orphaned": True}]
+        assert job.status == JobStatus.SUCCEEDED.value
+        assert job.result == {"removed": 3}
+        assert job.locked_by is None
+        assert worker._running == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_failure_is_retried(self, db_session: AsyncSession, monkeypatch):
+        async def _handler(payload):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setitem(JOB_HANDLERS, CLEANUP, _handler)
+        job = await JobQueueService.enqueue(db_session, CLEANUP)
+
+        worker = worker_module.Worker(job_types=[CLEANUP], worker_id=WORKER)
+        await worker.poll_once()
+        await worker.drain()
+
+        await db_session.refresh(job)
+        assert job.status == JobStatus.QUEUED.value
+        assert job.attempts == 1
+        assert job.last_error == "disk full"
+
+    def test_unknown_job_type_is_rejected(self):
+        with pytest.raises(ValueError):
+            worker_module.Worker(job_types=["nope"])
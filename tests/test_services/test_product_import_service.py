@@ -0,0 +1,134 @@
+"""
+Test Product Import Service
+
+Unit tests for bulk product import/update
+"""
+
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.chair import Chair, ProductVariation, chair_categories
+from backend.core.exceptions import BusinessLogicError
+from backend.models.tmp_catalog import ProductImportJob
+from backend.services.product_import_service import ProductImportService, check_upsert_support
+from tests.factories import create_category, create_chair
+
+
+async def _run_import(db_session, tmp_path, monkeypatch, name, content, batch_size=2):
+    invalidations = []
+
+    async def _record_invalidation(db):
+        invalidations.append(db)
+
+    monkeypatch.setattr(
+        ProductImportService, "invalidate_after_import", staticmethod(_record_invalidation)
+    )
+
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    job = ProductImportJob(
+        filename=name,
+        file_format="csv" if name.endswith(".csv") else "ndjson",
+        file_path=str(path),
+    )
+    db_session.add(job)
+    await db_session.commit()
+
+    job = await ProductImportService.import_file(db_session, job, batch_size=batch_size)
+    return job, invalidations
+
+
+@pytest.mark.unit
+@pytest.mark.products
+class TestProductImportService:
+    """Test cases for ProductImportService"""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_creates_updates_and_reports_errors(
+        self, db_session: AsyncSession, tmp_path, monkeypatch
+    ):
+        seating = await create_category(db_session, slug="import-seating")
+        tables = await create_category(db_session, slug="import-tables")
+        existing = await create_chair(
+            db_session, category_id=seating.id, slug="existing-chair", base_price=1000
+        )
+
+        rows = [
+            {
+                "slug": "new-chair",
+                "name": "New Chair",
+                "model_number": "9001",
+                "base_price": 25000,
+                "category_ids": [tables.id, seating.id],
+                "variations": [{"sku": "9001-WAL", "name": "Walnut", "price_adjustment": 500}],
+            },
+            {"slug": "existing-chair", "base_price": 1500},
+            {"slug": "orphan-chair", "name": "Orphan", "model_number": "1", "category_id": 99999},
+            {"slug": "no-name-chair"},
+        ]
+        content = "\n".join(json.dumps(r) for r in rows) + "\n{not json}\n"
+
+        job, invalidations = await _run_import(
+            db_session, tmp_path, monkeypatch, "products.ndjson", content
+        )
+
+        assert job.status == "completed"
+        assert job.total_rows == 5
+        assert job.rows_processed == 5
+        assert job.products_created == 1
+        assert job.products_updated == 1
+        assert job.variations_upserted == 1
+        assert sorted(e["row"] for e in job.row_errors) == [3, 4, 5]
+        assert len(invalidations) == 1
+
+        new_chair = (
+            await db_session.execute(select(Chair).where(Chair.slug == "new-chair"))
+        ).scalar_one()
+        assert new_chair.category_id == tables.id
+        assigned = await db_session.execute(
+            select(chair_categories.c.category_id).where(
+                chair_categories.c.chair_id == new_chair.id
+            )
+        )
+        assert set(assigned.scalars().all()) == {tables.id, seating.id}
+
+        variation = (
+            await db_session.execute(
+                select(ProductVariation).where(ProductVariation.sku == "9001-WAL")
+            )
+        ).scalar_one()
+        assert variation.product_id == new_chair.id
+
+        await db_session.refresh(existing)
+        assert existing.base_price == 1500
+        assert existing.name  # untouched columns keep their values
+
+    @pytest.mark.asyncio
+    async def test_csv_rows_are_coerced(
+        self, db_session: AsyncSession, tmp_path, monkeypatch
+    ):
+        category = await create_category(db_session, slug="import-csv")
+        content = (
+            "slug,name,model_number,base_price,is_active,category_ids\n"
+            f"csv-chair,CSV Chair,7001,12000,false,{category.id}\n"
+        )
+
+        job, _ = await _run_import(db_session, tmp_path, monkeypatch, "products.csv", content)
+
+        assert job.status == "completed"
+        assert job.rows_failed == 0
+        chair = (
+            await db_session.execute(select(Chair).where(Chair.slug == "csv-chair"))
+        ).scalar_one()
+        assert chair.base_price == 12000
+        assert chair.is_active is False
+        assert chair.category_id == category.id
+
+    def test_unsupported_database_is_a_business_error(self):
+        check_upsert_support("sqlite")
+        with pytest.raises(BusinessLogicError) as exc_info:
+            check_upsert_support("oracle")
+        assert exc_info.value.status_code == 400
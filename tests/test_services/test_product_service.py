@@ -7,7 +7,8 @@ Unit tests for product service
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.services.product_service import ProductService
+from backend.services.cache_service import cache_service
+from backend.services.product_service import SEARCH_WARM_LOCK, ProductService
 from backend.core.exceptions import (
     ResourceNotFoundError,
 )
@@ -411,3 +412,68 @@ class TestProductService:
         upholstery_names = [u.name for u in upholsteries]
         assert "Leather" in upholstery_names
         assert "Fabric" in upholstery_names
+
+
+@pytest.mark.unit
+@pytest.mark.products
+class TestSearchCacheWarmup:
+    """Test cases for the batched search cache warm-up"""
+
+    @pytest.fixture
+    def cache_calls(self, monkeypatch):
+        """Record pipelined index writes and simulate the warm-up lock"""
+        calls = {"batches": [], "locks": set(), "released": []}
+
+        async def _index(products, ttl=3600):
+            calls["batches"].append(list(products))
+            return len(products)
+
+        async def _acquire(name, ttl):
+            if name in calls["locks"]:
+                return None
+            calls["locks"].add(name)
+            return "token"
+
+        async def _release(name, token):
+            calls["locks"].discard(name)
+            calls["released"].append(name)
+            return True
+
+        monkeypatch.setattr(cache_service, "index_products_for_search", _index)
+        monkeypatch.setattr(cache_service, "acquire_lock", _acquire)
+        monkeypatch.setattr(cache_service, "release_lock", _release)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_warm_indexes_active_products_in_batches(self, db_session: AsyncSession, cache_calls):
+        category = await create_category(db_session, name="Barstools")
+        chairs = [
+            await create_chair(db_session, category_id=category.id, keywords=["walnut", "swivel"])
+            for _ in range(5)
+        ]
+        await create_chair(db_session, category_id=category.id, is_active=False)
+
+        indexed = await ProductService.warm_search_cache(db_session, batch_size=2)
+
+        assert indexed == 5
+        assert all(len(batch) <= 2 for batch in cache_calls["batches"])
+        entries = dict(entry for batch in cache_calls["batches"] for entry in batch)
+        assert set(entries) == {chair.id for chair in chairs}
+        text = entries[chairs[0].id]
+        assert chairs[0].model_number in text
+        assert "Barstools" in text
+        assert text.endswith("walnut swivel")
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs_once_per_interval(self, db_session: AsyncSession, cache_calls):
+        await create_chair(db_session)
+
+        assert await ProductService.refresh_search_cache(db_session) == 1
+        # Another worker within the same interval skips the rebuild
+        assert await ProductService.refresh_search_cache(db_session) is None
+        assert cache_calls["released"] == []
+
+    @pytest.mark.asyncio
+    async def test_refresh_gives_lock_back_when_nothing_indexed(self, db_session: AsyncSession, cache_calls):
+        assert await ProductService.refresh_search_cache(db_session) == 0
+        assert cache_calls["released"] == [SEARCH_WARM_LOCK]
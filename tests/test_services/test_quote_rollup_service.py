@@ -0,0 +1,159 @@
+"""
+Test Quote Rollup Service
+
+Unit tests for the incrementally maintained daily quote rollups
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.analytics import QuoteCompanyDaily, QuoteResponseDaily, QuoteStatusDaily
+from backend.models.quote import QuoteStatus
+from backend.services.admin_service import AdminService
+from backend.services.analytics_service import AnalyticsService
+from backend.services.quote_rollup_service import QuoteRollupService
+from tests.factories import create_company, create_quote
+
+
+async def _rollup_state(db: AsyncSession):
+    """All rollup rows as comparable tuples (zero rows ignored)"""
+    status = await db.execute(select(
+        QuoteStatusDaily.day, QuoteStatusDaily.status, QuoteStatusDaily.quote_count,
+        QuoteStatusDaily.total_amount_sum, QuoteStatusDaily.quoted_price_sum, QuoteStatusDaily.quoted_price_count,
+    ))
+    company = await db.execute(select(
+        QuoteCompanyDaily.day, QuoteCompanyDaily.company_id, QuoteCompanyDaily.quote_count,
+        QuoteCompanyDaily.accepted_count, QuoteCompanyDaily.quoted_value_sum,
+    ))
+    response = await db.execute(select(
+        QuoteResponseDaily.day, QuoteResponseDaily.response_count, QuoteResponseDaily.response_seconds_sum,
+        QuoteResponseDaily.fastest_seconds, QuoteResponseDaily.slowest_seconds,
+    ))
+    return (
+        sorted(r for r in status.all() if any(r[2:])),
+        sorted(r for r in company.all() if any(r[2:])),
+        sorted(response.all()),
+    )
+
+
+@pytest.mark.unit
+class TestQuoteRollups:
+    """Test cases for quote rollup maintenance and the dashboard queries"""
+
+    @pytest.mark.asyncio
+    async def test_new_quotes_are_counted(self, db_session: AsyncSession):
+        company = await create_company(db_session)
+        await create_quote(db_session, company_id=company.id, status=QuoteStatus.SUBMITTED, total_amount=1000)
+        await create_quote(db_session, company_id=company.id, status=QuoteStatus.SUBMITTED, total_amount=3000)
+        await create_quote(db_session, status=QuoteStatus.DECLINED, total_amount=2000)
+
+        trends = await AnalyticsService.get_quote_trends(db_session, days=30)
+        assert [point["count"] for point in trends["submitted"]] == [2]
+        assert [point["count"] for point in trends["declined"]] == [1]
+
+        rates = await AnalyticsService.get_conversion_rates(db_session)
+        assert rates["pending_rate"] == pytest.approx(200 / 3)
+        assert rates["quote_to_declined"] == pytest.approx(100 / 3)
+
+        averages = await AnalyticsService.get_average_quote_value(db_session)
+        assert averages["average_total_amount"] == 2000
+
+    @pytest.mark.asyncio
+    async def test_status_changes_move_counts(self, db_session: AsyncSession):
+        company = await create_company(db_session)
+        quote = await create_quote(
+            db_session, company_id=company.id, status=QuoteStatus.SUBMITTED,
+            submitted_at=(datetime.utcnow() - timedelta(hours=5)).isoformat(),
+        )
+
+        await AdminService.update_quote_status(db_session, quote.id, QuoteStatus.QUOTED, quoted_price=50000)
+        await AdminService.update_quote_status(db_session, quote.id, QuoteStatus.ACCEPTED)
+
+        trends = await AnalyticsService.get_quote_trends(db_session, days=30)
+        assert list(trends) == ["accepted"]
+
+        rates = await AnalyticsService.get_conversion_rates(db_session)
+        assert rates["quote_to_accepted"] == 100
+
+        averages = await AnalyticsService.get_average_quote_value(db_session)
+        assert averages["average_accepted_value"] == 50000
+
+        top = await AnalyticsService.get_top_customers(db_session, by="total_value")
+        assert [(c["company"].id, c["metric_value"]) for c in top] == [(company.id, 50000)]
+
+        response = await AnalyticsService.get_quote_response_time(db_session)
+        assert response["average_response_time_hours"] == pytest.approx(5, abs=0.01)
+        assert response["fastest_response_hours"] == response["slowest_response_hours"]
+
+    @pytest.mark.asyncio
+    async def test_top_customers_ranked_by_quote_count(self, db_session: AsyncSession):
+        busy = await create_company(db_session)
+        quiet = await create_company(db_session)
+        for _ in range(3):
+            await create_quote(db_session, company_id=busy.id)
+        await create_quote(db_session, company_id=quiet.id)
+
+        top = await AnalyticsService.get_top_customers(db_session, limit=1)
+        assert [(c["company"].id, c["metric_value"]) for c in top] == [(busy.id, 3)]
+
+    @pytest.mark.asyncio
+    async def test_top_customers_include_companies_without_quotes(self, db_session: AsyncSession):
+        busy = await create_company(db_session)
+        quiet = await create_company(db_session)
+        await create_quote(db_session, company_id=busy.id)
+
+        top = await AnalyticsService.get_top_customers(db_session, limit=10)
+        ranked = [(c["company"].id, c["metric_value"]) for c in top]
+        assert ranked[0] == (busy.id, 1)
+        assert (quiet.id, 0) in ranked
+
+    @pytest.mark.asyncio
+    async def test_deleted_quote_is_removed(self, db_session: AsyncSession):
+        quote = await create_quote(
+            db_session, status=QuoteStatus.SUBMITTED,
+            submitted_at=(datetime.utcnow() - timedelta(hours=1)).isoformat(),
+        )
+        await AdminService.update_quote_status(db_session, quote.id, QuoteStatus.QUOTED, quoted_price=100)
+        await db_session.delete(quote)
+        await db_session.commit()
+
+        assert await AnalyticsService.get_quote_trends(db_session, days=30) == {}
+        responses = await db_session.execute(select(func.sum(QuoteResponseDaily.response_count)))
+        assert responses.scalar() == 0
+
+    @pytest.mark.asyncio
+    async def test_update_without_loaded_previous_value(self, db_session: AsyncSession):
+        """An attribute assigned while expired has no old value in its history."""
+        company = await create_company(db_session)
+        quote = await create_quote(db_session, company_id=company.id, status=QuoteStatus.SUBMITTED)
+        db_session.expire(quote, ["status", "quoted_price"])
+
+        quote.status = QuoteStatus.QUOTED
+        quote.quoted_price = 700
+        await db_session.commit()
+
+        trends = await AnalyticsService.get_quote_trends(db_session, days=30)
+        assert list(trends) == ["quoted"]
+        incremental = await _rollup_state(db_session)
+        await QuoteRollupService.rebuild(db_session)
+        assert await _rollup_state(db_session) == incremental
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental_rollups(self, db_session: AsyncSession):
+        company = await create_company(db_session)
+        first = await create_quote(
+            db_session, company_id=company.id, status=QuoteStatus.SUBMITTED,
+            submitted_at=(datetime.utcnow() - timedelta(hours=2)).isoformat(),
+        )
+        await create_quote(db_session, company_id=company.id, status=QuoteStatus.DRAFT)
+        await create_quote(db_session, status=QuoteStatus.SUBMITTED)
+        await AdminService.update_quote_status(db_session, first.id, QuoteStatus.QUOTED, quoted_price=12345)
+
+        incremental = await _rollup_state(db_session)
+        stats = await QuoteRollupService.rebuild(db_session)
+
+        assert stats["quotes"] == 3
+        assert await _rollup_state(db_session) == incremental
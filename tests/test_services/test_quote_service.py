@@ -11,6 +11,7 @@ from backend.services.quote_service import QuoteService
 from backend.models.quote import QuoteStatus
 from tests.factories import (
     create_company,
+    create_company_pricing,
     create_category,
     create_chair,
     create_quote,
@@ -235,3 +236,38 @@ class TestQuoteService:
         await db_session.refresh(cart)
         cart_with_items = await QuoteService.get_cart_with_items(db_session, cart.id, company.id)
         assert len(cart_with_items.items) == 0
+    
+    async def test_cart_prices_come_from_snapshot(self, db_session: AsyncSession):
+        """Test cart prices are recomputed only when pricing inputs change."""
+        tier = await create_company_pricing(db_session, percentage_adjustment=10)
+        company = await create_company(db_session, pricing_tier_id=tier.id)
+        category = await create_category(db_session)
+        product = await create_chair(
+            db_session, category_id=category.id, base_price=10000, minimum_order_quantity=1
+        )
+        cart = await create_cart(db_session, company_id=company.id)
+        await create_cart_item(
+            db_session, cart.id, product_id=product.id, quantity=2, unit_price=1, customization_cost=0
+        )
+        
+        cart = await QuoteService.get_cart_with_items(db_session, cart.id, company.id)
+        assert cart.items[0].unit_price == 11000
+        assert cart.subtotal == 22000
+        assert cart.estimated_total == 22000
+        assert cart.price_version
+        
+        # Nothing changed: served from the snapshot
+        assert await QuoteService.refresh_cart_prices(db_session, cart) is False
+        
+        # Tier change invalidates the snapshot
+        tier.percentage_adjustment = -10
+        await db_session.commit()
+        assert await QuoteService.refresh_cart_prices(db_session, cart) is True
+        assert cart.items[0].unit_price == 9000
+        
+        # So does a product price change
+        product.base_price = 20000
+        await db_session.commit()
+        cart = await QuoteService.get_cart_with_items(db_session, cart.id, company.id)
+        assert cart.items[0].unit_price == 18000
+        assert cart.subtotal == 36000
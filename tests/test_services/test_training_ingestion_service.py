@@ -0,0 +1,152 @@
+"""
+Test Training Ingestion Service
+
+Unit tests for chunked, concurrent training-document ingestion
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import backend.services.ai_service as ai_service
+import backend.services.training_ingestion_service as ingestion_module
+from backend.core.config import settings
+from backend.models.ai_chat import AIFileType, AITrainingDocument, TrainingStatus
+from backend.services.training_ingestion_service import TrainingIngestionService, chunk_content
+
+
+@pytest.fixture(autouse=True)
+def _ingestion_env(db_session: AsyncSession, monkeypatch):
+    """Test session, in-thread extraction, small chunks and fresh semaphore"""
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    monkeypatch.setattr(ingestion_module, "AsyncSessionLocal", _session)
+    monkeypatch.setattr(ingestion_module, "_model_semaphore", None)
+    monkeypatch.setattr(settings, "AI_TRAINING_EXTRACT_WORKERS", 0)
+    monkeypatch.setattr(settings, "AI_TRAINING_CHUNK_CHARS", 100)
+    monkeypatch.setattr(settings, "AI_TRAINING_MODEL_CONCURRENCY", 2)
+
+
+async def _create_document(db: AsyncSession, tmp_path, sections: int) -> AITrainingDocument:
+    path = tmp_path / "pricing.txt"
+    path.write_text("\n\n".join(f"Section {i}: " + "x" * 70 for i in range(sections)))
+    doc = AITrainingDocument(
+        name="Pricing guide",
+        file_type=AIFileType.TEXT,
+        original_filename="pricing.txt",
+        file_path=str(path),
+    )
+    db.add(doc)
+    await db.commit()
+    return doc
+
+
+def _stub_model(monkeypatch, fail_parts=()):
+    calls = {"parts": [], "active": 0, "peak": 0}
+
+    async def _analyze(document_name, file_type, content, part=1, parts=1):
+        calls["active"] += 1
+        calls["peak"] = max(calls["peak"], calls["active"])
+        await asyncio.sleep(0.01)
+        calls["active"] -= 1
+        calls["parts"].append(part)
+        if part in fail_parts:
+            raise RuntimeError("model unavailable")
+        return {
+            "summary": f"summary {part}",
+            "key_facts": [f"fact {part}"],
+            "structured_data": f"| part | {part} |",
+            "insights": [],
+        }
+
+    async def _merge(document_name, summaries):
+        return " / ".join(summaries)
+
+    monkeypatch.setattr(ai_service, "analyze_training_chunk", _analyze)
+    monkeypatch.setattr(ai_service, "merge_training_summaries", _merge)
+    return calls
+
+
+@pytest.mark.unit
+class TestChunkContent:
+    """Test cases for chunk_content"""
+
+    def test_packs_paragraphs_up_to_limit(self):
+        text = "\n\n".join(["a" * 40, "b" * 40, "c" * 40])
+        chunks = chunk_content(text, 90)
+        assert chunks == ["a" * 40 + "\n\n" + "b" * 40, "c" * 40]
+
+    def test_splits_oversized_paragraph(self):
+        chunks = chunk_content("\n".join(["l" * 30] * 5) + "\n" + "z" * 130, 50)
+        assert all(len(c) <= 50 for c in chunks)
+        assert "".join(chunks).count("z") == 130
+
+
+@pytest.mark.unit
+class TestTrainingIngestionService:
+    """Test cases for TrainingIngestionService.ingest"""
+
+    @pytest.mark.asyncio
+    async def test_ingest_analyzes_chunks_concurrently(self, db_session: AsyncSession, tmp_path, monkeypatch):
+        calls = _stub_model(monkeypatch)
+        doc = await _create_document(db_session, tmp_path, sections=5)
+
+        stats = await TrainingIngestionService.ingest(doc.id)
+
+        assert stats["chunks"] == 5
+        assert stats["chunks_resumed"] == 0
+        assert sorted(calls["parts"]) == [1, 2, 3, 4, 5]
+        assert calls["peak"] == 2
+
+        await db_session.refresh(doc)
+        assert doc.status == TrainingStatus.COMPLETED
+        assert doc.summary == " / ".join(f"summary {i}" for i in range(1, 6))
+        assert doc.key_facts == [f"fact {i}" for i in range(1, 6)]
+        assert doc.structured_data.startswith("| part | 1 |")
+        assert (doc.chunks_done, doc.chunks_total) == (5, 5)
+        assert doc.chunk_results is None
+        assert doc.processing_stats["chars"] == stats["chars"]
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_keeps_progress_and_retry_resumes(
+        self, db_session: AsyncSession, tmp_path, monkeypatch
+    ):
+        _stub_model(monkeypatch, fail_parts=(3,))
+        doc = await _create_document(db_session, tmp_path, sections=4)
+
+        with pytest.raises(RuntimeError, match="1 of 4 chunks failed"):
+            await TrainingIngestionService.ingest(doc.id)
+
+        await db_session.refresh(doc)
+        assert doc.status == TrainingStatus.FAILED
+        assert doc.chunks_done == 3
+        assert sorted(doc.chunk_results["parts"]) == ["0", "1", "3"]
+
+        calls = _stub_model(monkeypatch)
+        stats = await TrainingIngestionService.ingest(doc.id)
+
+        assert calls["parts"] == [3]
+        assert stats["chunks_resumed"] == 3
+        await db_session.refresh(doc)
+        assert doc.status == TrainingStatus.COMPLETED
+        assert doc.error_message is None
+
+    @pytest.mark.asyncio
+    async def test_missing_file_marks_document_failed(self, db_session: AsyncSession, monkeypatch):
+        calls = _stub_model(monkeypatch)
+        doc = AITrainingDocument(
+            name="Gone", file_type=AIFileType.TEXT, original_filename="gone.txt", file_path="/nonexistent/gone.txt"
+        )
+        db_session.add(doc)
+        await db_session.commit()
+
+        with pytest.raises(RuntimeError):
+            await TrainingIngestionService.ingest(doc.id)
+
+        await db_session.refresh(doc)
+        assert doc.status == TrainingStatus.FAILED
+        assert calls["parts"] == []
@@ -0,0 +1,53 @@
+"""
+Unit Tests for the Benchmark Baseline Comparison
+"""
+
+import copy
+
+import pytest
+
+from benchmarks.results import RESULTS_VERSION, compare, load_results, save_results
+
+
+def _results(**endpoint) -> dict:
+    metrics = {"method": "GET", "path": "/api/v1/products", "status": 200,
+               "p50_ms": 20.0, "p95_ms": 30.0, "queries": 8, "peak_kib": 800.0}
+    metrics.update(endpoint)
+    return {
+        "version": RESULTS_VERSION,
+        "catalogs": {"1000": {"seed_seconds": 1.0, "rows": {}, "endpoints": {"products:default": metrics}}},
+    }
+
+
+@pytest.mark.unit
+class TestBenchmarkCompare:
+    """Test cases for benchmarks.results.compare"""
+
+    def test_within_threshold(self):
+        assert compare(_results(), _results(p50_ms=24.0, p95_ms=36.0, peak_kib=950.0), threshold=0.25) == []
+
+    def test_query_count_increase_fails(self):
+        [regression] = compare(_results(), _results(queries=9), threshold=0.25)
+
+        assert (regression.metric, regression.baseline, regression.current) == ("queries", 8, 9)
+
+    def test_latency_and_status_regressions(self):
+        regressions = compare(_results(), _results(p95_ms=45.0, status=500), threshold=0.25)
+
+        assert {r.metric for r in regressions} == {"p95_ms", "status"}
+
+    def test_noise_floor_for_fast_endpoints(self):
+        # +60% but only 0.6ms: noise, not a regression
+        assert compare(_results(p50_ms=1.0), _results(p50_ms=1.6), threshold=0.25) == []
+
+    def test_new_endpoints_and_sizes_are_skipped(self):
+        current = copy.deepcopy(_results())
+        current["catalogs"]["50000"] = current["catalogs"]["1000"]
+
+        assert compare(_results(), current, threshold=0.25) == []
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_results(_results(), path)
+
+        assert load_results(path) == _results()
@@ -0,0 +1,104 @@
+"""
+Unit Tests for Connection Pool Sizing and Instrumentation
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy import exc as sa_exc
+
+import backend.database.pool as db_pool
+from backend.database.pool import (
+    BACKGROUND_PROCESSES,
+    MIN_CONNECTIONS_PER_PROCESS,
+    instrument_engine,
+    instrumented_pool_class,
+    plan_pools,
+    pool_status,
+)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Keep test engines out of the app's pool registry"""
+    monkeypatch.setattr(db_pool, "_stats", {})
+    monkeypatch.setattr(db_pool, "_engines", {})
+
+
+@pytest.fixture
+def engine(tmp_path, registry):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class("test", is_async=False),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_engine(engine, "test", pre_ping_interval=30)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestPoolPlan:
+    """Test cases for plan_pools"""
+
+    @pytest.mark.parametrize("budget,cpus", [(60, 1), (60, 4), (60, 32), (200, 16), (20, 8)])
+    def test_plan_fits_budget(self, budget, cpus):
+        plan = plan_pools(budget=budget, cpus=cpus)
+
+        assert 1 <= plan.workers <= cpus
+        assert plan.max_connections <= budget
+        assert plan.pool_size >= 1 and plan.max_overflow >= 0
+
+    def test_workers_capped_by_budget(self):
+        plan = plan_pools(budget=60, cpus=32)
+
+        assert plan.workers == 60 // MIN_CONNECTIONS_PER_PROCESS - BACKGROUND_PROCESSES
+        assert plan.connections_per_process >= MIN_CONNECTIONS_PER_PROCESS
+
+    def test_explicit_overrides(self):
+        plan = plan_pools(budget=60, cpus=4, workers=2, pool_size=5, max_overflow=3)
+
+        assert (plan.workers, plan.pool_size, plan.max_overflow) == (2, 5, 3)
+
+
+@pytest.mark.unit
+class TestPoolInstrumentation:
+    """Test cases for the instrumented pools"""
+
+    def test_checkout_metrics(self, engine):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            [status] = pool_status()
+            assert status["in_use"] == 1
+            assert status["idle"] == 0
+
+            with pytest.raises(sa_exc.TimeoutError):
+                engine.connect()
+
+        [status] = pool_status()
+        assert status["name"] == "test"
+        assert status["checkouts"] == 1
+        assert status["timeouts"] == 1
+        assert status["in_use"] == 0
+        assert status["overflow"] == 0
+
+    def test_stats_survive_dispose(self, engine):
+        with engine.connect():
+            pass
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert pool_status()[0]["checkouts"] == 2
+
+    def test_pings_only_idle_connections(self, engine):
+        for _ in range(3):
+            with engine.connect() as conn:
+                record = conn.connection._connection_record
+        assert pool_status()[0]["pre_pings"] == 0
+
+        record.info["idle_since"] -= 60
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert pool_status()[0]["pre_pings"] == 1
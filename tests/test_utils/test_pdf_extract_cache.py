@@ -0,0 +1,124 @@
+"""
+Unit Tests for the Catalog PDF Extraction Cache
+"""
+
+import os
+
+import pytest
+
+from backend.scripts import catalog_sync_utils
+from backend.scripts.migrations import pdf_extract_cache
+from backend.scripts.migrations.pdf_extract_cache import PdfExtractCache, extract_pdfs
+
+
+def _fake_records(pdf_path):
+    text = open(pdf_path, "rb").read().decode()
+    return [
+        {
+            "base_model": model,
+            "family_name": "Parsed",
+            "variations": [{"full_model": f"{model}P", "base_model": model}],
+            "dimensions": {"width": 18.5},
+            "family_info": {},
+            "full_page_text": text,
+            "page_number": 1,
+        }
+        for model in text.split()
+    ]
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Stand-in for pdfplumber parsing that records which files were read"""
+    calls = []
+
+    def fake_parse(pdf_path, family_name_override=None):
+        calls.append(os.path.basename(pdf_path))
+        return _fake_records(pdf_path)
+
+    monkeypatch.setattr(pdf_extract_cache, "parse_pdf_for_fill", fake_parse)
+    return calls
+
+
+@pytest.fixture
+def pdf_dir(tmp_path):
+    folder = tmp_path / "catalogs"
+    folder.mkdir()
+    (folder / "cat.6010-6011.Abruzzo.2024.pdf").write_bytes(b"6010 6011")
+    (folder / "cat.7020.Milano.4mail.pdf").write_bytes(b"7020")
+    return folder
+
+
+@pytest.mark.unit
+class TestPdfExtractCache:
+    """Test cases for PdfExtractCache"""
+
+    def test_parses_once_per_content(self, tmp_path, pdf_dir, parsed):
+        pdfs = sorted(pdf_dir.glob("*.pdf"))
+        cache_path = tmp_path / "cache.sqlite"
+
+        first = extract_pdfs(pdfs, cache_path=cache_path, workers=1)
+        second = extract_pdfs(pdfs, cache_path=cache_path, workers=1)
+
+        assert sorted(parsed) == ["cat.6010-6011.Abruzzo.2024.pdf", "cat.7020.Milano.4mail.pdf"]
+        assert first == second
+        [abruzzo, milano] = second.values()
+        assert [r["base_model"] for r in abruzzo] == ["6010", "6011"]
+        assert abruzzo[1]["full_page_text"] == "6010 6011"
+        assert abruzzo[0]["family_name"] == "Abruzzo"
+        assert milano[0]["variations"] == [{"full_model": "7020P", "base_model": "7020"}]
+
+    def test_changed_file_is_reparsed(self, tmp_path, pdf_dir, parsed):
+        pdf = pdf_dir / "cat.7020.Milano.4mail.pdf"
+        cache_path = tmp_path / "cache.sqlite"
+        extract_pdfs([pdf], cache_path=cache_path, workers=1)
+
+        pdf.write_bytes(b"7021")
+        stat = pdf.stat()
+        os.utime(pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        [records] = extract_pdfs([pdf], cache_path=cache_path, workers=1).values()
+
+        assert len(parsed) == 2
+        assert records[0]["base_model"] == "7021"
+
+    def test_copies_share_an_entry(self, tmp_path, pdf_dir, parsed):
+        copy = pdf_dir / "cat.7020.Verona.2023.pdf"
+        copy.write_bytes((pdf_dir / "cat.7020.Milano.4mail.pdf").read_bytes())
+
+        extracted = extract_pdfs(sorted(pdf_dir.glob("*.pdf")), cache_path=tmp_path / "c.sqlite", workers=1)
+
+        assert len(parsed) == 2
+        assert extracted[str(copy)][0]["family_name"] == "Verona"
+
+    def test_parser_version_bump_invalidates(self, tmp_path, pdf_dir, parsed, monkeypatch):
+        pdfs = sorted(pdf_dir.glob("*.pdf"))
+        with PdfExtractCache(tmp_path / "cache.sqlite") as cache:
+            cache.extract(pdfs, workers=1)
+            monkeypatch.setattr(pdf_extract_cache, "PARSER_VERSION", pdf_extract_cache.PARSER_VERSION + 1)
+            cache.extract(pdfs, workers=1)
+            assert cache.prune() == 2
+
+        assert len(parsed) == 4
+
+    def test_process_pool_with_unreadable_pdfs(self, tmp_path):
+        for i in range(3):
+            (tmp_path / f"broken{i}.pdf").write_bytes(b"not a pdf %d" % i)
+
+        extracted = extract_pdfs(sorted(tmp_path.glob("*.pdf")), cache_path=tmp_path / "c.sqlite", workers=2)
+
+        assert list(extracted.values()) == [[], [], []]
+
+
+@pytest.mark.unit
+class TestParsePdfsForModels:
+    """Test cases for catalog_sync_utils.parse_pdfs_for_models"""
+
+    def test_only_matching_pdfs_are_read(self, tmp_path, pdf_dir, parsed, monkeypatch):
+        monkeypatch.setattr(pdf_extract_cache, "DEFAULT_CACHE_PATH", tmp_path / "cache.sqlite")
+
+        by_model = catalog_sync_utils.parse_pdfs_for_models(pdf_dir, {"6010", "9999"}, workers=1)
+
+        assert parsed == ["cat.6010-6011.Abruzzo.2024.pdf"]
+        assert set(by_model) == {"6010"}
+        assert by_model["6010"]["pdf_paths"] == [str(pdf_dir / "cat.6010-6011.Abruzzo.2024.pdf")]
+        assert by_model["6010"]["dimensions"] == {"width": 18.5}
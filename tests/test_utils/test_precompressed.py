@@ -0,0 +1,104 @@
+"""
+Tests for pre-compressed static files and the content bundle export
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backend.utils import precompressed
+from backend.utils.precompressed import choose_file, precompressed_response, write_precompressed
+from backend.utils.static_content_exporter import MANIFEST_NAME, StaticContentExporter
+
+
+@pytest.fixture
+def content_file(tmp_path):
+    path = tmp_path / "contentData.json"
+    data = json.dumps({"siteSettings": {"companyName": "Eagle Chair"}, "pad": "x" * 5000}).encode()
+    path.write_bytes(data)
+    write_precompressed(path, data)
+    return path
+
+
+@pytest.mark.unit
+class TestPrecompressed:
+    """Test cases for writing and choosing compressed siblings"""
+
+    def test_gzip_sibling_and_no_stale_brotli(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(precompressed, "_load_brotli", lambda: None)
+        path = tmp_path / "contentData.json"
+        path.write_bytes(b'{"a": 1}')
+        (tmp_path / "contentData.json.br").write_bytes(b"old")
+
+        written = write_precompressed(path)
+
+        assert [p.name for p in written] == ["contentData.json.gz"]
+        assert gzip.decompress((tmp_path / "contentData.json.gz").read_bytes()) == b'{"a": 1}'
+        assert not (tmp_path / "contentData.json.br").exists()
+
+    def test_choose_file(self, content_file):
+        gz = content_file.with_name("contentData.json.gz")
+        br = content_file.with_name("contentData.json.br")
+        br.write_bytes(b"br")
+
+        assert choose_file(content_file, "gzip, deflate, br") == (br, "br")
+        assert choose_file(content_file, "br;q=0, gzip") == (gz, "gzip")
+        assert choose_file(content_file, None) == (content_file, None)
+
+        # A sibling older than the file (interrupted export) is never sent
+        stat = content_file.stat()
+        os.utime(gz, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        os.utime(br, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        assert choose_file(content_file, "gzip, br") == (content_file, None)
+
+    def test_response_negotiates_and_revalidates(self, content_file):
+        app = FastAPI()
+
+        @app.get("/contentData.json")
+        async def serve(request: Request):
+            return precompressed_response(request, content_file, "application/json", {"Cache-Control": "no-cache"})
+
+        client = TestClient(app)
+        response = client.get("/contentData.json", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json()["siteSettings"]["companyName"] == "Eagle Chair"
+
+        etag = response.headers["etag"]
+        cached = client.get("/contentData.json", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert cached.status_code == 304
+
+        identity = client.get("/contentData.json", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["etag"] != etag
+
+
+@pytest.mark.unit
+class TestContentBundleExport:
+    """Test cases for the hashed, pre-compressed contentData export"""
+
+    def test_export_writes_bundle_and_prunes(self, tmp_path):
+        exporter = StaticContentExporter(frontend_path=str(tmp_path))
+        data_dir = exporter.data_dir
+
+        for i in range(5):
+            assert exporter.export_all_content({"siteSettings": {"i": i}, "heroSlides": [], "salesReps": []})
+            manifest = json.loads((data_dir / MANIFEST_NAME).read_text())
+            bundle = data_dir / manifest["file"]
+            stat = bundle.stat()
+            # Distinct mtimes so pruning order is deterministic
+            os.utime(bundle, ns=(stat.st_atime_ns, stat.st_mtime_ns + i * 10**9))
+
+        assert bundle.read_bytes() == exporter.content_file.read_bytes()
+        assert gzip.decompress(bundle.with_name(bundle.name + ".gz").read_bytes()) == bundle.read_bytes()
+        assert exporter.content_file.with_name("contentData.json.gz").exists()
+
+        bundles = sorted(p.name for p in data_dir.glob("contentData.*.json") if p.name != MANIFEST_NAME)
+        assert len(bundles) == 3
+        assert manifest["file"] in bundles
+        assert len(list(data_dir.glob("contentData.*.json.gz"))) == 3
@@ -0,0 +1,153 @@
+"""
+Unit Tests for the WordPress SQL Dump Parser
+"""
+
+import io
+import os
+
+import pytest
+
+from backend.scripts.migrations.base_parser import (
+    DumpParseError,
+    _DumpReader,
+    iter_dump,
+    open_dump_index,
+    parse_insert_values,
+)
+from backend.scripts.migrations.migrate_products_v2 import (
+    extract_attachment_urls,
+    extract_product_metadata,
+    extract_taxonomy_relationships,
+    extract_wordpress_terms,
+    parse_products_from_wp_posts,
+)
+
+DUMP = r"""-- phpMyAdmin SQL Dump
+/*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT */;
+SET SQL_MODE = "NO_AUTO_VALUE_ON_ZERO";
+
+CREATE TABLE `wp_terms` (
+  `term_id` bigint(20) UNSIGNED NOT NULL,
+  `name` varchar(200) NOT NULL DEFAULT '',
+  `slug` varchar(200) NOT NULL DEFAULT '' COMMENT 'not; a ''statement''',
+  `term_group` bigint(10) NOT NULL DEFAULT 0,
+  KEY `slug` (`slug`(191))
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO `wp_terms` VALUES
+(7, 'Wood &amp; Metal', 'wood-chairs', 0),
+(8, 'Tags', 'post-tag', 0);
+
+INSERT INTO `wp_term_taxonomy` (`term_taxonomy_id`, `term_id`, `taxonomy`, `description`, `parent`, `count`) VALUES
+(70, 7, 'product_cat', '', 0, 1),
+(80, 8, 'post_tag', '', 0, 1);
+
+INSERT INTO `wp_term_relationships` (`object_id`, `term_taxonomy_id`, `term_order`) VALUES (101, 70, 0), (101, 80, 0);
+
+# hash comment
+INSERT INTO `wp_posts` (`ID`, `post_content`, `post_title`, `post_excerpt`, `post_status`, `post_name`, `post_type`) VALUES
+(101, '<p>It\'s a \"chair\"; (really)\r\nNew line</p>', '6010P Side Chair', '', 'publish', '6010p', 'product'),
+(102, 'Draft', '6011 Side Chair', '', 'draft', '6011', 'product'),
+(103, 'Terms', 'Terms', '', 'publish', 'terms', 'page');
+
+INSERT INTO `wp_postmeta` (`meta_id`, `post_id`, `meta_key`, `meta_value`) VALUES
+(1, 101, '_thumbnail_id', '201'),
+(2, 101, '_regular_price', '12.50'),
+(3, 201, '_wp_attached_file', '2020/01/o''brien.jpg'),
+(4, 101, '_stock_status', NULL);
+/* trailing comment */
+"""
+
+
+@pytest.mark.unit
+class TestDumpTokenizer:
+    """Test cases for the streaming INSERT tokenizer"""
+
+    def test_typed_values_and_escapes(self):
+        rows = parse_insert_values(
+            r"(1, 'it''s', NULL, -2.5e1, 0x4142), (2, 'a\nb\\c\'d\%', '', _binary 'xy', 3)"
+        )
+
+        assert rows == [(1, "it's", None, -25.0, b"AB"), (2, "a\nb\\c'd\\%", "", b"xy", 3)]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+    def test_chunk_boundaries(self, chunk_size):
+        rows = list(_DumpReader(io.StringIO(DUMP), chunk_size=chunk_size).statements(None))
+
+        assert len(rows) == 13
+        table, columns, row = rows[0]
+        assert table == "wp_terms"
+        assert columns == ("term_id", "name", "slug", "term_group")
+        assert row == (7, "Wood &amp; Metal", "wood-chairs", 0)
+        assert rows[6][2][1] == "<p>It's a \"chair\"; (really)\r\nNew line</p>"
+
+    def test_table_filter(self, tmp_path):
+        path = tmp_path / "dump.sql"
+        path.write_text(DUMP, encoding="utf-8")
+
+        rows = list(iter_dump(path, tables=["wp_postmeta"]))
+
+        assert {table for table, _, _ in rows} == {"wp_postmeta"}
+        assert rows[2][2] == (3, 201, "_wp_attached_file", "2020/01/o'brien.jpg")
+
+    def test_malformed_row(self):
+        with pytest.raises(DumpParseError):
+            parse_insert_values("(1, 'unterminated)")
+
+
+@pytest.mark.unit
+class TestDumpIndex:
+    """Test cases for the on-disk SQLite index"""
+
+    @pytest.fixture
+    def dump_path(self, tmp_path):
+        path = tmp_path / "eaglechair_com.sql"
+        path.write_text(DUMP, encoding="utf-8")
+        return path
+
+    def test_build_and_reuse(self, dump_path):
+        index = open_dump_index(dump_path)
+        assert index.execute("SELECT COUNT(*) FROM wp_posts").fetchone()[0] == 3
+        index.close()
+
+        index_path = dump_path.with_name("eaglechair_com.index.sqlite")
+        built_at = index_path.stat().st_mtime_ns
+        open_dump_index(dump_path).close()
+
+        assert index_path.stat().st_mtime_ns == built_at
+
+    def test_rebuilt_when_dump_changes(self, dump_path):
+        open_dump_index(dump_path).close()
+
+        dump_path.write_text(DUMP.replace("'Tags'", "'Labels'"), encoding="utf-8")
+        stat = dump_path.stat()
+        os.utime(dump_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        index = open_dump_index(dump_path)
+
+        assert index.execute("SELECT name FROM wp_terms WHERE term_id = 8").fetchone()[0] == "Labels"
+        index.close()
+
+    def test_missing_dump(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            open_dump_index(tmp_path / "missing.sql")
+
+    def test_product_migration_queries(self, dump_path):
+        index = open_dump_index(dump_path)
+
+        terms = extract_wordpress_terms(index)
+        product_cat_terms, post_terms = extract_taxonomy_relationships(index)
+        metadata = extract_product_metadata(index)
+        attachments = extract_attachment_urls(index)
+        data = parse_products_from_wp_posts(index, terms, post_terms, metadata)
+        index.close()
+
+        assert terms["7"] == {"name": "Wood & Metal", "slug": "wood-chairs"}
+        assert product_cat_terms == {"7": None}
+        assert post_terms == {"101": ["7"]}
+        assert metadata["101"] == {"_thumbnail_id": "201", "_regular_price": "12.50", "_stock_status": ""}
+        assert attachments == {"201": "/wp-content/uploads/2020/01/o'brien.jpg"}
+        [product] = data["products"]
+        assert product["model_number"] == "6010"
+        assert product["suffix"] == "P"
+        assert product["wp_categories"] == ["wood-chairs"]
+        assert product["description"] == "It's a \"chair\"; (really) New line"